@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import math
+import struct
+import threading
+from array import array
+from timeit import default_timer as clock
+import morph
+
+# automation file, all little endian:
+#   header: magic, format version, number of events, recorded tempo (bpm), length (seconds)
+#   then every event time (seconds, double), then every event word (unsigned 16 bit)
+magic = b'YEAA'
+version = 1
+header_format = '<4sHIdd'
+
+# an event word packs where the CC came from with its controller and value
+received_flag = 1 << 14
+
+
+class Recorder():
+    ''' timestamps CCs into a packed event log: one array of times, one of
+        (received << 14 | controller << 7 | value) words. MidiManager calls Record()
+        for every CC it sends, and its listener for every CC it hears '''
+    def __init__(self, tempo=120.0):
+        # bpm while recording, so playback can follow a different tempo
+        self.tempo = tempo
+        self.times = array('d')
+        self.events = array('H')
+        # seconds from the start of the log to where a loop wraps round
+        self.length = 0.0
+        self.start = None
+        self.lock = threading.Lock()
+
+    def Start(self):
+        ''' starts the clock. Record() only logs between Start() and Stop() '''
+        self.start = clock()
+
+    def Stop(self):
+        ''' stops logging. the loop length is up to now '''
+        if (self.start == None): return
+        self.length = clock() - self.start
+        self.start = None
+
+    def IsRecording(self):
+        ''' returns True between Start() and Stop() '''
+        return (self.start != None)
+
+    def Record(self, controller, value, received=False):
+        ''' logs a CC at the current time '''
+        start = self.start
+        if (start == None): return
+        word = (controller << 7) | value
+        if (received): word |= received_flag
+        with self.lock:
+            self.times.append(clock() - start)
+            self.events.append(word)
+
+    def __len__(self):
+        ''' returns the number of events logged '''
+        return len(self.times)
+
+    def Clear(self):
+        ''' empties the log '''
+        with self.lock:
+            self.times = array('d')
+            self.events = array('H')
+            self.length = 0.0
+
+    def Save(self, path):
+        ''' writes the log to a file '''
+        with open(path, 'wb') as log_file:
+            log_file.write(struct.pack(header_format, magic, version, len(self.times), self.tempo, self.length))
+            log_file.write(self.times.tostring())
+            log_file.write(self.events.tostring())
+
+    def Load(self, path):
+        ''' reads a log written by Save() '''
+        with open(path, 'rb') as log_file:
+            data = log_file.read()
+        header_size = struct.calcsize(header_format)
+        if (len(data) < header_size):
+            raise ValueError('Incorrect automation file passed to Recorder.Load(): %s' % (path))
+        file_magic, file_version, count, tempo, length = struct.unpack_from(header_format, data, 0)
+        times = array('d')
+        events = array('H')
+        if (file_magic != magic or file_version != version or
+            len(data) != header_size + count * (times.itemsize + events.itemsize)):
+            raise ValueError('Incorrect automation file passed to Recorder.Load(): %s' % (path))
+        times.fromstring(data[header_size:header_size + count * times.itemsize])
+        events.fromstring(data[header_size + count * times.itemsize:])
+        with self.lock:
+            self.times = times
+            self.events = events
+            self.tempo = tempo
+            self.length = length
+
+
+class Player():
+    ''' replays a Recorder's log through a MidiManager on its own timer thread. every event has
+        an absolute deadline from the start, so timing doesn't drift however long it plays.
+        events due at the same moment go out as one SendMany() '''
+    def __init__(self, manager, recorder, loop=False, tempo=None, done=None, sent=None):
+        self.manager = manager
+        # a copy, so recording can carry on while this plays
+        with recorder.lock:
+            self.times = array('d', recorder.times)
+            self.events = array('H', recorder.events)
+        self.length = max(recorder.length, self.times[-1] if (self.times) else 0.0)
+        self.recorded_tempo = recorder.tempo
+        self.loop = loop
+        # called from the player thread when playback ends, unless stopped
+        self.done = done
+        # called from the player thread when CCs go out and TakeSent() has nothing waiting, so
+        # whoever keeps track of the device can catch up without hearing about every send
+        self.sent_callback = sent
+        self.unseen = {}
+        self.thread = None
+        self.running = False
+        self.lock = threading.Lock()
+        # seconds of playback per second of the recording, and when the recording's 0 is (on clock())
+        self.scale = 1.0
+        self.origin = None
+        self.SetTempo(tempo if (tempo != None) else recorder.tempo)
+        # lateness of each send against its deadline, in seconds
+        self.sends = 0
+        self.sent = 0
+        self.loops = 0
+        self.late_sum = 0.0
+        self.late_squares = 0.0
+        self.late_max = 0.0
+
+    def SetTempo(self, tempo):
+        ''' follows a new tempo (bpm), carrying on from the same point in the recording '''
+        if (tempo <= 0):
+            raise ValueError('Incorrect value passed to Player.SetTempo()')
+        with self.lock:
+            scale = self.recorded_tempo / float(tempo)
+            if (self.origin != None):
+                now = clock()
+                self.origin = now - (now - self.origin) / self.scale * scale
+            self.scale = scale
+
+    def Start(self):
+        ''' plays from the start of the recording '''
+        if (self.running or not self.times): return
+        self.running = True
+        self.thread = threading.Thread(target=self._Run, name='Player')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def Stop(self, timeout=None):
+        ''' stops playing '''
+        self.running = False
+        if (self.thread and self.thread is not threading.current_thread()): self.thread.join(timeout)
+
+    def IsRunning(self):
+        ''' returns True until playback ends or is stopped '''
+        return self.running
+
+    def TakeSent(self):
+        ''' returns the (controller, value) pairs sent since the last call, the newest value per controller '''
+        with self.lock:
+            pairs = list(self.unseen.items())
+            self.unseen = {}
+        return pairs
+
+    def GetStats(self):
+        ''' returns sends, CCs, loops played, and lateness (drift and jitter) of the sends in seconds '''
+        sends = max(self.sends, 1)
+        mean = self.late_sum / sends
+        return {
+            'sends':     self.sends,
+            'sent':      self.sent,
+            'loops':     self.loops,
+            'late_mean': mean,
+            'late_max':  self.late_max,
+            'jitter':    math.sqrt(max(self.late_squares / sends - mean * mean, 0.0))}
+
+    def _Run(self):
+        ''' the player thread '''
+        times = self.times
+        events = self.events
+        count = len(times)
+        with self.lock:
+            self.origin = clock()
+        finished = False
+        try:
+            while (self.running):
+                index = 0
+                while (index < count and self.running):
+                    # everything due at the same moment goes out together
+                    stop = index + 1
+                    while (stop < count and times[stop] == times[index]): stop += 1
+                    with self.lock:
+                        deadline = self.origin + times[index] * self.scale
+                    late = morph.WaitUntil(deadline)
+                    if (not self.running): break
+                    pairs = [((word >> 7) & 0x7F, word & 0x7F) for word in events[index:stop]]
+                    self.manager.SendMany(pairs)
+                    if (self.sent_callback):
+                        with self.lock:
+                            wake = not self.unseen
+                            self.unseen.update(pairs)
+                        if (wake): self.sent_callback()
+                    self.sends += 1
+                    self.sent += stop - index
+                    self.late_sum += late
+                    self.late_squares += late * late
+                    if (late > self.late_max): self.late_max = late
+                    index = stop
+                if (not (self.loop and self.length > 0 and self.running)):
+                    finished = self.running
+                    break
+                # the next pass starts where this one's loop length ends, not when its last event went out
+                with self.lock:
+                    self.origin += self.length * self.scale
+                self.loops += 1
+        finally:
+            self.running = False
+            if (finished and self.done): self.done()
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+
+# imports
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import subprocess
+from timeit import default_timer as clock
+import core
+import midi_backends
+
+# where the modules under test live
+here = os.path.dirname(os.path.abspath(__file__))
+
+# what importing core must stay under, in milliseconds, and the gui modules it must not pull in
+import_budget = 25.0
+gui_modules = ('wx', 'natsort', 'images', 'rtmidi_python')
+
+
+def Measure(function, repeat=5):
+    ''' calls function repeat times, returns timing stats in seconds '''
+    times = []
+    for index in range(repeat):
+        started = clock()
+        function()
+        times.append(clock() - started)
+    times.sort()
+    return {
+        'repeat': repeat,
+        'min':    times[0],
+        'median': times[len(times) // 2],
+        'mean':   sum(times) / len(times),
+        'max':    times[-1]}
+
+
+class NullOutput():
+    ''' a midi output that throws everything away '''
+    def send_message(self, message):
+        ''' drops the message '''
+        pass
+
+
+def LegacySendCC(manager, controller, value):
+    ''' SendCC as it was before the status byte table, line for line, for comparison '''
+    # 1st byte changes depending on the midi channel
+    if   (manager.midi_channel == 1):  byte1 = 0xB0
+    elif (manager.midi_channel == 2):  byte1 = 0xB1
+    elif (manager.midi_channel == 3):  byte1 = 0xB2
+    elif (manager.midi_channel == 4):  byte1 = 0xB3
+    elif (manager.midi_channel == 5):  byte1 = 0xB4
+    elif (manager.midi_channel == 6):  byte1 = 0xB5
+    elif (manager.midi_channel == 7):  byte1 = 0xB6
+    elif (manager.midi_channel == 8):  byte1 = 0xB7
+    elif (manager.midi_channel == 9):  byte1 = 0xB8
+    elif (manager.midi_channel == 10): byte1 = 0xB9
+    elif (manager.midi_channel == 11): byte1 = 0xBA
+    elif (manager.midi_channel == 12): byte1 = 0xBB
+    elif (manager.midi_channel == 13): byte1 = 0xBC
+    elif (manager.midi_channel == 14): byte1 = 0xBD
+    elif (manager.midi_channel == 15): byte1 = 0xBE
+    elif (manager.midi_channel == 16): byte1 = 0xBF
+    else:
+        raise ValueError('Incorrect value passed to MidiManager.SendCC()')
+    # send CC 
+    manager.midi_output_device.send_message([byte1, controller, value])
+
+
+def BenchSendCC(count=100000, channel=core.default_remoteChannel):
+    ''' per-message overhead of SendCC before and after the status byte table, in seconds '''
+    manager = core.MidiManager()
+    manager.midi_output_device = NullOutput()
+    manager.SetChannel(channel)
+
+    started = clock()
+    for index in xrange(count):
+        LegacySendCC(manager, index & 0x7F, 64)
+    before = (clock() - started) / count
+
+    started = clock()
+    for index in xrange(count):
+        manager.SendCC(index & 0x7F, 64)
+    after = (clock() - started) / count
+
+    return {'messages': count, 'channel': int(channel), 'before': before, 'after': after}
+
+
+def BenchImport(module, preload=(), repeat=5):
+    ''' times importing a module in a fresh interpreter, and the memory it adds (linux only) '''
+    # anything in preload is imported before the clock starts, so it isn't counted
+    script = (
+        'import sys\n'
+        'from timeit import default_timer as clock\n'
+        'import os\n'
+        'def rss():\n'
+        '    # resident set size in KB, where the platform tells us\n'
+        '    if (not os.path.exists("/proc/self/statm")): return 0\n'
+        '    with open("/proc/self/statm") as statm:\n'
+        '        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024\n'
+        '%s\n'
+        'before = rss()\n'
+        'started = clock()\n'
+        'import %s\n'
+        'elapsed = clock() - started\n'
+        'sys.stdout.write("%%r %%r" %% (elapsed, rss() - before))\n'
+        % (''.join('import %s\n' % (name) for name in preload), module))
+    # time loading compiled modules, the way a user's second launch would
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    subprocess.check_output([sys.executable, '-c', script], cwd=here, env=env)
+    times = []
+    rss = []
+    for index in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=here, env=env)
+        elapsed, grown = output.split()
+        times.append(float(elapsed))
+        rss.append(int(grown))
+    times.sort()
+    return {
+        'module': module,
+        'repeat': repeat,
+        'min':    times[0],
+        'median': times[len(times) // 2],
+        'mean':   sum(times) / len(times),
+        'max':    times[-1],
+        'rss_kb': max(rss)}
+
+
+def ImportTime(module, repeat=5):
+    ''' the median seconds importing a module takes in a fresh interpreter, from -X importtime where
+        the interpreter has it (3.7 and up), otherwise timed around the import statement '''
+    if (sys.version_info < (3, 7)): return BenchImport(module, repeat=repeat)['median']
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    command = [sys.executable, '-X', 'importtime', '-c', 'import %s' % (module)]
+    subprocess.check_output(command, cwd=here, env=env, stderr=subprocess.STDOUT)
+    times = []
+    for index in range(repeat):
+        output = subprocess.check_output(command, cwd=here, env=env, stderr=subprocess.STDOUT)
+        # import time: self [us] | cumulative | imported package
+        for line in output.decode('utf-8').splitlines():
+            fields = line.split('|')
+            if (len(fields) == 3 and fields[2].strip() == module):
+                times.append(int(fields[1]) / 1000000.0)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def CheckImport(module='core', budget=import_budget, repeat=5):
+    ''' returns a list of what's wrong with importing module: over budget (milliseconds), or loading
+        any of the gui modules. empty when it's fine '''
+    problems = []
+    elapsed = ImportTime(module, repeat) * 1000
+    if (elapsed > budget):
+        problems.append('importing %s took %.1f ms, over the %.1f ms budget' % (module, elapsed, budget))
+    script = 'import sys\nimport %s\nsys.stdout.write(" ".join(sorted(sys.modules)))\n' % (module)
+    loaded = subprocess.check_output([sys.executable, '-c', script], cwd=here).decode('utf-8').split()
+    for name in gui_modules:
+        if (name in loaded): problems.append('importing %s loaded %s' % (module, name))
+    return problems
+
+
+def NewEditor():
+    ''' builds a notebook with a fresh patch state and loopback midi manager behind it '''
+    # wx and the editor only load for the gui benchmarks, so --no-gui runs without wx
+    import wx
+    import editor
+    editor.patchState = core.PatchState()
+    editor.midiManager = core.MidiManager(midi_backends.LoopbackBackend())
+    editor.midiManager.SetChannel(core.default_remoteChannel)
+    frame = wx.Frame(None)
+    notebook = editor.Editor(frame)
+    return frame, notebook
+
+
+def BenchPartPages(repeat=5):
+    ''' times building PartSettings pages (InitGUI runs in the constructor) '''
+    import editor
+    frame, notebook = NewEditor()
+    results = {}
+    for count in (1, 4):
+        pages = []
+        def Build():
+            for part in range(1, count + 1):
+                pages.append(editor.PartSettings(notebook, part))
+        results['%d_part' % (count)] = Measure(Build, repeat)
+        for page in pages: page.Destroy()
+    frame.Destroy()
+    return results
+
+
+def BenchPartChange(repeat=5):
+    ''' times Editor.OnPartChange(4) on an editor that has only just been confirmed '''
+    times = []
+    for index in range(repeat):
+        frame, notebook = NewEditor()
+        # the state right after "Confirm Settings": layout page plus part 1
+        notebook.OnPartChange(0)
+        started = clock()
+        notebook.OnPartChange(4)
+        times.append(clock() - started)
+        frame.Destroy()
+    times.sort()
+    return {
+        'repeat': repeat,
+        'min':    times[0],
+        'median': times[len(times) // 2],
+        'mean':   sum(times) / len(times),
+        'max':    times[-1]}
+
+
+def BenchSendDefaults(repeat=5, rate=core.midi_bytes_per_second):
+    ''' times a full four part SendDefaults push through the queue onto a loopback wire '''
+    import editor
+    frame, notebook = NewEditor()
+    notebook.OnPartChange(0)
+    notebook.OnPartChange(4)
+    pages = [notebook.GetPage(index) for index in range(1, notebook.GetPageCount())]
+    manager = editor.midiManager
+    manager.EnableQueue()
+    manager.SetRate(rate)
+    output = manager.midi_output_device
+    def Push():
+        manager.ForgetSent()
+        manager.BeginBatch()
+        try:
+            for page in pages: page.SendDefaults()
+        finally:
+            manager.EndBatch()
+        manager.Drain()
+    output.Reset()
+    manager.ResetThroughput()
+    result = Measure(Push, repeat)
+    result['throughput'] = manager.GetThroughput()
+    result['wire'] = output.GetStats()
+    manager.DisableQueue()
+    frame.Destroy()
+    return result
+
+
+def BenchPatchSwitch(repeat=5, rate=core.midi_bytes_per_second):
+    ''' times switching between two patches a few parameters apart, as a full push and as a delta '''
+    import editor
+    frame, notebook = NewEditor()
+    notebook.OnPartChange(0)
+    notebook.OnPartChange(4)
+    state = editor.patchState
+    manager = editor.midiManager
+    manager.EnableQueue()
+    manager.SetRate(rate)
+    output = manager.midi_output_device
+    # two patches that differ in a tempo, an arp pattern and a transpose
+    first = state.Snapshot()
+    for part, name, steps in ((0, 'tempo', 5), (2, 'arpPattern', 3), (3, 'transpose', -2)):
+        state.Set(part, name, state.tables[state.offsets[(part, name)]].Step(state.Get(part, name), steps))
+    second = state.Snapshot()
+    state.Restore(first)
+    patches = [first, second]
+    def Full():
+        patches.reverse()
+        state.Restore(patches[0])
+        manager.SendMany(state.Pairs())
+        manager.Drain()
+    def Delta():
+        patches.reverse()
+        notebook.LoadPatch(patches[0])
+        manager.Drain()
+    results = {}
+    for name, switch in (('full', Full), ('delta', Delta)):
+        output.Reset()
+        results[name] = Measure(switch, repeat)
+        results[name]['wire'] = output.GetStats()
+    manager.DisableQueue()
+    frame.Destroy()
+    return results
+
+
+def BenchSetlist(size=8, repeat=5, rate=core.midi_bytes_per_second):
+    ''' times setlist recalls, from the call to the first byte reaching a loopback device.
+        for comparison, the same steps through Editor.LoadPatch(), which diffs at recall time '''
+    import editor
+    import random
+    import setlist
+    frame, notebook = NewEditor()
+    notebook.OnPartChange(0)
+    notebook.OnPartChange(4)
+    state = editor.patchState
+    manager = editor.midiManager
+    manager.EnableQueue()
+    manager.SetRate(rate)
+    # songs a few parameters apart
+    songs = setlist.Setlist(state, manager)
+    generator = random.Random(0)
+    snapshot = state.Snapshot()
+    for number in range(size):
+        for change in range(4):
+            offset = generator.randrange(len(snapshot))
+            snapshot[offset] = generator.randrange(len(state.tables[offset]))
+        songs.Add('song %d' % (number), bytearray(snapshot))
+    start = clock()
+    songs.Prepare()
+    results = {'prepare': clock() - start}
+    def Latency(recall, stream):
+        # a pause between songs, so the pacer has its burst back
+        time.sleep(0.05)
+        pressed = clock()
+        recall()
+        manager.Drain()
+        return stream().written - pressed
+    recalls = []
+    loads = []
+    for run in range(repeat):
+        for number in range(size):
+            recalls.append(Latency(lambda: songs.Recall(number), lambda: songs.history[-1][3]))
+    # LoadPatch() sends a plain list, so note when the device is first handed bytes instead
+    output = manager.midi_output_device
+    send_message = output.send_message
+    written = []
+    def Send(message):
+        send_message(message)
+        if (not written): written.append(clock())
+    output.send_message = Send
+    for run in range(repeat):
+        for number in range(size):
+            time.sleep(0.05)
+            del written[:]
+            pressed = clock()
+            notebook.LoadPatch(songs.entries[number].snapshot)
+            manager.Drain()
+            if (written): loads.append(written[0] - pressed)
+    for name, times in (('recall', recalls), ('load_patch', loads)):
+        times.sort()
+        results[name] = {
+            'min':    times[0],
+            'median': times[len(times) // 2],
+            'max':    times[-1]}
+    manager.DisableQueue()
+    frame.Destroy()
+    return results
+
+
+def BenchMorph(duration=1.0, rates=(250, 1000)):
+    ''' runs a morph of a few continuous and discrete parameters on two parts, returns its tick stats '''
+    import morph
+    state = core.PatchState()
+    manager = core.MidiManager(midi_backends.LoopbackBackend())
+    manager.SetChannel(core.default_remoteChannel)
+    manager.InitMIDI()
+    manager.EnableQueue()
+    manager.SetRate()
+    manager.EnableCoalescing()
+    source = state.Snapshot()
+    target = state.Snapshot()
+    for part in (1, 2):
+        for name in ('portamento', 'vibratoSpeed', 'fineTuning', 'arpGateLength', 'euclideanFill', 'oscillatorShape'):
+            offset = state.offsets[(part, name)]
+            target[offset] = len(state.tables[offset]) - 1
+    results = {}
+    for rate in rates:
+        glide = morph.Morph(state, manager, source, target, duration, rate)
+        glide.Start()
+        glide.thread.join()
+        results[str(rate)] = glide.GetStats()
+    manager.Drain()
+    results['coalescing'] = manager.GetCoalescingStats()
+    manager.DisableQueue()
+    return results
+
+
+def BenchAutomation(duration=3.0, tempo=133.0):
+    ''' loops a one second recording (a CC every 5 ms) for duration seconds at another tempo,
+        returns how late the sends were against their deadlines '''
+    import automation
+    manager = core.MidiManager(midi_backends.LoopbackBackend())
+    manager.SetChannel(core.default_remoteChannel)
+    manager.InitMIDI()
+    manager.EnableQueue()
+    recorder = automation.Recorder(120.0)
+    for step in range(200):
+        recorder.times.append(step * 0.005)
+        recorder.events.append((10 << 7) | (step % 128))
+    recorder.length = 1.0
+    player = automation.Player(manager, recorder, loop=True, tempo=tempo)
+    player.Start()
+    time.sleep(duration)
+    player.Stop()
+    manager.DisableQueue()
+    return player.GetStats()
+
+
+def BenchDeviceGroup(count=4, repeat=5, rate=core.midi_bytes_per_second):
+    ''' times a full patch push to count yarns on their own loopback ports, one port after another
+        through MidiManagers, and all at once through a DeviceGroup '''
+    pairs = core.PatchState().Pairs()
+    ports = ['Yarns %d' % (number + 1) for number in range(count)]
+    managers = []
+    for number, port in enumerate(ports):
+        manager = core.MidiManager(midi_backends.LoopbackBackend(port=port))
+        manager.InitMIDI()
+        manager.SetOutput(port)
+        manager.SetChannel(16 - number)
+        manager.SetRate(rate)
+        manager.OpenMIDI()
+        managers.append(manager)
+    def Sequential():
+        for manager in managers: manager.SendMany(pairs)
+    group = core.DeviceGroup(rate=rate)
+    for number, port in enumerate(ports):
+        group.Add(port, 16 - number, midi_backends.LoopbackBackend(port=port))
+    group.Open()
+    def Parallel():
+        group.SendMany(pairs)
+        group.Drain()
+    results = {'devices': count, 'sequential': Measure(Sequential, repeat), 'parallel': Measure(Parallel, repeat)}
+    results['devices_health'] = group.GetStats()
+    group.Close()
+    for manager in managers: manager.CloseMIDI()
+    return results
+
+
+def BenchLibrary(size=100000, repeat=5):
+    ''' times library searches over size randomized patches, in a temporary file '''
+    import random
+    import tempfile
+    import library
+    state = core.PatchState()
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    patches = library.Library(state, path)
+    # variants of the defaults with a few parameters randomized, a seventh of them tagged
+    generator = random.Random(0)
+    batch = []
+    start = clock()
+    for number in range(size):
+        snapshot = state.Snapshot()
+        for change in range(10):
+            offset = generator.randrange(len(snapshot))
+            snapshot[offset] = generator.randrange(len(state.tables[offset]))
+        batch.append(('patch %06d' % (generator.randrange(1000000)), snapshot, ['live'] if (number % 7 == 0) else []))
+    patches.AddMany(batch)
+    results = {'size': size, 'build': clock() - start, 'bytes': os.path.getsize(path), 'queries': {}}
+    for query in ('patch 05', 'layout=4T', 'arpDirection=Random', 'arpDirection=Random #live',
+                  'lowerNote=0', 'upperNote=120 lowerNote=0'):
+        prefix, where, tags = library.ParseQuery(query)
+        def Query():
+            count = patches.Count(prefix, where, tags)
+            patches.Search(prefix, where, tags, 3, count=count)
+        results['queries'][query] = Measure(Query, repeat)
+    patches.Close()
+    os.remove(path)
+    return results
+
+
+def RunAll(repeat=5, gui=True):
+    ''' runs every benchmark, returns the results as a dict '''
+    results = {
+        'python':    platform.python_version(),
+        'platform':  platform.platform(),
+        'firmware':  core.firmware,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'import_cc_values': BenchImport('cc_values', repeat=repeat),
+        'import_core':      BenchImport('core', repeat=repeat),
+        'import_cli':       BenchImport('cli', repeat=repeat),
+        'send_cc':          BenchSendCC(),
+        'morph':            BenchMorph(),
+        'automation':       BenchAutomation(),
+        'device_group':     BenchDeviceGroup(repeat=repeat),
+        'library':          BenchLibrary(repeat=repeat)}
+    if (gui):
+        # the pages need a running wx.App
+        import wx
+        app = wx.App(False)
+        results['import_images'] = BenchImport('images', preload=['wx', 'wx.lib.embeddedimage'], repeat=repeat)
+        results['import_editor'] = BenchImport('editor', preload=['wx'], repeat=repeat)
+        results['part_pages'] = BenchPartPages(repeat)
+        results['part_change_4'] = BenchPartChange(repeat)
+        results['send_defaults'] = BenchSendDefaults(repeat)
+        results['patch_switch'] = BenchPatchSwitch(repeat)
+        results['setlist'] = BenchSetlist(repeat=repeat)
+        app.Destroy()
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the Yarns Editor startup, pages and midi pushes.')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark')
+    parser.add_argument('--json', metavar='FILE', help='write the results to FILE instead of stdout')
+    parser.add_argument('--no-gui', action='store_true', help='skip the benchmarks that need wx')
+    parser.add_argument('--check-import', action='store_true',
+                        help='only check that importing core stays within budget without gui modules, '
+                             'exits 1 if it doesn\'t')
+    parser.add_argument('--budget', type=float, default=import_budget,
+                        help='the --check-import budget in milliseconds (default: %(default)s)')
+    args = parser.parse_args()
+
+    if (args.check_import):
+        problems = CheckImport(budget=args.budget, repeat=args.repeat)
+        for problem in problems: sys.stderr.write('%s\n' % (problem))
+        sys.exit(1 if (problems) else 0)
+
+    results = RunAll(args.repeat, gui=not args.no_gui)
+    if (args.json):
+        with open(args.json, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(results, indent=2, sort_keys=True))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+
+# imports
+import os
+import sys
+import mmap
+import struct
+
+# file layout, all little endian:
+#   header: magic, format version, number of entries
+#   index:  one (name, offset, length) entry per asset, offsets from the start of the file
+#   then the raw asset bytes, back to back
+magic = b'YEAB'
+version = 1
+header_format = '<4sHH'
+entry_format = '<16sII'
+
+# where the artwork and the bundle built from it live
+assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+layouts_path = os.path.join(assets_dir, 'layouts.bin')
+
+
+class AssetBundle():
+    ''' a read-only, memory-mapped asset bundle '''
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as bundle_file:
+            self.map = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        # parse the header and index. the asset bytes stay in the mapping until asked for
+        header_size = struct.calcsize(header_format)
+        entry_size = struct.calcsize(entry_format)
+        file_magic, file_version, count = struct.unpack_from(header_format, self.map, 0)
+        if (file_magic != magic or file_version != version):
+            raise ValueError('Incorrect asset bundle passed to AssetBundle(): %s' % (path))
+        self.index = {}
+        for number in range(count):
+            name, offset, length = struct.unpack_from(entry_format, self.map, header_size + number * entry_size)
+            if (offset + length > len(self.map)):
+                raise ValueError('Incorrect asset bundle passed to AssetBundle(): %s' % (path))
+            self.index[name.rstrip(b'\0').decode('ascii')] = (offset, length)
+
+    def Names(self):
+        ''' returns the names of the assets in the bundle '''
+        return sorted(self.index)
+
+    def GetData(self, name):
+        ''' returns the raw bytes of an asset '''
+        offset, length = self.index[name]
+        return self.map[offset:offset + length]
+
+    def Close(self):
+        ''' unmaps the bundle '''
+        self.map.close()
+
+
+def WriteBundle(path, assets):
+    ''' writes a list of (name, bytes) pairs out as an asset bundle '''
+    header_size = struct.calcsize(header_format)
+    entry_size = struct.calcsize(entry_format)
+    offset = header_size + len(assets) * entry_size
+    index = []
+    for name, data in assets:
+        name = name.encode('ascii')
+        if (len(name) > 16):
+            raise ValueError('Incorrect value passed to WriteBundle(): %s' % (name))
+        index.append(struct.pack(entry_format, name, offset, len(data)))
+        offset += len(data)
+    with open(path, 'wb') as bundle_file:
+        bundle_file.write(struct.pack(header_format, magic, version, len(assets)))
+        bundle_file.write(b''.join(index))
+        for name, data in assets:
+            bundle_file.write(data)
+
+
+def BuildLayouts(source=assets_dir, path=layouts_path):
+    ''' bundles every assets/layout_*.png, named by file name without the extension '''
+    import glob
+    assets = []
+    for png in sorted(glob.glob(os.path.join(source, 'layout_*.png'))):
+        with open(png, 'rb') as png_file:
+            assets.append((os.path.splitext(os.path.basename(png))[0], png_file.read()))
+    WriteBundle(path, assets)
+    return [name for name, data in assets]
+
+
+if __name__ == '__main__':
+    # the build step: run this after adding or changing layout artwork
+    names = BuildLayouts()
+    sys.stdout.write('wrote %d layouts to %s\n' % (len(names), layouts_path))
@@ -30,6 +30,9 @@ endorsed by Mutable Instruments. Their company website, and the license, can be
 found at the following address: http://mutable-instruments.net/
 '''
 
+# imports
+from array import array
+
 # cc map 
 controllers = {
     # global
@@ -722,7 +725,7 @@ vibrato_speed = {
     '67': 78, 
     '68': 80, 
     '69': 81,
-    '70': 70, 
+    '70': 82, 
     '71': 83, 
     '72': 84, 
     '73': 85, 
@@ -1340,3 +1343,90 @@ arp_gate_length = {
     '46': 120, 
     '47': 123, 
     '48': 126}
+
+
+class Table():
+    ''' a compact view of one of the label/cc value maps above, ordered by cc value '''
+    def __init__(self, values, settings=None):
+        items = sorted(values.items(), key=lambda item: (item[1], item[0]))
+        # labels and cc values share an index: labels[i] is sent as values[i]
+        self.labels = tuple(label for label, value in items)
+        self.values = array('B', [value for label, value in items])
+        self.label_index = dict((label, index) for index, label in enumerate(self.labels))
+        self.value_index = dict((value, index) for index, value in enumerate(self.values))
+        # index for every possible incoming cc value. the firmware scales a cc into one of
+        # its settings as value * settings >> 7, where settings is one per label unless the
+        # table leaves some out. a cc selects the label of its setting, or the last label
+        # below it when the table doesn't have that setting. built a run of values at a time,
+        # from the first cc value of each label's setting
+        if (settings == None): settings = len(self.values)
+        starts = [0] + [((value * settings >> 7) * 128 + settings - 1) // settings
+                        for value in self.values[1:]] + [128]
+        self.reverse = array('B')
+        for index in range(len(self.values)):
+            self.reverse.extend(array('B', [index]) * (starts[index + 1] - starts[index]))
+
+    def __len__(self):
+        ''' returns the number of labels '''
+        return len(self.labels)
+
+    def Index(self, label):
+        ''' returns the index of a label '''
+        return self.label_index[label]
+
+    def Value(self, label):
+        ''' returns the cc value sent for a label '''
+        return self.values[self.label_index[label]]
+
+    def Find(self, text):
+        ''' returns the label text is, or uniquely starts with (ignoring case), or None '''
+        if (text in self.label_index): return text
+        matches = [label for label in self.labels if (label.lower().startswith(text.lower()))]
+        return matches[0] if (len(matches) == 1) else None
+
+    def Label(self, value):
+        ''' returns the label an incoming cc value (0-127) selects '''
+        return self.labels[self.reverse[value]]
+
+    def Random(self):
+        ''' returns a random label '''
+        # random is only needed for randomizing, so it isn't loaded with the tables
+        import random
+        return self.labels[random.randrange(len(self.labels))]
+
+    def Step(self, label, steps):
+        ''' returns the label steps entries after (or before, if negative) label, stopping at the ends '''
+        index = min(max(self.label_index[label] + steps, 0), len(self.labels) - 1)
+        return self.labels[index]
+
+
+# every value map above as a Table, by name. channel leaves out the firmware's 17th
+# setting (omni), and tempo only has some of the bpms, so each cc value is its own setting
+tables = {
+    'layout':             Table(layout),
+    'tempo':              Table(tempo, 128),
+    'swing':              Table(swing),
+    'portamento':         Table(portamento),
+    'channel':            Table(channel, 17),
+    'note':               Table(note),
+    'tuning_root':        Table(tuning_root),
+    'boolean':            Table(boolean),
+    'vibrato_speed':      Table(vibrato_speed),
+    'oscillator':         Table(oscillator),
+    'midi_output':        Table(midi_output),
+    'note_priority':      Table(note_priority),
+    'voicing':            Table(voicing),
+    'arp_direction':      Table(arp_direction),
+    'arp_clock_division': Table(arp_clock_division),
+    'tuning_system':      Table(tuning_system),
+    'trigger_shape':      Table(trigger_shape),
+    'aux_cv':             Table(aux_cv),
+    'pitch_bend':         Table(pitch_bend),
+    'vibrato_range':      Table(vibrato_range),
+    'transpose':          Table(transpose),
+    'fine_tuning':        Table(fine_tuning),
+    'euclidean':          Table(euclidean),
+    'trigger_duration':   Table(trigger_duration),
+    'arp_range':          Table(arp_range),
+    'arp_pattern':        Table(arp_pattern),
+    'arp_gate_length':    Table(arp_gate_length)}
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+
+# imports
+import sys
+import argparse
+import core
+import patch
+import midi_backends
+
+# which parameters live on part 0, and which on every part
+global_names = [name for name, table, default in core.global_parameters]
+part_names = [name for name, table, default in core.part_parameters]
+
+
+def ParseSetting(state, part, text):
+    ''' returns the (part, name, label) of a name=value setting. globals ignore part '''
+    if ('=' not in text):
+        raise ValueError('Incorrect setting passed to ParseSetting(): %s' % (text))
+    name, value = text.split('=', 1)
+    if (name in global_names): part = 0
+    elif (name not in part_names):
+        raise ValueError('Incorrect parameter passed to ParseSetting(): %s' % (name))
+    label = state.tables[state.offsets[(part, name)]].Find(value)
+    if (label == None):
+        raise ValueError('Incorrect value passed to ParseSetting(): %s=%s' % (name, value))
+    return (part, name, label)
+
+
+def Randomize(state, part, names):
+    ''' returns random (part, name, label) edits for names, where 'all' is every part parameter '''
+    edits = []
+    for name in names:
+        if (name == 'all'):
+            edits.extend(Randomize(state, part, part_names))
+            continue
+        if (name in global_names): key = (0, name)
+        elif (name in part_names): key = (part, name)
+        else:
+            raise ValueError('Incorrect parameter passed to Randomize(): %s' % (name))
+        edits.append(key + (state.tables[state.offsets[key]].Random(),))
+    return edits
+
+
+def SendGroup(devices, pairs, loopback=False):
+    ''' sends pairs to every PORT:CHANNEL in devices at once. returns the stats of those that failed '''
+    group = core.DeviceGroup()
+    for text in devices:
+        if (':' not in text):
+            raise ValueError('Incorrect value passed to --device: %s' % (text))
+        port, channel = text.rsplit(':', 1)
+        group.Add(port, channel, midi_backends.LoopbackBackend(port=port) if (loopback) else None)
+    group.Open()
+    try:
+        group.SendMany(pairs)
+        group.Drain()
+    finally:
+        group.Close()
+    return [stats for stats in group.GetStats() if (not stats['healthy'])]
+
+
+def Main(argv):
+    ''' the command line: apply a patch, set and randomize parameters, then exit '''
+    parser = argparse.ArgumentParser(
+        description='Sends parameters to Yarns without the editor window, '
+                    'e.g. --part 2 --set arpDirection=Random --randomize euclideanFill')
+    parser.add_argument('--list', action='store_true', help='list the midi output ports and exit')
+    parser.add_argument('--port', help='midi output port (default: the first one)')
+    parser.add_argument('--channel', type=int, default=int(core.default_remoteChannel),
+                        help='the remote control channel set on yarns (default: %(default)s)')
+    parser.add_argument('--device', action='append', default=[], metavar='PORT:CHANNEL',
+                        help='send to the yarns on this port and rc channel instead, can be repeated. '
+                             'the ports are written in parallel')
+    parser.add_argument('--loopback', action='store_true', help='send to an in-process loopback port')
+    parser.add_argument('--patch', help='a .yarns patch or .json export to send in full')
+    parser.add_argument('--part', type=int, default=1, help='the part --set and --randomize change (default: 1)')
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help='set a parameter to a value, or a unique start of one, can be repeated')
+    parser.add_argument('--randomize', action='append', default=[], metavar='NAME',
+                        help="randomize a parameter, or 'all' part parameters, can be repeated")
+    parser.add_argument('--dry-run', action='store_true', help='print what would be sent, and send nothing')
+    args = parser.parse_args(argv)
+
+    state = core.PatchState()
+    manager = core.MidiManager(midi_backends.LoopbackBackend() if (args.loopback) else None)
+    try:
+        if (args.list):
+            manager.InitMIDI()
+            for port in manager.ListMIDI('output'): sys.stdout.write('%s\n' % (port))
+            return 0
+        if (args.part < 1 or args.part > state.parts):
+            raise ValueError('Incorrect value passed to --part: %d' % (args.part))
+        # a patch is sent whole, since there's no telling what yarns holds now
+        offsets = set()
+        if (args.patch):
+            state.data[:] = patch.Load(args.patch, state)
+            offsets.update(range(len(state.data)))
+        edits = [ParseSetting(state, args.part, text) for text in args.set]
+        edits.extend(Randomize(state, args.part, args.randomize))
+        for part, name, label in edits:
+            state.Set(part, name, label)
+            offsets.add(state.offsets[(part, name)])
+        pairs, edits = state.Delta(state.data, state.Order(offsets))
+        if (args.dry_run):
+            for (part, name, label), (controller, value) in zip(edits, pairs):
+                sys.stdout.write('part %d %-16s %-24s cc %3d = %3d\n' % (part, name, label, controller, value))
+            return 0
+        if (args.device):
+            failed = SendGroup(args.device, pairs, args.loopback)
+            for stats in failed:
+                sys.stderr.write('%s:%d failed: %s\n' % (stats['port'], stats['channel'], stats['last_error']))
+            return 1 if (failed) else 0
+        manager.InitMIDI()
+        ports = manager.ListMIDI('output')
+        if (not ports):
+            raise ValueError('No midi output ports')
+        if (args.port == None): manager.SetOutput(ports[0])
+        elif (args.port in ports): manager.SetOutput(args.port)
+        else:
+            raise ValueError('Incorrect value passed to --port: %s' % (args.port))
+        manager.SetChannel(args.channel)
+        # the same pacing as the editor, so yarns keeps up
+        manager.SetRate(core.midi_bytes_per_second)
+        manager.OpenMIDI()
+        try:
+            manager.SendMany(pairs)
+        finally:
+            manager.CloseMIDI()
+    except (ValueError, IOError) as error:
+        sys.stderr.write('%s\n' % (error))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(Main(sys.argv[1:]))
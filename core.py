@@ -0,0 +1,1095 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import threading
+import time
+from timeit import default_timer as clock
+import cc_values
+import midi_backends
+
+# the editor only supports this firmware version
+firmware = str(1.02)
+
+# i gave that script some variables. scripts love variables
+default_tempo = '120'
+default_swing = '0'
+default_layout = '1M - Monophonic'
+default_midiChannel = '1'
+default_remoteChannel = '16'
+default_lowerNote = '0 - C_0'
+default_upperNote = '127 - G_10'
+default_swing = '0'
+default_legato = 'Off'
+default_portamento = '0'
+default_pitchBendRange = '2'
+default_vibratoRange = '1'
+default_fineTuning = '0'
+default_oscillator = 'Off'
+default_priority = 'Last'
+default_voicing = 'Poly'
+default_mode = 'Off'
+default_vibrato = '50'
+default_triggerDuration = '2'
+default_transpose = '0'
+default_arpRange = '0'
+default_arpDirection = 'Up'
+default_arpClockDiv = '/16'
+default_arpGateLength = '3'
+default_arpPattern = '1'
+default_eucLength = '0'
+default_eucFill = '0'
+default_eucRotate = '0'
+default_tuningSystem = 'Equal temperament'
+default_tuningRoot = 'C'
+default_velocityScale = 'Off'
+default_triggerShape = 'Square'
+default_auxCV = 'Aftertouch CC#2'
+default_vibratoSpeed = '50'
+
+# every part parameter as (name in cc_values.controllers, cc_values table name, default),
+# in the order they are sent when a part is reset
+part_parameters = [
+    ('vibratoRange',    'vibrato_range',      default_vibratoRange),
+    ('vibratoSpeed',    'vibrato_speed',      default_vibratoSpeed),
+    ('pitchBendRange',  'pitch_bend',         default_pitchBendRange),
+    ('transpose',       'transpose',          default_transpose),
+    ('fineTuning',      'fine_tuning',        default_fineTuning),
+    ('triggerDuration', 'trigger_duration',   default_triggerDuration),
+    ('arpRange',        'arp_range',          default_arpRange),
+    ('arpPattern',      'arp_pattern',        default_arpPattern),
+    ('arpGateLength',   'arp_gate_length',    default_arpGateLength),
+    ('euclideanLength', 'euclidean',          default_eucLength),
+    ('euclideanFill',   'euclidean',          default_eucFill),
+    ('euclideanRotate', 'euclidean',          default_eucRotate),
+    ('portamento',      'portamento',         default_portamento),
+    ('midiChannel',     'channel',            default_midiChannel),
+    ('lowerNote',       'note',               default_lowerNote),
+    ('upperNote',       'note',               default_upperNote),
+    ('midiOutMode',     'midi_output',        default_mode),
+    ('voicing',         'voicing',            default_voicing),
+    ('notePriority',    'note_priority',      default_priority),
+    ('legato',          'boolean',            default_legato),
+    ('tuningRoot',      'tuning_root',        default_tuningRoot),
+    ('tuningSystem',    'tuning_system',      default_tuningSystem),
+    ('velocityScale',   'boolean',            default_velocityScale),
+    ('triggerShape',    'trigger_shape',      default_triggerShape),
+    ('auxCVout',        'aux_cv',             default_auxCV),
+    ('oscillatorShape', 'oscillator',         default_oscillator),
+    ('arpClockDiv',     'arp_clock_division', default_arpClockDiv),
+    ('arpDirection',    'arp_direction',      default_arpDirection)]
+
+# the global parameters, sent on the layout page as (name in cc_values.controllers, table name, default)
+global_parameters = [
+    ('layout',          'layout',             default_layout),
+    ('tempo',           'tempo',              default_tempo),
+    ('swing',           'swing',              default_swing)]
+
+# what a patch change has to send first. the layout decides which parts exist, then the
+# channels and note ranges decide which part hears what. everything else comes after
+sync_order = {'layout': 0, 'midiChannel': 1, 'lowerNote': 2, 'upperNote': 2}
+
+# control change status bytes, indexed by midi channel - 1
+cc_status = tuple(range(0xB0, 0xC0))
+
+# DIN MIDI runs at 31250 baud, and every byte takes 10 bits on the wire
+midi_bytes_per_second = 31250 / 10
+
+
+class MidiSendQueue():
+    ''' a bounded ring buffer of midi messages, drained by a writer thread '''
+    def __init__(self, write, size=512, overflow='block', discard=None):
+        if (overflow not in ('block', 'drop')):
+            raise ValueError('Incorrect value passed to MidiSendQueue()')
+        # callable that puts a single message on the wire
+        self.write = write
+        # optional callable told about messages that will never be written
+        self.discard = discard
+        # what Put() does when the buffer is full: wait for room, or drop the oldest message
+        self.overflow = overflow
+        # the ring buffer itself
+        self.size = size
+        self.buffer = [None] * size
+        self.head = 0
+        self.count = 0
+        # the writer thread sleeps on this until there is something to send
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.busy = False
+        # back-pressure stats
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.errors = 0
+        self.stalls = 0
+        self.stall_time = 0.0
+        self.high_water = 0
+
+    def Start(self):
+        ''' starts the writer thread '''
+        with self.condition:
+            if (self.running): return
+            self.running = True
+        self.thread = threading.Thread(target=self._Run, name='MidiSendQueue')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def Stop(self, timeout=None):
+        ''' sends whatever is pending, then stops the writer thread '''
+        self.Drain(timeout)
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if (self.thread): self.thread.join(timeout)
+        self.thread = None
+
+    def Put(self, message):
+        ''' adds a message to the buffer. returns False if it had to be dropped '''
+        with self.condition:
+            if (self.count == self.size):
+                if (self.overflow == 'drop'):
+                    # the oldest message makes room for the newest
+                    oldest = self.buffer[self.head]
+                    self.head = (self.head + 1) % self.size
+                    self.count -= 1
+                    self.dropped += 1
+                    if (self.discard): self.discard(oldest)
+                else:
+                    # block the caller until the writer catches up
+                    self.stalls += 1
+                    started = time.time()
+                    while (self.count == self.size and self.running):
+                        self.condition.wait()
+                    self.stall_time += time.time() - started
+                    if (self.count == self.size):
+                        self.dropped += 1
+                        if (self.discard): self.discard(message)
+                        return False
+            self.buffer[(self.head + self.count) % self.size] = message
+            self.count += 1
+            self.enqueued += 1
+            if (self.count > self.high_water): self.high_water = self.count
+            self.condition.notify_all()
+        return True
+
+    def Flush(self):
+        ''' discards all pending messages. returns how many were thrown away '''
+        with self.condition:
+            discarded = self.count
+            if (self.discard):
+                for index in range(self.count):
+                    self.discard(self.buffer[(self.head + index) % self.size])
+            self.buffer = [None] * self.size
+            self.head = 0
+            self.count = 0
+            self.flushed += discarded
+            self.condition.notify_all()
+        return discarded
+
+    def Drain(self, timeout=None):
+        ''' waits until every pending message has been written. returns False on timeout '''
+        deadline = None if (timeout == None) else time.time() + timeout
+        with self.condition:
+            while ((self.count or self.busy) and self.running):
+                if (deadline == None):
+                    self.condition.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if (remaining <= 0): return False
+                    self.condition.wait(remaining)
+            return (self.count == 0 and not self.busy)
+
+    def GetStats(self):
+        ''' returns a snapshot of the queue counters '''
+        with self.condition:
+            return {
+                'size':       self.size,
+                'pending':    self.count,
+                'high_water': self.high_water,
+                'enqueued':   self.enqueued,
+                'sent':       self.sent,
+                'dropped':    self.dropped,
+                'flushed':    self.flushed,
+                'errors':     self.errors,
+                'stalls':     self.stalls,
+                'stall_time': self.stall_time}
+
+    def _Run(self):
+        ''' the writer thread: pops messages off the buffer and writes them '''
+        while True:
+            with self.condition:
+                while (self.count == 0 and self.running):
+                    self.condition.wait()
+                if (self.count == 0): return # stopped and empty
+                message = self.buffer[self.head]
+                self.buffer[self.head] = None
+                self.head = (self.head + 1) % self.size
+                self.count -= 1
+                self.busy = True
+                # wake up anyone blocked in Put()
+                self.condition.notify_all()
+            try:
+                self.write(message)
+            except Exception:
+                # a flaky driver shouldn't kill the writer
+                with self.condition: self.errors += 1
+            else:
+                with self.condition: self.sent += 1
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+
+class MidiPacer():
+    ''' a token bucket that keeps outgoing midi under a bytes-per-second budget '''
+    def __init__(self, rate=midi_bytes_per_second, burst=24):
+        # bytes per second, or None to send as fast as the driver takes them
+        self.rate = rate
+        # how many bytes may go out back-to-back before pacing kicks in
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled = clock()
+        self.lock = threading.Lock()
+        self.Reset()
+
+    def SetRate(self, rate, burst=None):
+        ''' changes the budget. None disables pacing but keeps the meter running '''
+        with self.lock:
+            self.rate = rate
+            if (burst != None): self.burst = burst
+            self.tokens = float(self.burst)
+            self.refilled = clock()
+
+    def Reset(self):
+        ''' clears the throughput counters '''
+        with self.lock:
+            self.bytes = 0
+            self.messages = 0
+            self.waited = 0.0
+            self.first = None
+            self.last = None
+
+    def Wait(self, size):
+        ''' blocks until size bytes fit in the budget, then charges them '''
+        if (self.rate == None):
+            # unpaced: only the meter runs, and a count off by one now and then isn't worth a lock
+            now = clock()
+            if (self.first == None): self.first = now
+            self.last = now
+            self.bytes += size
+            self.messages += 1
+            return
+        with self.lock:
+            if (self.rate):
+                now = clock()
+                self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+                self.refilled = now
+                # go into debt for the message, and sleep off whatever we owe
+                self.tokens -= size
+                delay = -self.tokens / self.rate if (self.tokens < 0) else 0.0
+            else:
+                delay = 0.0
+        if (delay > 0):
+            time.sleep(delay)
+        with self.lock:
+            now = clock()
+            if (self.first == None): self.first = now
+            self.last = now
+            self.bytes += size
+            self.messages += 1
+            self.waited += delay
+
+    def GetThroughput(self):
+        ''' returns what actually went out since the last reset '''
+        with self.lock:
+            elapsed = (self.last - self.first) if (self.first != None) else 0.0
+            return {
+                'budget':              self.rate,
+                'bytes':               self.bytes,
+                'messages':            self.messages,
+                'elapsed':             elapsed,
+                'waited':              self.waited,
+                'bytes_per_second':    (self.bytes / elapsed) if (elapsed > 0) else 0.0,
+                'messages_per_second': (self.messages / elapsed) if (elapsed > 0) else 0.0}
+
+
+class MidiListener():
+    ''' decodes CCs arriving on the RC channel, and hands them on in batches at a capped rate '''
+    def __init__(self, manager, deliver, fps=30):
+        # the manager knows the RC channel, and wants to hear what yarns already has
+        self.manager = manager
+        # called from the listener thread with a list of (part, parameter, label). part 0 is global
+        self.deliver = deliver
+        # at most this many batches a second
+        self.interval = 1.0 / fps
+        # controller -> (part, parameter, cc_values table)
+        self.decode = {}
+        part_tables = dict((name, table) for name, table, default in part_parameters)
+        for key, controller in cc_values.controllers.items():
+            prefix, parameter = key.split('_', 1)
+            if (prefix == 'yarns'): self.decode[controller] = (0, parameter, cc_values.tables[parameter])
+            else: self.decode[controller] = (int(prefix[4:]), parameter, cc_values.tables[part_tables[parameter]])
+        # (part, parameter) -> newest label, waiting for the next batch
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        # counters
+        self.received = 0
+        self.ignored = 0
+        self.batches = 0
+
+    def Start(self):
+        ''' starts the listener thread '''
+        with self.condition:
+            if (self.running): return
+            self.running = True
+        self.thread = threading.Thread(target=self._Run, name='MidiListener')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def Stop(self, timeout=None):
+        ''' stops the listener thread, dropping anything not yet delivered '''
+        with self.condition:
+            self.running = False
+            self.pending.clear()
+            self.condition.notify_all()
+        if (self.thread): self.thread.join(timeout)
+        self.thread = None
+
+    def OnMessage(self, message, delta):
+        ''' the midi input callback. runs on the midi driver's thread, so it only decodes '''
+        self.received += 1
+        if (len(message) != 3 or message[0] != self.manager.status_byte):
+            self.ignored += 1
+            return
+        decoded = self.decode.get(message[1])
+        if (decoded == None):
+            self.ignored += 1
+            return
+        part, parameter, table = decoded
+        self.manager._Received(message[1], message[2])
+        if (self.manager.recorder != None): self.manager.recorder.Record(message[1], message[2], received=True)
+        with self.condition:
+            # only the newest value per parameter survives until the next batch
+            self.pending[(part, parameter)] = table.Label(message[2])
+            self.condition.notify_all()
+
+    def GetStats(self):
+        ''' returns the listener counters '''
+        with self.condition:
+            return {
+                'received': self.received,
+                'ignored':  self.ignored,
+                'batches':  self.batches,
+                'pending':  len(self.pending)}
+
+    def _Run(self):
+        ''' the listener thread: waits for edits, then delivers them no faster than fps '''
+        next_batch = 0.0
+        while True:
+            with self.condition:
+                while (not self.pending and self.running):
+                    self.condition.wait()
+                if (not self.running): return
+            # let edits pile up until the next frame is due
+            delay = next_batch - clock()
+            if (delay > 0): time.sleep(delay)
+            with self.condition:
+                # globals first, so a layout change happens before its parts are touched
+                batch = sorted((part, parameter, label) for (part, parameter), label in self.pending.items())
+                self.pending.clear()
+                self.batches += 1
+            next_batch = clock() + self.interval
+            if (batch): self.deliver(batch)
+
+
+class MidiStream(list):
+    ''' a prebuilt [status, controller, value, ...] stream that notes when it reached the device '''
+    def __init__(self, stream):
+        list.__init__(self, stream)
+        # clock() when it was handed to SendStream(), and when its first bytes reached the device
+        self.queued = None
+        self.written = None
+
+
+class MidiManager():
+    ''' handles midi events '''
+    def __init__(self, backend=None):
+        # where the midi ports come from, real hardware unless told otherwise
+        self.backend = backend if (backend) else midi_backends.RtMidiBackend()
+        self.midi_channel = None
+        self.status_byte = None
+        # reused for every unqueued message
+        self.message = [0xB0, 0, 0]
+        self.midi_input_device = None
+        self.midi_output_device = None
+        self.midi_input_port = None
+        self.midi_output_port = None
+        self.send_queue = None
+        self.pacer = MidiPacer(rate=None)
+        # coalescing: the queued message (and value index) and last sent value per (status, controller)
+        self.coalescing = False
+        self.coalesce_lock = threading.Lock()
+        self.pending = {}
+        self.confirmed = {}
+        self.coalesced = 0
+        self.skipped = 0
+        # turns incoming CCs into edits, once started
+        self.listener = None
+        # logs every CC sent and heard, when set
+        self.recorder = None
+        # CCs collected between BeginBatch() and EndBatch(), per thread, so a morph or playback
+        # thread never ends up in a batch the gui opened (or the other way round)
+        self.batching = threading.local()
+        self.batch_lock = threading.Lock()
+        self.open_batches = 0
+        # whether SendCC can go straight to the device, see _UpdatePath(), and how many it sent that way
+        self.direct = False
+        self.direct_sent = 0
+
+    def InitMIDI(self):
+        ''' initializes midi '''
+        self.midi_input_device = self.backend.CreateInput()
+        self.midi_output_device = self.backend.CreateOutput()
+
+    def ListMIDI(self, portDirection):
+        ''' returns a list of available midi devices '''
+        if (portDirection == 'input'):
+            midiDevices = self.midi_input_device.ports
+        elif (portDirection == 'output'):
+            midiDevices = self.midi_output_device.ports
+        else:
+            raise ValueError('Incorrect value passed to MidiManager.ListMIDI()')
+        return midiDevices
+
+    def SetInput(self, deviceName):
+        ''' sets the midi input port to use '''
+        self.midi_input_port = deviceName
+
+    def SetOutput(self, deviceName):
+        ''' sets the midi output port to use '''
+        self.midi_output_port = deviceName
+
+    def SetChannel(self, channel):
+        ''' sets the midi channel to use '''
+        channel = int(channel)
+        if (channel < 1 or channel > 16):
+            raise ValueError('Incorrect value passed to MidiManager.SetChannel()')
+        self.midi_channel = channel
+        # work out the status byte once, instead of on every message
+        self.status_byte = cc_status[channel - 1]
+        self.message[0] = self.status_byte
+        self._UpdatePath()
+
+    def OpenMIDI(self):
+        ''' looks up the ports by the index, and opens them '''
+        if (self.midi_input_port): # midi input device is optional
+            self.midi_input_device.open_port(
+                self.midi_input_device.ports.index(self.midi_input_port))
+            if (self.listener): self.midi_input_device.callback = self.listener.OnMessage
+        self.midi_output_device.open_port(
+            self.midi_output_device.ports.index(self.midi_output_port))
+
+    def CloseMIDI(self):
+        ''' looks up the open ports by the index, and closes them '''
+        # let queued messages reach the port before it goes away
+        if (self.send_queue): self.send_queue.Drain(1.0)
+        if (self.midi_input_port): self.midi_input_device.close_port()
+        if (self.midi_output_port): self.midi_output_device.close_port()
+
+    def SetRecorder(self, recorder=None):
+        ''' logs every CC sent (and heard, once listening) to an automation.Recorder. None stops logging '''
+        self.recorder = recorder
+        self._UpdatePath()
+
+    def StartListener(self, deliver, fps=30):
+        ''' starts passing edits made on yarns to deliver(), in batches of (part, parameter, label) '''
+        if (self.listener): return
+        self.listener = MidiListener(self, deliver, fps)
+        self.listener.Start()
+        if (self.midi_input_device and self.midi_input_port):
+            self.midi_input_device.callback = self.listener.OnMessage
+
+    def StopListener(self):
+        ''' stops listening to the midi input '''
+        if (self.listener == None): return
+        if (self.midi_input_device): self.midi_input_device.callback = None
+        self.listener.Stop(1.0)
+        self.listener = None
+
+    def EnableQueue(self, size=512, overflow='block'):
+        ''' sends CC messages from a writer thread instead of the calling thread '''
+        if (self.send_queue): return
+        self.send_queue = MidiSendQueue(self._Write, size, overflow, self._Discard)
+        self.send_queue.Start()
+        self._UpdatePath()
+
+    def DisableQueue(self, timeout=None):
+        ''' sends whatever is pending, then goes back to sending directly '''
+        if (self.send_queue == None): return
+        self.send_queue.Stop(timeout)
+        self.send_queue = None
+        self._UpdatePath()
+
+    def Flush(self):
+        ''' discards any queued messages that haven't been sent yet '''
+        if (self.send_queue == None): return 0
+        return self.send_queue.Flush()
+
+    def Drain(self, timeout=None):
+        ''' blocks until every queued message has been sent '''
+        if (self.send_queue == None): return True
+        return self.send_queue.Drain(timeout)
+
+    def GetQueueStats(self):
+        ''' returns the send queue counters, or None when not queued '''
+        if (self.send_queue == None): return None
+        return self.send_queue.GetStats()
+
+    def SetRate(self, rate=midi_bytes_per_second, burst=None):
+        ''' paces outgoing messages to rate bytes per second (None for unpaced) '''
+        self.pacer.SetRate(rate, burst)
+        self._UpdatePath()
+
+    def GetThroughput(self):
+        ''' returns the achieved output rate since the last ResetThroughput(). CCs SendCC sent
+            straight to the device count towards the bytes and messages, but aren't timed '''
+        throughput = self.pacer.GetThroughput()
+        throughput['bytes'] += 3 * self.direct_sent
+        throughput['messages'] += self.direct_sent
+        return throughput
+
+    def ResetThroughput(self):
+        ''' starts a new throughput measurement '''
+        self.pacer.Reset()
+        self.direct_sent = 0
+
+    def EnableCoalescing(self, enabled=True):
+        ''' drops redundant CCs: stale queued values and repeats of the last sent value '''
+        with self.coalesce_lock:
+            self.coalescing = enabled
+            if (not enabled): self.confirmed.clear()
+        self._UpdatePath()
+
+    def ForgetSent(self):
+        ''' forgets what was last sent, so the next value for every controller goes out '''
+        with self.coalesce_lock:
+            self.confirmed.clear()
+
+    def GetCoalescingStats(self):
+        ''' returns how many CCs were merged into a queued one, or skipped as repeats '''
+        with self.coalesce_lock:
+            return {
+                'pending':   len(self.pending),
+                'coalesced': self.coalesced,
+                'skipped':   self.skipped}
+
+    def BeginBatch(self):
+        ''' collects CCs from SendCC until EndBatch(), then sends them with one SendMany() '''
+        batching = self.batching
+        if (getattr(batching, 'depth', 0) == 0):
+            batching.pairs = []
+            batching.depth = 0
+            with self.batch_lock: self.open_batches += 1
+            self._UpdatePath()
+        batching.depth += 1
+
+    def EndBatch(self):
+        ''' sends everything collected since the outermost BeginBatch() '''
+        batching = self.batching
+        batching.depth -= 1
+        if (batching.depth == 0):
+            pairs = batching.pairs
+            batching.pairs = None
+            with self.batch_lock: self.open_batches -= 1
+            self._UpdatePath()
+            self.SendMany(pairs)
+
+    def _UpdatePath(self):
+        ''' works out whether SendCC can skip batching, logging, coalescing, the queue and the pacer '''
+        self.direct = (self.status_byte != None and self.open_batches == 0 and self.recorder == None and
+                       not self.coalescing and self.send_queue == None and self.pacer.rate == None)
+
+    def SendMany(self, pairs):
+        ''' sends a list of (controller, value) pairs as one running status stream '''
+        batch = getattr(self.batching, 'pairs', None)
+        if (batch != None):
+            batch.extend(pairs)
+            return
+        status = self.status_byte
+        if (status == None):
+            raise ValueError('Incorrect value passed to MidiManager.SendMany()')
+        stream = [status]
+        coalescing = self.coalescing
+        if (coalescing): self.coalesce_lock.acquire()
+        try:
+            for controller, value in pairs:
+                # anything outside 0-127 has bits above the 7th set (or is negative)
+                if ((controller | value) >> 7):
+                    raise ValueError('Incorrect value passed to MidiManager.SendMany()')
+                if (coalescing):
+                    key = (status, controller)
+                    queued = self.pending.get(key)
+                    if (queued):
+                        # already waiting to go out, possibly earlier in this very stream
+                        queued[0][queued[1]] = value
+                        self.coalesced += 1
+                        continue
+                    if (self.confirmed.get(key) == value):
+                        self.skipped += 1
+                        continue
+                    self.pending[key] = (stream, len(stream) + 1)
+                stream.append(controller)
+                stream.append(value)
+        except:
+            # nothing from a rejected stream gets sent
+            if (coalescing):
+                for index in range(1, len(stream), 2):
+                    key = (status, stream[index])
+                    if (self.pending.get(key, (None,))[0] is stream): del self.pending[key]
+            raise
+        finally:
+            if (coalescing): self.coalesce_lock.release()
+        if (self.recorder != None):
+            for controller, value in pairs: self.recorder.Record(controller, value)
+        if (len(stream) == 1): return
+        if (self.send_queue): self.send_queue.Put(stream)
+        else: self._Write(stream)
+
+    def SendStream(self, stream):
+        ''' sends a prebuilt [status, controller, value, ...] stream as it is. returns it as a MidiStream,
+            which has the time its first bytes were written once the writer gets to it '''
+        stream = MidiStream(stream)
+        stream.queued = clock()
+        batch = getattr(self.batching, 'pairs', None)
+        if (batch != None):
+            batch.extend(zip(stream[1::2], stream[2::2]))
+            return stream
+        if (self.coalescing):
+            with self.coalesce_lock:
+                # later CCs for these controllers mustn't be folded into messages queued before this one
+                for index in range(1, len(stream), 2):
+                    self.pending.pop((stream[0], stream[index]), None)
+        if (self.recorder != None):
+            for index in range(1, len(stream), 2): self.recorder.Record(stream[index], stream[index + 1])
+        if (self.send_queue): self.send_queue.Put(stream)
+        else: self._Write(stream)
+        return stream
+
+    def _Received(self, controller, value):
+        ''' called by the listener: yarns has this value now, so there's no need to send it '''
+        if (self.coalescing):
+            with self.coalesce_lock:
+                self.confirmed[(self.status_byte, controller)] = value
+
+    def _Discard(self, message):
+        ''' called by the send queue for messages that will never be written '''
+        with self.coalesce_lock:
+            for index in range(1, len(message), 2):
+                key = (message[0], message[index])
+                if (self.pending.get(key, (None,))[0] is message): del self.pending[key]
+
+    def _Write(self, message):
+        ''' puts a status byte followed by controller/value pairs on the wire. returns the number of bytes
+            handed to the device, status bytes included, which is what the pacer charged for them '''
+        status = message[0]
+        stream = message if (type(message) is MidiStream) else None
+        coalescing = self.coalescing
+        if (coalescing):
+            with self.coalesce_lock:
+                # from here on, new values for these controllers need a new message
+                for index in range(1, len(message), 2):
+                    key = (status, message[index])
+                    if (self.pending.get(key, (None,))[0] is message): del self.pending[key]
+                    self.confirmed[key] = message[index + 1]
+                message = list(message)
+        device = self.midi_output_device
+        written = 0
+        try:
+            if (len(message) == 3):
+                self.pacer.Wait(3)
+                device.send_message(message)
+                written = 3
+                if (stream): stream.written = clock()
+            elif (getattr(device, 'running_status', False)):
+                # the backend takes raw byte streams, so the status byte is sent once per chunk
+                step = 2 * max(1, (self.pacer.burst - 1) // 2) if (self.pacer.rate) else len(message)
+                for index in range(1, len(message), step):
+                    chunk = [status] + message[index:index + step]
+                    self.pacer.Wait(len(chunk))
+                    device.send_message(chunk)
+                    written += len(chunk)
+                    if (stream and stream.written == None): stream.written = clock()
+            else:
+                for index in range(1, len(message), 2):
+                    self.pacer.Wait(3)
+                    device.send_message([status, message[index], message[index + 1]])
+                    written += 3
+                    if (stream and stream.written == None): stream.written = clock()
+        except Exception:
+            # the device may not have it, so don't skip it next time
+            if (coalescing):
+                with self.coalesce_lock:
+                    for index in range(1, len(message), 2):
+                        self.confirmed.pop((status, message[index]), None)
+            raise
+        return written
+
+    def SendCC(self, controller, value):
+        ''' sends data the the MIDI output '''
+        if (self.direct):
+            message = self.message
+            message[1] = controller
+            message[2] = value
+            self.midi_output_device.send_message(message)
+            self.direct_sent += 1
+            return
+        batch = getattr(self.batching, 'pairs', None)
+        if (batch != None):
+            batch.append((controller, value))
+            return
+        status = self.status_byte
+        if (status == None):
+            raise ValueError('Incorrect value passed to MidiManager.SendCC()')
+        if (self.recorder != None): self.recorder.Record(controller, value)
+        if (self.coalescing):
+            key = (status, controller)
+            with self.coalesce_lock:
+                queued = self.pending.get(key)
+                if (queued):
+                    # the writer hasn't got to it yet, so just change what it will send
+                    queued[0][queued[1]] = value
+                    self.coalesced += 1
+                    return
+                if (self.confirmed.get(key) == value):
+                    # yarns already has this value
+                    self.skipped += 1
+                    return
+                message = [status, controller, value]
+                if (self.send_queue): self.pending[key] = (message, 2)
+        elif (self.send_queue):
+            # queued messages can't share a buffer
+            message = [status, controller, value]
+        else:
+            message = self.message
+            message[1] = controller
+            message[2] = value
+        # send CC, or hand it to the writer thread
+        if (self.send_queue): self.send_queue.Put(message)
+        else: self._Write(message)
+
+
+class MidiDevice():
+    ''' one yarns in a DeviceGroup: the output port it hangs off, its rc channel, and how sending to it went '''
+    def __init__(self, port, channel):
+        channel = int(channel)
+        if (channel < 1 or channel > 16):
+            raise ValueError('Incorrect value passed to MidiDevice()')
+        self.port = port
+        self.channel = channel
+        self.status_byte = cc_status[channel - 1]
+        # health and throughput, updated by the port's writer thread
+        self.lock = threading.Lock()
+        self.streams = 0
+        self.messages = 0
+        self.bytes = 0
+        self.errors = 0
+        self.failures = 0
+        self.last_error = None
+        self.busy_time = 0.0
+
+    def _Wrote(self, stream, written, started, finished):
+        ''' called by the writer thread once a stream is on the wire, with the bytes that took '''
+        with self.lock:
+            self.streams += 1
+            self.messages += len(stream) // 2
+            self.bytes += written
+            self.failures = 0
+            self.busy_time += finished - started
+
+    def _Failed(self, error):
+        ''' called by the writer thread when the port wouldn't take a stream '''
+        with self.lock:
+            self.errors += 1
+            self.failures += 1
+            self.last_error = str(error) or error.__class__.__name__
+
+    def GetStats(self):
+        ''' returns the counters. healthy until a write fails, and again after the next one works.
+            bytes_per_second is over the time spent writing, so idle time doesn't count against it '''
+        with self.lock:
+            return {
+                'port':             self.port,
+                'channel':          self.channel,
+                'healthy':          self.failures == 0,
+                'streams':          self.streams,
+                'messages':         self.messages,
+                'bytes':            self.bytes,
+                'errors':           self.errors,
+                'failures':         self.failures,
+                'last_error':       self.last_error,
+                'busy_time':        self.busy_time,
+                'bytes_per_second': (self.bytes / self.busy_time) if (self.busy_time > 0) else 0.0}
+
+
+class DeviceGroup():
+    ''' several yarns on their own output ports and rc channels, e.g. modules polychained with the 8> layout.
+        every port gets a paced MidiManager and a writer thread of its own, so the ports are written in
+        parallel, and a push to four modules takes as long as a push to one. devices sharing a port share
+        its writer, in the order they were sent to '''
+    def __init__(self, backend=None, rate=midi_bytes_per_second, size=512):
+        # where the ports come from unless Add() says otherwise, their pacing, and their queue size
+        self.backend = backend
+        self.rate = rate
+        self.size = size
+        self.devices = []
+        # port name -> (MidiManager, MidiSendQueue), once open
+        self.ports = {}
+        self.backends = {}
+        self.is_open = False
+
+    def Add(self, port, channel, backend=None):
+        ''' adds the yarns listening on rc channel on an output port. returns its MidiDevice '''
+        for device in self.devices:
+            if (device.port == port and device.channel == int(channel)):
+                raise ValueError('Incorrect value passed to DeviceGroup.Add(): %s:%s' % (port, channel))
+        device = MidiDevice(port, channel)
+        if (port not in self.backends): self.backends[port] = backend if (backend) else self.backend
+        self.devices.append(device)
+        if (self.is_open and port not in self.ports): self._OpenPort(port)
+        return device
+
+    def Open(self):
+        ''' opens every port and starts its writer thread '''
+        try:
+            for device in self.devices:
+                if (device.port not in self.ports): self._OpenPort(device.port)
+        except:
+            self.Close()
+            raise
+        self.is_open = True
+
+    def _OpenPort(self, port):
+        ''' opens a port with its own paced MidiManager, and starts its writer thread '''
+        manager = MidiManager(self.backends[port])
+        manager.InitMIDI()
+        manager.SetOutput(port)
+        manager.SetRate(self.rate)
+        manager.OpenMIDI()
+        queue = MidiSendQueue(lambda item: self._Write(manager, item), self.size)
+        queue.Start()
+        self.ports[port] = (manager, queue)
+
+    def Close(self, timeout=1.0):
+        ''' sends whatever is pending, stops the writer threads and closes the ports '''
+        for port, (manager, queue) in self.ports.items():
+            queue.Stop(timeout)
+            manager.CloseMIDI()
+        self.ports = {}
+        self.is_open = False
+
+    def SendMany(self, pairs, devices=None):
+        ''' queues a list of (controller, value) pairs for every device (or just devices), as one running
+            status stream each, and returns without waiting for them to be written '''
+        # nothing to send through until Open()
+        if (not self.is_open):
+            raise ValueError('Incorrect value passed to DeviceGroup.SendMany()')
+        data = []
+        for controller, value in pairs:
+            if ((controller | value) >> 7):
+                raise ValueError('Incorrect value passed to DeviceGroup.SendMany()')
+            data.append(controller)
+            data.append(value)
+        if (not data): return
+        for device in (self.devices if (devices == None) else devices):
+            self.ports[device.port][1].Put((device, [device.status_byte] + data))
+
+    def SendCC(self, controller, value, devices=None):
+        ''' queues one CC for every device (or just devices) '''
+        self.SendMany([(controller, value)], devices)
+
+    def Drain(self, timeout=None):
+        ''' blocks until every port has written everything queued. returns False on timeout '''
+        deadline = None if (timeout == None) else clock() + timeout
+        drained = True
+        for manager, queue in self.ports.values():
+            remaining = None if (deadline == None) else max(0.0, deadline - clock())
+            drained = queue.Drain(remaining) and drained
+        return drained
+
+    def _Write(self, manager, item):
+        ''' runs on a port's writer thread: writes one device's stream, and keeps its counters '''
+        device, stream = item
+        started = clock()
+        try:
+            written = manager._Write(stream)
+        except Exception as error:
+            device._Failed(error)
+            # the send queue counts it too
+            raise
+        device._Wrote(stream, written, started, clock())
+
+    def GetStats(self):
+        ''' returns every device's counters, with its port's queue and throughput when open '''
+        stats = []
+        for device in self.devices:
+            device_stats = device.GetStats()
+            if (device.port in self.ports):
+                manager, queue = self.ports[device.port]
+                device_stats['queue'] = queue.GetStats()
+                device_stats['throughput'] = manager.GetThroughput()
+            stats.append(device_stats)
+        return stats
+
+
+class PatchState():
+    ''' every parameter on yarns, stored as indexes into the cc_values tables.
+        part 0 holds the globals, parts 1-4 hold part_parameters in order '''
+    def __init__(self, parts=4):
+        self.parts = parts
+        # the globals, then each part's parameters
+        self.data = bytearray(len(global_parameters) + parts * len(part_parameters))
+        # (part, name) -> offset in data, and the key, table, controller and default of each offset
+        self.offsets = {}
+        self.keys = []
+        self.tables = []
+        self.controllers = []
+        self.defaults = []
+        # controller -> offset, for working out what CCs sent to yarns did
+        self.controller_offsets = {}
+        for name, table, default in global_parameters:
+            self._AddSlot(0, name, 'yarns_' + name, table, default)
+        for part in range(1, parts + 1):
+            for name, table, default in part_parameters:
+                self._AddSlot(part, name, 'part%d_%s' % (part, name), table, default)
+        # functions called with a list of (part, name, label) after Update() changes something
+        self.observers = []
+        self.Reset()
+
+    def _AddSlot(self, part, name, controller, table, default):
+        ''' appends the offset of a parameter, with its key, table, controller and default '''
+        self.offsets[(part, name)] = len(self.tables)
+        self.keys.append((part, name))
+        self.tables.append(cc_values.tables[table])
+        self.controllers.append(cc_values.controllers[controller])
+        self.controller_offsets[cc_values.controllers[controller]] = len(self.tables) - 1
+        self.defaults.append(cc_values.tables[table].Index(default))
+
+    def Span(self, part):
+        ''' returns the (start, stop) offsets of a part '''
+        if (part == 0): return (0, len(global_parameters))
+        start = len(global_parameters) + (part - 1) * len(part_parameters)
+        return (start, start + len(part_parameters))
+
+    def Reset(self, part=None):
+        ''' sets a part (or everything) back to the defaults, without telling the observers '''
+        start, stop = self.Span(part) if (part != None) else (0, len(self.data))
+        self.data[start:stop] = bytearray(self.defaults[start:stop])
+
+    def Get(self, part, name):
+        ''' returns the label of a parameter '''
+        offset = self.offsets[(part, name)]
+        return self.tables[offset].labels[self.data[offset]]
+
+    def Set(self, part, name, label):
+        ''' stores a label the widgets already show. returns True if it changed '''
+        offset = self.offsets[(part, name)]
+        index = self.tables[offset].Index(label)
+        if (self.data[offset] == index): return False
+        self.data[offset] = index
+        return True
+
+    def Update(self, edits):
+        ''' stores a list of (part, name, label) and tells the observers which of them changed '''
+        changed = [edit for edit in edits if (self.Set(*edit))]
+        if (changed):
+            for observer in self.observers: observer(changed)
+        return changed
+
+    def Observe(self, observer):
+        ''' calls observer(edits) whenever Update() changes something '''
+        self.observers.append(observer)
+
+    def Unobserve(self, observer):
+        ''' stops calling observer '''
+        self.observers.remove(observer)
+
+    def Snapshot(self):
+        ''' returns a copy of every parameter '''
+        return bytearray(self.data)
+
+    def Restore(self, snapshot):
+        ''' puts back a Snapshot(), telling the observers what changed '''
+        return self.Update([self.Edit(offset, index) for offset, index in enumerate(snapshot)])
+
+    def Edit(self, offset, index):
+        ''' returns the (part, name, label) of an offset holding index '''
+        part, name = self.keys[offset]
+        return (part, name, self.tables[offset].labels[index])
+
+    def Diff(self, target):
+        ''' returns the offsets where a Snapshot() differs from this state, in sync_order '''
+        if (self.data == target): return []
+        return self.Order([offset for offset in range(len(self.data)) if (self.data[offset] != target[offset])])
+
+    def Decode(self, pairs):
+        ''' returns the (part, name, label) edits (controller, value) pairs sent to yarns make, in sync_order.
+            the last value per controller wins, and controllers yarns doesn't have are left out '''
+        values = {}
+        for controller, value in pairs:
+            offset = self.controller_offsets.get(controller)
+            if (offset != None): values[offset] = value
+        return [self.Edit(offset, self.tables[offset].reverse[values[offset]]) for offset in self.Order(values)]
+
+    def Order(self, offsets):
+        ''' returns offsets sorted into sync_order '''
+        return sorted(offsets, key=lambda offset: (sync_order.get(self.keys[offset][1], 3), offset))
+
+    def Delta(self, target, offsets=None):
+        ''' returns the (controller, value) pairs that take yarns from this state to a Snapshot(),
+            and the (part, name, label) edits that take this state there. offsets overrides Diff() '''
+        pairs = []
+        edits = []
+        for offset in (self.Diff(target) if (offsets == None) else offsets):
+            index = target[offset]
+            pairs.append((self.controllers[offset], self.tables[offset].values[index]))
+            edits.append(self.Edit(offset, index))
+        return pairs, edits
+
+    def Pairs(self, part=None):
+        ''' returns the (controller, value) pairs that send a part (or everything) to yarns '''
+        start, stop = self.Span(part) if (part != None) else (0, len(self.data))
+        return [(self.controllers[offset], self.tables[offset].values[self.data[offset]])
+                for offset in range(start, stop)]
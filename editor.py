@@ -34,16 +34,16 @@ found at the following address: http://mutable-instruments.net/
 import sys
 import platform
 import ctypes
-import random
-import rtmidi_python as rtmidi
 import wx
-from wx.lib.embeddedimage import PyEmbeddedImage
-from natsort import natsorted
 import cc_values
+import core
 import images
-
-# the editor only supports this firmware version
-firmware = str(1.02)
+import midi_backends
+import patch
+import library
+import setlist
+import morph
+import automation
 
 # information for the layout editor page
 info_1M = 'In this mode, Yarns offers a single voice of CV/Gate conversion.'
@@ -90,115 +90,27 @@ info_3plus = (
     '3+ mode with 2 parts, designed specially for Edges. The first part has 3 voices\n'
     'of polyphony on channels 1-3, and the second part is monophonic, on channel 4.')
 
-# i gave that script some variables. scripts love variables
-default_tempo = '120'
-default_swing = '0'
-default_layout = '1M - Monophonic'
-default_midiChannel = '1'
-default_remoteChannel = '16'
-default_lowerNote = '0 - C_0'
-default_upperNote = '127 - G_10'
-default_swing = '0'
-default_legato = 'Off'
-default_portamento = '0'
-default_pitchBendRange = '2'
-default_vibratoRange = '1'
-default_fineTuning = '0'
-default_oscillator = 'Off'
-default_priority = 'Last'
-default_voicing = 'Poly'
-default_mode = 'Off'
-default_vibrato = '50'
-default_triggerDuration = '2'
-default_transpose = '0'
-default_arpRange = '0'
-default_arpDirection = 'Up'
-default_arpClockDiv = '/16'
-default_arpGateLength = '3'
-default_arpPattern = '1'
-default_eucLength = '0'
-default_eucFill = '0'
-default_eucRotate = '0'
-default_tuningSystem = 'Equal temperament'
-default_tuningRoot = 'C'
-default_velocityScale = 'Off'
-default_triggerShape = 'Square'
-default_auxCV = 'Aftertouch CC#2'
-default_vibratoSpeed = '50'
-
-
-class MidiManager():
-    ''' handles midi events '''
-    def __init__(self):
-        self.midi_channel = None
-        self.midi_input_device = None
-        self.midi_output_device = None
-        self.midi_input_port = None
-        self.midi_output_port = None
-
-    def InitMIDI(self):
-        ''' initializes midi '''
-        self.midi_input_device = rtmidi.MidiIn()
-        self.midi_output_device = rtmidi.MidiOut()
-
-    def ListMIDI(self, portDirection):
-        ''' returns a list of available midi devices '''
-        if (portDirection == 'input'):
-            midiDevices = self.midi_input_device.ports
-        elif (portDirection == 'output'):
-            midiDevices = self.midi_output_device.ports
-        else:
-            raise ValueError('Incorrect value passed to MidiManager.ListMIDI()')
-        return midiDevices
-
-    def SetInput(self, deviceName):
-        ''' sets the midi input port to use '''
-        self.midi_input_port = deviceName
-
-    def SetOutput(self, deviceName):
-        ''' sets the midi output port to use '''
-        self.midi_output_port = deviceName
-
-    def SetChannel(self, channel):
-        ''' sets the midi channel to use '''
-        self.midi_channel = int(channel)
-
-    def OpenMIDI(self):
-        ''' looks up the ports by the index, and opens them '''
-        if (self.midi_input_port): # midi input device is optional
-            self.midi_input_device.open_port(
-                self.midi_input_device.ports.index(self.midi_input_port))
-        self.midi_output_device.open_port(
-            self.midi_output_device.ports.index(self.midi_output_port))
-
-    def CloseMIDI(self):
-        ''' looks up the open ports by the index, and closes them '''
-        if (self.midi_input_port): self.midi_input_device.close_port()
-        if (self.midi_output_port): self.midi_output_device.close_port()
-
-    def SendCC(self, controller, value):
-        ''' sends data the the MIDI output '''
-        # 1st byte changes depending on the midi channel
-        if   (self.midi_channel == 1):  byte1 = 0xB0
-        elif (self.midi_channel == 2):  byte1 = 0xB1
-        elif (self.midi_channel == 3):  byte1 = 0xB2
-        elif (self.midi_channel == 4):  byte1 = 0xB3
-        elif (self.midi_channel == 5):  byte1 = 0xB4
-        elif (self.midi_channel == 6):  byte1 = 0xB5
-        elif (self.midi_channel == 7):  byte1 = 0xB6
-        elif (self.midi_channel == 8):  byte1 = 0xB7
-        elif (self.midi_channel == 9):  byte1 = 0xB8
-        elif (self.midi_channel == 10): byte1 = 0xB9
-        elif (self.midi_channel == 11): byte1 = 0xBA
-        elif (self.midi_channel == 12): byte1 = 0xBB
-        elif (self.midi_channel == 13): byte1 = 0xBC
-        elif (self.midi_channel == 14): byte1 = 0xBD
-        elif (self.midi_channel == 15): byte1 = 0xBE
-        elif (self.midi_channel == 16): byte1 = 0xBF
-        else:
-            raise ValueError('Incorrect value passed to MidiManager.SendCC()')
-        # send CC 
-        self.midi_output_device.send_message([byte1, controller, value])
+# natsorted combobox choices by cc_values table name, sorted once and shared by every page
+menus = {}
+
+def GetMenu(name):
+    ''' returns the natsorted labels of a cc_values table, e.g. 'note' '''
+    menu = menus.get(name)
+    if (menu == None):
+        # natsort is slow to import and only the menus need it
+        from natsort import natsorted
+        menu = natsorted(getattr(cc_values, name).keys())
+        menus[name] = menu
+    return menu
+
+# file dialog filter for patches
+patch_wildcard = 'Yarns patch (*.yarns)|*.yarns|JSON (*.json)|*.json'
+
+# file dialog filter for automation recordings
+automation_wildcard = 'Yarns automation (*.yauto)|*.yauto'
+
+# ticks per second when morphing between patches
+morph_rate = 500
 
 
 class LayoutSettings(wx.Panel):
@@ -215,31 +127,23 @@ class LayoutSettings(wx.Panel):
         txt_layout = wx.StaticText(self, label='Layout:')
 
         # populate menu contents
-        tempo_menu = []
-        for each in cc_values.tempo:
-            tempo_menu.append(each)
-        tempo_menu = natsorted(tempo_menu)
-
-        swing_menu = []
-        for each in cc_values.swing:
-            swing_menu.append(each)
-        swing_menu = natsorted(swing_menu)
-
-        layout_menu = []
-        for each in cc_values.layout:
-            layout_menu.append(each)
-        layout_menu = natsorted(layout_menu)
+        tempo_menu = GetMenu('tempo')
+        swing_menu = GetMenu('swing')
+        layout_menu = GetMenu('layout')
 
         # comboboxes
-        self.cbox_tempo = wx.ComboBox(self, choices=tempo_menu, value=default_tempo, style=wx.CB_READONLY)
-        self.cbox_swing = wx.ComboBox(self, choices=swing_menu, value=default_swing, style=wx.CB_READONLY)
-        self.cbox_layouts = wx.ComboBox(self, choices=layout_menu, value=default_layout, style=wx.CB_READONLY)
+        self.cbox_tempo = wx.ComboBox(self, choices=tempo_menu, value=patchState.Get(0, 'tempo'), style=wx.CB_READONLY)
+        self.cbox_swing = wx.ComboBox(self, choices=swing_menu, value=patchState.Get(0, 'swing'), style=wx.CB_READONLY)
+        self.cbox_layouts = wx.ComboBox(self, choices=layout_menu, value=patchState.Get(0, 'layout'), style=wx.CB_READONLY)
 
         # combobox bindings
         self.cbox_tempo.Bind(wx.EVT_COMBOBOX, self.OnTempoSelect)
         self.cbox_swing.Bind(wx.EVT_COMBOBOX, self.OnSwingSelect)
         self.cbox_layouts.Bind(wx.EVT_COMBOBOX, self.OnLayoutSelect)
 
+        # parameter name -> combobox, for edits coming back from yarns
+        self.comboboxes = {'tempo': self.cbox_tempo, 'swing': self.cbox_swing, 'layout': self.cbox_layouts}
+
         # add it all to the sizer
         self.sizer.Add(txt_tempo)
         self.sizer.Add(self.cbox_tempo)
@@ -249,7 +153,7 @@ class LayoutSettings(wx.Panel):
         self.sizer.Add(self.cbox_layouts)
 
         # default layout placeholders
-        image = images.layout_1M.GetBitmap()
+        image = images.layout_bitmaps.Get('1M')
         self.layout_image = wx.StaticBitmap(self, -1, image, (0,0), (image.GetWidth(), image.GetHeight()))
 
         self.txt_info = wx.StaticText(self, label=info_1M)
@@ -257,57 +161,57 @@ class LayoutSettings(wx.Panel):
         self.sizer.Add(self.layout_image, 1, wx.ALIGN_CENTRE)
         self.sizer.Add(self.txt_info, 0, wx.ALIGN_CENTRE)
 
-    def ChangeLayout(self, layout):
+    def ChangeLayout(self, layout, sendDefaults=True):
         ''' changes the layout image/text. also enables/disables tabs '''
         # pick correct layout image
         if   (layout == '1M - Monophonic'):                
-            newImage = images.layout_1M.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('1M')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_1M)
 
         elif (layout == '2M - Dual monophonic'):           
-            newImage = images.layout_2M.GetBitmap()
-            self.parent.OnPartChange(2)
+            newImage = images.layout_bitmaps.Get('2M')
+            self.parent.OnPartChange(2, sendDefaults)
             self.txt_info.SetLabel(info_2M)
 
         elif (layout == '4M - Quad monophonic'):           
-            newImage = images.layout_4M.GetBitmap()
-            self.parent.OnPartChange(4)
+            newImage = images.layout_bitmaps.Get('4M')
+            self.parent.OnPartChange(4, sendDefaults)
             self.txt_info.SetLabel(info_4M)
 
         elif (layout == '2P - Duophonic'):                 
-            newImage = images.layout_2P.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('2P')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_2P)
 
         elif (layout == '4P - Quadraphonic'):              
-            newImage = images.layout_4P.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('4P')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_4poly)
 
         elif (layout == '2> - Duophonic polychaining'):    
-            newImage = images.layout_2P_chain.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('2P_chain')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_2poly)
 
         elif (layout == '4> - Quadraphonic polychaining'): 
-            newImage = images.layout_4P_chain.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('4P_chain')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_4poly)
 
         elif (layout == '8> - Octophonic polychaining'):   
-            newImage = images.layout_8P_chain.GetBitmap()
-            self.parent.OnPartChange(1)
+            newImage = images.layout_bitmaps.Get('8P_chain')
+            self.parent.OnPartChange(1, sendDefaults)
             self.txt_info.SetLabel(info_8poly)
 
         elif (layout == '4T - Quad trigger'):              
-            newImage = images.layout_4T.GetBitmap()
-            self.parent.OnPartChange(4)
+            newImage = images.layout_bitmaps.Get('4T')
+            self.parent.OnPartChange(4, sendDefaults)
             self.txt_info.SetLabel(info_4trig)
 
         elif (layout == '3+ - Three plus one'):            
-            newImage = images.layout_3plus.GetBitmap()
-            self.parent.OnPartChange(2)
+            newImage = images.layout_bitmaps.Get('3plus')
+            self.parent.OnPartChange(2, sendDefaults)
             self.txt_info.SetLabel(info_3plus)
 
         else:
@@ -322,11 +226,15 @@ class LayoutSettings(wx.Panel):
     def OnTempoSelect(self, event):
         ''' called when the user selects a value from the combobox '''
         # get event type
-        if (event == 'default'): choice = default_tempo 
-        elif (event == 'random'): choice = random.choice(cc_values.tempo.keys())
+        if (event == 'default'): choice = core.default_tempo 
+        elif (event == 'random'): choice = cc_values.tables['tempo'].Random()
         else: choice = event.GetString() 
         # correct combobox value 
         self.cbox_tempo.SetValue(choice)
+        patchState.Set(0, 'tempo', choice)
+        # keep automation playback in time
+        window = self.GetTopLevelParent()
+        if (isinstance(window, Window) and window.player): window.player.SetTempo(morph.TempoToBPM(choice))
         # set controller
         controller = cc_values.controllers['yarns_tempo']
         # set cc value
@@ -337,11 +245,12 @@ class LayoutSettings(wx.Panel):
     def OnSwingSelect(self, event):
         ''' called when the user selects a value from the combobox '''
         # get event type
-        if (event == 'default'): choice = default_swing
-        elif (event == 'random'): choice = random.choice(cc_values.swing.keys())
+        if (event == 'default'): choice = core.default_swing
+        elif (event == 'random'): choice = cc_values.tables['swing'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_swing.SetValue(choice)
+        patchState.Set(0, 'swing', choice)
         # set controller
         controller = cc_values.controllers['yarns_swing']
         # set cc value
@@ -352,26 +261,71 @@ class LayoutSettings(wx.Panel):
     def OnLayoutSelect(self, event):
         ''' called when the user selects a value from the combobox '''
         # get event type
-        if (event == 'default'): choice = default_layout
-        elif (event == 'random'): choice = random.choice(cc_values.layout.keys())
+        if (event == 'default'): choice = core.default_layout
+        elif (event == 'random'): choice = cc_values.tables['layout'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_layouts.SetValue(choice)
+        patchState.Set(0, 'layout', choice)
         # set controller
         controller = cc_values.controllers['yarns_layout']
         # set cc value
         value = cc_values.layout[choice]
-         # send cc message to midi output
-        midiManager.SendCC(controller, value)
+        # the layout cc and the defaults for any parts it adds go out as one stream
+        midiManager.BeginBatch()
+        try:
+            # send cc message to midi output
+            midiManager.SendCC(controller, value)
+
+            # change layout image/text
+            self.ChangeLayout(choice)
+        finally:
+            midiManager.EndBatch()
+
+    def ShowValue(self, name, label):
+        ''' shows a value changed outside the widgets, without sending anything to yarns '''
+        self.comboboxes[name].SetValue(label)
+        if (name == 'layout'): self.ChangeLayout(label, sendDefaults=False)
+
+    def SendDefaults(self):
+        ''' inits yarns with some default settings '''
+        midiManager.BeginBatch()
+        try:
+            self.OnLayoutSelect('default')
+            self.OnTempoSelect('default')
+            self.OnSwingSelect('default')
+        finally:
+            midiManager.EndBatch()
+
+
+class PartPage(wx.Panel):
+    ''' a notebook tab for a part. the settings page inside is built the first time it's shown '''
+    def __init__(self, parent, partNumber):
+        wx.Panel.__init__(self, parent)
+        self.partNumber = partNumber
+        self.page = None
+        self.sizer = wx.BoxSizer(wx.VERTICAL)
+        self.SetSizer(self.sizer)
+
+    def Build(self):
+        ''' builds the settings page from the patch state, if that hasn't happened yet '''
+        if (self.page): return self.page
+        self.page = PartSettings(self, self.partNumber)
+        self.sizer.Add(self.page, 1, wx.EXPAND)
+        self.sizer.Layout()
+        return self.page
 
-        # change layout image/text
-        self.ChangeLayout(choice)
+    def ShowValue(self, name, label):
+        ''' shows a value changed outside the widgets, without sending anything to yarns '''
+        if (self.page): self.page.comboboxes[name].SetValue(label)
 
     def SendDefaults(self):
         ''' inits yarns with some default settings '''
-        self.OnLayoutSelect('default')
-        self.OnTempoSelect('default')
-        self.OnSwingSelect('default')
+        if (self.page): self.page.SendDefaults()
+        else:
+            # no widgets to go through
+            patchState.Reset(self.partNumber)
+            midiManager.SendMany(patchState.Pairs(self.partNumber))
 
 
 class PartSettings(wx.Panel):
@@ -454,210 +408,125 @@ class PartSettings(wx.Panel):
         chk_eucRotate.Bind(wx.EVT_CHECKBOX, self.OnBoxChecked)
 
         # populate menu contents
-        midiChannel_menu = []
-        for each in cc_values.channel:
-            midiChannel_menu.append(each)
-        midiChannel_menu = natsorted(midiChannel_menu)
-
-        midiNote_menu = []
-        for each in cc_values.note:
-            midiNote_menu.append(each)
-        midiNote_menu = natsorted(midiNote_menu)
-
-        midiOutput_menu = []
-        for each in cc_values.midi_output:
-            midiOutput_menu.append(each)
-        midiOutput_menu = natsorted(midiOutput_menu)
-
-        vibratoSpeed_menu = []
-        for each in cc_values.vibrato_speed:
-            vibratoSpeed_menu.append(each)
-        vibratoSpeed_menu = natsorted(vibratoSpeed_menu)
-
-        voicing_menu = []
-        for each in cc_values.voicing:
-            voicing_menu.append(each)
-        voicing_menu = natsorted(voicing_menu)
-
-        note_priority_menu = []
-        for each in cc_values.note_priority:
-            note_priority_menu.append(each)
-        note_priority_menu = natsorted(note_priority_menu)
-
-        boolean_menu = []
-        for each in cc_values.boolean:
-            boolean_menu.append(each)
-        boolean_menu = natsorted(boolean_menu)
-
-        tuningRoot_menu = []
-        for each in cc_values.tuning_root:
-            tuningRoot_menu.append(each)
-        tuningRoot_menu = natsorted(tuningRoot_menu)
-
-        tuningSystem_menu = []
-        for each in cc_values.tuning_system:
-            tuningSystem_menu.append(each)
-        tuningSystem_menu = natsorted(tuningSystem_menu)
-
-        triggerShape_menu = []
-        for each in cc_values.trigger_shape:
-            triggerShape_menu.append(each)
-        triggerShape_menu = natsorted(triggerShape_menu)
-
-        auxCV_menu = []
-        for each in cc_values.aux_cv:
-            auxCV_menu.append(each)
-        auxCV_menu = natsorted(auxCV_menu)
-
-        oscillator_menu = []
-        for each in cc_values.oscillator:
-            oscillator_menu.append(each)
-        oscillator_menu = natsorted(oscillator_menu)
-
-        arpClock_menu = []
-        for each in cc_values.arp_clock_division:
-            arpClock_menu.append(each)
-        arpClock_menu = natsorted(arpClock_menu)
-
-        arpDirection_menu = []
-        for each in cc_values.arp_direction:
-            arpDirection_menu.append(each)
-        arpDirection_menu = natsorted(arpDirection_menu)
-
-        pitchBend_menu = []
-        for each in cc_values.pitch_bend:
-            pitchBend_menu.append(each)
-        pitchBend_menu = natsorted(pitchBend_menu)
-
-        vibratoRange_menu = []
-        for each in cc_values.vibrato_range:
-            vibratoRange_menu.append(each)
-        vibratoRange_menu = natsorted(vibratoRange_menu)
-
-        transpose_menu = []
-        for each in cc_values.transpose:
-            transpose_menu.append(each)
-        transpose_menu = natsorted(transpose_menu)
-
-        fineTuning_menu = []
-        for each in cc_values.fine_tuning:
-            fineTuning_menu.append(each)
-        fineTuning_menu = natsorted(fineTuning_menu)
-
-        triggerDuration_menu = []
-        for each in cc_values.trigger_duration:
-            triggerDuration_menu.append(each)
-        triggerDuration_menu = natsorted(triggerDuration_menu)
-
-        arpRange_menu = []
-        for each in cc_values.arp_range:
-            arpRange_menu.append(each)
-        arpRange_menu = natsorted(arpRange_menu)
-
-        arpPattern_menu = []
-        for each in cc_values.arp_pattern:
-            arpPattern_menu.append(each)
-        arpPattern_menu = natsorted(arpPattern_menu)
-
-        arpGateLength_menu = []
-        for each in cc_values.arp_gate_length:
-            arpGateLength_menu.append(each)
-        arpGateLength_menu = natsorted(arpGateLength_menu)
-
-        euclidean_menu = []
-        for each in cc_values.euclidean:
-            euclidean_menu.append(each)
-        euclidean_menu = natsorted(euclidean_menu)
-
-        swing_menu = []
-        for each in cc_values.swing:
-            swing_menu.append(each)
-        swing_menu = natsorted(swing_menu)
+        midiChannel_menu = GetMenu('channel')
+        midiNote_menu = GetMenu('note')
+        midiOutput_menu = GetMenu('midi_output')
+        vibratoSpeed_menu = GetMenu('vibrato_speed')
+        voicing_menu = GetMenu('voicing')
+        note_priority_menu = GetMenu('note_priority')
+        boolean_menu = GetMenu('boolean')
+        tuningRoot_menu = GetMenu('tuning_root')
+        tuningSystem_menu = GetMenu('tuning_system')
+        triggerShape_menu = GetMenu('trigger_shape')
+        auxCV_menu = GetMenu('aux_cv')
+        oscillator_menu = GetMenu('oscillator')
+        arpClock_menu = GetMenu('arp_clock_division')
+        arpDirection_menu = GetMenu('arp_direction')
+        pitchBend_menu = GetMenu('pitch_bend')
+        vibratoRange_menu = GetMenu('vibrato_range')
+        transpose_menu = GetMenu('transpose')
+        fineTuning_menu = GetMenu('fine_tuning')
+        triggerDuration_menu = GetMenu('trigger_duration')
+        arpRange_menu = GetMenu('arp_range')
+        arpPattern_menu = GetMenu('arp_pattern')
+        arpGateLength_menu = GetMenu('arp_gate_length')
+        euclidean_menu = GetMenu('euclidean')
+        swing_menu = GetMenu('swing')
 
         # combo boxes
         self.cbox_triggerDuration = wx.ComboBox(
-            self, choices=triggerDuration_menu, value=default_triggerDuration, style=wx.CB_READONLY)
+            self, choices=triggerDuration_menu, value=patchState.Get(self.partNumber, 'triggerDuration'), style=wx.CB_READONLY)
 
         self.cbox_arpRange = wx.ComboBox(
-            self, choices=arpRange_menu, value=default_arpRange, style=wx.CB_READONLY)
+            self, choices=arpRange_menu, value=patchState.Get(self.partNumber, 'arpRange'), style=wx.CB_READONLY)
 
         self.cbox_arpPattern = wx.ComboBox(
-            self, choices=arpPattern_menu, value=default_arpPattern, style=wx.CB_READONLY)
+            self, choices=arpPattern_menu, value=patchState.Get(self.partNumber, 'arpPattern'), style=wx.CB_READONLY)
 
         self.cbox_arpGateLength = wx.ComboBox(
-            self, choices=arpGateLength_menu, value=default_arpGateLength, style=wx.CB_READONLY)
+            self, choices=arpGateLength_menu, value=patchState.Get(self.partNumber, 'arpGateLength'), style=wx.CB_READONLY)
 
         self.cbox_eucLength = wx.ComboBox(
-            self, choices=euclidean_menu, value=default_eucLength, style=wx.CB_READONLY)
+            self, choices=euclidean_menu, value=patchState.Get(self.partNumber, 'euclideanLength'), style=wx.CB_READONLY)
 
         self.cbox_eucFill = wx.ComboBox(
-            self, choices=euclidean_menu, value=default_eucFill, style=wx.CB_READONLY)
+            self, choices=euclidean_menu, value=patchState.Get(self.partNumber, 'euclideanFill'), style=wx.CB_READONLY)
 
         self.cbox_eucRotate = wx.ComboBox(
-            self, choices=euclidean_menu, value=default_eucRotate, style=wx.CB_READONLY)
+            self, choices=euclidean_menu, value=patchState.Get(self.partNumber, 'euclideanRotate'), style=wx.CB_READONLY)
 
         self.cbox_fineTuning = wx.ComboBox(
-            self, choices=fineTuning_menu, value=default_fineTuning, style=wx.CB_READONLY)
+            self, choices=fineTuning_menu, value=patchState.Get(self.partNumber, 'fineTuning'), style=wx.CB_READONLY)
 
         self.cbox_transpose = wx.ComboBox(
-            self, choices=transpose_menu, value=default_transpose, style=wx.CB_READONLY)
+            self, choices=transpose_menu, value=patchState.Get(self.partNumber, 'transpose'), style=wx.CB_READONLY)
 
         self.cbox_vibratoRange = wx.ComboBox(
-            self, choices=vibratoRange_menu, value=default_vibratoRange, style=wx.CB_READONLY)
+            self, choices=vibratoRange_menu, value=patchState.Get(self.partNumber, 'vibratoRange'), style=wx.CB_READONLY)
 
         self.cbox_pitchBendRange = wx.ComboBox(
-            self, choices=pitchBend_menu, value=default_pitchBendRange, style=wx.CB_READONLY)
+            self, choices=pitchBend_menu, value=patchState.Get(self.partNumber, 'pitchBendRange'), style=wx.CB_READONLY)
 
         self.cbox_portamento = wx.ComboBox(
-            self, choices=swing_menu, value=default_portamento, style=wx.CB_READONLY)
+            self, choices=swing_menu, value=patchState.Get(self.partNumber, 'portamento'), style=wx.CB_READONLY)
 
         self.cbox_midiChannel = wx.ComboBox(
-            self, choices=midiChannel_menu, value=default_midiChannel, style=wx.CB_READONLY)
+            self, choices=midiChannel_menu, value=patchState.Get(self.partNumber, 'midiChannel'), style=wx.CB_READONLY)
 
         self.cbox_vibratoSpeed = wx.ComboBox(
-            self, choices=vibratoSpeed_menu, value=default_vibrato, style=wx.CB_READONLY)
+            self, choices=vibratoSpeed_menu, value=patchState.Get(self.partNumber, 'vibratoSpeed'), style=wx.CB_READONLY)
 
         self.cbox_lowerNote = wx.ComboBox(
-            self, choices=midiNote_menu, value=default_lowerNote, style=wx.CB_READONLY)
+            self, choices=midiNote_menu, value=patchState.Get(self.partNumber, 'lowerNote'), style=wx.CB_READONLY)
 
         self.cbox_upperNote = wx.ComboBox(
-            self, choices=midiNote_menu, value=default_upperNote, style=wx.CB_READONLY)
+            self, choices=midiNote_menu, value=patchState.Get(self.partNumber, 'upperNote'), style=wx.CB_READONLY)
 
         self.cbox_midiOutMode = wx.ComboBox(
-            self, choices=midiOutput_menu, value=default_mode, style=wx.CB_READONLY)
+            self, choices=midiOutput_menu, value=patchState.Get(self.partNumber, 'midiOutMode'), style=wx.CB_READONLY)
 
         self.cbox_voicing = wx.ComboBox(
-            self, choices=voicing_menu, value=default_voicing, style=wx.CB_READONLY)
+            self, choices=voicing_menu, value=patchState.Get(self.partNumber, 'voicing'), style=wx.CB_READONLY)
 
         self.cbox_notePriority = wx.ComboBox(
-            self, choices=note_priority_menu, value=default_priority, style=wx.CB_READONLY)
+            self, choices=note_priority_menu, value=patchState.Get(self.partNumber, 'notePriority'), style=wx.CB_READONLY)
 
         self.cbox_legato = wx.ComboBox(
-            self, choices=boolean_menu, value=default_legato, style=wx.CB_READONLY)        
+            self, choices=boolean_menu, value=patchState.Get(self.partNumber, 'legato'), style=wx.CB_READONLY)        
 
         self.cbox_tuningRoot = wx.ComboBox(
-            self, choices=tuningRoot_menu, value=default_tuningRoot, style=wx.CB_READONLY)
+            self, choices=tuningRoot_menu, value=patchState.Get(self.partNumber, 'tuningRoot'), style=wx.CB_READONLY)
 
         self.cbox_tuningSystem = wx.ComboBox(
-            self, choices=tuningSystem_menu, value=default_tuningSystem, style=wx.CB_READONLY)
+            self, choices=tuningSystem_menu, value=patchState.Get(self.partNumber, 'tuningSystem'), style=wx.CB_READONLY)
 
         self.cbox_velocityScale = wx.ComboBox(
-            self, choices=boolean_menu, value=default_velocityScale, style=wx.CB_READONLY)
+            self, choices=boolean_menu, value=patchState.Get(self.partNumber, 'velocityScale'), style=wx.CB_READONLY)
 
         self.cbox_triggerShape = wx.ComboBox(
-            self, choices=triggerShape_menu, value=default_triggerShape, style=wx.CB_READONLY)
+            self, choices=triggerShape_menu, value=patchState.Get(self.partNumber, 'triggerShape'), style=wx.CB_READONLY)
 
         self.cbox_auxCvOut = wx.ComboBox(
-            self, choices=auxCV_menu, value=default_auxCV, style=wx.CB_READONLY)
+            self, choices=auxCV_menu, value=patchState.Get(self.partNumber, 'auxCVout'), style=wx.CB_READONLY)
 
         self.cbox_oscShape = wx.ComboBox(
-            self, choices=oscillator_menu, value=default_oscillator, style=wx.CB_READONLY)
+            self, choices=oscillator_menu, value=patchState.Get(self.partNumber, 'oscillatorShape'), style=wx.CB_READONLY)
 
         self.cbox_arpClockDiv = wx.ComboBox(
-            self, choices=arpClock_menu, value=default_arpClockDiv, style=wx.CB_READONLY)
+            self, choices=arpClock_menu, value=patchState.Get(self.partNumber, 'arpClockDiv'), style=wx.CB_READONLY)
 
         self.cbox_arpDirection = wx.ComboBox(
-            self, choices=arpDirection_menu, value=default_arpDirection, style=wx.CB_READONLY)
+            self, choices=arpDirection_menu, value=patchState.Get(self.partNumber, 'arpDirection'), style=wx.CB_READONLY)
+
+        # parameter name -> combobox, for edits coming back from yarns
+        self.comboboxes = {}
+        for name, table, default in core.part_parameters:
+            self.comboboxes[name] = getattr(self, 'cbox_' + {
+                'euclideanLength': 'eucLength',
+                'euclideanFill':   'eucFill',
+                'euclideanRotate': 'eucRotate',
+                'auxCVout':        'auxCvOut',
+                'oscillatorShape': 'oscShape'}.get(name, name))
         
         # combo box bindings
         self.cbox_pitchBendRange.Bind(wx.EVT_COMBOBOX, self.OnPitchBendRangeSelect)
@@ -728,50 +597,57 @@ class PartSettings(wx.Panel):
 
     def OnRandomSelection(self, event):
         ''' randomizes all currently checked boxes '''
-        for box in self.checkedBoxes:
-            if   (box == 'MIDI channel:'): self.OnChannelSelect('random')
-            elif (box == 'Lower note:'): self.OnLowerNoteSelect('random')
-            elif (box == 'Upper note:'): self.OnUpperNoteSelect('random')
-            elif (box == 'Portamento:'): self.OnPortamentoSelect('random')
-            elif (box == 'Pitch bend range:'): self.OnPitchBendRangeSelect('random')
-            elif (box == 'Transpose:'): self.OnTransposeSelect('random')
-            elif (box == 'Fine tuning:'): self.OnFineTuningSelect('random')
-            elif (box == 'Tuning system:'): self.OnTuningSystemSelect('random')
-            elif (box == 'Tuning root:'): self.OnTuningRootSelect('random')
-            elif (box == 'Arp/Seq gate length:'): self.OnArpGateLengthSelect('random')
-            elif (box == 'Arp/Seq clock divider:'): self.OnArpClockDivSelect('random')
-            elif (box == 'Arpeggiator range:'): self.OnArpRangeSelect('random')
-            elif (box == 'Arpeggiator direction:'): self.OnArpDirectionSelect('random')
-            elif (box == 'Arpeggiator pattern:'): self.OnArpPatternSelect('random')
-            elif (box == 'MIDI out mode:'): self.OnMidiOutModeSelect('random')
-            elif (box == 'Voicing:'): self.OnVoicingSelect('random')
-            elif (box == 'Note priority:'): self.OnNotePrioritySelect('random')
-            elif (box == 'Legato:'): self.OnLegatoSelect('random')
-            elif (box == 'Vibrato range:'): self.OnVibratoRangeSelect('random')
-            elif (box == 'Vibrato speed:'): self.OnVibratoSpeedSelect('random')
-            elif (box == 'Trigger velocity scale:'): self.OnVelocityScaleSelect('random')
-            elif (box == 'Trigger duration:'): self.OnTriggerDurationSelect('random')
-            elif (box == 'Trigger shape:'): self.OnTriggerShapeSelect('random')
-            elif (box == 'Oscillator shape:'): self.OnOscShapeSelect('random')
-            elif (box == 'Aux CV out:'): self.OnAuxCvOutSelect('random')
-            elif (box == 'Euclidean length:'): self.OnEucLengthSelect('random')
-            elif (box == 'Euclidean fill:'): self.OnEucFillSelect('random')
-            elif (box == 'Euclidean rotate:'): self.OnEucRotateSelect('random')
-            else:
-                raise ValueError('Incorrect value passed to PartSettings.OnRandomSelection()')
+        midiManager.BeginBatch()
+        try:
+            for box in self.checkedBoxes:
+                if   (box == 'MIDI channel:'): self.OnChannelSelect('random')
+                elif (box == 'Lower note:'): self.OnLowerNoteSelect('random')
+                elif (box == 'Upper note:'): self.OnUpperNoteSelect('random')
+                elif (box == 'Portamento:'): self.OnPortamentoSelect('random')
+                elif (box == 'Pitch bend range:'): self.OnPitchBendRangeSelect('random')
+                elif (box == 'Transpose:'): self.OnTransposeSelect('random')
+                elif (box == 'Fine tuning:'): self.OnFineTuningSelect('random')
+                elif (box == 'Tuning system:'): self.OnTuningSystemSelect('random')
+                elif (box == 'Tuning root:'): self.OnTuningRootSelect('random')
+                elif (box == 'Arp/Seq gate length:'): self.OnArpGateLengthSelect('random')
+                elif (box == 'Arp/Seq clock divider:'): self.OnArpClockDivSelect('random')
+                elif (box == 'Arpeggiator range:'): self.OnArpRangeSelect('random')
+                elif (box == 'Arpeggiator direction:'): self.OnArpDirectionSelect('random')
+                elif (box == 'Arpeggiator pattern:'): self.OnArpPatternSelect('random')
+                elif (box == 'MIDI out mode:'): self.OnMidiOutModeSelect('random')
+                elif (box == 'Voicing:'): self.OnVoicingSelect('random')
+                elif (box == 'Note priority:'): self.OnNotePrioritySelect('random')
+                elif (box == 'Legato:'): self.OnLegatoSelect('random')
+                elif (box == 'Vibrato range:'): self.OnVibratoRangeSelect('random')
+                elif (box == 'Vibrato speed:'): self.OnVibratoSpeedSelect('random')
+                elif (box == 'Trigger velocity scale:'): self.OnVelocityScaleSelect('random')
+                elif (box == 'Trigger duration:'): self.OnTriggerDurationSelect('random')
+                elif (box == 'Trigger shape:'): self.OnTriggerShapeSelect('random')
+                elif (box == 'Oscillator shape:'): self.OnOscShapeSelect('random')
+                elif (box == 'Aux CV out:'): self.OnAuxCvOutSelect('random')
+                elif (box == 'Euclidean length:'): self.OnEucLengthSelect('random')
+                elif (box == 'Euclidean fill:'): self.OnEucFillSelect('random')
+                elif (box == 'Euclidean rotate:'): self.OnEucRotateSelect('random')
+                else:
+                    raise ValueError('Incorrect value passed to PartSettings.OnRandomSelection()')
+        finally:
+            midiManager.EndBatch()
 
     def OnReset(self, event):
         ''' resets all values to defaults '''
+        # yarns may have been edited from its panel, so resend everything
+        midiManager.ForgetSent()
         self.SendDefaults()
 
     def OnChannelSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_midiChannel
-        elif (event == 'random'): choice = random.choice(cc_values.channel.keys())
+        if (event == 'default'): choice = core.default_midiChannel
+        elif (event == 'random'): choice = cc_values.tables['channel'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_midiChannel.SetValue(choice)
+        patchState.Set(self.partNumber, 'midiChannel', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_midiChannel']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_midiChannel']
@@ -785,11 +661,12 @@ class PartSettings(wx.Panel):
     def OnLowerNoteSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_lowerNote
-        elif (event == 'random'): choice = random.choice(cc_values.note.keys())
+        if (event == 'default'): choice = core.default_lowerNote
+        elif (event == 'random'): choice = cc_values.tables['note'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_lowerNote.SetValue(choice)
+        patchState.Set(self.partNumber, 'lowerNote', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_lowerNote']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_lowerNote']
@@ -803,11 +680,12 @@ class PartSettings(wx.Panel):
     def OnUpperNoteSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_upperNote
-        elif (event == 'random'): choice = random.choice(cc_values.note.keys())
+        if (event == 'default'): choice = core.default_upperNote
+        elif (event == 'random'): choice = cc_values.tables['note'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_upperNote.SetValue(choice)
+        patchState.Set(self.partNumber, 'upperNote', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_upperNote']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_upperNote']
@@ -821,11 +699,12 @@ class PartSettings(wx.Panel):
     def OnMidiOutModeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_mode
-        elif (event == 'random'): choice = random.choice(cc_values.midi_output.keys())
+        if (event == 'default'): choice = core.default_mode
+        elif (event == 'random'): choice = cc_values.tables['midi_output'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_midiOutMode.SetValue(choice)
+        patchState.Set(self.partNumber, 'midiOutMode', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_midiOutMode']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_midiOutMode']
@@ -839,11 +718,12 @@ class PartSettings(wx.Panel):
     def OnVoicingSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_voicing
-        elif (event == 'random'): choice = random.choice(cc_values.voicing.keys())
+        if (event == 'default'): choice = core.default_voicing
+        elif (event == 'random'): choice = cc_values.tables['voicing'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_voicing.SetValue(choice)
+        patchState.Set(self.partNumber, 'voicing', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_voicing']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_voicing']
@@ -857,11 +737,12 @@ class PartSettings(wx.Panel):
     def OnNotePrioritySelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_priority
-        elif (event == 'random'): choice = random.choice(cc_values.note_priority.keys())
+        if (event == 'default'): choice = core.default_priority
+        elif (event == 'random'): choice = cc_values.tables['note_priority'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_notePriority.SetValue(choice)
+        patchState.Set(self.partNumber, 'notePriority', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_notePriority']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_notePriority']
@@ -875,11 +756,12 @@ class PartSettings(wx.Panel):
     def OnPortamentoSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_portamento
-        elif (event == 'random'): choice = random.choice(cc_values.portamento.keys())
+        if (event == 'default'): choice = core.default_portamento
+        elif (event == 'random'): choice = cc_values.tables['portamento'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_portamento.SetValue(choice)
+        patchState.Set(self.partNumber, 'portamento', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_portamento']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_portamento']
@@ -893,11 +775,12 @@ class PartSettings(wx.Panel):
     def OnLegatoSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_legato
-        elif (event == 'random'): choice = random.choice(cc_values.boolean.keys())
+        if (event == 'default'): choice = core.default_legato
+        elif (event == 'random'): choice = cc_values.tables['boolean'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_legato.SetValue(choice)
+        patchState.Set(self.partNumber, 'legato', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_legato']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_legato']
@@ -911,11 +794,12 @@ class PartSettings(wx.Panel):
     def OnPitchBendRangeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_pitchBendRange
-        elif (event == 'random'): choice = random.choice(cc_values.pitch_bend.keys())
+        if (event == 'default'): choice = core.default_pitchBendRange
+        elif (event == 'random'): choice = cc_values.tables['pitch_bend'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_pitchBendRange.SetValue(choice)
+        patchState.Set(self.partNumber, 'pitchBendRange', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_pitchBendRange']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_pitchBendRange']
@@ -929,11 +813,12 @@ class PartSettings(wx.Panel):
     def OnVibratoRangeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_vibratoRange
-        elif (event == 'random'): choice = random.choice(cc_values.vibrato_range.keys())
+        if (event == 'default'): choice = core.default_vibratoRange
+        elif (event == 'random'): choice = cc_values.tables['vibrato_range'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_vibratoRange.SetValue(choice)
+        patchState.Set(self.partNumber, 'vibratoRange', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_vibratoRange']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_vibratoRange']
@@ -947,11 +832,12 @@ class PartSettings(wx.Panel):
     def OnVibratoSpeedSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_vibratoSpeed
-        elif (event == 'random'): choice = random.choice(cc_values.vibrato_speed.keys())
+        if (event == 'default'): choice = core.default_vibratoSpeed
+        elif (event == 'random'): choice = cc_values.tables['vibrato_speed'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_vibratoSpeed.SetValue(choice)
+        patchState.Set(self.partNumber, 'vibratoSpeed', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_vibratoSpeed']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_vibratoSpeed']
@@ -965,11 +851,12 @@ class PartSettings(wx.Panel):
     def OnTransposeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_transpose
-        elif (event == 'random'): choice = random.choice(cc_values.transpose.keys())
+        if (event == 'default'): choice = core.default_transpose
+        elif (event == 'random'): choice = cc_values.tables['transpose'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_transpose.SetValue(choice)
+        patchState.Set(self.partNumber, 'transpose', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_transpose']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_transpose']
@@ -983,11 +870,12 @@ class PartSettings(wx.Panel):
     def OnFineTuningSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_fineTuning
-        elif (event == 'random'): choice = random.choice(cc_values.fine_tuning.keys())
+        if (event == 'default'): choice = core.default_fineTuning
+        elif (event == 'random'): choice = cc_values.tables['fine_tuning'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_fineTuning.SetValue(choice)
+        patchState.Set(self.partNumber, 'fineTuning', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_fineTuning']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_fineTuning']
@@ -1001,11 +889,12 @@ class PartSettings(wx.Panel):
     def OnTuningRootSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_tuningRoot
-        elif (event == 'random'): choice = random.choice(cc_values.tuning_root.keys())
+        if (event == 'default'): choice = core.default_tuningRoot
+        elif (event == 'random'): choice = cc_values.tables['tuning_root'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_tuningRoot.SetValue(choice)
+        patchState.Set(self.partNumber, 'tuningRoot', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_tuningRoot']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_tuningRoot']
@@ -1019,11 +908,12 @@ class PartSettings(wx.Panel):
     def OnTuningSystemSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_tuningSystem
-        elif (event == 'random'): choice = random.choice(cc_values.tuning_system.keys())
+        if (event == 'default'): choice = core.default_tuningSystem
+        elif (event == 'random'): choice = cc_values.tables['tuning_system'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_tuningSystem.SetValue(choice)
+        patchState.Set(self.partNumber, 'tuningSystem', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_tuningSystem']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_tuningSystem']
@@ -1037,11 +927,12 @@ class PartSettings(wx.Panel):
     def OnTriggerDurationSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_triggerDuration
-        elif (event == 'random'): choice = random.choice(cc_values.trigger_duration.keys())
+        if (event == 'default'): choice = core.default_triggerDuration
+        elif (event == 'random'): choice = cc_values.tables['trigger_duration'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_triggerDuration.SetValue(choice)
+        patchState.Set(self.partNumber, 'triggerDuration', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_triggerDuration']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_triggerDuration']
@@ -1055,11 +946,12 @@ class PartSettings(wx.Panel):
     def OnVelocityScaleSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_velocityScale
-        elif (event == 'random'): choice = random.choice(cc_values.boolean.keys())
+        if (event == 'default'): choice = core.default_velocityScale
+        elif (event == 'random'): choice = cc_values.tables['boolean'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_velocityScale.SetValue(choice)
+        patchState.Set(self.partNumber, 'velocityScale', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_velocityScale']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_velocityScale']
@@ -1073,11 +965,12 @@ class PartSettings(wx.Panel):
     def OnTriggerShapeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_triggerShape
-        elif (event == 'random'): choice = random.choice(cc_values.trigger_shape.keys())
+        if (event == 'default'): choice = core.default_triggerShape
+        elif (event == 'random'): choice = cc_values.tables['trigger_shape'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_triggerShape.SetValue(choice)
+        patchState.Set(self.partNumber, 'triggerShape', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_triggerShape']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_triggerShape']
@@ -1091,11 +984,12 @@ class PartSettings(wx.Panel):
     def OnAuxCvOutSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_auxCV
-        elif (event == 'random'): choice = random.choice(cc_values.aux_cv.keys())
+        if (event == 'default'): choice = core.default_auxCV
+        elif (event == 'random'): choice = cc_values.tables['aux_cv'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_auxCvOut.SetValue(choice)
+        patchState.Set(self.partNumber, 'auxCVout', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_auxCVout']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_auxCVout']
@@ -1109,11 +1003,12 @@ class PartSettings(wx.Panel):
     def OnOscShapeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_oscillator
-        elif (event == 'random'): choice = random.choice(cc_values.oscillator.keys())
+        if (event == 'default'): choice = core.default_oscillator
+        elif (event == 'random'): choice = cc_values.tables['oscillator'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_oscShape.SetValue(choice)
+        patchState.Set(self.partNumber, 'oscillatorShape', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_oscillatorShape']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_oscillatorShape']
@@ -1127,11 +1022,12 @@ class PartSettings(wx.Panel):
     def OnArpClockDivSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_arpClockDiv
-        elif (event == 'random'): choice = random.choice(cc_values.arp_clock_division.keys())
+        if (event == 'default'): choice = core.default_arpClockDiv
+        elif (event == 'random'): choice = cc_values.tables['arp_clock_division'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_arpClockDiv.SetValue(choice)
+        patchState.Set(self.partNumber, 'arpClockDiv', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_arpClockDiv']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_arpClockDiv']
@@ -1145,11 +1041,12 @@ class PartSettings(wx.Panel):
     def OnArpGateLengthSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_arpGateLength
-        elif (event == 'random'): choice = random.choice(cc_values.arp_gate_length.keys())
+        if (event == 'default'): choice = core.default_arpGateLength
+        elif (event == 'random'): choice = cc_values.tables['arp_gate_length'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_arpGateLength.SetValue(choice)
+        patchState.Set(self.partNumber, 'arpGateLength', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_arpGateLength']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_arpGateLength']
@@ -1163,11 +1060,12 @@ class PartSettings(wx.Panel):
     def OnArpRangeSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_arpRange
-        elif (event == 'random'): choice = random.choice(cc_values.arp_range.keys())
+        if (event == 'default'): choice = core.default_arpRange
+        elif (event == 'random'): choice = cc_values.tables['arp_range'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_arpRange.SetValue(choice)
+        patchState.Set(self.partNumber, 'arpRange', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_arpRange']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_arpRange']
@@ -1181,11 +1079,12 @@ class PartSettings(wx.Panel):
     def OnArpDirectionSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_arpDirection
-        elif (event == 'random'): choice = random.choice(cc_values.arp_direction.keys())
+        if (event == 'default'): choice = core.default_arpDirection
+        elif (event == 'random'): choice = cc_values.tables['arp_direction'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_arpDirection.SetValue(choice)
+        patchState.Set(self.partNumber, 'arpDirection', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_arpDirection']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_arpDirection']
@@ -1199,11 +1098,12 @@ class PartSettings(wx.Panel):
     def OnArpPatternSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_arpPattern
-        elif (event == 'random'): choice = random.choice(cc_values.arp_pattern.keys())
+        if (event == 'default'): choice = core.default_arpPattern
+        elif (event == 'random'): choice = cc_values.tables['arp_pattern'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_arpPattern.SetValue(choice)
+        patchState.Set(self.partNumber, 'arpPattern', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_arpPattern']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_arpPattern']
@@ -1217,11 +1117,12 @@ class PartSettings(wx.Panel):
     def OnEucLengthSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_eucLength
-        elif (event == 'random'): choice = random.choice(cc_values.euclidean.keys())
+        if (event == 'default'): choice = core.default_eucLength
+        elif (event == 'random'): choice = cc_values.tables['euclidean'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_eucLength.SetValue(choice)
+        patchState.Set(self.partNumber, 'euclideanLength', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_euclideanLength']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_euclideanLength']
@@ -1235,11 +1136,12 @@ class PartSettings(wx.Panel):
     def OnEucFillSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_eucFill
-        elif (event == 'random'): choice = random.choice(cc_values.euclidean.keys())
+        if (event == 'default'): choice = core.default_eucFill
+        elif (event == 'random'): choice = cc_values.tables['euclidean'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_eucFill.SetValue(choice)
+        patchState.Set(self.partNumber, 'euclideanFill', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_euclideanFill']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_euclideanFill']
@@ -1253,11 +1155,12 @@ class PartSettings(wx.Panel):
     def OnEucRotateSelect(self, event):
         ''' combobox '''
         # get event type
-        if (event == 'default'): choice = default_eucRotate
-        elif (event == 'random'): choice = random.choice(cc_values.euclidean.keys())
+        if (event == 'default'): choice = core.default_eucRotate
+        elif (event == 'random'): choice = cc_values.tables['euclidean'].Random()
         else: choice = event.GetString()
         # correct combobox value 
         self.cbox_eucRotate.SetValue(choice)
+        patchState.Set(self.partNumber, 'euclideanRotate', choice)
         # set controller
         if   (self.partNumber == 1): controller = cc_values.controllers['part1_euclideanRotate']
         elif (self.partNumber == 2): controller = cc_values.controllers['part2_euclideanRotate']
@@ -1270,34 +1173,38 @@ class PartSettings(wx.Panel):
 
     def SendDefaults(self):
         ''' inits yarns with some default settings '''
-        self.OnVibratoRangeSelect('default')
-        self.OnVibratoSpeedSelect('default')
-        self.OnPitchBendRangeSelect('default')
-        self.OnTransposeSelect('default')
-        self.OnFineTuningSelect('default')
-        self.OnTriggerDurationSelect('default')
-        self.OnArpRangeSelect('default')
-        self.OnArpPatternSelect('default')
-        self.OnArpGateLengthSelect('default')
-        self.OnEucLengthSelect('default')
-        self.OnEucFillSelect('default')
-        self.OnEucRotateSelect('default')
-        self.OnPortamentoSelect('default')
-        self.OnChannelSelect('default')
-        self.OnLowerNoteSelect('default')
-        self.OnUpperNoteSelect('default')
-        self.OnMidiOutModeSelect('default')
-        self.OnVoicingSelect('default')
-        self.OnNotePrioritySelect('default')
-        self.OnLegatoSelect('default')
-        self.OnTuningRootSelect('default')
-        self.OnTuningSystemSelect('default')
-        self.OnVelocityScaleSelect('default')
-        self.OnTriggerShapeSelect('default')
-        self.OnAuxCvOutSelect('default')
-        self.OnOscShapeSelect('default')
-        self.OnArpClockDivSelect('default')
-        self.OnArpDirectionSelect('default')
+        midiManager.BeginBatch()
+        try:
+            self.OnVibratoRangeSelect('default')
+            self.OnVibratoSpeedSelect('default')
+            self.OnPitchBendRangeSelect('default')
+            self.OnTransposeSelect('default')
+            self.OnFineTuningSelect('default')
+            self.OnTriggerDurationSelect('default')
+            self.OnArpRangeSelect('default')
+            self.OnArpPatternSelect('default')
+            self.OnArpGateLengthSelect('default')
+            self.OnEucLengthSelect('default')
+            self.OnEucFillSelect('default')
+            self.OnEucRotateSelect('default')
+            self.OnPortamentoSelect('default')
+            self.OnChannelSelect('default')
+            self.OnLowerNoteSelect('default')
+            self.OnUpperNoteSelect('default')
+            self.OnMidiOutModeSelect('default')
+            self.OnVoicingSelect('default')
+            self.OnNotePrioritySelect('default')
+            self.OnLegatoSelect('default')
+            self.OnTuningRootSelect('default')
+            self.OnTuningSystemSelect('default')
+            self.OnVelocityScaleSelect('default')
+            self.OnTriggerShapeSelect('default')
+            self.OnAuxCvOutSelect('default')
+            self.OnOscShapeSelect('default')
+            self.OnArpClockDivSelect('default')
+            self.OnArpDirectionSelect('default')
+        finally:
+            midiManager.EndBatch()
 
 
 class EditorSettings(wx.Panel):
@@ -1329,14 +1236,14 @@ class EditorSettings(wx.Panel):
 
         # remote control channel
         txt_channel = wx.StaticText(self, label='MIDI RC Channel:')
-        spin_channel = wx.SpinCtrl(self, value=default_remoteChannel)
+        spin_channel = wx.SpinCtrl(self, value=core.default_remoteChannel)
         spin_channel.Bind(wx.EVT_SPINCTRL, self.OnRemoteChannelSelect)
         spin_channel.SetRange(1, 16)
 
         # notes
         txt_notes = wx.StaticText(self, label='Set MIDI channel to match Yarns RC channel.\n' + 
                                               'Restart program to refresh attached devices.\n' +
-                                              'This program only supports firmware %s' %(firmware))
+                                              'This program only supports firmware %s' %(core.firmware))
         # select button
         self.btn_confirm = wx.Button(self, label='Confirm Settings')
         self.btn_confirm.Bind(wx.EVT_BUTTON, self.OnConfirm)
@@ -1385,6 +1292,85 @@ class EditorSettings(wx.Panel):
         ''' called when the user clicks a midi output device in the listbox '''
         midiManager.SetOutput(event.GetString())
 
+class LibraryDialog(wx.Dialog):
+    ''' browses the patch library a page at a time, and loads the chosen patch '''
+    def __init__(self, parent, patchLibrary):
+        wx.Dialog.__init__(self, parent, title='Patch Library', size=(420, 480),
+                           style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+        self.library = patchLibrary
+        # the current search, page, and the (id, name) pairs on it
+        self.query = ('', {}, [])
+        self.page = 0
+        self.count = 0
+        self.patches = []
+        # the patch to load, once the dialog closes with wx.ID_OK
+        self.snapshot = None
+
+        # widgets
+        txt_search = wx.StaticText(self, label='Search (name, parameter=value, #tag):')
+        self.txt_query = wx.TextCtrl(self, style=wx.TE_PROCESS_ENTER)
+        self.txt_query.Bind(wx.EVT_TEXT, self.OnQuery)
+        self.listbox = wx.ListBox(self)
+        self.listbox.Bind(wx.EVT_LISTBOX_DCLICK, self.OnLoad)
+        self.txt_page = wx.StaticText(self, label='')
+        btn_previous = wx.Button(self, label='<')
+        btn_previous.Bind(wx.EVT_BUTTON, self.OnPrevious)
+        btn_next = wx.Button(self, label='>')
+        btn_next.Bind(wx.EVT_BUTTON, self.OnNext)
+        btn_load = wx.Button(self, label='Load')
+        btn_load.Bind(wx.EVT_BUTTON, self.OnLoad)
+
+        # add it all to the sizers
+        buttons = wx.BoxSizer(wx.HORIZONTAL)
+        buttons.Add(btn_previous)
+        buttons.Add(self.txt_page, 1, wx.ALIGN_CENTRE_VERTICAL | wx.LEFT | wx.RIGHT, 8)
+        buttons.Add(btn_next)
+        buttons.Add(btn_load, 0, wx.LEFT, 16)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(txt_search, 0, wx.ALL, 4)
+        sizer.Add(self.txt_query, 0, wx.EXPAND | wx.ALL, 4)
+        sizer.Add(self.listbox, 1, wx.EXPAND | wx.ALL, 4)
+        sizer.Add(buttons, 0, wx.EXPAND | wx.ALL, 4)
+        self.SetSizer(sizer)
+        self.ShowPage(0)
+
+    def ShowPage(self, page):
+        ''' fetches one page of the current search into the listbox '''
+        prefix, where, tags = self.query
+        if (page == 0): self.count = self.library.Count(prefix, where, tags)
+        pages = max(1, (self.count + library.page_size - 1) // library.page_size)
+        self.page = min(max(page, 0), pages - 1)
+        self.patches = self.library.Search(prefix, where, tags, self.page, count=self.count)
+        self.listbox.Set([name for patch_id, name in self.patches])
+        self.txt_page.SetLabel('page %d of %d, %d patches' % (self.page + 1, pages, self.count))
+
+    def OnQuery(self, event):
+        ''' called as the search text changes '''
+        query = library.ParseQuery(self.txt_query.GetValue())
+        try:
+            for name, text in query[1].items(): self.library.FindLabel(name, text)
+        except ValueError:
+            # still being typed
+            return
+        self.query = query
+        self.ShowPage(0)
+
+    def OnPrevious(self, event):
+        ''' shows the previous page '''
+        self.ShowPage(self.page - 1)
+
+    def OnNext(self, event):
+        ''' shows the next page '''
+        self.ShowPage(self.page + 1)
+
+    def OnLoad(self, event):
+        ''' closes the dialog with the selected patch '''
+        selection = self.listbox.GetSelection()
+        if (selection == wx.NOT_FOUND): return
+        name, self.snapshot, tags = self.library.Get(self.patches[selection][0])
+        self.EndModal(wx.ID_OK)
+
+
 class Editor(wx.Notebook):
     ''' all the panels put together in a "notebook" style (with tabs) '''
     def __init__(self, parent):
@@ -1394,17 +1380,38 @@ class Editor(wx.Notebook):
         self.page_editor = EditorSettings(self)
         self.AddPage(self.page_editor, 'Editor')
 
+        # part pages are built when their tab is first shown
+        self.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.OnPageChanged)
+
+        # the pages show whatever the patch state is changed to
+        patchState.Observe(self.OnStateChanged)
+
+    def OnPageChanged(self, event):
+        ''' builds a part's settings page the first time its tab is selected '''
+        page = self.GetPage(event.GetSelection())
+        if (isinstance(page, PartPage)): page.Build()
+        event.Skip()
+
     def OnConfirm(self):
         ''' confirms midi device selection '''
 
         # close/re open midi ports
         midiManager.CloseMIDI()
         midiManager.OpenMIDI()
+        midiManager.ForgetSent()
+
+        # mirror edits made on yarns itself, if there's an input to hear them on
+        if (midiManager.midi_input_port):
+            midiManager.StartListener(lambda edits: wx.CallAfter(self.OnHardwareEdits, edits))
 
          # add layout panel and switch to it
         self.OnPartChange(0)
         self.ChangeSelection(1)
 
+        # patches, setlists and playback can go out now
+        window = self.GetTopLevelParent()
+        if (isinstance(window, Window)): window.EnableSending()
+
     def KillPage(self, pageText):
         ''' removes a notebook page based on its page label '''
         for index in range(self.GetPageCount()):
@@ -1413,14 +1420,36 @@ class Editor(wx.Notebook):
                 self.SendSizeEvent()
                 break
 
-    def OnPartChange(self, number_of_parts):
+    def OnHardwareEdits(self, edits):
+        ''' stores a batch of (part, parameter, label) edits made on yarns. OnStateChanged() shows them '''
+        patchState.Update(edits)
+
+    def LoadPatch(self, target):
+        ''' sends yarns only the parameters a Snapshot() changes, then shows them '''
+        pairs, edits = patchState.Delta(target)
+        midiManager.SendMany(pairs)
+        patchState.Update(edits)
+        return len(pairs)
+
+    def OnStateChanged(self, edits):
+        ''' shows (part, parameter, label) edits made to the patch state. part 0 is the layout page '''
+        for part, parameter, label in edits:
+            # a layout change can add or remove part pages, so look them up for every edit
+            pages = {}
+            for index in range(1, self.GetPageCount()):
+                page = self.GetPage(index)
+                if (isinstance(page, LayoutSettings)): pages[0] = page
+                elif (isinstance(page, PartPage)): pages[page.partNumber] = page
+            if (part in pages): pages[part].ShowValue(parameter, label)
+
+    def OnPartChange(self, number_of_parts, sendDefaults=True):
         ''' enables/disables tabs as layouts are changed '''
         if (number_of_parts == 0):
             # add the layout panel if it doesn't exist
             if (self.GetPageCount() == 1):
                 page_layout = LayoutSettings(self)
                 self.AddPage(page_layout, 'Layout')
-                page_layout.SendDefaults()
+                if (sendDefaults): page_layout.SendDefaults()
 
         elif (number_of_parts == 1):
             # remove parts 2, 3, and 4 if they exist
@@ -1429,9 +1458,9 @@ class Editor(wx.Notebook):
             self.KillPage('Part 4')
             # add page 1 if it doesn't exist
             if (self.GetPageCount() == 2):
-                page_part1 = PartSettings(self, 1)
+                page_part1 = PartPage(self, 1)
                 self.AddPage(page_part1, 'Part 1')
-                page_part1.SendDefaults()
+                if (sendDefaults): page_part1.SendDefaults()
 
         elif (number_of_parts == 2):
             # remove parts 3 and 4 if they exist
@@ -1439,30 +1468,30 @@ class Editor(wx.Notebook):
             self.KillPage('Part 4')
             # add page 2 if it doesn't exist
             if (self.GetPageCount() == 3):
-                page_part2 = PartSettings(self, 2)
+                page_part2 = PartPage(self, 2)
                 self.AddPage(page_part2, 'Part 2')
-                page_part2.SendDefaults()
+                if (sendDefaults): page_part2.SendDefaults()
 
         elif (number_of_parts == 4):
             if (self.GetPageCount() == 4):
                 # add parts 3 and 4 if they don't exist
-                page_part3 = PartSettings(self, 3)
-                page_part4 = PartSettings(self, 4)
+                page_part3 = PartPage(self, 3)
+                page_part4 = PartPage(self, 4)
                 self.AddPage(page_part3, 'Part 3')
                 self.AddPage(page_part4, 'Part 4')
-                page_part3.SendDefaults()
-                page_part4.SendDefaults()
+                if (sendDefaults): page_part3.SendDefaults()
+                if (sendDefaults): page_part4.SendDefaults()
             elif (self.GetPageCount() == 3):
                 # add parts 2, 3, and 4 if they don't exist
-                page_part2 = PartSettings(self, 2)
-                page_part3 = PartSettings(self, 3)
-                page_part4 = PartSettings(self, 4)
+                page_part2 = PartPage(self, 2)
+                page_part3 = PartPage(self, 3)
+                page_part4 = PartPage(self, 4)
                 self.AddPage(page_part2, 'Part 2')
                 self.AddPage(page_part3, 'Part 3')
                 self.AddPage(page_part4, 'Part 4')
-                page_part2.SendDefaults()
-                page_part3.SendDefaults()
-                page_part4.SendDefaults()
+                if (sendDefaults): page_part2.SendDefaults()
+                if (sendDefaults): page_part3.SendDefaults()
+                if (sendDefaults): page_part4.SendDefaults()
         else: 
             raise ValueError('Incorrect value passed to Editor.OnPartChange()')
 
@@ -1497,15 +1526,23 @@ class Window(wx.Frame):
         self.SetMinSize((xSize, ySize))
         self.SetIcon(images.icon.GetIcon())
         self.Bind(wx.EVT_CLOSE, self.OnQuit)
+        # the patch library, opened when first used, and the setlist, once one is loaded
+        self.library = None
+        self.setlist = None
+        # the morph in progress, if any
+        self.morph = None
+        # the last automation recording, and its playback
+        self.recorder = None
+        self.player = None
         self.InitMenubar()
         self.InitGUI()
 
     def InitGUI(self):
         ''' creates the window elements '''
         panel = wx.Panel(self)
-        notebook = Editor(panel)
+        self.notebook = Editor(panel)
         sizer = wx.BoxSizer(wx.VERTICAL)
-        sizer.Add(notebook, 1, wx.EXPAND)
+        sizer.Add(self.notebook, 1, wx.EXPAND)
         sizer.Layout() # causes black box glitch if omitted
         panel.SetSizer(sizer)
         self.Layout()
@@ -1519,22 +1556,283 @@ class Window(wx.Frame):
 
         # file menu
         fileMenu = wx.Menu()
+        fileMenu_load = fileMenu.Append(wx.ID_OPEN, '&Load Patch...')
+        fileMenu_save = fileMenu.Append(wx.ID_SAVE, '&Save Patch...')
+        fileMenu_export = fileMenu.Append(wx.ID_ANY, '&Export Patch as JSON...')
+        fileMenu_morph = fileMenu.Append(wx.ID_ANY, '&Morph to Patch...')
+        fileMenu.AppendSeparator()
+        self.Bind(wx.EVT_MENU, self.OnMorphPatch, fileMenu_morph)
+        fileMenu_store = fileMenu.Append(wx.ID_ANY, '&Add Patch to Library...')
+        fileMenu_browse = fileMenu.Append(wx.ID_ANY, '&Browse Library...')
+        fileMenu.AppendSeparator()
+        self.Bind(wx.EVT_MENU, self.OnStorePatch, fileMenu_store)
+        self.Bind(wx.EVT_MENU, self.OnBrowseLibrary, fileMenu_browse)
+        self.Bind(wx.EVT_MENU, self.OnLoadPatch, id=wx.ID_OPEN)
+        self.Bind(wx.EVT_MENU, self.OnSavePatch, id=wx.ID_SAVE)
+        self.Bind(wx.EVT_MENU, self.OnExportPatch, fileMenu_export)
         fileMenu_quit = fileMenu.Append(wx.ID_EXIT, '&Quit Yarns Editor')
         self.Bind(wx.EVT_MENU, self.OnQuit, id=wx.ID_EXIT)
 
+        # setlist menu
+        setlistMenu = wx.Menu()
+        setlistMenu_load = setlistMenu.Append(wx.ID_ANY, '&Load Setlist...')
+        setlistMenu_next = setlistMenu.Append(wx.ID_ANY, '&Next Patch\tCtrl+Right')
+        setlistMenu_previous = setlistMenu.Append(wx.ID_ANY, '&Previous Patch\tCtrl+Left')
+        self.Bind(wx.EVT_MENU, self.OnLoadSetlist, setlistMenu_load)
+        self.Bind(wx.EVT_MENU, self.OnNextPatch, setlistMenu_next)
+        self.Bind(wx.EVT_MENU, self.OnPreviousPatch, setlistMenu_previous)
+
+        # automation menu
+        automationMenu = wx.Menu()
+        automationMenu_record = automationMenu.Append(wx.ID_ANY, '&Record')
+        automationMenu_play = automationMenu.Append(wx.ID_ANY, '&Play')
+        automationMenu_loop = automationMenu.Append(wx.ID_ANY, 'Play &Looped')
+        automationMenu_stop = automationMenu.Append(wx.ID_ANY, '&Stop')
+        automationMenu.AppendSeparator()
+        automationMenu_load = automationMenu.Append(wx.ID_ANY, 'L&oad Recording...')
+        automationMenu_save = automationMenu.Append(wx.ID_ANY, 'S&ave Recording...')
+        self.Bind(wx.EVT_MENU, self.OnRecord, automationMenu_record)
+        self.Bind(wx.EVT_MENU, lambda event: self.OnPlay(event, loop=False), automationMenu_play)
+        self.Bind(wx.EVT_MENU, lambda event: self.OnPlay(event, loop=True), automationMenu_loop)
+        self.Bind(wx.EVT_MENU, self.OnStopAutomation, automationMenu_stop)
+        self.Bind(wx.EVT_MENU, self.OnLoadRecording, automationMenu_load)
+        self.Bind(wx.EVT_MENU, self.OnSaveRecording, automationMenu_save)
+
         # help menu
         helpMenu = wx.Menu()
         helpMenu_about = helpMenu.Append(wx.ID_ABOUT, '&About Yarns Editor')
         self.Bind(wx.EVT_MENU, self.OnAbout, id=wx.ID_ABOUT)
 
+        # everything that sends to yarns waits for Confirm Settings, which opens the ports
+        self.send_items = [fileMenu_load, fileMenu_morph, fileMenu_browse, setlistMenu_next,
+                           setlistMenu_previous, automationMenu_play, automationMenu_loop]
+        for item in self.send_items: item.Enable(False)
+
         # add items to menubar
         menubar.Append(fileMenu, '&File')
+        menubar.Append(setlistMenu, '&Setlist')
+        menubar.Append(automationMenu, '&Automation')
         menubar.Append(helpMenu, '&Help')
         self.SetMenuBar(menubar)
 
+    def EnableSending(self):
+        ''' enables the menu items that send to yarns, once the ports are open '''
+        for item in self.send_items: item.Enable(True)
+
+    def OnLoadPatch(self, event):
+        ''' loads a patch file and sends yarns whatever it changes '''
+        dialog = wx.FileDialog(self, 'Load Patch', wildcard=patch_wildcard, style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        if (dialog.ShowModal() == wx.ID_OK):
+            try:
+                snapshot = patch.Load(dialog.GetPath(), patchState)
+            except (IOError, ValueError) as error:
+                wx.MessageBox(str(error), 'Load Patch', wx.OK | wx.ICON_ERROR)
+            else:
+                self.LoadPatch(snapshot)
+        dialog.Destroy()
+
+    def ShowPages(self):
+        ''' adds the layout page and its part pages, without sending anything, if they aren't there yet '''
+        if (self.notebook.GetPageCount() == 1):
+            self.notebook.OnPartChange(0, sendDefaults=False)
+            self.notebook.GetPage(1).ChangeLayout(patchState.Get(0, 'layout'), sendDefaults=False)
+
+    def LoadPatch(self, snapshot):
+        ''' sends yarns a patch, adding the pages to show it if need be '''
+        self.StopMorph()
+        self.ShowPages()
+        self.notebook.LoadPatch(snapshot)
+
+    def OnSavePatch(self, event):
+        ''' saves the current settings as a patch file '''
+        dialog = wx.FileDialog(self, 'Save Patch', wildcard=patch_wildcard, style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if (dialog.ShowModal() == wx.ID_OK):
+            path = dialog.GetPath()
+            try:
+                # the same choice patch.Load() makes, so the file loads back
+                if (path.lower().endswith('.json')): patch.SaveJSON(path, patchState)
+                else: patch.Save(path, patchState)
+            except IOError as error:
+                wx.MessageBox(str(error), 'Save Patch', wx.OK | wx.ICON_ERROR)
+        dialog.Destroy()
+
+    def OnExportPatch(self, event):
+        ''' saves the current settings as readable json '''
+        dialog = wx.FileDialog(self, 'Export Patch', wildcard='JSON (*.json)|*.json', style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if (dialog.ShowModal() == wx.ID_OK):
+            try:
+                patch.SaveJSON(dialog.GetPath(), patchState)
+            except IOError as error:
+                wx.MessageBox(str(error), 'Export Patch', wx.OK | wx.ICON_ERROR)
+        dialog.Destroy()
+
+    def OnMorphPatch(self, event):
+        ''' glides from the current settings to a patch file over a number of beats '''
+        dialog = wx.FileDialog(self, 'Morph to Patch', wildcard=patch_wildcard, style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        path = dialog.GetPath() if (dialog.ShowModal() == wx.ID_OK) else None
+        dialog.Destroy()
+        if (path == None): return
+        beats = wx.GetNumberFromUser('Beats to morph over, at the current tempo:', 'Beats', 'Morph to Patch', 4, 1, 256, self)
+        if (beats < 0): return
+        try:
+            target = patch.Load(path, patchState)
+        except (IOError, ValueError) as error:
+            wx.MessageBox(str(error), 'Morph to Patch', wx.OK | wx.ICON_ERROR)
+            return
+        self.ShowPages()
+        # a morph that's still going starts this one from wherever it got to
+        self.StopMorph()
+        duration = morph.BeatsToSeconds(beats, patchState.Get(0, 'tempo'))
+        # the widgets show the result once the glide ends
+        gliding = morph.Morph(patchState, midiManager, patchState.Snapshot(), target, duration, morph_rate,
+                              done=lambda edits: wx.CallAfter(self.OnMorphDone, gliding, edits))
+        self.morph = gliding
+        self.morph.Start()
+
+    def OnMorphDone(self, finished, edits):
+        ''' stores where a morph ended, unless StopMorph() already did '''
+        if (finished is not self.morph): return
+        self.morph = None
+        patchState.Update(edits)
+
+    def StopMorph(self):
+        ''' stops a running morph and stores where it got to now, so whatever comes next diffs against it '''
+        if (self.morph == None): return
+        self.morph.Stop(1.0)
+        patchState.Update(self.morph.GetEdits())
+        self.morph = None
+
+    def ShowStatus(self, text):
+        ''' shows text in the status bar, adding one if need be '''
+        if (not self.GetStatusBar()): self.CreateStatusBar()
+        self.SetStatusText(text)
+
+    def OnRecord(self, event):
+        ''' starts a new automation recording of every CC sent and heard '''
+        self.OnStopAutomation(None)
+        self.recorder = automation.Recorder(morph.TempoToBPM(patchState.Get(0, 'tempo')))
+        midiManager.SetRecorder(self.recorder)
+        self.recorder.Start()
+        self.ShowStatus('Recording automation')
+
+    def OnPlay(self, event, loop=False):
+        ''' plays the automation recording at the current tempo '''
+        self.OnStopAutomation(None)
+        if (self.recorder == None or len(self.recorder) == 0): return
+        # what plays goes into the patch state too, so the widgets follow it and later diffs are right
+        player = automation.Player(midiManager, self.recorder, loop, morph.TempoToBPM(patchState.Get(0, 'tempo')),
+                                   done=lambda: wx.CallAfter(self.ShowStatus, 'Automation played'),
+                                   sent=lambda: wx.CallAfter(self.OnAutomationSent, player))
+        self.player = player
+        self.player.Start()
+        self.ShowStatus('Playing automation%s' % (' (looped)' if (loop) else ''))
+
+    def OnStopAutomation(self, event):
+        ''' stops recording and playback '''
+        if (self.recorder != None and self.recorder.IsRecording()):
+            self.recorder.Stop()
+            midiManager.SetRecorder(None)
+            self.ShowStatus('Recorded %d CCs over %.1f s' % (len(self.recorder), self.recorder.length))
+        if (self.player):
+            self.player.Stop(1.0)
+            self.OnAutomationSent(self.player)
+            self.player = None
+
+    def OnAutomationSent(self, player):
+        ''' stores what a player has sent since last time in the patch state '''
+        patchState.Update(patchState.Decode(player.TakeSent()))
+
+    def OnLoadRecording(self, event):
+        ''' loads an automation recording '''
+        dialog = wx.FileDialog(self, 'Load Recording', wildcard=automation_wildcard, style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        if (dialog.ShowModal() == wx.ID_OK):
+            self.OnStopAutomation(None)
+            recorder = automation.Recorder()
+            try:
+                recorder.Load(dialog.GetPath())
+            except (IOError, ValueError) as error:
+                wx.MessageBox(str(error), 'Load Recording', wx.OK | wx.ICON_ERROR)
+            else:
+                self.recorder = recorder
+        dialog.Destroy()
+
+    def OnSaveRecording(self, event):
+        ''' saves the automation recording '''
+        if (self.recorder == None): return
+        self.OnStopAutomation(None)
+        dialog = wx.FileDialog(self, 'Save Recording', wildcard=automation_wildcard, style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if (dialog.ShowModal() == wx.ID_OK):
+            try:
+                self.recorder.Save(dialog.GetPath())
+            except IOError as error:
+                wx.MessageBox(str(error), 'Save Recording', wx.OK | wx.ICON_ERROR)
+        dialog.Destroy()
+
+    def GetLibrary(self):
+        ''' opens the patch library the first time it's needed '''
+        if (self.library == None): self.library = library.Library(patchState)
+        return self.library
+
+    def OnStorePatch(self, event):
+        ''' adds the current settings to the library, with a name and optional #tags '''
+        dialog = wx.TextEntryDialog(self, 'Patch name, then any #tags:', 'Add Patch to Library')
+        if (dialog.ShowModal() == wx.ID_OK):
+            words = dialog.GetValue().split()
+            name = ' '.join(word for word in words if (not word.startswith('#')))
+            tags = [word[1:] for word in words if (word.startswith('#'))]
+            if (name): self.GetLibrary().Add(name, patchState.Snapshot(), tags)
+        dialog.Destroy()
+
+    def OnBrowseLibrary(self, event):
+        ''' searches the library, and loads the chosen patch '''
+        dialog = LibraryDialog(self, self.GetLibrary())
+        if (dialog.ShowModal() == wx.ID_OK): self.LoadPatch(dialog.snapshot)
+        dialog.Destroy()
+
+    def OnLoadSetlist(self, event):
+        ''' loads a setlist file, and encodes every patch in it ready to send '''
+        dialog = wx.FileDialog(self, 'Load Setlist', wildcard='Setlist (*.txt)|*.txt', style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        if (dialog.ShowModal() == wx.ID_OK):
+            loaded = setlist.Setlist(patchState, midiManager)
+            try:
+                loaded.Load(dialog.GetPath())
+            except (IOError, ValueError) as error:
+                wx.MessageBox(str(error), 'Load Setlist', wx.OK | wx.ICON_ERROR)
+            else:
+                self.setlist = loaded
+                self.ShowStatus('Setlist: %d patches, Ctrl+Right to start' % (len(loaded.entries)))
+        dialog.Destroy()
+
+    def OnNextPatch(self, event):
+        ''' recalls the next patch in the setlist '''
+        if (self.setlist == None): return
+        self.StopMorph()
+        self.ShowPages()
+        if (self.setlist.Next()): wx.CallLater(100, self.ShowSetlistStatus)
+
+    def OnPreviousPatch(self, event):
+        ''' recalls the previous patch in the setlist '''
+        if (self.setlist == None): return
+        self.StopMorph()
+        self.ShowPages()
+        if (self.setlist.Previous()): wx.CallLater(100, self.ShowSetlistStatus)
+
+    def ShowSetlistStatus(self):
+        ''' shows where in the setlist we are, and how long the last recall took to reach the device '''
+        position = self.setlist.position
+        text = 'Setlist %d/%d: %s' % (position + 1, len(self.setlist.entries), self.setlist.entries[position].name)
+        latency = self.setlist.GetLatency()
+        if (latency != None): text += ', first byte after %.2f ms' % (latency * 1000)
+        self.ShowStatus(text)
+
     def OnQuit(self, event):
         ''' called when the user quits '''
+        if (self.morph): self.morph.Stop(1.0)
+        self.OnStopAutomation(None)
+        midiManager.StopListener()
         midiManager.CloseMIDI()
+        midiManager.DisableQueue(1.0)
+        if (self.library): self.library.Close()
         self.Destroy()
 
     def OnAbout(self, event):
@@ -1550,11 +1848,21 @@ class Window(wx.Frame):
         wx.AboutBox(info)
 
 if __name__ == '__main__':
-    global midiManager
-
-    # handles midi events
-    midiManager = MidiManager()
-    midiManager.SetChannel(default_remoteChannel)
+    global midiManager, patchState
+
+    # the value of every parameter. the widgets show it
+    patchState = core.PatchState()
+
+    # handles midi events. --loopback runs the editor without any midi hardware
+    if ('--loopback' in sys.argv[1:]): midiManager = core.MidiManager(midi_backends.LoopbackBackend())
+    else: midiManager = core.MidiManager()
+    midiManager.SetChannel(core.default_remoteChannel)
+    # keep the GUI thread off the midi driver
+    midiManager.EnableQueue()
+    # don't flood yarns faster than a DIN cable could carry it
+    midiManager.SetRate(core.midi_bytes_per_second)
+    # skip intermediate values when scrolling through long menus
+    midiManager.EnableCoalescing()
 
     # the wx app
     app = wx.App()
@@ -31,6 +31,8 @@ found at the following address: http://mutable-instruments.net/
 '''
 
 # imports
+from collections import OrderedDict
+import wx
 from wx.lib.embeddedimage import PyEmbeddedImage
 
 icon = PyEmbeddedImage(
@@ -52,1706 +54,67 @@ icon = PyEmbeddedImage(
     'RHG2tqB3304qp+MnTHz15KhMRviEyX+0AUtfRI6Yl3OyOKwiJnoUV7Ln/2wDKTwS/1sSxDat'
     '4kj+/wpRs828lfjEZGLEfwGsKC1a2zl3sAAAAABJRU5ErkJggg==')
 
-layout_1M = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhgHCy1p6AAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAhq0lEQVR4nO2dsY8fRZbHrdPm'
-    'djQOGW3sOTsZAiNxGDtDMqTeAIE23mMEiUHigMTg3QMbbXrAcZJ9Egm+ZTPbjDkJS8cFjD0k'
-    'F9krEWAnxn9B3+P3mNpy1evqrurqetW/+n70NOpfdXf1+1W99+2q6p6ZQx0AAChxSNsBAEC7'
-    'QIAAAGpAgAAAakCAAABqQIAAAGpAgECN3L137/znnxnTdeb63vfbr79mTNeZNQMC1FF8m9ii'
-    'UBOPseOP7MqtXf+Yj6596Rw2r99rTVU5X5Uza8Y/HGqbG3f2bt7Ziz3r6je3/MKEegBonN9o'
-    'O6ADKcj+3+7v37//8PHPCafTWXTu1uamXWFaVaB+tp7avPDyK9perCnaQzAd7GmXbSOnYGSv'
-    'fnzJPoA++scU+SrrCWY9jQABShQgsp8ePeK9d+/dEw+wa7hya9csqYpLSDb+EiyVGI2jDfvS'
-    'djl9FCukK9oS+cJ773x07UtTyciLzlq50/K+ACl+08EVcT6ArmWuO6aXQdesAFHEUIizJQsQ'
-    'RTbv7ZMzuwb7mMHHOo5X/vI2xTolFYV4QBYZ+mgnRkBwBy+asXKxxbScGaw8MByjw8TB78iO'
-    'Bo0KkE2sAJmAo3DvViHo78orQKL1JZuRxW4oJ52vPOais1Zup726M3blAQEKXxQCNAgEKFqA'
-    '7HEHbZuPpD7Ojd2uYaIA0SninZYnBXYJyyJj39upnGcWlKv2Keb4MRfNVTnPucic+k3al3Rm'
-    'sPI+AXKGTmauZwanEKBBIEDRAkTHmLCmqDX3QLs8rwCZcYET8X3lotv2koQ9ajPfuu+ifV9q'
-    'SuX2l7Uz37RMSWcGK+9z3ln0cTqRZcjvXGADAUoRIH/VmW+YAQGKoi/io8odJ50VEzvtedyh'
-    'Unm3Wjb2d9XzTUdetG9RHIRp/UXENLY2NzcOH7FLTh8/oeVMHw+efC/p6JEjfR8T3mDKWPnG'
-    'k+cmMOs3HXlR+6UwMB4IUCK/+6fnAh8BAGOAACViD3mOPbV5dPJtHCyaBz/jPfgktOeA+iSs'
-    'AXGhebfQzP8Da0BRLyJmWaQIfzV/l0rlXc/yfFXfdMxFxT7FwtAgEKB0AfKZ6SlYcrm9/mr/'
-    '7oiz7surtjVUbtK4BmeiLmqe/TP8BgAeww/SqAD1vbvcJx8LFSDnSQ0lif/CS9+rN7NWzu9M'
-    'Jbx6o/JN+8qdZ/z+94IADQIBWmcB8nc5ZntSsnLR7BFEVd80y0WBCBah15wzx0988oedY09t'
-    'OuUbh4/snH3p/Wl/ZSK58nPPPuccT/VMfJI96zcNXPSrt991vg5DnlT4ckZ1aCsgKIf5/ds5'
-    'FkfDlfuDCJq/aDkzE/ZvOBe76NKBAIESBGYxoGUgQKAEECAgAgECJYAAAREIECgBBAiIQIAA'
-    'AGpAgAAAakCACvHd//4PTNG0+x/IQIAKoZ6BjZt2/wMZCFAh1DOwcdPufyADASqEegY2btr9'
-    'D2QgQIVQz8DGTbv/gQwEqBDqGdi4afc/kIEAFUI9Axs37f4HMhCgQqhnYOOm3f9ABgJUCPUM'
-    'bNy0+x/IQIAKoZ6BjZt2/wMZCFAh1DOwcdPufyCDP8m6Vjx48ODSpctvnn+L7MaNm1RCP6nQ'
-    'OYZ3heu5euUq10MV7t/dN7voXPt0/uibuMuunz0cc67xnz1nY5cCfoJloK2ArVDgJn/h/QvU'
-    'oed+d442dnZeO7Z17PQB9mF+iV/PxsYGnU4bZHQwVUsbtOurv/6Fw4Y27NqIjRX2Fekw2wf7'
-    'ouSeXR4+l7a58JNP/o0/0i6qQfTziy++wAhoQUCACjG3+rA0UFo6UsKqZBcaNekzymqnHqqc'
-    'kp+Fg8XCOUDUtcCFWDVGnkuXpo/sgL1L9PP27dsQoAUBASrE3AJEqegIjZjMvh6Nr4eFg0ZY'
-    'ZLSRLECslVHn2h95O+wnBGgpYA1oTdjf/4HnID5UfvNg/YU2+g4brOfBgwc/7P+wtYI2nKUl'
-    'katXf12gIbt65epIHxx4VWhr69hIP8GS0FbAVph7BBRY2bFHPYeG5l92PbzmwtC2Peg45E33'
-    'xFEML0ixmTmUM//qO9esAdFUy5xrvkKfn5iCLQuMgNafM2d+GSmYB0z8McCDh78ObTaObpw+'
-    'c5rs5s2bDx4+vHHzJokC1/PLxs2BR2mHfhm2bNHl2Lb+cevQwTBq0Ac+ly69v79/+uDcMX7+'
-    '+OOPgzWDeviNtgMgD5R+b735FqX30aNHhb0Hs7DBaYtdD0OFb7156PHjxyQcpDtmNsezMPFy'
-    'AcbPv1i8Vld/y2wP+gmWBUZAawLlJ01VLl/62JTwO0G8zaMD4vTQ0MPU4yzx0EiEfn766Sfv'
-    'f3CBjDYOrdQk1s8bI3xw/KG5HmmN845Pn59gYWjPAVth7jWg71ZPl2iEwi/UHFst2drLNNzd'
-    '4+s5tBoumZd0fvvb3/rvE9nPwsLrOIz//CtwrvOcnnz407/+0X4PSPQTa0DLAgJUiAICZFZk'
-    'edHXL7eXcsfIENfD7xyaDeeAQP1m+dkYv38o+uyfa1+Or/WnP/3RX9J2/Owz7f4HMhCgQhQT'
-    'oJrNf/5VzLT7H8hAgAqhnvw1mJb6QICqBQJUCPXkb9y0+x/IQIAKoZ6BjZt2/wMZCFAh1DOw'
-    'cdPufyADASqEegY2btr9D2QgQIVQz8DGTbv/gQwEqBDqGdi4afc/kIEAFUI9Axs37f4HMhCg'
-    'QqhnYOOm3f9AZtIvoz79xg6MbNIv483A7te7osGfMOqBVImVbPNEAaoz8bSopDUGE7tw5tfm'
-    'T4BKerASSrZGigChq0QUmyU2jedO+9r8CYN4FinTLPh7QIsnOXVnyvna/AE1Ey1AuF0EKN84'
-    'YtJ+e/u2aCNPXyd/BkE8ByjQOBgBLRg/XfsSO7A3Y87X5g+oHwjQUhGzfcyJM+V8bf6ARQAB'
-    'WiROioYHGj7+8RNzvjZ/wFKAAAEA1IAALQ9/uJFWT65BR23+gAUBAVo2ydme5fTsFWb3B1QO'
-    'BAgAoEZzAnT6+Am2jcNHtH1JwZ6YZBkv2JUkzHpq86dCjj21ySFHG9q+VEcJAbrw8ivffXiZ'
-    'zMl5Lh9Tw7lnn6ODJ7pBldDl3n/5Fba//su7n/xhh2KCfn719rviKVROeydeFzQLhRyF0Kf/'
-    'vMMhRxv0cefsS4M3vywBvwxif31++/XXYu363vd87pVbu375+BoSLu3UQA688N479JF+fnTt'
-    'y58ePaJy2qBdr358yTmFSqic9kZdqK/dcv1ZiYsXPzB29sWzWcyuszZ/pnS6rnHI0U8OObLz'
-    'n3929949KqSNuQM+l0X/fY1IygkQJX/3ZJ4XEyCWGF9KKDJYkjpPHMnYYRM9lRgEaBFGEtOt'
-    '1EfcBQEylBMgznO6A/S1MmkT3x/4MCNVPFTpVt3JxuVUoRlb2cf7RqeTBTyk0/0DqMT2thKD'
-    'AC3CxIhyjALbBLwdw9MDPqMlK8tIygnQ9sGYwjScLUA836Fm5fsDd0ygP6gzWCD84x1j4RPv'
-    'RXYoOKenzb8KWGsCFOtPn2WM50EbE3Ic/2QcwGQc5BR4EwM+r8XqQyxFBcgZBNkC5N8x7AGI'
-    'PyJ1jg90OQ+Gw4NefxaWPP/qa7dciVRbwtfmTw0CNCbk+oKQY3hKwOe1WH2Ipehj+IePf776'
-    'za2tzU3neeTG4SNUePPOnl1IH6lQfF7Ax1NVds037uydOX4i2bH9+/dPW6fTNpVQeVqFANhQ'
-    'xJr3P8RXQKiQQjpwet6Ar4hYxUoQUVvO7UGQKRfvGHahc0PgXVSJGaOS8ag1+XZkz8KmzL/6'
-    '2i3XnTz7oGP6cKM2fyocAXGJgXfxMxCOW4M4AooK+LwWIQ1JlBagbWslKK8A2ct1to1UE3sW'
-    'NuX5V1+7QYDaESAOOf+5qhPVvI5Dh9FHDrYuRoD6Aj6vxepDLAoCZJbTJgrQ+Dl29+TTtz4z'
-    '0+wpz7/62m0mAZqY805V6+GPugAFQs6ErihSXVCAYheVcn2RWVEQoO2D+Y49huy8FTX7LL8G'
-    '//iA8YhG7D+70Lwu1E14/tXXbhlzKVfOZ8z22vxRF6C+kDNSImpK178IHRXwGS1WH2LREaDt'
-    '1SjDrtB5Qu88lvLnRH4H07nioHf7YMxFZj+25Lcq7E7li7Jjye8f9rUbBKgpAeKQ6/rH9f4I'
-    'yLw5PT3gM1qsPsSiJkA80OisxWn73YduJQSmA7i3+DcneJZEu3gKzVM53g7cIkz99vGdN9Ix'
-    'dWbvsLzp5Od8VNr7566fP7oCZIcox62JOnMj5DjngORjTAxPD3gI0N+NWrNv+uOUkxxwV/kz'
-    'IF60JrNVn043hWNmyOZ4fgHMH+awq1Pe7+prt+wZlZzz82V7bf7oCpCJKApOE6VOaJmA53I7'
-    '9rIE/HSL1YdYSghQU9bXbnMklZjzgbQXD15vf9QFaOkWqw+xRL+IOPIPaLRJ+cY59fwpv/CZ'
-    'kydFG3n6OvkzCOI5QIHGae4Pkq0fyUk7U7bX5g+omRQBwk1DRLFZKHWjsjf2+KX7EwbxLFKm'
-    'WRJHQPwXDvO6slwqaQ1O40AmDx6w3v4EqKQHK6Foa8y9yASYmdZWYRMXoYEuEKBCqGdg46bd'
-    '/0AGAlQI9Qxs3LT7H8hAgAqhnoGNm3b/AxkIUCHUM7Bx0+5/IAMBKoR6BjZu2v0PZCBAhVDP'
-    'wMZNu/+BDASoEOoZ2Lhp9z+QgQAVQj0DGzft/gcyEKBCqGdg46bd/0AGAlQI9Qxs3LT7H8hA'
-    'gAqhnoGNm3b/AxkIUCHUM7Bx0+5/IAMBKoR6BjZu2v0PZCBAhVDPwMZNu/+BDASoEOoZ2Lhp'
-    '9z+QmfQnWZ9+YwdGlutvM+Vi9+td0eBPGPVAqsRKtnmiANWZeFpU0hqDiV0482vzJ0AlPVgJ'
-    'JVsjRYDQVSKKzRKbxnOnfW3+hEE8i5RpFvxXjMWTnLoz5Xxt/oCaiRYg3C4ClG8cMWm/vX1b'
-    'tJGnr5M/gyCeAxRoHIyAFoyfrn2JHdibMedr8wfUDwRoqYjZPubEmXK+Nn/AIoAALRInRcMD'
-    'DR//+Ik5X5s/YClAgAAAakCAloc/3EirJ9egozZ/wIKAAC2b5GzPcnr2CrP7AyoHAgQAUKN2'
-    'ATr37HMXXn5F24uKsCcmWcYLdiUJs57a/AHLYnYB+uQPO1+9/a64i8ppb/j0rc3NM8dPTHGA'
-    '9Ou7Dy/zNuQMZITiKmB9kWYHJIj+cxzbr78WZR9d+5LOevXjS045lVA57Q2ffn3v+4SLOg5Q'
-    'JblqG7S+dsv1ZyUuXvzA2NkXz2Yxu87a/Jm1syba+c8/M3b33j3qZbvEj3k/IOu31D+zMZbZ'
-    'BeiF996hs67c2nXKqYTKaW/49LySUUCA5jYIUJ22BqElWla1EZh9Cvbw8c/79++f9qZRVELl'
-    'tJc/bhw+wkNTMpqXHXtqU6yNymlv32FOJTThOmRNu2hja3U8fWTbOfuSP07m8mlfGoBfMeFH'
-    'sUob9NFZB6CgNSHtx+TgXjFr/IvO/TXTiVWsBBH1Z2HO/IvGQT89ekSDWHs0y8fbNxY+SzzM'
-    '7KV6qFqz166BymkvbVMJG4/CfMf88Vo91toIKNfUNWM8i9Y3AuJy/mlizxzJ8wMKSw5pc9jI'
-    'veGssS+a/L1i9SGWEgLkz8Kc+Re1HTWlczy3mt1bzmFk3AH2XntOR73i1OBEiS83IyeGCR2W'
-    'K5FqS/ja/KlTgCg4zX3OD2k73mL3BrLGvmj2eM5Ficfw/izMnn/RMHJrc/PqN7fs42/c2XMe'
-    'fvFhN+/s2YX0kQppl9lr5nS8N+zYD3+7H3AMgFz8/s+XKdicQjFoo/aGs0a8aG0Ueg+Imubo'
-    'kSM8R6WftH3jQB2oHeknNZxZmiHb8taA+LD9JxuUP9Iuce94x1iD6CdtX/3vW7GVlOTU86fM'
-    '9jMnT06v0K7Ernyh/iyIcNCO2TuYNfVTSIB4MMLyzD/DwxNq9xtD45cs/OdKbowADToGQLUU'
-    'y5qMFBIgexYmTnNo3PHWf/y7Y2V844Erjcvopz2mXQQTBx1ZxiwZK8zuz3qjmDXZiF00Sl7N'
-    '4mdh5qez0NW3UG+vuvmHhff6x4grhebhWie9MJlr0S7XYqq/9Ju8+utUsk7+1LYInSukxwR8'
-    'wJmM8ZyLcgJknil23mMmfvbED62MKPDDKbspnafmzsM1vxL/OVrfQy72yjxQm6PDIEAQIL+E'
-    'tzloKSw5PkfuHZk1M8VzLsoJ0PbqwWEn5Tk1rtlFbcfbvnzwiw+d9TKF/ZDS7OVKjLf+m0R0'
-    'GBXajzC5Lwd/L6QeAfJzPirt/XPXz59FCJCJfIa2zftr4/eGswYC9Hej/A/8jgy/asXvBxpd'
-    '51Psw/hXachEvbD3sjY5NdBHcxVTaPfrTB2WPaOSc36+bK/Nn5IC5AdqX3lfif/m7Zi9I7Mm'
-    'ezznoqgA1Wl9v62Wt8PmSCox5wNpLx683v4UE6Dk2HNKeHg+Zm8Zi9WHWKIFqNPus+zm/0LG'
-    'HL01U1715fxIa8GfsADpxjONU0hTePBifp3C6E54bwFLEIdYIEC/tHKW5edwh82XWsk5344/'
-    '1QoQLwgYT2jb+c3EwN4yqTE3KQLUrZ0GFeitWbMrNu0LOFObP4jnvPGci8QXEfkvAOR9I2m5'
-    'VNIap54/xZZ8wHr7E6CSHqyEoq1RRudAmUEHLG0EBLSAABVCPQMbN+3+BzIQoEKoZ2Djpt3/'
-    'QAYCVAj1DGzctPsfyECACqGegY2bdv8DGQhQIdQzsHHT7n8gAwEqhHoGNm7a/Q9kIECFUM/A'
-    'xk27/4EMBKgQ6hnYuGn3P5CBABVCPQMbN+3+BzIQoEKoZ2Djpt3/QAYCVAj1DGzctPsfyECA'
-    'CqGegY2bdv8DGQhQIdQzsHHT7n8gAwEqhHoGNm7a/Q9kIECFUM/Axk27/4HMpP+M+vQbOzCy'
-    'XH+bKRe7X++KBn/CqAdSJVayzRMFqM7E06KS1hhM7MKZX5s/ASrpwUoo2RopAoSuElFsltg0'
-    'njvta/MnDOJZpEyzTJqCgRpITt2Zcr42f0DNRAsQbhcByjeOmLTf3r4t2sjT18mfQRDPAQo0'
-    'DkZAC8ZP177EDuzNmPO1+QPqBwK0VMRsH3PiTDlfmz9gEUCAFomTouGBho9//MScr80fsBQg'
-    'QAAANSBAy8MfbqTVk2vQUZs/YEFAgJZNcrZnOT17hdn9AZUDAQIAqFGvAJ179rkLL7+S98g1'
-    'wJ6YZBkv2JUkzHpq82ctOX38BNvG4SOmcHrYV5E4sb+9uv36a7Zd3/teLCf76dEjKqcD/F1j'
-    'jGvOeORH1750nBl/ifHW1265fqv74sUPjJ198WwWs+tcuj+xvw2fHM9iPeZ0hk6hklc/vhSI'
-    'kMGgdY6/e+8eVzg9esfU0NduucgmQNRSdvn5zz/j8noEyD/Ml6Tp1tduEKA0f/L2zsggGRPP'
-    'VHLl1i6V0E/atk+nj2y0y78NiycGnKHDXnjvHfpIP8krFrWoBJmSOLH6EEseASJVpnaxy6mE'
-    'rKtbgJZoEKBZLSqeWZVsERFjjAttRfNP9I3HPo4Obq9kiCSp71oJXzZ8zHSJCZNHgGhM2FkN'
-    'yh/5p91hVMK92FkjSbtl7b28bTrDETI61wxu7XakI00l9lX41sH+sPnVBtzjI7nvzQF8Xyps'
-    'EKBZLSqeRwrQ9kq/qNwEzBgBonB1RFB0dUz0bq+SywzuaC/rmlMDxTaVOF7F6kMseQRo++AW'
-    'Yb4Jb3dWh3H/UTmPTrmxTDNRA3WrObMZu9qX8/vV7kJ7L4uLGQOz6NBVRAGyTwy7x0dSDTxs'
-    '5rtTOD5mstYEKNafPssez1EC5Bw5KECcDuHZw/jo5b0UrhS3Zq+fOOIVY/UhlmwCxDlJX5Xb'
-    'jiW2s76SP6ylj6aPea89pvBbZ4wABTrSP8wuCbtnboxmL0ukc58JdFiuRKot4WvzJ5cADcZz'
-    'lAA55w4K0Jgh0vjo9ZPLSRy+nKh3sfoQSzYB4u9MH3nhzWl07kWeuzo5TLvEvdMFiO8G3QgB'
-    'Crs36AAEqB5/cglQOJ6rEqCE5LJrCKjPwgSIvzOP9JxGFxvUFIp70wSIl2l4tmUYFKCwe1UJ'
-    'UPacn57ttfmTS4AC8VyVACUkl12D2A6LFCDW2s5abOuKCxDPb3mlht3oIEAQoCQBCsRzrADx'
-    'KowRskF9cY6fVYDCT6uH9GAqOd+Efvj450v/dY2MNjJWO55jT21ubW5e/ebW5b9cu3lnT8uN'
-    'kjxz8qTi6dkrzO7PFDLG85njJ+gnxeTI43/4231z1tz8/s+Xb9zZO7N607rA5VxiFStwxxDl'
-    '0yhr56lseBKbMAISxb4btwgdcK+2EZAz6EgedziVrJM/WUZA4XgePwLyF1nGzLB4Aige44/K'
-    'w9Hr7/WP4VUL/82SWH2IpZwAOY+NHNFxFurNi6f80Xkpiyrh9nJ6ggeutpDZDxftRWXf+bB7'
-    'EKBl+VOJAFE4mYUk5yGUGDy20fH8KpD9pJVf5/FvqOHo9bXMr8G8B+No0GhhSKScAHGDdgdv'
-    '4nRPflvz/WkXixEf7J9rpqxdz3tA3WpaSxtcm/HBvA3Bu/wOCLhXmwD5OR+V9v656+fP3AIk'
-    '1mMv6xqcoX3YAV+DTDyb9wz91wgHk8uux1zX+bLi47C+dsvFVAGirA4v5jtvyvArxWR975jz'
-    'g0/admp29pKZZWbnSHMJvrTtA78/zZWIzve55x9pO6AiQMk5P1+21+ZPggCNj2fzsiubfbox'
-    '/zWxvhMDRsdcP3h71g658dHr7xUTx/hmR3WsPsQyVYBgjvW12xxJJeZ8IO3Fg9fbn1gBgo2M'
-    '51xEPwX77sPLc6yFrwflG+fU86f8wmdOnhRt5Onr5M8giOcABRqn3j9IBkaSnLQzZXtt/oCa'
-    'SREg3DREFJuFUjcqe2OPX7o/YRDPImWaJXEERM6h2wyVtAancSCTBw9Yb38CVNKDlVC0NeZe'
-    'ZALMTGursImL0EAXCFAh1DOwcdPufyADASqEegY2btr9D2QgQIVQz8DGTbv/gQwEqBDqGdi4'
-    'afc/kIEAFUI9Axs37f4HMhCgQqhnYOOm3f9ABgJUCPUMbNy0+x/IQIAKoZ6BjZt2/wMZCFAh'
-    '1DOwcdPufyADASqEegY2btr9D2QgQIVQz8DGTbv/gQwEqBDqGdi4afc/kIEAFUI9Axs37f4H'
-    'MhCgQqhnYOOm3f9ABgJUCPUMbNy0+x/ITPqTrE+/sQMjy/W3mXKx+/WuaPAnjHogVWIl2zxR'
-    'gOpMPC0qaY3BxC6c+bX5E6CSHqyEkq2RIkDoKhHFZolN47nTvjZ/wiCeRco0C/4rxuJJTt2Z'
-    'cr42f0DNRAsQbhcByjeOmLTf3r4t2sjT18mfQRDPAQo0DkZAC8ZP177EDuzNmPO1+QPqBwK0'
-    'VMRsH3PiTDlfmz9gEUCAFomTouGBho9//MScr80fsBQgQAAANSBAy8MfbqTVk2vQUZs/YEFA'
-    'gJZNcrZnOT17hdn9AZUDAQIAqNG6AJ179rkLL7+StlcFe2KSZbxgV5Iw66nNnzVj4/CR08dP'
-    'sGn7Mg+xv726/fprg3b33j06kn6OOThg1/e+H3nFmS6R4EBfu+X6re6LFz8wdvbFs1nMrnPp'
-    '/sT+NrzY42Kn//ToEZXTAWJHO6czdAqVvPrxpUCEBGLpyq1d52DKKa7to2tfGk8SbPzp/UqQ'
-    'h/wC9MJ773SrpqeftD1FHSa28hiDAFUuQLP2fl+PExR7dvn5zz/jchOQVMICQT9p2z6dPrLR'
-    'Lke2+k7s88S4QanEZ/EpE+/N40+P1YdY8gsQNVm3arjO68UKLbsAzW0QoALxQAMNEg67nEp4'
-    'XO9ISXegCIGAcaREPNExGuaI6UMyxCMgCFCvmc6jn84szKg4Y0anfeXOCIgO4yDgY+gUs5eP'
-    'tOuhI834i/aaEztrHGt6wq6ZaujrJzrM3CHtSkoaBGhW4/7l/DcCwR/5Z4IAbR8sSpiAHBSg'
-    '8AEUz2ZgxRYOcpNHVEIbt/bv+qf3Waw+xJJZgHj+xTnMWmDPwuhrk1FzUMtyI/KX7yu3u9PM'
-    '7Hhw68zV+SPt5WEtj7/MTYxb2QyMufXtO4k50blZOQ6wpHIl3NnlNag1AYr1p89GxrPpcR7y'
-    'cCHFBm93qQLkHDlyBNS3iioK0GCQm5T5vx9/XFsB4sznr+0MI8VG58YSy53u5IGVLWf2XnPj'
-    'MntZ/kSBYC2zNc6+OiuLfwlnWG5XMqbDciVSbQlfmz+5BMhEMnc0h3GXKkDOuYMCZOLQ3Br7'
-    '/OwzP8j9gX84lxcpQHb2svdGxbnR/WltX7ndTPbAKiBAfrV+zxnJ8wdZ256GOg44Toq92Ndu'
-    'EKBlCdD2amDOM31z4+kKCpCzLtHFKMhgkK+nAPmDArPCYnq0W7WjI+p95aaZxA4bL0Dcl3wV'
-    'Q1/f2Cc6DpCHZtRKxhUWFqDsOT8922vzJ5cAcf7z4kB5AbKvwnNAdrjvKVhUkK+nAPHYwcd+'
-    'lGi/KMELOoHyXALEncfqxmrY5RAgcf7c124QoMUJEN9QO+sO2qUK0JjliDFK1B2sbPoXigry'
-    '9RQgbgKzDGbGgf5aGvWHs04slmcRIO57Z/rWJQnQmIjpa7eZBGhizjtVrYc/uQRoe3VPtefd'
-    'XaoAOQ9k0gTIrt+5UGyQr6EA9S3KOrOwMa0gtrJf+UgBEju7G9c3YQe0BChXzmfM9tr8ySVA'
-    'fucmCJC9HNN3omO8+C2mhjgCmhLkayJAPHIRF3271eCTn47bu/i5Ul+5qAX2mo7tT9QIyDyV'
-    '3Pb00Vnt9lcE7C9INTv3HAhQJf5UIkAcId1qRG8Lypj3gOy1JyeVtr0h1Zggt6vyX5FZvAA5'
-    'z7+c78Cvz3AN9gquGaH45U7D2e8KcoV9z8v9PjaPIbl+v2/M1bsnY0V0gOvx34stKUB+zkel'
-    'vX/u+vkztwCJ9dhLmQZ/ZhRwwAiKWU7myHTijRWHg9m+WweC3KnfOX3xAsRjjb7WZCHgJR5u'
-    'UOoVW7/7yp27BJf4b6P7R1IlZjVu++Bl0OsH71ibSkyF/F61c8/xq+WXFdlP8Q7W127ZMyo5'
-    '5+fL9tr8SRAgv8f7gtxZ67RPNyZmhHhi3+U4LDnenNr4tWbeNSbI/W/qnL5sAZrb/OGieWG6'
-    'KutrtzmSSsz5QNqLB6+3P7ECBBsZz7mIFqBOqc94VszjjvMHvwkx8bftS/bWTHnVl/MjrQV/'
-    'wgKkFc+LsARxiGUxAsQjRuPDde/PrNRggUabL7WSc74dfyBA2eM5FykC1KHP4ntr1uyKTfsC'
-    'ztTmD+I5bzznIvFPsn734WWyvH+bcblU0hqnnj/FlnzAevsToJIerISirVFG50CZQQcsbQQE'
-    'tIAAFUI9Axs37f4HMhCgQqhnYOOm3f9ABgJUCPUMbNy0+x/IQIAKoZ6BjZt2/wMZCFAh1DOw'
-    'cdPufyADASqEegY2btr9D2QgQIVQz8DGTbv/gQwEqBDqGdi4afc/kIEAFUI9Axs37f4HMhCg'
-    'QqhnYOOm3f9ABgJUCPUMbNy0+x/IQIAKoZ6BjZt2/wMZCFAh1DOwcdPufyADASqEegY2btr9'
-    'D2QgQIVQz8DGTbv/gcz/AwTir9Hgx5ZCAAAAAElFTkSuQmCC')
-
-layout_2M = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhc61N05NgAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAjL0lEQVR4nO1dsc8dRZK3TpdD'
-    'ZMK1NrYPko/ASBzGzpDMpWyAQBfvYkHiRdoFEoN3D2x06QEisINN8O1uZht7AywdF2BskovM'
-    'SgSYxMtfMFf7ar9W0V3dr3ump6tn5vdT6dN7Pd019bqqflPdM+99RwYAAAAjHLE2AACA7QIE'
-    'BACAGUBAAACYAQQEAIAZQEAAAJihdwL6/tGj63e/Yrn34IG1OXtAFp7/9BMnKz7pctHVdFFU'
-    'H7z+mhNbY0zQKQFduX2LgkP6xskH1z4jVvL6e31oeKiTBnrdqpttEk8I4iJ0NV1dGWOCTglI'
-    'pR4nL7zzlsdBYYdQJzWCgICupqsrY0ywSAIiefXDS+n+3nqNaqKwT3WzQUD9o6vpkjsMJLbG'
-    'mKBfAqKChVjDVTohg8giaC9D0VsQEDBgujpDpwT0wbXP1EYZOvKKoVZJjqGoGlI7SOW868Si'
-    'biGFIP3SJHrtWeh6xjY+Y+2s2dsFI0amlvA6WZRR4RmpxbEzvZCTJttjdwBoriS5k5HhJt3e'
-    'k86q3JuxcLoMP+neHXHuIHcP8uNzEeiUgFR4obOXgByLxfazpXLZJ+fmiGdMWn+MIzLbPfHM'
-    'KyIgr3O4Mc/7a+qK1Us2ehtuq6ne2XvSispVX1sZs1d5wnfUTS3b80N0EVgSAXlZIS8mst25'
-    'jbeiyZHhodDfRQSUjshQf10COhDcmlCiIoc3Yx9NnjRnBlxm5px0VuUy7c2NyfRd+qQgIAN4'
-    'BbA8JH0jeYpeu7c03Ls8Sg1FBORd2VxJHFuCjSAgslZugRHbyoiUH38iAdGHVa+0vCiQLfKk'
-    '8pNSO18MyFo5xPXPOWkt5bzm4glU076lMXuVx3znBZJb67niFATUGp6rvGWwPEQ9XXCQ713e'
-    'yvaJBKRGdmjk6PacGaiixBGcF/GxdnUGpC9kvXlwWBrEThpzxxTl8sPKzHc+bWnMXuUx471N'
-    'H8+JTEOhc5eIZRCQ52zvDtcQEFC468yXnQQB5cNTnrOkH8cdHGexCiVTiYcqFiZmYPhp2jM7'
-    'mygfgjV7b58086T9fwFgChZAQN4iPHwKcQgIaAiW0BwfVQgoEfEVCSi2cd4DAaXPGNaSJspL'
-    '9bf/pONOujL0TkA57DNoBORd/XjUUggoZB+62MZ20EFAIKDlomsCIk/ksM+gEZB384u7LYKA'
-    'vPVmbPc0x5584/tJSxBQbCNpleiXgMK7GwlPhAQ0iGcL3So6QUD5DyKqu4+qzbF2Z8/0DEm0'
-    'q6ilPDYD6iET5UPkxkJXnzTnpGo0rmZjqFMC8m6+UO1zXXxl5nrw3ZlElEjUugvm1WUcDfzQ'
-    'ak6c8a1iCixvo0rtHPsySkx52vJaGSLXg/KegLry7UG5S+MejCk6qQswBj8BgNvwM8LzSkLc'
-    'kMYEpD7hmjBvyPh6revvVVj8DYzwRlhsuormdnS7d6dGNXL04nGKcn7aa8SjNyafNNbuxUD4'
-    'uUBAM6J/AhoiD6qqFQ1D5axYf/UWWKyzCQGFhzyRc9hSuSqygujqk1Y56aIBAlIO5Xg3/KoO'
-    '1eT5e5ZuUZljz8HuGtvVHhBDftNSfjRv26Kl8nDx7m2XdPVJ0yf1vu3sJPyG7XLRIwEtCBSX'
-    '10t+yaWof6lyQ1yf82dz08rDHHY/stPemJngImERwVAEEBCwbBQVgEBvAAEBywYIaNEAAQHL'
-    'Bgho0QABAcsGCGjRAAEBAGAGEBAAAGYAATXCl//7PxBDsfY/oAME1AjmGbhxsfY/oAME1Ajm'
-    'GbhxsfY/oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/'
-    'oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/oAME1AjmGbhxsfY/oOOfjgAr'
-    'wsOHDy9duvzr82+S3Lhxk1roLzV6ffhQWs/VK1dZDym8f+++O0Rj5XB+G4p6SOpnC3PGOvvZ'
-    'chY2KWEnsAxYM+BW0OAif+HdC+TQl37xEr04d+614yeOnz6E7Ba2hHqOHj1Kw+kFCXUmtfSC'
-    'Dv3pz3/ksKEXUhvh6A7yjNRN2iBPSubJ9vRYes2NH330X/yWDpEG1c4//OEPqIAWBBBQI8zN'
-    'PkwNlJYelTAryUbHJjGhrPb0kHJKfiYOJguvg8priRMxa2SOpVPTWzZAHlLtvHPnDghoQQAB'
-    'NcLcBESp6BGNmswhH+XrYeKgCouEXowmIObKorHyLb9O2wkCWgqwB7QS3L//Da9BQlD7zcP9'
-    'F3oR67ZXz8OHD7+5/82JHeiFt7Wk4urVf2zQkFy9cjXTBg+8K3TixPFMO4ElwZoBt4K5K6DE'
-    'zo6seo7sW39JPbznwqDXsug4Eiz31CqGN6RY3BrKW3/Fxro9IFpqubHuI8TsxBJsWUAFtH6c'
-    'OfP3SsHdYOK3CTz84R+lzdEnjp4+c5rk5s2bD3/44cbNm0QKrOfvL27uuZV25O9lywk6HcuJ'
-    'fzlx5LCM2msDj6VT379///Th2Bw7v/vuu72agX7wz9YGAHVA6ffmr9+k9H7iiSeUo4ersL3L'
-    'FqmHQY1v/vrIjz/+SMRBvONWc7wKU0+XQP76i8lrd/Y33eu9dgLLAiqglYDyk5Yqly996Fr4'
-    'mSB+zdUB4fS+0sPp8bZ4qBKhvx9//NG7710goRdHdmxSaueNDBs8e2itR1zjPeMTsxNYGKzX'
-    'gFvB3HtAX+7uLlGFwg/UHN9t2cptGnZ3vp4ju3LJPaTz85//PHyeSN4LS+/jMML7X4mx3n16'
-    'suH3//E7+RyQaif2gJYFEFAjNCAgtyPLm75hu9zKzaEh1sPPHLoXXoeEfrf97ISfP1RtDsfK'
-    '0/G5fv/734Vb2p6dMbH2P6ADBNQIzQioZwnvfzUTa/8DOkBAjWCe/D2IFfuAgLoFCKgRzJN/'
-    '42Ltf0AHCKgRzDNw42Ltf0AHCKgRzDNw42Ltf0AHCKgRzDNw42Ltf0AHCKgRzDNw42Ltf0AH'
-    'CKgRzDNw42Ltf0AHCKgRzDNw42Ltf0AHCKgRzDNw42Ltf0DHpC+jPv3GOQjJpC/jzYBbn99S'
-    'BfakYR5InUjLOR9JQH0mnhU6mY29id0483uzJ4FOPNgJWs7GGAKCq1QYTktpGs+d9r3Zkwbi'
-    'WUWbacHvAS0eo1N3ppzvzR6gZxQTEC4XCbSfHDVpv7hzR5XM4WuyZy8Qzwk0mBxUQAtGmK6x'
-    'xE4crZjzvdkD9A8Q0FKhZnvOwJlyvjd7gEUABLRIeCmaLjRChP0n5nxv9gBLAQgIAAAzgICW'
-    'h7DcGKenVtHRmz3AggACWjZGZ3uV4dUVVrcH6BwgIAAAzLBaAjr95FMsRx973NqWmpALkyr1'
-    'glQyYtXTmz2d4PjPjnH40QtrW7pGTQK68PIrX75/mcTLeW7P0fDSs89R54lmkBI63bsvv8Ly'
-    '59++/dEvz1Ec0N8//eZtdQi109EctRNtA1YPihMKp49/dY7Dj17Q23Nn/23vhbBK8B9ZXKCW'
-    'fn3+4PXXYnL97lfc58rtW2F7YuCInmkNZMAL77xFb+nvB9c++/7RI2qnF3To1Q8veUOohdrp'
-    'aEIt9SElObbF5q3Wz0pcvPiek7Mvnq0iUmdv9kwJhvbC4Ud/OfxIzn/6yb0HD6iRXswd/EWB'
-    'miml/FCK+gREyT/8NM+bERBTTEglFA1MSUNAjiRssIuYtA9q+XW0gIC6FaKYYcc+6qEGBDRH'
-    'oI7glCLUJyDOc2L92MwSN/E1gbs5quJSZdi5kIXbSaGrrWT/UGg4ScJCGh52oBZpbSx62OZa'
-    'fh0tIKBuRY0uTyjIXfDLeJ4e/DMF6ihWKUB9Ajo4rCncZEkC4vUOzZGcrIQPyAFMEGF/T5j4'
-    '1OuPdL83PGf9FX4KQ9kaAZXaE5MR8VwkOeHHUUTCwUzCAU9BODH45wvUUn4oxSwE5BVBckbC'
-    'q4QsQMK58/on3MwFcLrQDVdhe9dfpX6NzVutROot4Xuzx4qAcsIvFpAcz1OCf0SgZkopP5Ri'
-    'ltvwP/z4t6t/uX3i2DHvHuTRxx6nxptf35WN9JYa1XsE3J9USc03vr575smnRht2/9tvT4vh'
-    '9JpaqH2cQgCIgaLXPQuiPg5CjRTeieF1g79TlDJWJvXKIsi1q1cJ2eiRNx8iJa4uJYlt8mde'
-    'guQqLH/9lX9hic1brSt59aJjernRmz2dVEDc4sCH+H4Ix7CDWgEVBf9yK6C5COhA7ATVJSC5'
-    'RSclk03kKix//QUCWpA9JgTE4RfeY/UinPdxqBu95cAbSggoFvwjAjVTSvmhFDMSkNtCm0hA'
-    '+evq4ad332LiltZ773+N8Gts3mYioIk576lahz0mBJQIPxfGKkkNSQIq3VTKD9T8DzUrZiSg'
-    'g8P1jqwbh2AXTY4KNYT9E8IVjeoz2egeFxqy11/5fo3NW8VcqpXzFbO9N3tMCCgWfo5KVE4Z'
-    '4pvQRcFfGqiZUsoPpZiXgA52VYYc6N2h925LhWui0Kk0Vi10Dw5rLhJ5q5KfpJCO5JOyYZnr'
-    'r3y/xuYNBLR6AuLwG+I1flgBuSenpwd/aaBmSik/lGJ2AuJCw7U7JzEpDDsicJPOHuJvTvAq'
-    'iQ7xspmXcvw6cVlw+mX/Iah0nM5xPkgUxrF5q5tOYc4XpX04dn32tCcgGa4cwy4C3UWRY56D'
-    'k/u4eJ4e/EWBukICohmMLX+8dqIDdk+4AuJNaxLJ9DTcNebMqevPD32FZQ6buveZLmm/lMzv'
-    'bUhUz6jROT9ftvdmT3sCctFFgeoi1gszF/zcLuNwYvAXBWqmlPJDKWoSECThsDmSSs35RNqr'
-    'nddtjwkBrUlK+aEUxQ8iLumb/s3RfnJOPX8qbHzm5ElVMoevyZ69QDwn0GByVvuDZNvB6KSd'
-    'Kdt7swfoGWMICBcNFYbTQqlblL2l/ZduTxqIZxVtpmVkBcS/fFjXlOWik9ngNE5k8t4O67Yn'
-    'gU482Amazsbcm0wAY6a9VcjETWjAFiCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2L'
-    'tf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCg'
-    'RjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2L'
-    'tf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHSCgRjDPwI2Ltf8BHZN+kvXpN85BSGr9NlMt'
-    '3Pr8liqwJw3zQOpEWs75SALqM/Gs0Mls7E3sxpnfmz0JdOLBTtByNsYQEFylwnBaStN47rTv'
-    'zZ40EM8q2kwL/ivG4jE6dWfK+d7sAXpGMQHhcpFA+8lRk/aLO3dUyRy+Jnv2AvGcQIPJQQW0'
-    'YITpGkvsxNGKOd+bPUD/AAEtFWq25wycKed7swdYBEBAi4SXoulCI0TYf2LO92YPsBSAgAAA'
-    'MAMIaHkIy41xemoVHb3ZAywIIKBlY3S2VxleXWF1e4DOAQICAMAMqyWg008+xXL0scenazv+'
-    's2OsbbqqiZALkyr1glQyYtXTmz2dwAUMvTA5b8uTTkFNArrw8itfvn+ZxMt5bs/R8NKzz1Hn'
-    'iWaQEjrduy+/wvLn37790S/PkWPo759+87Y6hNrpaELbx786x9ro9YK8C7QHBQyFkwsYekFv'
-    'z539t70XwonBv9RALf36/MHrr8Xk+t2vuM+V27fC9sTAET3TGsiAF955i97S3w+uffb9o0fU'
-    'Ti/o0KsfXvKGUAu109GYQtLGo0gb6w+VOInNW62flbh48T0nZ188W0Wkzt7smRIM7YXDg/5y'
-    '+JGc//STew8eUCO9mDX4SwM1U0r5oRT1CYhmYfjpJ29GQEwxIZWQP5iShoAcSdhgFzHhWO/t'
-    'sIuwiX4dLSCgboUoJhYbdGhuApopUCtwTBL1CYg/ObF+bGaJm/iawN0cVXGpMuxmjcVNpaut'
-    'ZP9QaDhJwkIaHnagFmltjktAQCCgzOjyhILcBb+M5+nBP1OgjuSVbNQnoIPDmsJNliQgXu/Q'
-    'VPI1gZ2R8AE5gAki7O9JDuWHq7D0+it2lrCMaiZbI6BSe2IyIp6LJLPi4MDmYCbhgKcgnBj8'
-    '8wVqKT+UYhYC8oogSUDhVUIWIGEV6vVPuJkL4HShG3olvf4KJVxgZjqsViL1lvC92WNFQDnh'
-    'FwtIjucpwT8iUDOllB9KMctt+B9+/NvVv9w+ceyYdw/y6GOPU+PNr+/KRnpLjeo9Au5PqqTm'
-    'G1/fPTN2e5+G3//2W3l3gF5TC7XnDKeP84t/fY76f/PXb8cZAGwHFL3uWRD1cRBqpPBODB8d'
-    '/EsK1FLGSpClpHBZBLl29SohG72LAB8iJa4uJeFKdfQlSK7CitZfXA+TpMul2LzVupJXLzqm'
-    'lxu92dNJBcQtDnyI74dwDDuoFVBR8I8I1E4qoLkI6EAUgXUJSG7RSclkE7kKy19/sVOHjJo2'
-    'Nm8goHUTEIefuuciI5z3cagbveXAG0oIKBb8IwJ1/QTkttAmElD+unr46d23mLildf79LzYs'
-    'x5LYvM1EQBNz3lO1DntMCCgRfi6MVZIakgRUuqmUH6j5H2pWzEhAB4frHVk3DsEumhwVagj7'
-    'J4QrGnX2ZaN7XGjIW38VOTU2bxVzqVbOV8z23uwxIaBY+DkqUTlliG9CFwV/aaBmSik/lGJe'
-    'AjrYVRlyoLc5792WCtdEoVNpbOzmolv9yvqTn6SQjuSTsmF711+lTo3NGwho9QTklj+xGj+s'
-    'gNyT09ODfw72ScRzLcxOQFxoDGJzWj7vMOyIwE06e4i/OcGrJDrEy2ZeyvHrxGXB6Zf9h6DS'
-    'cTpHOyDm6Vj/uukU5nxR2odj12dPewKS4cox7CLQXRQ55jk4uY+L54nBXxqoKyQgmsHY8sdr'
-    'Jzpg94QrIN605i+2SA2uMWdCXX9+6Cssc9jUnI0698yYJ7HSKTZv1TNqdM7Pl+292dOegFx0'
-    'UaC6iPXCzAU/t8s4nBL8pYG6QgKCJBw2R1KpOZ9Ie7Xzuu0xIaA1SSk/lKL4QcTMH9bYJtpP'
-    'zqnnT4WNz5w8qUrm8DXZsxeI5wQaTM5qf5BsOxidtDNle2/2AD1jDAHhoqHCcFoodYuyt7T/'
-    '0u1JA/Gsos20jKyA+JcP65qyXHQyG5zGiUze22Hd9iTQiQc7QdPZmHuTCWDMtLcKmbgJDdgC'
-    'BNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4'
-    'cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6AD'
-    'BNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4cbH2P6ADBNQI5hm4'
-    'cbH2P6ADBNQI5hm4cbH2P6Bj0k+yPv3GOQhJrd9mqoVbn99SBfakYR5InUjLOR9JQH0mnhU6'
-    'mY29id0483uzJ4FOPNgJWs7GGAKCq1QYTktpGs+d9r3ZkwbiWUWbacF/xVg8RqfuTDnfmz1A'
-    'zygmIFwuEmg/OWrSfnHnjiqZw9dkz14gnhNoMDmogBaMMF1jiZ04WjHne7MH6B8goKVCzfac'
-    'gTPlfG/2AIsACGiR8FI0XWiECPtPzPne7AGWAhAQAABmAAEtD2G5MU5PraKjN3uABQEEtGyM'
-    'zvYqw6srrG4P0DlAQAAAmKFfAnrp2ecuvPxK3Z4rgFyYVKkXpJIRq57e7FklTj/5FMvRxx53'
-    'jdPDvovEKf326sHrr0m5fvcrtZ3k+0ePqJ06hIdyhDVX7PnBtc88Y/JPkS+xeav1re6LF99z'
-    'cvbFs1VE6ly6PaXfhh8dz6oeN5xBQ6jl1Q8vJSJkb9B6/e89eMAKp0dvjobYvNVCNQKimZLt'
-    '5z/9hNv7IaCwW0hJ0yU2byCgcfbU9U5mkOTEM7VcuX2LWugvvZbD6S0LHQovw+rAhDHU7YV3'
-    '3qK39JesYlIrSpApiVPKD6WoQ0DEyjQvsp1aSIa+CWiJAgKaVYrimVlJkogaY9woGS0cGArX'
-    'Ph4PHuxoiCgpdq4RHzbdZzrFpFGHgKgmHMSE8lv+Kx1GLezFQVSScmblUX7tnOERGY11xa2c'
-    'R+rplMiz8KWD7WEJ1SbM457se9eBr0uNBQQ0qxTFcyYBHez4i9pdwOQQEIWrR4KqqTnRe7BL'
-    'Llfc0VHmNU8DxTa1eFaV8kMp6hDQweElwn0Sfj0Ih7H/qJ2rU54sN000QcNuzexqV3m60K/S'
-    'hfIok4urgZl06CwqAcmBafO4J2ngspmvTun4mEm2RkCl9sSkejwXEZDXcy8BcTqkVw/50ctH'
-    'KVwpbt3RMHHUM5byQymqERDnJH1Unjum2EF8pLCspbfOx3xU1hTh7OQQUMKRYTfZkjbPXRjd'
-    'UaZI7zqTcFitROot4XuzpxYB7Y3nIgLyxu4loJwSKT96w+TyEodPp/JdKT+UohoB8Wemt7zx'
-    '5k06e5HXrl4O0yH16HQC4qvBkEFAafP2GgAC6seeWgSUjueuCGhEckkNCfZZGAHxZ+ZKz5t0'
-    'dUJdo3p0HAHxNg2vthz2ElDavK4IqHrOT8/23uypRUCJeO6KgEYkl9SgzsMiCYi5dhCbbUNz'
-    'AuL1Le/UsBkDCAgENIqAEvFcSkC8C+OIbC+/eP1nJaD03ep9fDAVNZ+E/uHHv13672sk9KKi'
-    '2nwc/9mxE8eOXf3L7ct/vHbz67tWZrTEMydPGg6vrrC6PVNQMZ7PPPkU/aWYzOz/zV+/daPm'
-    'xr//5+UbX989s3vSusHpfJQyVuKKodKnY9YhYNn0InZEBaSS/ZC3CZ0wr7cKyCs6RtcdnpI1'
-    '2VOlAkrHc34FFG6y5KyweAGo9gmr8nT0hkfDPrxrET5ZUsoPpWhHQN5tI490vI169+Apv/Ue'
-    'yiIlPF+eJ7hwlUQmby7KTeXQ+LR5IKBl2dMJAVE4uY0k7yaUGjxSqD8/CiTvtPLjPOEFNR29'
-    'IZeFGtxzMB4HZRPDSLQjIJ7Q4fBJnOGnn9Z9fjrEZMSdw7FuyTpEngMadstaesHanA3uaQg+'
-    'FDogYV5vBBTmfFHah2PXZ8/cBKTqkdu6Dl5pnzYg5CAXz+45w/Axwr3JJfW483ofVr0dFpu3'
-    'WphKQJTV6c1870kZfqSYJPaMOd/4pNeeZu8oidtm9nq6U/CppQ38/DQrUY2PmRf2lAaYENDo'
-    'nJ8v23uzZwQB5ceze9iVRQ53Ej4mFhuYEOpz/fDpWRly+dEbHlUTx9kmo7qUH0oxlYAgnsTm'
-    'bY6kUnM+kfZq53XbU0pAkMx4roXiu2Bfvn95jr3wdaD95Jx6/lTY+MzJk6pkDl+TPXuBeE6g'
-    'weT0+4NkQCZGJ+1M2d6bPUDPGENAuGioMJwWSt2i7C3tv3R70kA8q2gzLSMrIDIObnPoZDY4'
-    'jROZvLfDuu1JoBMPdoKmszH3JhPAmGlvFTJxExqwBQioEcwzcONi7X9ABwioEcwzcONi7X9A'
-    'BwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwz'
-    'cONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9A'
-    'BwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9ABwioEcwzcONi7X9Ax6SfZH36'
-    'jXMQklq/zVQLtz6/pQrsScM8kDqRlnM+koD6TDwrdDIbexO7ceb3Zk8CnXiwE7ScjTEEBFep'
-    'MJyW0jSeO+17sycNxLOKNtOC/4qxeIxO3Zlyvjd7gJ5RTEC4XCTQfnLUpP3izh1VMoevyZ69'
-    'QDwn0GByUAEtGGG6xhI7cbRizvdmD9A/QEBLhZrtOQNnyvne7AEWARDQIuGlaLrQCBH2n5jz'
-    'vdkDLAUgIAAAzAACWh7CcmOcnlpFR2/2AAsCCGjZGJ3tVYZXV1jdHqBzgIAAADDD1gnopWef'
-    'u/DyK+OOmkAuTKrUC1LJiFVPb/asDEcfe/z0k0+xWNsyD0q/vXrw+mt75d6DB9ST/uZ0Tsj1'
-    'u19lnnGmU4wwIDZvtb7VffHie07Ovni2ikidS7en9NvwqsdVp3//6BG1UwfV0d5wBg2hllc/'
-    'vJSIkEQsXbl9y+tMOcXaPrj2mbNkhOQPjzNBHdQnoBfeeWvYTT39pddT2GHiLOcICKhzAprV'
-    '+zGPEyj2ZPv5Tz/hdheQ1MIEQX/ptRxOb1nokEdbsYExS5wZlEo8iodMvDbnDy/lh1LUJyCa'
-    'smE3cUPgxQ6lOgHNLSCgBvFAhQYRh2ynFq7rPSoZDhkhETAelagDPaEyR00foiGugEBAUXHO'
-    'o7/eKsyxOMNVp7F2rwKibhwE3IeGuKPcU+qhnq7+oqNu4CDqWOcJqZk0xPxE3dwVUippKSCg'
-    'WYX9y/nvCILf8t8RBHRwuCnhAnIvAaU7UDy7woolHeQuj6iFXty+fy8cHpNSfihFZQLi9Rfn'
-    'MHOBXIXRxyah6aCZ5UnkDx9rl+50Kzsubr21Or+lo1zWcv3lLmI8y64w5tmXVxI30LtYeQYw'
-    'pbISdnZ7DtoaAZXaE5PMeHYe55KHGyk2+PUwloC8npkVUGwXVSWgvUHuUub/vvtutQTEmc8f'
-    '2ysj1UnnyVLbPXdyYSXpTB51Fy53lOlPJQjmMslx8uzMLOEpvLJcKslxWK1E6i3he7OnFgG5'
-    'SGZHcxgPYwnIG7uXgFwcuktjzM6YhEEeFv7pXF4kAcnsZesdi/Okh8vaWLucJllYJQgoVBt6'
-    'zlFeWGQdBBzqGeAZqXoxNm8goGUR0MGuMOeVvrvwDA0JyNuXGEoYZG+Qr5OAwqLA7bA4jw67'
-    'efRIPdbupkl1WD4BsS/5LA4x38iBngFkoataSVhhYwKqnvPTs703e2oREOc/bw60JyB5Fl4D'
-    'ssGxu2BFQb5OAuLaIYS8lSgflOANnUR7LQJi5zG7MRsONQhIXT/H5g0EtDgC4gvqIK6gw1gC'
-    'ytmOyGGi4XBnMzxRUZCvk4B4Ctw2mKsDw7008oe3T6y2VyEg9r23fBtGEVBOxMTmbSYCmpjz'
-    'nqp12FOLgA5211S57h7GEpB3Q2YcAUn93olKg3yFBBTblPVWYTmzoM5yqDyTgFRnD3m+SRtg'
-    'RUC1cr5itvdmTy0CCp07goDkdkxsoCe8+a2mhloBTQnylRAQVy7qpu+wKz757rg8xPeVYu0q'
-    'F8g9HWlPUQXk7koeBPzo7XaHOwLyA5Jm75oDAurEnk4IiCNk2FX0klByngOSe09eKh0EJVVO'
-    'kEtV4SMyiycg7/6X9xn48RnWIHdwXYUStnsTJ58VZIWx++Whj91tSNYf+sadffhprKgGsJ7w'
-    'udiWBBTmfFHah2PXZ8/cBKTqkVuZDuHKKGGAIxS3ncyR6cUbMw4Hs7xaJ4Lc0+8NXzwBca0R'
-    'm00mAt7i4Qklr0j+jrV7VwluCZ9GD3uSErcbd3D4MOj1w2esnRKnkJ+r9q45oVp+WJHtVK9g'
-    'sXmrnlGjc36+bO/NnhEEFHo8FuTeXqcc7kTNCHVg7HQclhxvnjZ+rJkP5QR5+Em94csmoLkl'
-    'LBfdA9NdSWze5kgqNecTaa92Xrc9pQQEyYznWigmoMHIZ7wq5rrj/OE3ISZ+276lt2bKq1jO'
-    'Z8oW7EkTkFU8L0JGkEMpFkNAXDE6G64HP7PSgyQmbb7UGp3z27EHBFQ9nmthDAEN8Fm5t2bN'
-    'rtK0b2BMb/YgnuvGcy2M/EnWL9+/TFL3txmXi05m49Tzp1hGd1i3PQl04sFO0HQ22vAc0Kbo'
-    'gIyrgAArgIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0'
-    'gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwD'
-    'Ny7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0'
-    'gIAawTwDNy7W/gd0gIAawTwDNy7W/gd0/D+sPVDm+6mcNwAAAABJRU5ErkJggg==')
-
-layout_2P = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcy2gaxBAAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAieElEQVR4nO1dsc8dRZK3TpdD'
-    'ZEKsje2D5BEYicPYGZLZlA0Q6OJdLEi8SLtAYvDugY0uXUAEdrAJvt3NbPN5AywdF2BskovM'
-    'SgSYxMtfMFf7ar9Wu7u6p7unp6tn5vdT6dO8nu6emq6q31T39HvfkQEAAEAJR7QVAABguwAB'
-    'AQCgBhAQAABqAAEBAKAGEBAAAGoAAeXhh4cPr9/5muXu/fva6jwC0uf8Z58a0VZHRldKkhF3'
-    'b7xuRFeZbQIElIQrtw4oWmxnNfLhtc+JlZz6Yk0W6od6m0PJRYRTV0p2pcw2AQJKQoRQSF58'
-    '922Hg+L1xSbTsYhw6krJrpTZJkBASRgllNc+upRVnzmorpKLCKeulLQn1CS6ymwTIKAkMF/Q'
-    '1MmkLXTsEIqd0TjcxP5NkzWnSV2n7yq2Q1iEkkAzgICSQNwhFobYxFn0MeVO+JlTvMbEkrhC'
-    'RHxnK0DHjj6mZmjdd3Q9mDQh9rRTNn/By++ESkwrJl+7vk9ATv3Q0n4VZZzOR0eAK9C1bJPN'
-    'tIS3TYCAyuHEUgoBhU7ZK9wp74acS4sSqjxaPuzZzY66SOLmU2pWfT8rdHLJKcqMdh4fAZvv'
-    'HFF/f7cagIDK4czC7KfrrAQUD8jpBJTSvwn7FCq0wz6lvp1vVlfG7jxCQPGLgoBqAQRUDmdG'
-    'YJ8KOavDWSaZzyIg58FuOglNwXIJyO6H7ouJlYjAVtLcr9OJWfBy0gcT9j5HULdOZXswpygz'
-    '2nnKCOysnRb0ly0IAqoFEFAhHN911gXEmPRnBCYvyCKg3Od5bnnovkhb+xTnHZEkwo58c1NO'
-    'fXEEaikz2nlIeWfRxxl/pqGgeYAcgIBK4Hi/8w5+SHsNX+bElAKIMTZUIqBI/8OjnMLcFyEg'
-    'J91TVGbKRXvb774ygICy4axKiFsKR9lHfK2WgkjAVwm/+GtyP1PL1UdFmYoXBeoCBJSHFPYZ'
-    'wgTEL4+nPFRBQAXKgIC6BQgoA+SaKewzRN+CTdcBBJSrzJSLVv/GDGADBJQK/3VPxDVzCSh9'
-    'I6K4+CpqGCo3+VfKIrSzjdA/FeEIcWV9yop4sTK1luENsDBUCyCgJDgvsCj3sb9D5H+ZKJeA'
-    'st6COVkYBwPv2U0JM34rR3HlbHUx9e3FXXt93VlUZv5NjG0TxrlcMIcyWRc1I8zgHQB4DV8L'
-    'IKBxJO61Cz1CqxOQuME3osyQ9lbOVHZeA1EE+rtpQvt6qFrZ1ptQ+RRlii/qpJn+fYGAagEE'
-    'NI7eCGgI7NMNZTRDgLMi9eO3HPl2myh2BpHLBVOUaXNRYApAQOPokID8byrRlCR9ydZMISP1'
-    '7a9x2g2dNRGnE3+u6iyXFHBBsTITL+p83deI/w1boBggoAWDwvJ6zg/Z5NZnXI/+BK0fw+ZH'
-    'duZYqY0rMxPMuIF3qgMEBEwCds0AUwACAiYBBARMAQgImAQQEDAFICBgEkBAwBSAgAAAUAMI'
-    'CAAANYCAGuGr//0fiKJo2x+QAQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+Q'
-    'AQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+QAQJqBPUI'
-    '3Lho2x+QAQJqBPUI3Lho2x+QAQJqBPUI3Lho2x+Q8S9HgBXhwYMHly5d/vX5t0hu3LhJJfSX'
-    'Cp06fCrez9UrV7kf6vDe3XvmFLW1m/NHX8RTdv+sYUpboz9rzsIqRfQElgFtBtwKGjzkL7x3'
-    'gQz68i9epoNz514/fuL46UPY1fwSv5+jR49SczogocrULR3QqT//5U/sNnRg90Y4uod9Rapm'
-    '62BflNSzy+Nt6ZgLP/74D/yRTlEPop5//OMfkQEtCCCgRpibfZgaKCwdKmFWsgsNm4SEotrp'
-    'hzqn4GfiYLJwKoi8FrkQs0ZiW7o0fWQF7FOinrdv3wYBLQggoEaYm4AoFB2iEYPZ56P0fpg4'
-    'KMMioYNiAmKuzGprf+TjuJ4goKUAa0Arwb173/IcxAeV3zxcf6GDULXRfh48ePDtvW9P7EEH'
-    'ztKSiKtX/7lAQ3L1ytVEHRzwqtCJE8cT9QSWBG0G3ArmzoAiKzt21nNkbP5l98NrLgw6tpOO'
-    'I950T8xieEGKxcyhnPlXqK1ZA6KplmlrbiGkJ6ZgywIyoPXjzJl/ZArmBRN/jODBj/9MbY4+'
-    'cfT0mdMkN2/efPDjjzdu3iRS4H7+cXBz5FXakX+kLSfociwn/u3EkcM0alQHbkuXvnfv3unD'
-    'til6fv/996M9A/3gX7UVAOqAwu+tX79F4f3EE08IZw9nYaPTFrsfBhW+9esjP/30ExEH8Y6Z'
-    'zfEsTLxcBOnzLyav/dXfMsejegLLAjKglYDik6Yqly99ZEp4TxAfc3ZAOD2Weph+nCUeykTo'
-    '7yeffPze+xdI6ODInk1y9byRoIOjD831iGucPT4hPYGFQXsOuBXMvQb01f7tEmUovKHm+H7J'
-    '1l6mYXOn93Nkny6ZTTo/+9nP/P1E9ruw+DoOw3//FWnrvKcnHX7/n7+z9wGJemINaFkAATVC'
-    'AwIyK7K86OuX20u5KTTE/fCeQ3PgVIj0b5afjfD+Q1Fnv619Ob7W73//O39J29EzJNr2B2SA'
-    'gBqhGQH1LP77r2aibX9ABgioEdSDvwfRYh8QULcAATWCevBvXLTtD8gAATWCegRuXLTtD8gA'
-    'ATWCegRuXLTtD8gAATWCegRuXLTtD8gAATWCegRuXLTtD8gAATWCegRuXLTtD8gAATWCegRu'
-    'XLTtD8gAATWCegRuXLTtD8iY9GXUZ948ByGZ9GW8GXDwxYEo0CcOdUfqRFqOeSEB9Rl4Wuhk'
-    'NEYDu3Hk96ZPBJ1YsBO0HI0SAoKpRCgOS24Yzx32vekTB/xZRJthwe8BLR7FoTtTzPemD9Az'
-    'sgkIj4sI2g+OGLRf3r4tSmLzNekzCvhzBA0GBxnQguGHayiwI2crxnxv+gD9AwS0VIjRntJw'
-    'ppjvTR9gEQABLRJOiMYTDR9+/Ykx35s+wFIAAgIAQA0goOXBTzfK+qmVdPSmD7AggICWjeJo'
-    'r9K8eofV9QE6BwgIAAA1rJaATj/1NMvRxx7X1qUm7IlJlXzB7qRg1tObPp3g+JPH2P3oQFuX'
-    'rlGTgC688upXH1wmcWKey1N6ePm556nyRDWoE7rce6+8yvKX377z8S/PkR/Q3z//5h2xCZXT'
-    '2ZRuJ+oGrB7kJ+ROn/zqHLsfHdDHc2d/PvogrOL8RxbnqLlfn9+98XpIrt/5mutcuXXgl0ca'
-    'FtSM90AKvPju2/SR/n547fMfHj6kcjqgU699dMlpQiVUTmcj3VId6iRFt9C41fpZiYsX3zdy'
-    '9qWzVcTuszd9pjhDe2H3o7/sfiTnP/v07v37VEgHczt/lqMmSi4/5KI+AVHwD4/GeTMCYorx'
-    'qYS8gSlp8MiRhBU2HhO3QS27FgsIqFshihn27COeakBAczhqAadkoT4BcZwT64dGlriJnwlc'
-    'zVAVpyrD3oQsXE4dmtzKru8LNSeJaEjN/QpUYmsb8h7WuZZdiwUE1K2I3uUIOblxftufpzv/'
-    'TI5axCoZqE9Au8OcwgyWTUA836ExsgcrYgMyABOEX98RJj7x+WOb32meMv/y70JRtkZAufqE'
-    'pMCfsyTF/diLSNiZSdjhyQknOv98jprLD7mYhYCcJMgeEf8pYScg/tg59SNm5gQ4nuj6s7DR'
-    '+VeuXUPjViuQegv43vTRIqAU9ws5JPvzFOcvcNREyeWHXMzyGv7Hn/5+9a+3Thw75ryDPPrY'
-    '41R485s7diF9pELxHQHXp67snm98c+fMU08XK3bvu+9OW83pmEqovKxDAAiBvNfsBRG3g1Ah'
-    'uXekeV3n7xS5jJVIvXYSZMrFp4Rd6JA3n6JOTF5KElrkT3wE2bOw9PlX+oMlNG61nuTVk47p'
-    '6UZv+nSSAXGJAZ/i9yHswwZiBpTl/MvNgOYioJ21ElSXgOwlOlsS2cSehaXPv0BAC9JHhYDY'
-    '/fx3rI6H8zoOVaOP7HhDDgGFnL/AURMllx9yMSMBmSW0iQSUPq8eHn37FhIztR59/1Vg19C4'
-    'zURAE2Pe6Wod+qgQUMT9jBuLJDVECSh3USndUdNvalbMSEC7w/mOnTcO3iqa3crvwa8fEc5o'
-    'RJvZhWa70JA8/0q3a2jcKsZSrZivGO296aNCQCH3M1QicsoQXoTOcv5cR02UXH7IxbwEtNtn'
-    'GXZD5w2981rKnxP5RqW2YqK7O8y5SOxXlbyTwjYkX5QVS5x/pds1NG4goNUTELvfEM7x/QzI'
-    '7Jye7vy5jpooufyQi9kJiBMNU26MxKQw7InADDpbiL85wbMkOsXTZp7K8XHksWD6t+sPXqZj'
-    '+iyzQSQxDo1b3XDyYz4r7P2269OnPQHZ7so+bDzQPBTZ59k5uY7x5+nOn+WoKyQgGsHQ9Mcp'
-    'Jzpg8/gzIF60JrGZnpqbwpQxNfV505ef5rCqo3u6bP1tSfzeho3qEVUc8/NFe2/6tCcg413k'
-    'qMZjHTczzs/lth9OdP4sR02UXH7IRU0CgkQMNkdQiTEfCXux8rr1USGgNUkuP+QieyPikr7p'
-    '3xztB+fUC6f8wmdPnhQlsfma9BkF/DmCBoOz2h8k2w6Kg3amaO9NH6BnlBAQHhoiFIeFQjcr'
-    'enPrL12fOODPItoMS2EGxL98WFeV5aKT0eAwjkTyaIV16xNBJxbsBE1HY+5FJoAx09oqZOIi'
-    'NKALEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAj'
-    'qEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb'
-    '/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAjqEfgxkXb/oAMEFAj'
-    'qEfgxkXb/oAMEFAjqEfgxkXb/oCMST/J+syb5yAktX6bqRYOvjgQBfrEoe5InUjLMS8koD4D'
-    'TwudjMZoYDeO/N70iaATC3aClqNRQkAwlQjFYckN47nDvjd94oA/i2gzLPivGItHcejOFPO9'
-    '6QP0jGwCwuMigvaDIwbtl7dvi5LYfE36jAL+HEGDwUEGtGD44RoK7MjZijHfmz5A/wABLRVi'
-    'tKc0nCnme9MHWARAQIuEE6LxRMOHX39izPemD7AUgIAAAFADCGh58NONsn5qJR296QMsCCCg'
-    'ZaM42qs0r95hdX2AzgECAgBADasloNNPPc1y9LHHp/d2/Mlj3Nv0ribCnphUyRfsTgpmPb3p'
-    '0wmMw9CBynVbXnQKahLQhVde/eqDyyROzHN5Sg8vP/c8VZ6oBnVCl3vvlVdZ/vLbdz7+5Tky'
-    'DP3982/eEZtQOZ2N9PbJr85xb3S8IOsC7UEOQ+5kHIYO6OO5sz8ffRBOdP6lOmru1+d3b7we'
-    'kut3vuY6V24d+OWRhgU14z2QAi+++zZ9pL8fXvv8h4cPqZwO6NRrH11ymlAJldPZUIfUG7ei'
-    '3rh/vxMjoXGr9bMSFy++b+TsS2eriN1nb/pMcYb2wu5Bf9n9SM5/9und+/epkA5mdf5cR02U'
-    'XH7IRX0ColEYHr3zZgTEFONTCdmDKWnwyJGEFTYe47d1Pg57D5to12IBAXUrRDEh36BTcxPQ'
-    'TI5agWOiqE9AfOfE+qGRJW7iZwJXM1TFqcqwHzUWM5Qmt7Lr+0LNSSIaUnO/ApXY2qaYBAQE'
-    'Akr0LkfIyY3z2/483flnctRCXklGfQLaHeYUZrBsAuL5Dg0lPxPYGBEbkAGYIPz6jqRQvj8L'
-    'i8+/Qlfx06hmsjUCytUnJAX+nCWJGQc7NjszCTs8OeFE55/PUXP5IRezEJCTBNkE5D8l7ATE'
-    'z0Kd+hEzcwIcT3R9q8TnX774E8xEg9UKpN4Cvjd9tAgoxf1CDsn+PMX5Cxw1UXL5IRezvIb/'
-    '8ae/X/3rrRPHjjnvII8+9jgV3vzmjl1IH6lQfEfA9akru+cb39w5U7q8T83vffed/XaAjqmE'
-    'ylOa0+384t+fp/rf/u27MgWA7YC81+wFEbeDUCG5d6R5sfMvyVFzGStCljaF20mQKRefEnah'
-    '8xDgU9SJyUtJOFMtfgTZs7Cs+RfnwyTxdCk0brWe5NWTjunpRm/6dJIBcYkBn+L3IezDBmIG'
-    'lOX8BY7aSQY0FwHtrCSwLgHZS3S2JLKJPQtLn3+xUYeEnDY0biCgdRMQu5+45mJ7OK/jUDX6'
-    'yI435BBQyPkLHHX9BGSW0CYSUPq8enj07VtIzNQ6/f0XK5aiSWjcZiKgiTHvdLUOfVQIKOJ+'
-    'xo1FkhqiBJS7qJTuqOk3NStmJKDd4XzHzhsHbxXNbuX34NePCGc04ujbhWa70JA2/8oyamjc'
-    'KsZSrZivGO296aNCQCH3M1QicsoQXoTOcv5cR02UXH7IxbwEtNtnGXZDZ3HeeS3lz4l8o1Lb'
-    '0MtFM/u180/eSWEbki/Kio3Ov3KNGho3ENDqCchMf0I5vp8BmZ3T051/DvaJ+HMtzE5AnGgM'
-    '1uK0vd9h2BOBGXS2EH9zgmdJdIqnzTyV4+PIY8H0b9cfvEzH9FlsgJClQ/XrhpMf81lh77dd'
-    'nz7tCch2V/Zh44Hmocg+z87JdYw/T3T+XEddIQHRCIamP0450QGbx58B8aI1f7HF7sEUpgyo'
-    'qc+bvvw0h1VNWagze8YcCaVOoXGrHlHFMT9ftPemT3sCMt5Fjmo81nEz4/xcbvvhFOfPddQV'
-    'EhAkYrA5gkqM+UjYi5XXrY8KAa1JcvkhF9kbERN/WGObaD84p1445Rc+e/KkKInN16TPKODP'
-    'ETQYnNX+INl2UBy0M0V7b/oAPaOEgPDQEKE4LBS6WdGbW3/p+sQBfxbRZlgKMyD+5cO6qiwX'
-    'nYwGh3EkkkcrrFufCDqxYCdoOhpzLzIBjJnWViETF6EBXYCAGkE9Ajcu2vYHZICAGkE9Ajcu'
-    '2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICA'
-    'GkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu'
-    '2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZICAGkE9Ajcu2vYHZEz6'
-    'SdZn3jwHIan120y1cPDFgSjQJw51R+pEWo55IQH1GXha6GQ0RgO7ceT3pk8EnViwE7QcjRIC'
-    'gqlEKA5LbhjPHfa96RMH/FlEm2HBf8VYPIpDd6aY700foGdkExAeFxG0HxwxaL+8fVuUxOZr'
-    '0mcU8OcIGgwOMqAFww/XUGBHzlaM+d70AfoHCGipEKM9peFMMd+bPsAiAAJaJJwQjScaPvz6'
-    'E2O+N32ApQAEBACAGkBAy4OfbpT1Uyvp6E0fYEEAAS0bxdFepXn1DqvrA3QOEBAAAGrol4Be'
-    'fu75C6+8WrfmCmBPTKrkC3YnBbOe3vRZJU4/9TTL0cceN4XT3b6LwMn99urujddtuX7na7Gc'
-    '5IeHD6mcKvinUoR7rljzw2ufO8qkXyJdQuNW61vdFy++b+TsS2eriN3n0vXJ/TZ8sT+L/Zjm'
-    'DGpCJa99dCniIaNO69S/e/8+dzjde1N6CI1bLVQjIBopu/z8Z59yeT8E5FfzKWm6hMYNBFSm'
-    'T13rJDpJij9TyZVbB1RCf+nYbk4fWeiU/xgWG0aUoWovvvs2faS/pBWTWlaATAmcXH7IRR0C'
-    'IlamcbHLqYRk6JuAliggoFkly5+ZlWwSEX2MC21G8xv6wrmPw4O7PQ0RJYWuVXCz8TrTKSaO'
-    'OgREOeFgDSh/5L+2waiErThYmaQ9svZZPjbGcIiM2prk1h5Hqmk6sa/Cjw7Wh8XvNqIe12Tb'
-    'mwr8XGosIKBZJcufEwlot+cvKjcOk0JA5K4OCYqqpnjvbh9cJrmjs8xrTg/k21TiaJXLD7mo'
-    'Q0C7w0eEuRM+HiyDsf2onLNTHiwzTDRAw37ObHJX+3K+XW0T2meZXEwOzKRDVxEJyG4YV49r'
-    'Ug+cNvPTKe4fM8nWCChXn5BU9+csAnJqjhIQh0N89pDuvXyW3JX81pz1A0e8Yi4/5KIaAXFM'
-    '0q3y2DHFDtYt+WktfTQ25rN2TuGPTgoBRQzpV7NL4uqZB6M5yxTpPGciBqsVSL0FfG/61CKg'
-    'UX/OIiCn7SgBpaRI6d7rB5cTOHw5ke9y+SEX1QiI75k+8sKbM+hsRZ67OjFMp8Sz0wmInwZD'
-    'AgHF1RtVAATUjz61CCjuz10RUEFw2T1E2GdhBMT3zJmeM+jigJpC8WwZAfEyDc+2DEYJKK5e'
-    'VwRUPeanR3tv+tQioIg/d0VABcFl9yCOwyIJiLl2sBbbhuYExPNbXqlhNQYQEAioiIAi/pxL'
-    'QLwKY4hslF+c+rMSUPxt9RgfTEXNndA//vT3S/99jYQOKnabjuNPHjtx7NjVv966/KdrN7+5'
-    'o6VGSzx78qRi8+odVtdnCir685mnnqa/5JOJ9b/923em1dz4j/+6fOObO2f2O60bXM5FLmNF'
-    'nhgifRpmHTyWjU9iCzIgkeyHtEXoiHq9ZUBO0lGcdzidrEmfKhlQ3J/TMyB/kSVlhsUTQLGO'
-    'n5XHvdc/69fhVQt/Z0kuP+SiHQE5r40c0nEW6s3GU/7obMqiTni8HEtw4moTmf1y0V5U9pWP'
-    'qwcCWpY+nRAQuZNZSHJeQonOYwvV561A9ptW3s7jP1Dj3utzmd+D2QfjcFAyMRSiHQHxgA6H'
-    'O3GGR+/W3D+dYjLiyn5bM2UdAvuAhv20lg64N6OD2Q3Bp3wDRNTrjYD8mM8Ke7/t+vSZm4DE'
-    'fuxlXQMntY8r4HOQ8Wezz9DfRjgaXHY/5rrOzYqvw0LjVgtTCYiiOr6Y7+yU4S3FJKE95vzi'
-    'k46dnp2zJGaZ2alpLsGXtnXg/dPciah8SD2/pq2ACgEVx/x80d6bPgUElO7PZrMri93ciL9N'
-    'LNQwIlTn+uHuWdvl0r3XPysGjtHN9upcfsjFVAKCOBIatzmCSoz5SNiLldetTy4BQRL9uRay'
-    '34J99cHlOdbC14H2g3PqhVN+4bMnT4qS2HxN+owC/hxBg8Hp9wfJgEQUB+1M0d6bPkDPKCEg'
-    'PDREKA4LhW5W9ObWX7o+ccCfRbQZlsIMiJSD2Qw6GQ0O40gkj1ZYtz4RdGLBTtB0NOZeZAIY'
-    'M62tQiYuQgO6AAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly0'
-    '7Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1'
-    'gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly0'
-    '7Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/ImPSTrM+8eQ5CUuu3mWrh4IsDUaBPHOqO1Im0'
-    'HPNCAuoz8LTQyWiMBnbjyO9Nnwg6sWAnaDkaJQQEU4lQHJbcMJ477HvTJw74s4g2w4L/irF4'
-    'FIfuTDHfmz5Az8gmIDwuImg/OGLQfnn7tiiJzdekzyjgzxE0GBxkQAuGH66hwI6crRjzvekD'
-    '9A8Q0FIhRntKw5livjd9gEUABLRIOCEaTzR8+PUnxnxv+gBLAQgIAAA1gICWBz/dKOunVtLR'
-    'mz7AggACWjaKo71K8+odVtcH6BwgIAAA1LB1Anr5uecvvPJq2VkV2BOTKvmC3UnBrKc3fVaG'
-    'o489fvqpp1m0dZkHud9e3b3x+qjcvX+fatLflMoRuX7n68QrznSJAgVC41brW90XL75v5OxL'
-    'Z6uI3efS9cn9NrxocdHoPzx8SOVUQTS005xBTajktY8uRTwk4ktXbh04lSmmuLcPr31uNCmQ'
-    '9OZhJqiD+gT04rtvD/uhp790PIUdJo5yioCAOiegWa0fsjiBfM8uP//Zp1xuHJJKmCDoLx3b'
-    'zekjC51yaCvUMKSJUYNCiVtxk4nP5vTmufyQi/oEREM27Adu8KzYoVQnoLkFBNTAHyjRIOKw'
-    'y6mE83qHSoZDRog4jEMlYkNHKM0Rw4doiDMgEFBQjPHorzMLMyzOMNlpqNzJgKgaOwHXoSbm'
-    'LNe0+6GaJv+is6bhYOWxxhJ2z9RDyE5UzTwh7U5aCghoVmH7cvwbguCP/LeAgHaHixLGIUcJ'
-    'KF6B/NkkVixxJzdxRCV0cOveXb95SHL5IReVCYjnXxzDzAX2LIxum4SGg0aWB5FvPlRum9PM'
-    '7Di5debq/JHOclrL+Zd5iPEom8SYR99+kpiGzsPKUYAplTthY7fnoK0RUK4+IUn0Z2NxTnm4'
-    'kHyDj4dSAnJqJmZAoVVUkYBGndyEzP99//1qCYgjn2/bSSPFQefBEssdc3JiZdOZfdY8uMxZ'
-    'pj+RIJjLbI6zr87M4l/CScvtTlIMViuQegv43vSpRUDGk9nQ7MZDKQE5bUcJyPiheTSG9AyJ'
-    '7+R+4h+P5UUSkB29rL1hcR50f1obKreHyU6sIgTkd+tbzlCen2TtPA51FHCUFK0YGjcQ0LII'
-    'aLdPzHmmbx48Q0MCctYlhhwGGXXydRKQnxSYFRZj0WE/jg6ph8rNMIkGSycgtiVfxSBkG7uh'
-    'owBpaLJWEu6wMQFVj/np0d6bPrUIiOOfFwfaE5B9FZ4DssKht2BZTr5OAuLcwYf9KtHeKMEL'
-    'OpHyWgTExmN2YzYcahCQOH8OjRsIaHEExA/UwXqCDqUElLIckcJEw+HKpn+hLCdfJwHxEJhl'
-    'MJMH+mtpZA9nnVgsr0JAbHtn+jYUEVCKx4TGbSYCmhjzTlfr0KcWAe32z1R73j2UEpDzQqaM'
-    'gOz+nQvlOvkKCSi0KOvMwlJGQRxlv/NEAhKNPaTZJq6AFgHVivmK0d6bPrUIyDduAQHZyzGh'
-    'ho7w4rcYGmIGNMXJV0JAnLmIi77DPvnkt+P2KX6vFCoXucBe07H1ycqAzFvJncePzmq3vyJg'
-    '3yD17DxzQECd6NMJAbGHDPuM3iaUlH1A9tqTE0o7L6VKcXK7K3+LzOIJyHn/5dwDb5/hHuwV'
-    'XJOh+OXOwNl7BbnD0Pty38bmNST379vGXH141FdEBbgff19sSwLyYz4r7P2269NnbgIS+7GX'
-    'Mg38mVFEAUMoZjmZPdPxN2Ycdmb7aR1xcqd/p/niCYhzjdBoMhHwEg8PKFnF5u9QufOU4BJ/'
-    'N7pfkzoxq3G7w82g1w/3WJtOTIe8r9p55vjd8mZF1lN8goXGrXpEFcf8fNHemz4FBORbPOTk'
-    'zlqn3dyIGBFiw9Dl2C3Z35zeeFszn0pxcv9OnebLJqC5xU8XzYbpriQ0bnMElRjzkbAXK69b'
-    'n1wCgiT6cy1kE9CgZDOeFXPecf7wmxATv23f0lozxVUo5hNlC/rECUjLnxchBeSQi8UQEGeM'
-    'Rofr3s+s9CCRQZsvtIpjfjv6gICq+3MtlBDQAJvlW2vW6MoN+wbK9KYP/LmuP9dC4U+yfvXB'
-    'ZZK6v824XHQyGqdeOMVSXGHd+kTQiQU7QdPRaMNzQJukA1KWAQFaAAE1gnoEbly07Q/IAAE1'
-    'gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly0'
-    '7Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1'
-    'gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly07Q/IAAE1gnoEbly0'
-    '7Q/I+H9598cXZCir+AAAAABJRU5ErkJggg==')
-
-layout_2P_chain = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcqyWopUgAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAkAUlEQVR4nO1dv88eRZK2TpdD'
-    'ZMK1iO2zk4/ASCzGzpDMphAg0MW7WJAYpF0gMXj3wEaXHiACO9gE3+5mtrEJsHRcgH+QXGSv'
-    'RIBJDH/BXO1b+5XK3dU93T09XT0z9ahkvW9Pd09N/XimumfezwcGg8FgUMIBbQUMBsN2YQRk'
-    'MBjUYARkMBjUYARkMBjUYARkMBjU0JqAfnz06Ort71Du3r/f+OzpAN3OfvE5ibY6MrpSEhy6'
-    '9+YbJLrKpKCZ9WY90eLM7qARAV26eQNMzy1F8vGVL4GV2qiRjkX4tSslu1ImBc0UnvVEizO7'
-    'g0YEJFIPyYvvv9sbBy3Cr10p2ZUyKTAC6gFdEBDI659c4P2hagXLttFNxCL82pWSfHGt67tE'
-    'rIOAFmd2B+0ICMocWIhRpQOfHQ7iRRD6zBnSEl3ldgiLULJbrIOAlo5GBPTxlS/FRu4Yzt+O'
-    'z85+8Xn6jjXuN6HA55QhwHFcGfjs6EY9QxuKoxuNoAlUeXzV6W9++ZNAC42CD84tzo9sp3/I'
-    'aFWUcSYftQB2gHNxt8YdlGuQrAsUeQG6hYLHUYbPFr+0XDdhNDp7pjA5tPjXmx6QibHRGJqP'
-    '4R3HRAiIfJBCKNxzKQ8dxHM5Euo82j7s4omHpiNx2s3q75DmnldXTlFmdPK4BTgdOBLxUa5B'
-    'plwgNoZuPMPjcQWnSL+0iZaMmysxIFNiQwWaBOSswsQ7qugDsGaEv7MIKB6vo34dbU+Zn7Ii'
-    'hQp53KT057VndWX45BECip80nYBGDTLlArER4krsPDy+j0kXnnJpEy1ZZvbck2pBk4CcIlns'
-    'AyEFPCW6OVSBZxGQc2egCit0J8wlID4PXAXyJlyUeDt1JsELBHHusRQ3fpDBtE5nbtgpyoxO'
-    'nmKBPfbWBXo27qNcg0y5QDopn5x0c4gJZ068tAJLwlG++wmn4ymQYvbck2pBjYAcA42urfyw'
-    'IyM6RJ5FQGIc++oVt4euEWKLH0ImjRQRYlY4/SlencqxijKjk4eUd3ZGHPtjroa8k2uQKtZ2'
-    'CnNs5FxDT2wTLy3XklmmSGwvO2kD6BCQExDOM/j4QHE1W6aGc1tL2dHIao/MPzyeQsh9kXwT'
-    's0JFmSknzd34zDJIrQsU2YpzDdJK+qUV7BsO+/zlly1T3DF60vZQICBnoZ71FmJdAoo4o4pf'
-    '4872K7VcfVSUqXjSUWQZpKK1nc4itaVfWgEXhHY/pxPN1gmomH3Sl2DpMAIqUGYLBOTvDzhj'
-    'sy4t15I++0DkO8FfPPmmCQguPpd9Cjahs/TJSvjcdiOg0E5EIrQIaAg/3roaeIgWubQsizkL'
-    'wNADh7LJR6+6PdoRkP9EIx6OxY/h019EFFf7orahdlIjZRPaoUv/UPqiIEvJusrU2oYnFOye'
-    'hAxSy9qD94RL7JZ4aVXuE0ZAk+C4E24vV9kPWK56v2RxzESjqr+I6FRkGDE+94UUwyrMr9Go'
-    'P6+c+V67s4ca31bwVwRie6j/rMpknZQsjMAH5OmP4UcNUuUCEc6+D4qz2E+8tCo1o/gUoqKb'
-    'tNCCgEQ2ESU0JOunGFPeAxpVbEj4YS3v78QxvlCf+F4PdCt79SbUPkWZ4pM6ZaZ/XVnvAcUN'
-    'UuUCCf6eo/+biZRLm7IEEy9hijuMgJLyFoeU/Rg196cY4mo/VNEMAc6K9I9fPtcwxVA8BwqC'
-    'rFiZNid1kGuQKhdIcIoO8bW9lNNN34SOBJgR0DgKCGjKn+PIJSD/5zwQeek7mrScjPTnvwPk'
-    'A50VpTOJv26NJ9to+xRlJp409P5E/ElCrkGqXGCoQ2j5P3ppBRZzOAjmtz2glQMpL531cvsj'
-    'rkb/HK0fHPTXXub47XJcmZlAdksx3USDTLxAh1ZGK/GsSxtFWYAtDkZAHaG3u5M6dA3ilDON'
-    'z74R/MsBg8Hg4dqd2/zrqaPHtDRZN4yADAYBl7++yb++8uvndfRYO4yADAYXD3/++fu/P6Cv'
-    'J638mQ/aa0CDwbBdGAEZDAY1GAE1wrf/+z8miqLtf4MMI6BGUM/AjYu2/w0yjIAaQT0DNy7a'
-    '/jfIMAJqBPUM3Lho+98gwwioEdQzcOOi7X+DDCOgRlDPwI2Ltv8NMoyAGkE9Azcu2v43yDAC'
-    'agT1DNy4aPvfIMMIqBHUM3Djou1/gwwjoEZQz8CNi7b/DTKMgBpBPQM3Ltr+N8iwX8OvCg8f'
-    'Prxw4eLbZ98BuXbtOrTAv9Do9MFD8XkuX7qM88CE9+7eo0Mwlg/Hr76Ih/j8qGHKWNIfNUdB'
-    'lSJ6GpYBbQbcChrc5M99cA4c+vIrL8OHM2feOHzk8Ml98G5+iz/PwYMHYTh8AIHOMC18gEN/'
-    '/dtfMGzgA58NcHAHfkboxnXgJwX1eHt8LHzGxk8//S/8CodgBlHPP//5z1YBLQhGQI0wN/sg'
-    'NUBaOlSCrMQbiU1CAlntzAOTQ/IjcSBZOB1EXoucCFkjcSycGr6iAvyQqOetW7eMgBYEI6BG'
-    'mJuAIBUdohGT2eej9HmQOKDCAoEPxQSEXJk1ln/Fz3E9jYCWAtsDWgnu3fse1yA+oP36/v4L'
-    'fAh1G53n4cOH39/7/sgO8MHZWhJx+fI/N2hALl+6nKiDA9wVOnLkcKKehiVBmwG3grkroMjO'
-    'Dq96Doytv/g8uOeCgM+86DjgLffEKgY3pFBoDeWsv0JjaQ8Illo0li4hpKctwZYFq4DWj1On'
-    '/lEp0AMm/BrBw5/+WdocfOrgyVMnQa5fv/7wp5+uXb8OpIDz/OPD9ZFHaQf+UbYcgdOhHPm3'
-    'Iwf2y6hRHXAsnPrevXsn98em6PnDDz+MzmzoB/+qrYChDiD93nn7HUjvp556Sji6vwobXbbw'
-    'eRDQ+M7bB3755RcgDuAdWs3hKkw8XQTp6y8kr93Z36HPo3oalgWrgFYCyE9Yqly88Am14DtB'
-    '+BmrA8DJsdKD5nG2eKASgX8/++zTDz48BwIfDuzYJFfPawk6OPrAWg+4xnnHJ6SnYWHQXgNu'
-    'BXPvAX27e7oEFQq+UHN4t2XLt2nQ3enzHNiVS/SSztNPP+2/T8SfhcX3cRD+86/IWOc5Pejw'
-    'p//4I38PSNTT9oCWBSOgRmhAQLQji5u+fjvfyk2hIZwH3zmkD06HyPy0/UyC7x+KOvtj+enw'
-    'XH/60x/9LW1Hz5Bo+98gwwioEZoRUM/iP/9qJtr+N8gwAmoE9eTvQbTYxwioWxgBNYJ68m9c'
-    'tP1vkGEE1AjqGbhx0fa/QYYRUCOoZ+DGRdv/BhlGQI2gnoEbF23/G2QYATWCegZuXLT9b5Bh'
-    'BNQI6hm4cdH2v0GGEVAjqGfgxkXb/wYZRkCNoJ6BGxdt/xtkTPox6jNvnTEBmfRjvBlw46sb'
-    'opg+cagHUifS0uaFBNRn4mmhE2uMJnbjzO9Nnwg68WAnaGmNEgIyV4lQNEtuGs+d9r3pE4fF'
-    's4g2ZrG/B7R4FKfuTDnfmz6GnpFNQHa7iKC9ccSk/ebWLVESh69Jn1FYPEfQwDhWAS0YfrqG'
-    'EjtytGLO96aPoX8YAS0VYranDJwp53vTx7AIGAEtEk6KxgsNH37/iTnfmz6GpcAIyGAwqMEI'
-    'aHnwy42yeWoVHb3pY1gQjICWjeJsrzK8+oTV9TF0DiMgg8GghtUS0Mmjx1AOPvGkti41wRcm'
-    'VeoFPknBqqc3fTrB4V8dwvCDD9q6dI2aBHTu1de+/egiiJPz2J4yw8vPPQ+dJ6oBk8DpPnj1'
-    'NZS//eG9T397BuIA/v3r798Th0A7HE2ZdqJuhtUD4gTC6bPfncHwgw/w9czp34zeCKsE/4HF'
-    'BWruz+f33nwjJFdvf4d9Lt284bdHBhb0jM8ACrz4/rvwFf79+MqXPz56BO3wAQ69/skFZwi0'
-    'QDscjUwLfWCSFN1Cdqv1ZyXOn/+Q5PRLp6sIn7M3faYEQ3vB8IN/MfxAzn7x+d3796ERPswd'
-    '/FmBmii5/JCL+gQEyT88nufNCAgpxqcSiAakpMEjRxBUmCIm7oNafi0WI6BuBShm2LGPeKgB'
-    'Ac0RqAWckoX6BIR5DqwfsixwE94TsBtRFZYqw86FKNgOE1Jtxfv7AsNBIhrCcL8DtHBtQ9GD'
-    'Otfya7EYAXUrYnQ5AkFOwc/jeXrwzxSoRaySgfoEtLdfU5CxOAHhegdsxI0V8QE4AAnC7+8I'
-    'Ep94/+Hud4anrL/8q1CUrRFQrj4hKYjnLEkJP4wiEAxmEAx4CMKJwT9foObyQy5mISCnCOIW'
-    '8e8SvADxbef0j7gZC+B4oeuvwkbXX7l+DdmtViL1lvC96aNFQCnhFwpIjOcpwV8QqImSyw+5'
-    'mOUx/E+//Hz565tHDh1ynkEefOJJaLx+5zZvhK/QKD4jwP4wFZ/52p3bp44eK1bs3oMHJ9lw'
-    '+Awt0F42ocEQAkQvvQsivg4CjRDekeF1g79T5DJWIvXyIojaxbsEb3TIGw/BJFSXgoQ2+RNv'
-    'QXwVlr7+Sr+xhOxW605eveiYXm70pk8nFRC2EPAQPg/BGCaIFVBW8C+3ApqLgPbYTlBdAuJb'
-    'dFwS2YSvwtLXX0ZAC9JHhYAw/PxnrE6E4z4OdIOvGHhDDgGFgr8gUBMllx9yMSMB0RbaRAJK'
-    'X1cPjz99CwktrUeffxX4NWS3mQhoYs47U61DHxUCioQfhbFIUkOUgHI3ldIDNf2iZsWMBLS3'
-    'v97hdePg7aLxUf4Mfv+IYEUj+ow30utCQ/L6K92vIbtVzKVaOV8x23vTR4WAQuFHVCJyyhDe'
-    'hM4K/txATZRcfsjFvAS0t6sy+EDnCb3zWMpfE/lOhbFiobu3X3OB8EeV+CYFdySeFBVLXH+l'
-    '+zVkNyOg1RMQht8QrvH9CojenJ4e/LmBmii5/JCL2QkICw1qJychKQw7IiCjo4fwlxO4SoJD'
-    'uGzGpRx+jtwWaH7ef/AqHZqzzAeRwjhkt7rp5Od8Vtr7Y9enT3sC4uGKMUwRSDdFjHkMTuxD'
-    '8Tw9+LMCdYUEBBYMLX+cdqADdI+/AsJNaxDO9DCcGlNsSv3xpS+/zEFVR9/p4vpzSfzdBkf1'
-    'jCrO+fmyvTd92hMQRRcEKkWsE2YU/NjO43Bi8GcFaqLk8kMuahKQScRhcySVmPORtBc7r1sf'
-    'FQJak+TyQy6yX0Rc0i/9m6O9cU68cMJvfPb4cVESh69Jn1FYPEfQwDir/YNk20Fx0s6U7b3p'
-    'Y+gZJQRkNw0RimaB1M3K3tz+S9cnDotnEW3MUlgB4V8+rKvKctGJNTCNI5k82mHd+kTQiQc7'
-    'QVNrzL3JZEDMtLdqMnET2qALI6BGUM/AjYu2/w0yjIAaQT0DNy7a/jfIMAJqBPUM3Lho+98g'
-    'wwioEdQzcOOi7X+DDCOgRlDPwI2Ltv8NMoyAGkE9Azcu2v43yDACagT1DNy4aPvfIMMIqBHU'
-    'M3Djou1/gwwjoEZQz8CNi7b/DTKMgBpBPQM3Ltr+N8gwAmoE9QzcuGj73yDDCKgR1DNw46Lt'
-    'f4MMI6BGUM/AjYu2/w0yjIAaQT0DNy7a/jfIMAJqBPUM3Lho+98gY9KfZH3mrTMmILX+NlMt'
-    '3PjqhiimTxzqgdSJtLR5IQH1mXha6MQao4ndOPN70yeCTjzYCVpao4SAzFUiFM2Sm8Zzp31v'
-    '+sRh8SyijVnsf8VYPIpTd6ac700fQ8/IJiC7XUTQ3jhi0n5z65YoicPXpM8oLJ4jaGAcq4AW'
-    'DD9dQ4kdOVox53vTx9A/jICWCjHbUwbOlPO96WNYBIyAFgknReOFhg+//8Sc700fw1JgBGQw'
-    'GNRgBLQ8+OVG2Ty1io7e9DEsCEZAy0ZxtlcZXn3C6voYOocRkMFgUMNqCejk0WMoB594cvps'
-    'h391CGebPtVE8IVJlXqBT1Kw6ulNn05AAQMfVM7b8qRTUJOAzr362rcfXQRxch7bU2Z4+bnn'
-    'ofNENWASON0Hr76G8rc/vPfpb8+AY+Dfv/7+PXEItMPRyGyf/e4MzgafF+RdQ3tAwEA4UcDA'
-    'B/h65vRvRm+EE4N/qYGa+/P5vTffCMnV299hn0s3b/jtkYEFPeMzgAIvvv8ufIV/P77y5Y+P'
-    'HkE7fIBDr39ywRkCLdAOR0MTwmw4CmbD+f1JSEJ2q/VnJc6f/5Dk9Eunqwifszd9pgRDe8Hw'
-    'gH8x/EDOfvH53fv3oRE+zBr8uYGaKLn8kIv6BARWGB6/8mYEhBTjUwn4Aylp8MgRBBWmiPHH'
-    'Ol+HXYRN9GuxGAF1K0AxodiAQ3MT0EyBWoFjoqhPQHjlwPohywI34T0BuxFVYaky7KyGQqak'
-    '2or39wWGg0Q0hOF+B2jh2qa4xAjICCgxuhyBIKfg5/E8PfhnCtRCXklGfQLa268pyFicgHC9'
-    'A6bEewI6I+IDcAAShN/fkRTK91dh8fVX6Cx+GdVMtkZAufqEpCCesySx4sDAxmAGwYCHIJwY'
-    '/PMFai4/5GIWAnKKIE5A/l2CFyB+Fer0j7gZC+B4oet7Jb7+8sVfYCY6rFYi9ZbwvemjRUAp'
-    '4RcKSIznKcFfEKiJkssPuZjlMfxPv/x8+eubRw4dcp5BHnziSWi8fuc2b4Sv0Cg+I8D+MBWf'
-    '+dqd26dKt/dh+L0HD/jTAfgMLdCeMhwu55VfPw/9v//7gzIFDNsBRC+9CyK+DgKNEN6R4cXB'
-    'v6RAzWWsCFlyCudFELWLdwne6NwE8BBMQnUpCFaqxbcgvgrLWn9hPQwSL5dCdqt1J69edEwv'
-    'N3rTp5MKCFsIeAifh2AME8QKKCv4CwK1kwpoLgLaY0VgXQLiW3RcEtmEr8LS11/o1CGhpg3Z'
-    'zQho3QSE4SfuufAIx30c6AZfMfCGHAIKBX9BoK6fgGgLbSIBpa+rh8efvoWEltbpz79QsRRN'
-    'QnabiYAm5rwz1Tr0USGgSPhRGIskNUQJKHdTKT1Q0y9qVsxIQHv76x1eNw7eLhof5c/g948I'
-    'VjSi9XkjvS40pK2/spwaslvFXKqV8xWzvTd9VAgoFH5EJSKnDOFN6Kzgzw3URMnlh1zMS0B7'
-    'uyqDD3Q2553HUv6ayHcqjA09XKTVL68/8U0K7kg8KSo2uv7KdWrIbkZAqycgWv6Eany/AqI3'
-    'p6cH/xzsE4nnWpidgLDQGNjmNH/fYdgRARkdPYS/nMBVEhzCZTMu5fBz5LZA8/P+g1fp0JzF'
-    'Dgh5OtS/bjr5OZ+V9v7Y9enTnoB4uGIMUwTSTRFjHoMT+1A8Twz+3EBdIQGBBUPLH6cd6ADd'
-    '46+AcNMaf9jCZ6DGFINSf3zpyy9zUNWUjTp6Z8yRUOkUslv1jCrO+fmyvTd92hMQRRcEKkWs'
-    'E2YU/NjO43BK8OcG6goJyCTisDmSSsz5SNqLndetjwoBrUly+SEX2S8iJv5hjW2ivXFOvHDC'
-    'b3z2+HFREoevSZ9RWDxH0MA4q/2DZNtBcdLOlO296WPoGSUEZDcNEYpmgdTNyt7c/kvXJw6L'
-    'ZxFtzFJYAeFfPqyrynLRiTUwjSOZPNph3fpE0IkHO0FTa8y9yWRAzLS3ajJxE9qgCyOgRlDP'
-    'wI2Ltv8NMoyAGkE9Azcu2v43yDACagT1DNy4aPvfIMMIqBHUM3Djou1/gwwjoEZQz8CNi7b/'
-    'DTKMgBpBPQM3Ltr+N8gwAmoE9QzcuGj73yDDCKgR1DNw46Ltf4MMI6BGUM/AjYu2/w0yjIAa'
-    'QT0DNy7a/jfIMAJqBPUM3Lho+98gwwioEdQzcOOi7X+DDCOgRlDPwI2Ltv8NMoyAGkE9Azcu'
-    '2v43yDACagT1DNy4aPvfIGPSn2R95q0zJiC1/jZTLdz46oYopk8c6oHUibS0eSEB9Zl4WujE'
-    'GqOJ3Tjze9Mngk482AlaWqOEgMxVIhTNkpvGc6d9b/rEYfEsoo1Z7H/FWDyKU3emnO9NH0PP'
-    'yCYgu11E0N44YtJ+c+uWKInD16TPKCyeI2hgHKuAFgw/XUOJHTlaMed708fQP4yAlgox21MG'
-    'zpTzveljWASMgBYJJ0XjhYYPv//EnO9NH8NSYARkMBjUYAS0PPjlRtk8tYqO3vQxLAhGQMtG'
-    'cbZXGV59wur6GDqHEZDBYFBDvwT08nPPn3v1tbo9VwC+MKlSL/BJClY9vemzSpw8egzl4BNP'
-    'UuP0sO8icXJ/vbr35htcrt7+TmwH+fHRI2iHDv6hFMGZK/b8+MqXjjLpp0iXkN1q/ar7/PkP'
-    'SU6/dLqK8DmXrk/ur+GL41mch4YjYAi0vP7JhUiEjAat0//u/fs44fToTZkhZLdaqEZAYCne'
-    'fvaLz7G9HwLyu/mUNF1CdjMCKtOnrncSgyQlnqHl0s0b0AL/wmc+HL6iwCH/NiwOjCgD3V58'
-    '/134Cv+CVkhqWQkyJXFy+SEXdQgIWBnswtuhBWTom4CWKEZAs0pWPCMrcRIRYwwbOaP5A33B'
-    '2sfhwb0dDQElhc5VcLHxPtMpJo46BAQ14cAMil/xX+4waEEvDqyS5JblR/EzOcMhMhhLxS23'
-    'I/SkSfhZ8NaB+qD400bUw57oe+qA96XGYgQ0q2TFcyIB7e34C9opYFIICMLVIUFR1ZTo3dsl'
-    'FxV3cBR5zZkBYhtaHK1y+SEXdQhob/8WQVeCnwfmMPQftGN1isYiM4GBht2amWpXfjrfr9yF'
-    '/CiSC9XASDpwFpGA+MC4etgTZsCyGe9O8fiYSbZGQLn6hKR6PGcRkNNzlIAwHeKrh/ToxaMQ'
-    'rhC3dNRPHPGMufyQi2oEhDkJl4q2Q4od2CX5ZS18JR/jUV5T+NZJIaCII/1uvCWuHt0Y6ShS'
-    'pHOfiTisViL1lvC96VOLgEbjOYuAnLGjBJRSIqVHr59cTuLg6US+y+WHXFQjILxm+Iobb47R'
-    '0Yu4dnVyGA6JR6cTEN4NhgQCiqs3qoARUD/61CKgeDx3RUAFycVniLDPwggIrxkrPcfookGp'
-    'UTxaRkC4TYOrLcIoAcXV64qAquf89GzvTZ9aBBSJ564IqCC5+AyiHRZJQMi1A9tsG5oTEK5v'
-    'cacG1RiMgIyAiggoEs+5BIS7MERko/zi9J+VgOJPq8f4YCpqvgn90y8/X/jvKyDwoeK06Tj8'
-    'q0NHDh26/PXNi3+5cv3ObS01WuLZ48cVh1efsLo+U1Axnk8dPQb/Qkwm9v/+7w9o1Nz49/+8'
-    'eO3O7VO7N60bnM5FLmNF7hgifRKzDh7LxhexBRWQSPZD2iZ0RL3eKiCn6CiuO5xJ1qRPlQoo'
-    'Hs/pFZC/yZKywsIFoNjHr8rj0esf9fvgroX/ZkkuP+SiHQE5j40c0nE26unFU/zqvJQFk6C9'
-    'HE9g4cqJjD9c5JvKvvJx9YyAlqVPJwQE4UQbSc5DKDF4uEB/fBWIP2nF13n8G2o8en0u82eg'
-    '92AcDkomhkK0IyA06LD/Js7w+NXS9cMhJCPs7I+lJesQeA9o2C1r4QPORjrQ2xB4yHdARL3e'
-    'CMjP+ay098euT5+5CUich2/rEpzSPq6Az0EUz/Seof8a4Why8XnovM7Fio/DQnarhakEBFkd'
-    '38x33pTBV4pBQu+Y44NP+OzM7BwFoW1mpyedAk/NdcD3p3ESUfmQen5ProAKARXn/HzZ3ps+'
-    'BQSUHs/0sisKH07ivyYWGhgR6HN1/+1ZHnLp0esfFROHdONRncsPuZhKQCaOhOw2R1KJOR9J'
-    'e7HzuvXJJSCTxHiuheynYN9+dHGOvfB1oL1xTrxwwm989vhxURKHr0mfUVg8R9DAOP3+QTJD'
-    'IoqTdqZs700fQ88oISC7aYhQNAukblb25vZfuj5xWDyLaGOWwgoIlDO3ETqxBqZxJJNHO6xb'
-    'nwg68WAnaGqNuTeZDIiZ9lZNJm5CG3RhBNQI6hm4cdH2v0GGEVAjqGfgxkXb/wYZRkCNoJ6B'
-    'Gxdt/xtkGAE1gnoGbly0/W+QYQTUCOoZuHHR9r9BhhFQI6hn4MZF2/8GGUZAjaCegRsXbf8b'
-    'ZBgBNYJ6Bm5ctP1vkGEE1AjqGbhx0fa/QYYRUCOoZ+DGRdv/BhlGQI2gnoEbF23/G2QYATWC'
-    'egZuXLT9b5BhBNQI6hm4cdH2v0GGEVAjqGfgxkXb/wYZRkCNoJ6BGxdt/xtkTPqTrM+8dcYE'
-    'pNbfZqqFG1/dEMX0iUM9kDqRljYvJKA+E08LnVhjNLEbZ35v+kTQiQc7QUtrlBCQuUqEolly'
-    '03jutO9NnzgsnkW0MYv9rxiLR3HqzpTzvelj6BnZBGS3iwjaG0dM2m9u3RIlcfia9BmFxXME'
-    'DYxjFdCC4adrKLEjRyvmfG/6GPqHEdBSIWZ7ysCZcr43fQyLgBHQIuGkaLzQ8OH3n5jzvelj'
-    'WAqMgAwGgxqMgJYHv9wom6dW0dGbPoYFwQho2SjO9irDq09YXR9D5zACMhgMatg6Ab383PPn'
-    'Xn2t7KgK+MKkSr3AJylY9fSmz8pw8IknTx49hqKtyzzI/fXq3ptvjMrd+/ehJ/yb0jkiV29/'
-    'l3jGmU5RoEDIbrV+1X3+/Ickp186XUX4nEvXJ/fX8KLHRaf/+OgRtEMH0dHOcAQMgZbXP7kQ'
-    'iZBILF26ecPpDDmFs3185UvSpEDSh4eZoA7qE9CL77877EwP/8LnKeww0copYgTUOQHN6v2Q'
-    'xwEQe7z97BefYzsFJLQgQcC/8JkPh68ocMihrdDAkCakBqQSjsIhE+/N6cNz+SEX9QkITDbs'
-    'DDd4XuxQqhPQ3GIE1CAeoNAA4uDt0IJ1vUMlwz4jRALGoRJxoCNQ5ojpAzSEFZARUFDIefCv'
-    'swojFkdQdRpqdyog6IZBgH1gCB3Fnnwe6En1FxylgQOrY8kTfGaYIeQn6EZ3SD5JSzECmlXQ'
-    'v5j/RBD4Ff8tIKC9/U0JCshRAop3gHimwgolHuSUR9ACH27eu+sPD0kuP+SiMgHh+gtzGLmA'
-    'r8LgskHAHGBZNCJefKidu5NWdljcOmt1/ApHsazF+otuYmhlKozR+vxOQgOdm5WjAFIqToLO'
-    'bs9BWyOgXH1CkhjP5HEsebARYgM/D6UE5PRMrIBCu6giAY0GOaXM//3ww2oJCDMfL9spI0Wj'
-    'o7HEdsedWFhxOuNH6cZFR5H+RIJALuMcx8+OzOKfwinL+SQpDquVSL0lfG/61CIgimR0NIbx'
-    'UEpAzthRAqI4pFtjSM+Q+EHuF/7xXF4kAfHsRe2JxdHo/rI21M7NxAurCAH50/qeI8rzi6w9'
-    'j0MdBRwlRS+G7GYEtCwC2tsV5rjSpxvP0JCAnH2JIYdBRoN8nQTkFwW0w0IeHXZ2dEg91E5m'
-    'Eh2WTkDoSzwLIeQbPtBRADSkqhUEJ2xMQNVzfnq296ZPLQLC/MfNgfYExM+Ca0BUOPQULCvI'
-    '10lAWDv44I8S+YsSuKETaa9FQOg8ZDdkw6EGAYnr55DdjIAWR0B4Qx3YHXQoJaCU7YgUJhr2'
-    'dzb9E2UF+ToJCE1A22BUB/p7aeAPZ59YbK9CQOh7Z/k2FBFQSsSE7DYTAU3MeWeqdehTi4D2'
-    'dvdUvu4eSgnIeSBTRkB8fudEuUG+QgIKbco6q7AUK4hW9idPJCDR2UOab+IKaBFQrZyvmO29'
-    '6VOLgHznFhAQ344JDXQEN7/F1BAroClBvhICwspF3PQddsUnPh3nh/C5Uqhd5AK+p8P1yaqA'
-    '6KnknsePzm63vyPALxBmdu45RkCd6NMJAWGEDLuKnhNKyntAfO/JSaU9r6RKCXI+lf+KzOIJ'
-    'yHn+5VwDvj6DM/AdXKpQ/HbHcPxdQZww9Lzc9zE9hsT5fd/Q2YfHY0VUAOfx34ttSUB+zmel'
-    'vT92ffrMTUDiPHwrk+CvjCIKEKHQdjJGphNvyDgYzPxuHQlyZ35n+OIJCGuNkDWRCHCLBw0K'
-    'XuH8HWp37hLY4r+N7veESWg3bm//ZdCr++9Y0yQ0Ib5X7dxz/GnxZUXUU7yDhexWPaOKc36+'
-    'bO9NnwIC8j0eCnJnr5MPJxEzQhwYOh2GJcabMxu+1oyHUoLcv1Jn+LIJaG7xy0V6YborCdlt'
-    'jqQScz6S9mLndeuTS0AmifFcC9kENCj5DFfFWHec3f8lxMRf27f01kx5Fcr5RNmCPnEC0orn'
-    'RUgBOeRiMQSEFSPpcNX7Mys9SMRo86VWcc5vRx8joOrxXAslBDSYz/K9NWt25aZ9A2V608fi'
-    'uW4810Lhn2T99qOLIHX/NuNy0Yk1TrxwAqW4w7r1iaATD3aCptZow3OGNkWHSVkFZNCCEVAj'
-    'qGfgxkXb/wYZRkCNoJ6BGxdt/xtkGAE1gnoGbly0/W+QYQTUCOoZuHHR9r9BhhFQI6hn4MZF'
-    '2/8GGUZAjaCegRsXbf8bZBgBNYJ6Bm5ctP1vkGEE1AjqGbhx0fa/QYYRUCOoZ+DGRdv/BhlG'
-    'QI2gnoEbF23/G2QYATWCegZuXLT9b5BhBNQI6hm4cdH2v0GGEVAjqGfgxkXb/wYZRkCNoJ6B'
-    'Gxdt/xtkGAE1gnoGbly0/W+Q8f/8viC4a94MZgAAAABJRU5ErkJggg==')
-
-layout_3plus = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcjsLaR9gAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAjGklEQVR4nO1dMa8dxZK+etrc'
-    'jkyIRWwvJIfASCzGZEjmpX6BZX4Az1eQGEuASQx+LBjnCzxWsgMS0EJmm+sXYGm9AcYm2cis'
-    'RIBJDL9gtjj1bqvcXd3T3dPT1TNdn0rWuT3dPTVd9X3T3TPneGdQKBQKIexIO6BQKPqFCpBC'
-    'oRCDCpBCoRCDCpBCoRCDCpBCoRDDmgXol0ePrt/93pi0OyO49+DBuc8/Mybtzuzo7XoVLFYo'
-    'QFdv7UFCb14/69qrVy5D3gv6RilneQISSV0VcrAeerteBYsVChArPdQEZ0MBN3ojZG/Xq2Dx'
-    'p53+cP4//x6u8PC33278cBetikcKRa+QVsDygNvpy+++Awsxs8aBD1ASPwmiN+fivukMCNHb'
-    '9SpYrFCAPvrqS7fQSvdSAoT7TWjwebSmtSFF94NcQkIh1PHtXrGbuHgWyxPr1KDFMES/PHoU'
-    '42e4ctgfy/9IwfVtToc3raE3a3hxHGI8x6s2rvquevQCfduL2UPaA1YoQCwgCWh2hsMfL0A0'
-    'scKPcnz74kYQLUJCjrrVqNtWfThkZnnGEyikvArvhSVVDg8a+hDuxCdAqeVht0efr9FxS3J4'
-    'NEDTh7QHdCFAEGmaZOwUyaovLkCsUc+t+vQCjSe0ECdcFtkoYZIqhwctYKaTUgIUYPhoUMLq'
-    'Y8lEaoCmD2kPWLMAsZwfVZ9hHgFyF1ngiXlHCV9ZcsljsQvSl3WSZR29RVPfaJ9mNJIqjw7a'
-    'Zn/NBWZdgumkiADBqNJCs/aE8YTPMFzhoNCrhsq4hoK21orJN+DhAE0f0h7QlwCxa2/rfUUw'
-    'mjrWIWvaHC9ACPbWinCXVOxV+Oq7+x30ZutbuwEZMiqzCGwqU8qZUSoiQL5BMwi/9sWK17BN'
-    'CTdSqQGaPqQ9oC8BimH+qE1xKd6N7HKENTWgu6fWTTu1sg8Bf6wNuILXa3mOlMap5WgsrLaW'
-    'eLnzlCmO5Q1pD1izABng8wsadXpjXKUAxV9UamUfAv7ETF6yrzewiZO0ZrSOunPbKVOzmdJp'
-    'BehCgAZnUk1T03q8at2jrEMTv7WkAlRcgMIbyYF4qQC1gF4EaHic/GEdaepFxCICFPaqyDuB'
-    'UgJkjrrPmNB820A1BShhHDvD2gSIvgBN4a7JA53EC1D8i4iIagI0+HdYKcxYJVVmEfCH3aqP'
-    'vC5zUrY+TH/cV2+sLafAflCgmnsoNRDTh7QHrE2AMNet926t94DCSTnM8xgeQX2wdiiKC5D1'
-    'aq/7IjW+mZJRmUWkn4aKkfUxlPhM3a2PkbXozT7DYkGvmj6QYl9bTQ3E9CHtAesUoLDRlzVY'
-    'zCdA1hMQ83LadedFRNaZJAFinxDhZM19Zzqp8uigmebx7zHRrkYjuOFWOsbh+FhbV43vDZV6'
-    'cWn6kPaA7gQIYj/6+ul8AmTdWo3NIUBuHdeoz0mVM861CT58pF2x33LwzYDCsR5d44R7CIxP'
-    'zIVMHNIesDYBwkda7GZk3vcqwzVTBWjwsGsmARq26xH2jOiwxc+kyhYsf6x+XC2I3wMOzBDR'
-    'YTbc8V/4pN8ppSe1VnZ5gZgypD1gbQJkYL3f3FqkqW91vhCE3wWJHI2kygiXhyYEeYNvfIip'
-    'TMOdHetZsyVjSHvAagVIURn64FmRARUgRRmoACkyoAKkKAMVIEUGVIAUZaACpMiACpBCoRCD'
-    'CpBCoRCDClAl3Pmf/1YTNOn4K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4'
-    'K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4K3ioAFWC'
-    'OAM7N+n4K3ioAFWCOAM7N+n4K3ioAFWCOAM7N+n4K3j8aUexIjx8+PDy5Y/fPHce7MaNm1AC'
-    '/0KhVQcPhfu5dvUa9gMd3r933xyCtrQ5/ukae4j2jx7GtDX+o+do6FLAT8UyIK2AvaDCTf7i'
-    'exchoKf+cgo+7O6ePXL0yIl90GpuidvPoUOHoDl8AIPK0C18gENff/NfmDbwgfYGOLQFPSNU'
-    'oz7Qk4J7tDzcFj5j4Sef/Af+CYegB9bPL774QmdAC4IKUCXMrT4oDUBLS0pQlWihUROfAaut'
-    'fqBzID8KB4qFVYHVtcCJUDUi28Kp4U90gB5i/bx9+7YK0IKgAlQJcwsQUNESGpbMrh7F94PC'
-    'ATMsMPiQLUColUlt6Z/4OeynCtBSoHtAK8H9+z/iGsQFlN/c33+BD75qo/08fPjwx/s/Ht0C'
-    'PlhbSyyuXfvnBg3YtavXIn2wgLtCR48eifRTsSRIK2AvmHsGFNjZobOenbH1F+0H91wQ8JlO'
-    'Onac5R47i8ENKTSzhrLWX762Zg8IllqmrbkEn5+6BFsWdAa0frz00h8zBfOACf8M4OGv/5za'
-    'HHri0ImXToDdvHnz4a+/3rh5E0QB+/njw82RR2k7f0xbjsLp0I7+69Gd/WnUqA/YFk59//79'
-    'E/ttY/z8+eefR3tWtIN/kXZAUQZAv/Nvngd6P/HEE8zR/VXY6LKF9oOAwvNv7vz+++8gHKA7'
-    'ZjWHqzD2dAHEr79QvLZnP28+j/qpWBZ0BrQSAD9hqfLx5SumBN8Jws84OwCcGJt6mH6sLR6Y'
-    'icC/n376yXvvXwSDDztbNUn180aED5Y/sNYDrbHe8fH5qVgYpNeAvWDuPaA726dLMEPBF2qO'
-    'bLds6TYNhju+n53tdMm8pPPUU0+57xPRZ2HhfRyE+/wr0NZ6Tg8+fPDvf6PvAbF+6h7QsqAC'
-    'VAkVBMjsyOKmr1tOt3JjZAj7wXcOzQerQqB/s/1sDN8/ZH1229LT4bk++OBv7pa25afPpOOv'
-    '4KECVAnVBKhlc59/VTPp+Ct4qABVgjj5WzAp9VEBahYqQJUgTv7OTTr+Ch4qQJUgzsDOTTr+'
-    'Ch4qQJUgzsDOTTr+Ch4qQJUgzsDOTTr+Ch4qQJUgzsDOTTr+Ch4qQJUgzsDOTTr+Ch4qQJUg'
-    'zsDOTTr+Ch4qQJUgzsDOTTr+Ch6Tvoz67Bu7amCTvow3A/a+3WNN/QlDPJEasZpjnilAbRJP'
-    'Co2MxiixKzO/NX8CaCSCjaDmaOQIkIaKheCwpNJ4btq35k8Yms8s6gyL/h7Q4pFN3Zk435o/'
-    'ipaRLEB6uwig/uCwpP3u9m3WIpuvyZ9RaD4HUGFwdAa0YLh09RE7cLQg51vzR9E+VICWCpbt'
-    'MQ1n4nxr/igWARWgRcKiaHii4cKtP5HzrfmjWApUgBQKhRhUgJYHd7qR10+pSUdr/igWBBWg'
-    'ZSOb7UWaF++wuD+KxqECpFAoxLBaATrx9DNohw4clPalJOjCpMh8gXaSseppzZ9GcOTJw5h+'
-    '8EHal6ZRUoAunj5z58OPwSzOY3lMD6eefwEqT3QDOoHTvXf6DNo3b1/45LVdyAP49+u3LrBN'
-    'oByOxnQ70TfF6gF5Aun06V93Mf3gA/y5e/LPozfCIsm/s7hETf36/Ob1sz67fvd7rHP11p5b'
-    'HmiYUTPcAzjw8rvvwJ/w70dfffnLo0dQDh/g0KtXLltNoATK4WigW6gDncT45hu3Uj8rcenS'
-    '+8ZOvnKyiNE+W/NnSjLUN0w/+BfTD+zc55/de/AACuHD3MmflKiRlqoPqSgvQED+4XGeVxMg'
-    'lBhXSiAbUJIGRxzB0GGTMeEYlIprtqkANWsgMcNWfdhDFQRojkTN0JQklBcg5Dmovm9kQZvw'
-    'noDVjFThVGXYhhANy6FDM7ei9V2D5mABD6G5WwFKqLe+7EGfS8U121SAmjU2uyyDJDfJT/N5'
-    'evLPlKhZqpKA8gK02Z9TmMGiAoTrHRgjOliBGEAAUCDc+pah8LH3Hxp+q3nM+su9CkHrTYBS'
-    '/fFZRj4nWUz6YRaBYTKDYcJDEk5M/vkSNVUfUjGLAFmTIDoi7l2CTkDcsbPqB8KME+DwRNdd'
-    'hY2uv1Lj6hu3UkRqjfCt+SMlQDHp50tIzOcpyZ+RqJGWqg+pmOUx/K+//3btH7eOHj5sPYM8'
-    'dOAgFN784S4thD+hkH1GgPWhK9rzjR/uvvT0M9mO3f/ppxOkOXyGEijP61Ch8AGy17wLwr4O'
-    'AoWQ3oHmZZO/UaQqVqT00kmQKWfvErTQEm88BJ2YeSmYb5M/8hZEV2Hx66/4G4tv3ErdyYtP'
-    'OqZPN1rzp5EZEJYY4CF8HoI5bMDOgJKSf7kzoLkEaEN2gsoKEN2ioxapJnQVFr/+UgFakD8i'
-    'AoTp5z5jtTIc93GgGvyJiTekCJAv+TMSNdJS9SEVMwqQ2UKbKEDx6+rh8advPjNL69HnXxlx'
-    '9Y3bTAI0kfNWV+vwR0SAAuln0pgVqSEoQKmbSvGJGn9Rs2JGAdrsr3fovHFwdtFoK7cHt37A'
-    'cEbDxowWmteFhuj1V3xcfeNWkEulOF+Q7a35IyJAvvQzUsJqyuDfhE5K/tREjbRUfUjFvAK0'
-    '2c4yaEPrCb31WMpdE7lBhbbsRHezP+cCo48q8U0KGkg8KToWuf6Kj6tv3FSAVi9AmH6Df47v'
-    'zoDMm9PTkz81USMtVR9SMbsA4UTDlJsgoSgMWyEwg44Rwm9O4CoJDuGyGZdy+DlwWzD90/qD'
-    'M9MxfebFIDAx9o1bWTq5nE+ivdt2ff7UFyCarpjDJgPNTRFzHpMT65h8np78SYm6QgGCEfQt'
-    'f6xykAMMj7sCwk1rMKr00NwUxoypqY8vfbnTHHR19J0u6j+1yO9tUBRnVDbn52N7a/7UFyCT'
-    'XZCoJmOtNDPJj+U0Dycmf1KiRlqqPqSipACpBQI2B6lYzgdoz1Zetz8iArQmS9WHVCS/iLik'
-    'b/pXR/3BOf7icbfwuWPHWItsviZ/RqH5HECFwVntD5L1g2zSzsT21vxRtIwcAdKbBgvBYQHq'
-    'JrE3tf7S/QlD85lFnWHJnAHhLx+WdWW5aGQ0kMYBJo9WWLc/ATQSwUZQdTTm3mRSIGbaW1Wb'
-    'uAmtkIUKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocK'
-    'UCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bz'
-    'k46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocKUCWIM7Bzk46/gocK'
-    'UCWIM7Bzk46/gocKUCWIM7Bzk46/gsekn2R99o1dNbBSv81UCnvf7rGm/oQhnkiNWM0xzxSg'
-    'NoknhUZGY5TYlZnfmj8BNBLBRlBzNHIESEPFQnBYUmk8N+1b8ycMzWcWdYZF/1eMxSObujNx'
-    'vjV/FC0jWYD0dhFA/cFhSfvd7dusRTZfkz+j0HwOoMLg6AxowXDp6iN24GhBzrfmj6J9qAAt'
-    'FSzbYxrOxPnW/FEsAipAi4RF0fBEw4VbfyLnW/NHsRSoACkUCjGoAC0P7nQjr59Sk47W/FEs'
-    'CCpAy0Y224s0L95hcX8UjUMFSKFQiGG1AnTi6WfQDh04OL23I08ext6mdzURdGFSZL5AO8lY'
-    '9bTmTyMwCQMfRM5b86RTUFKALp4+c+fDj8EszmN5TA+nnn8BKk90AzqB0713+gzaN29f+OS1'
-    'XQgM/Pv1WxfYJlAORwO9ffrXXewNPi8ouor6gISBdDIJAx/gz92Tfx69EU5M/qUmaurX5zev'
-    'n/XZ9bvfY52rt/bc8kDDjJrhHsCBl999B/6Efz/66stfHj2CcvgAh169ctlqAiVQDkd9HUJv'
-    '2Ap6w/7dToz5xq3Uz0pcuvS+sZOvnCxitM/W/JmSDPUN0wP+xfQDO/f5Z/cePIBC+DBr8qcm'
-    'aqSl6kMqygsQjMLw+JVXEyCUGFdKIB4oSYMjjmDosMkYt63157DNsIlxzTYVoGYNJMaXG3Bo'
-    'bgGaKVELaEwQ5QUIrxxU3zeyoE14T8BqRqpwqjJsRw3NDKWZW9H6rkFzsICH0NytACXU25iQ'
-    'qACpAEVml2WQ5Cb5aT5PT/6ZEjVTV6JRXoA2+3MKM1hUgHC9A0OJ9wQMRiAGEAAUCLe+ZTGS'
-    '767Cwusv31ncaVQ1602AUv3xWUY+J1nkjAMTG5MZDBMeknBi8s+XqKn6kIpZBMiaBFEBcu8S'
-    'dALizkKt+oEw4wQ4PNF1oxJef7nmLjAjA1aKSK0RvjV/pAQoJv18CYn5PCX5MxI10lL1IRWz'
-    'PIb/9fffrv3j1tHDh61nkIcOHITCmz/cpYXwJxSyzwiwPnRFe77xw92Xcrf3ofn9n36iTwfg'
-    'M5RAeUxzuJy//NsLUP/H//spzwFFP4DsNe+CsK+DQCGkd6B5dvIvKVFTFSsgllTC6STIlLN3'
-    'CVpo3QTwEHRi5qVgOFPNvgXRVVjS+gvnw2Dh6ZJv3ErdyYtPOqZPN1rzp5EZEJYY4CF8HoI5'
-    'bMDOgJKSPyNRG5kBzSVAGzIJLCtAdIuOWqSa0FVY/PoLgzpEzGl946YCtG4BwvRj91xohuM+'
-    'DlSDPzHxhhQB8iV/RqKuX4DMFtpEAYpfVw+PP33zmVlaxz//QsdiPPGN20wCNJHzVlfr8EdE'
-    'gALpZ9KYFakhKECpm0rxiRp/UbNiRgHa7K936LxxcHbRaCu3B7d+wHBGw44+LTSvCw1x66+k'
-    'oPrGrSCXSnG+INtb80dEgHzpZ6SE1ZTBvwmdlPypiRppqfqQinkFaLOdZdCG1ua89VjKXRO5'
-    'QYW2voeLZvVL55/4JgUNJJ4UHRtdf6UG1TduKkCrFyCz/PHN8d0ZkHlzenryz6E+gXwuhdkF'
-    'CCcaA9mcpu87DFshMIOOEcJvTuAqCQ7hshmXcvg5cFsw/dP6gzPTMX1mB8AXaV/9snRyOZ9E'
-    'e7ft+vypL0A0XTGHTQaamyLmPCYn1jH5PDH5UxN1hQIEI+hb/ljlIAcYHncFhJvW+MUW2oMp'
-    'jBlQUx9f+nKnOehqzEadeWfMMt/UyTduxRmVzfn52N6aP/UFyGQXJKrJWCvNTPJjOc3DKcmf'
-    'mqgrFCC1QMDmIBXL+QDt2crr9kdEgNZkqfqQiuQXESN/WKNP1B+c4y8edwufO3aMtcjma/Jn'
-    'FJrPAVQYnNX+IFk/yCbtTGxvzR9Fy8gRIL1psBAcFqBuEntT6y/dnzA0n1nUGZbMGRD+8mFZ'
-    'V5aLRkYDaRxg8miFdfsTQCMRbARVR2PuTSYFYqa9VbWJm9AKWagAVYI4Azs36fgreKgAVYI4'
-    'Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgr'
-    'eKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4'
-    'Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgreKgAVYI4Azs36fgr'
-    'eEz6SdZn39hVAyv120ylsPftHmvqTxjiidSI1RzzTAFqk3hSaGQ0Roldmfmt+RNAIxFsBDVH'
-    'I0eANFQsBIcllcZz0741f8LQfGZRZ1j0f8VYPLKpOxPnW/NH0TKSBUhvFwHUHxyWtN/dvs1a'
-    'ZPM1+TMKzecAKgyOzoAWDJeuPmIHjhbkfGv+KNqHCtBSwbI9puFMnG/NH8UioAK0SFgUDU80'
-    'XLj1J3K+NX8US4EKkEKhEIMK0PLgTjfy+ik16WjNH8WCoAK0bGSzvUjz4h0W90fROFSAFAqF'
-    'GFYrQCeefgbt0IGD03s78uThgr1NAV2YFJkv0E4yVj2t+bNKsMl86vkXLp4+M6Xb6T0UQOq3'
-    'Vzevn/XZ9bvfY52X333HLQ80NPbRV19C5Zia4U4sn+89ePDqlcvw7y+PHrFNoByORvZ29dZe'
-    '4Oy+cSv1re5Ll943dvKVk0WM9rl0f1K/De/LYTZJoNzkJ9uPaY6AJlACuRfIkLxkTqJVmLDh'
-    'Or5xK4VZBMiiaPxIlRpTcABFEP6FEGIeYCytbACDEiiHo74OoTdsBb1h/77KKkDF/ZmSDNn5'
-    '44b43OefYbkRICiBxMBkg8+0OfyJBocs2fI1TE3mgmQJ10nVh1SUFyAcXMrzagKEEuOqA0QO'
-    'ozhw8xd02Jq10bZuSKZP07JNBWhWwwx0J8tQAjY4UjJs5SacwO5Ny22Ymsy+c2VcbLjOJHWJ'
-    'QHkBQp7TFY11nbgawt7MfBJH3Nwu0MyIm/sSre8aNPctskwauRUC6y9fSFSA1i1AOCk2AoF/'
-    '4r8ZAoSJN5CbXIwAjSZzJK3QLBKhrlk9gK5BieVVqj6korwAbfbnFGYI6HViFGEIcI6KQ4Y1'
-    'WQGCgUOBcOtbhsIXlgZ3FRZefwUSdG4m+Kw3AUr1x2eR+WxyFac8hpn4ecgVIKvmqADFJHMk'
-    'rcxR4BHkuTlq9YCf3TOm6kMqZhEgaxJEr9Odg9AJiBs/q34gMDF3FXcVFl5/GYMQwknxphQ+'
-    'hW/cShGpNcK35k8pATL3KswZvEUNuQJktR3N1ZhkjqcVHqVJjj2bHvB0LK1S9SEVswjQ5vFJ'
-    'kCVM1i4MlQArfjT2ozGOiZkbqsj1FwoQttWnYC37U0qAMDfwEYRJmKFJAQrTyrf1aXoIqM+C'
-    'BYhOgiyhtYaVFlrxw0PQiVmU4TSEdSNSgOgqLHX9ZZoENMg3bqWIVJzz09nemj+lBAg5jCuX'
-    'lgUoTKtAV/SlgdR8LoW5BGhDJkFlBYjuT7vSMKom9IYQuf4KX6YKUGv+lBIgTBWaIUOuAFnJ'
-    'OaovMclcSoDcp3srESCzfzxRgEYnNXSwYtZTZhWW+vyrQQGayHmrq3X4U0qANtv5MlWBIVeA'
-    'rFtdTGKPJnMpAdqQtVh8PpfCjAK02V/v0EXT4GituxVvXX/8M28MMzuOtNC8YTEkrr82j+uX'
-    'L29YFORSKc4XZHtr/pQSIDe4GQLkbrLECNBoMtNzhWnlI5G14TVwq4FUfUjFvAJkLsyUW0/o'
-    'rR0yd03khgHa+rZgcM4FRh+T4xsQNAB4Ut+Iu3JDe8PUEXwTuk3Ct+ZPIwKEuYrJZj2EGsYE'
-    'aDSZfc98fLSy/Nxw603LzzUIkPkyCx3WYf9ln+HxazYvLOBmM9bHNSou5cLrVdo/rT84kmH6'
-    'DKuPCUDk2asJkMv5JNq7bdfnz9wCxPZDt3UNrPtlPKHCyWzJR4BWVj/mvOyOh5XevnErhZIC'
-    'BPLhmzFa5fil0+vb72e5neAhGjZobgpjtoRM/evbNzvdaQ66GvM+IbS1eosRLBfFGZXN+fnY'
-    '3po/GQLky2GTVyZnzBe+aHpjc2NsgrENM5LZdTVAK+soduL2gC5RvqTqQypKCpBaIGBzkIrl'
-    'fID2bOV1+5MqQGqR+VwKyb8HdOfDj+f4VZB1oP7gHH/xuFv43LFjrEU2X5M/o9B8DqDC4Kz2'
-    'B8n6QTZpZ2J7a/4oWkaOAOlNg4XgsAB1k9ibWn/p/oSh+cyizrBkzoDAOQ2bQSOjgTQOMHm0'
-    'wrr9CaCRCDaCqqMx9yaTAjHT3qraxE1ohSxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpB'
-    'nIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8'
-    'FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpB'
-    'nIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTxUgCpBnIGdm3T8FTwm/STrs2/sqoGV'
-    '+m2mUtj7do819ScM8URqxGqOeaYAtUk8KTQyGqPErsz81vwJoJEINoKao5EjQBoqFoLDkkrj'
-    'uWnfmj9haD6zqDMs+r9iLB7Z1J2J8635o2gZyQKkt4sA6g8OS9rvbt9mLbL5mvwZheZzABUG'
-    'R2dAC4ZLVx+xA0cLcr41fxTtQwVoqWDZHtNwJs635o9iEVABWiQsioYnGi7c+hM535o/iqVA'
-    'BUihUIhBBWh5cKcbef2UmnS05o9iQVABWjay2V6kefEOi/ujaBwqQAqFQgyrFaATTz+DdujA'
-    'QWlfSoIuTIrMF2gnGaue1vxZGSB7TSZL+zILSgrQxdNn7nz4MZjFeSyP6eHU8y9A5YluQCdw'
-    'uvdOn0H75u0Ln7y2e+TJw/Dv129dYJtAORwd7RmuC2pGXotiiTA57B7C0Jv8xGrGrOZo0ARK'
-    'IPdoP2xDFrsn/wzZazIZKmMm70xmShGilUHq1+c3r5/12fW732Odq7f23PJAw4ya4R7AgZff'
-    'fQf+hH8/+urLXx49gnL4AIdevXLZagIlUA5Hwz1DV9DP6CD4xq3Uz0pcuvS+sZOvnCxitM/W'
-    '/JmSDNn54+bDuc8/w3KoYEogzTDZ4DNtDn+iwSHMGdPK19DniXED0g9bYZOJTIlvnqoPqSgv'
-    'QDhMlOfVBAglxpUSDB78OzjiCIYOo2AF7N6DByhkUzycbipAsxrGF2NtRR9scKRk2FeEQAJb'
-    'UsI2tMx3U4QsRWapAHmvCnkO0fJdLYwgxhKrGanCqcqwjTGaGXRzX6L1XYPmVt5Y5iYWtqLe'
-    '+i4NqhlPsgM/3VSAZjWML/LfCAT+if9mCBAm3kBucqMCFK7AMgUKDa1cZmEdKIEPt+7fY4nG'
-    'Wqo+pKK8AG325xTm+mlUMIowOjhHxSHDmuyw4sKHrW8ZCl94NN1VWMz6y6hPIMOqWW8ClOqP'
-    'zyLz2cQXpzxYCPmMn4dcAbJqRs6AfPdFlin4waz+sAKdLpm7+P/+/PPKBciaBNGouHMQOgFx'
-    '42fVD6jMaFBNc7oKG11/Wd2OCpBv3EoRqTXCt+ZPKQEy9yrMGbxFDbkCZLWNyVW810Lys1tF'
-    'o3lImWLWleycIGyp+pCKWQRo8/gkyBImaxeGSoA1LjT2o0MfE9SNo2jh9VdShqkAteBPKQHC'
-    '3IA/cSPZFZG5BcjsOhvEKwhOgobHBSiGROsRIDoJMuXsuNNCa1zwEHRi5oq4GmLdiBQgugob'
-    'XX/h6dyz4zM1EQEqzvnpbG/Nn1IChPyHiJtYDxUFiJ4F14DosO8pGAqWeVCL6FeANmQSVFaA'
-    'fKvW+Kfpw/4sbHT9hbt3KkDL8qeUAGGq0AwZcgXISs4kAbJOh9MxdrNi2H+0jw4PnQuQ2T+e'
-    'KEDxcRr8+3ZWqDCKMc+/wtcYH7CZBGgi562u1uFPKQHabO9A9E4z5AqQdavLEyDav/tkeXA2'
-    'N4bOBWizv96hi6bB2UKmrdwe3PoBo29qWUYLzetCQ8SMafQaIwNWkEulOF+Q7a35U0qA3OBm'
-    'CBDdjvE1tAw3v9n0Y2dAbIeDCtBmO8ugDa0n9Na2tLsmcjUF2rovE5re8FUg+qAdX96h4ceT'
-    'omOj7x8mJWggYCpAHQoQ5iomG820mPeA6N4TbYWFFlPcGZB59M5eVOTLt2sQIJxomHLzhQYU'
-    'heHx2OA44r4vKj0cwsUtLuXct1FZDbLqD85Mx/SZpD7tCJDL+STau23X58/cAsT2Y961oXBX'
-    'RqOEAiKYOzcyxcp8lynmWbt5cjL4BchtvgYBgqvyLX+scrO5666AcNMaH3/SHkxhzMrZ1L++'
-    'fTXLVXp0NfBSdeo11hegbM7Px/bW/MkQoHB8ac6YV/5oemNzY2yCsQ19p4OEN5lv9eYyxdAK'
-    'axoH2ItiibZsAVILBGwOUrGcD9Cerbxuf1IFSC0yn0sh+ec49McoAqg/OMdfPO4WPnfsGGuR'
-    'zdfkzyg0nwOoMDir/UGyfpBN2pnY3po/ipaRI0B602AhOCxA3ST2ptZfuj9haD6zqDMsmTOg'
-    '0R9z6wqNjAbSOMDk0Qrr9ieARiLYCKqOxtybTArETHurahM3oRWyUAGqBHEGdm7S8VfwUAGq'
-    'BHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S'
-    '8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGq'
-    'BHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S8VfwUAGqBHEGdm7S'
-    '8Vfw+H9ySsuuonIIUQAAAABJRU5ErkJggg==')
-
-layout_4M = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhccBtC8ywAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAivElEQVR4nO1dMa8dRbK2nl5u'
-    'R5cQa2P72ckhMBKLsTMkQ8oGlvkBwBUkgASYxMa7Dwz5Mywr2cEmoIXMvtgEWFpewDUmt5+0'
-    'AXZi/AvmFbf2ttrd1T3dMz1dPTPfp5I1p09PnzpdX31T3TP3+EAHAACghAPaDgAAsF5AgAAA'
-    'UAMECAAANUCAAABQAwQIAAA1QIAWhZ/v3Xv7yy+MabvTOpqaruu7P23efMOYrjPV0K4AETns'
-    'ePj8sN8lu3rrpj/IJ19/5XSr4Lki1kniwWhquppyphr+40CreOdvf83qf+37W37jzp3dIs4A'
-    'ADAJtBVQBtU7TuXSWwGRUdFkd6CayO9T7SuoYJ1X0cFoarp+ffSI/DGm60w1tFgB3bizO6xy'
-    'ufyPr51xCnkEAJPjqUOHTh87bkzbnVrQVkAXdB0wV6RXP7ucVQGR0en8rrOFJF7lqEQyG5Di'
-    'FpLontlXevHDD+iYLlbiRmZogzPUziM7pR99BLWEroe2M2R07Ox5xb+L7wm1mDmnA3sy7Xan'
-    '0jSgObRDxvNjBkn80EkHd2bSr4AUv2nvjjh3oM+ykyKRt82iOQEy88uJnStAxAN+11/E+TkZ'
-    'H9+Hw9f4+KHyPrHdMd+9LGdSvo6/YU+xoKQSV7JOstFLOzEcs9O+90MLDi5yQMuZ3sEj60Hq'
-    'ZutdLzdmhLYEyDCG5zRdgEx4iBxduIzajBCgOPP88csK0MbS1gHOiEiRsNCn5DpjMjPlQycd'
-    'fGOlvboz9uARAYp/KASoDEwAWES6HAGyr9J0bF6S+jiXQXuELAFyrmCm9A2tegYIEHlLw9oL'
-    'H5t5ZloGOCPCzxCaBPFKy4sCuyXkDLXzyoK+hX2K6Z/yoaUG5zUXT6yY9jWd6R08RAwnpmat'
-    'Z4pTCFAB2NcWk4HpAmSv1yjGoXXcGAESGdyNrnTiHxrqnOtMyuBm2h3Gh9pFZ+wtCbsO3eyX'
-    'BqEPDYVpzOD2lxX3E2s60zt4yHln08cJIsuQH9y5oBUBMvywZzNLgPxdZ768RAQoHc7gKUv3'
-    'YQLEfApVIoOdEVHE84gz3ZNpz0KpMnjnPZPR2jdN/NDQpvh80YQA2VNv3whwFiDO3QFHgDpv'
-    'qcw8KCJAEWYXFKDQxnli2sTfSv9SWe3xT/QvISqD545f/5sO+9AFoLnngHb2HgJie/j4N9NO'
-    'xzt9zwf96Y/PR142jnf+9lfn2x15+jCZkjsAUAXaCvg7Em9eOBcBu5ErIOfmF3ebRQXkbCKE'
-    'dkkHO5P1pdqpC1ABhTaSFoMmBMh5BGvwEqyzni00q+WIAKU/iCjuMjIS+WT8GZ8JA5wRUWrx'
-    'GHJGfEtl8C6wn9jUN035UJGls94YakKAQsjahE4ZJIWUIThqyFFn6UzhE98SJgI5G1ViZ3Oh'
-    'E7dOBzgjolSG2PuvpvD0necv1cLgJo1bcCbrQ02sGfwEAG7DT4WmBEh8ktW3kIfx/k5Rw+We'
-    'fyNsjDM+SmWIc6dGdD6+qJxocH4KbMCjNyrfNNTucMP/XhCgqdCUAHWBB1LFioYhykSov3gL'
-    'LDJ4rjM+Ct6/i+/i2XNbc3DR7AqiqW9a5ENnBwhQRhT9P8nhP0aN5LzzjOz1vQdzU/zpHdx3'
-    'hhYCKntADPsvLe2v7Gxb1BzcuQA465fWvmn8Q50/PDbm/4XtvNC0ALUJ4t916xdbenPe6Z81'
-    'ePH+FXB9/xdtptgcjQ/ux8L8yE59ZyaCiXhTQR8MCNBYZBUdwKRALGYHCNBYgPTtALGYHSBA'
-    'YwHStwPEYnaAAI0FSN8OEIvZAQIEAIAaIEAAAKgBAlQJP/7vP2GKph1/QAYEqBLUM3Dlph1/'
-    'QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLU'
-    'M3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/QAYEqBLUM3Dlph1/'
-    'QEZz/zEhMAYPHjy4fPnTd95+l+zGjR1qoX+p0enDb8XHuXb1Go9DA979+a55i861T+eXvolv'
-    '2eOzhynnGv/ZczZ2KeInMA9oK+BaUOEif+HiBQroK396hQ62t984cvTIqX3Y3fwWf5ytrS06'
-    'nQ7IqDMNSwf01jff/oNpQwf2aIStPdifSN1sH+wPJffs9vi5dMyNV678D7+kt2gE0c+///3v'
-    'qIBmBAhQJUytPiwNlJaOlLAq2Y1GTUJGWe2MQ4NT8rNwsFg4HURdi3wQq0biufTR9JIdsN8S'
-    '/bx9+zYEaEaAAFXC1AJEqegIjZjMvh6lj8PCQRUWGR0MFiDWyqxz7Zd8HPcTAjQXYA9oIbh7'
-    '9xdeg/ig9p39/Rc6CHXrHefBgwe/3P3l6B7owNlaEnHt2r83aMiuXb2W6IMD3hU6evRIop/A'
-    'nKCtgGvB1BVQZGfHrnoO9K2/7HF4z4VBx3bRccBb7olVDG9IsZk1lLP+Cp1r9oBoqWXONV8h'
-    '5CeWYPMCKqDl4/Tp3ysFc4OJX0bw4OG/S5utp7ZOnT5FtrOz8+Dhwxs7OyQKPM7vBzs9t9IO'
-    '/F62HKWPYzv6X0cP7JdRvT7wufTRd+/ePbV/boqf//rXv3pHBtrBf2o7AJQBpd+777xL6f3U'
-    'U08J7+6vwnqXLfY4DGp8950Djx8/JuEg3TGrOV6FiR8XQfr6i8Vr79PfNce9fgLzAiqghYDy'
-    'k5Yqn17+zLTwM0F8zNUB4VRf6WHGcbZ4qBKhfz///MrFjy6Q0cGBPTXJ9fNGgg+OP7TWI61x'
-    'nvEJ+QnMDNprwLVg6j2gH/fuLlGFwg/UHNnbsrW3aTjc6eMc2CuXzEM6f/jDH/zniex7YfF9'
-    'HIZ//ytyrnOfnnz4y3//2X4OSPQTe0DzAgSoEioIkNmR5U1fv93eyk2RIR6Hnzk0B06HyPhm'
-    '+9kYP38o+uyfa38cf9Zf/vJnf0vb8TNk2vEHZECAKqGaALVs/v2vaqYdf0AGBKgS1JO/BdNS'
-    'HwhQs4AAVYJ68q/ctOMPyIAAVYJ6Bq7ctOMPyIAAVYJ6Bq7ctOMPyIAAVYJ6Bq7ctOMPyIAA'
-    'VYJ6Bq7ctOMPyIAAVYJ6Bq7ctOMPyIAAVYJ6Bq7ctOMPyIAAVYJ6Bq7ctOMPyBj1x6jPvLUN'
-    'Ixv1x3gT4OZ3N0WDP3GoE6kRqznnAwWozcTTQiOz0ZvYlTO/NX8iaCSCjaDmbAwRIIRKhOK0'
-    '5Kbx1Gnfmj9xgM8i6kwLfg9o9hicuhPlfGv+AC0jW4BwuYig/uSISfvD7duiJZ6+JH96AT5H'
-    'UGFyUAHNGH66hhI78m7BnG/NH6B9QIDmCjHbU06cKOdb8weYBSBAs4STovFCw4fff2TOt+YP'
-    'MBdAgAAAUAMEaH7wy41h45QqOlrzB5gRIEDzxuBsL3J68QGL+wM0DggQAABqWKwAnTp2nG3r'
-    '4CFtX0rCXpgUqRfsQQaselrzpxEcefow048OtH1pGiUF6MLZcz9+/CmZk/PcnjLCK889T51H'
-    'ukGD0MddPHuO7dv3z195bZt4QP9+89558RRqp3dThh3pG7B4EE+ITp+/vs30owN6uX3m5d4L'
-    'YRHyH5gdUXP/fH7z5hshu777E/e5euum3x45cUDP+AjkwIsffkAv6d9Pvv7q10ePqJ0O6K1X'
-    'P7vsnEIt1E7vRoalPjRIim+heSv1sxKXLn1k7MxLZ4qYPWZr/owhQ31j+tG/TD+yt7/84ud7'
-    '96iRDqYmfxZREy1XH3JRXoAo+bsn87yaALHE+FJCbGBJ6jxxJGOHDWPiMSgV18EGAWrWSGK6'
-    'PfUR36ogQFMQdYCmZKG8AHGek+qHZpa0ia8J3M1IFZcq3V4I2bidBjS1ld3fNzqdLOIhne53'
-    'oBbb2xB72OdScR1sEKBmTWSXY0RyQ36bz+PJPxFRB6lKBsoL0Ga/pjCTZQsQr3dojuzJisSA'
-    'AsAC4fd3jIVPvP7Y4XdOT1l/+d9C0dYmQLn+hGwAn7MshX7MIjImMxkTnkg4kvzTETVXH3Ix'
-    'iQA5RZA9I/5Vwi5A/Llz+kfCzAVwvND1V2G966/cuIbmrVQitZbwrfmjJUAp9AsRkvk8hvwD'
-    'iJpoufqQi0luwz98/Nu1728dPXzYuQe5dfAQNe7c2bUb6SU1ivcIuD8NZY98487u6WPHBzt2'
-    '9/79U9bpdEwt1D5sQAAIgdhrngURHwehRqJ35PSy5G8UuYqVKL12EWTaxauE3eiIN79Fg5i6'
-    'lCy0yZ94CbJXYenrr/QLS2jeSl3Jixcd48uN1vxppALiFgN+i++HMIcNxAooi/zzrYCmEqCN'
-    'tRNUVoDsLTrbEtXEXoWlr78gQDPyR0WAmH7+PVaH4byPQ93oJROvyxGgEPkHEDXRcvUhFxMK'
-    'kNlCGylA6evq7sm7byEzS+ve+18D4hqat4kEaGTOO0Mtwx8VAYrQz9BYFKkuKkC5m0rpRE3/'
-    'UpNiQgHa7K937Lqx83bR7LP8Efz+EeOKRoyZ3WgeF+qS11/pcQ3NW8FcKpXzBbO9NX9UBChE'
-    'PyMloqZ04U3oLPLnEjXRcvUhF9MK0GavyrBPdO7QO7el/DWRH1Q6Vyx0N/s1F5l9q5KfpLAD'
-    'yR/KjiWuv9LjGpo3CNDiBYjp14VrfL8CMk9Ojyd/LlETLVcfcjG5AHGhYdpNkFgUuj0hMJPO'
-    'EeK/nOBVEr3Fy2ZeyvFx5LJgxrf7d16lY8YcFoNIYRyat7Lp5Od8Vtr75y7Pn/oCZNOVOWwY'
-    'aC6KzHkmJ/cxfB5P/iyiLlCAaAZDyx+nneSAw+OvgHjTmsxWejrdNKbMqenPD335ZQ672vtM'
-    'l+2/bYl/t2GjeEYNzvnpsr01f+oLkGEXEdUw1qGZIT+32zwcSf4soiZarj7koqQAwSIBmyKp'
-    'xJyPpL3Yedn+qAjQkixXH3KR/SDinP7SvzrqT87JF076jc+eOCFa4ulL8qcX4HMEFSZnsT9I'
-    'th4MTtqJsr01f4CWMUSAcNEQoTgtlLpZ2Zvbf+7+xAE+i6gzLQMrIP7lw7KuzBeNzAancSST'
-    'ezss258IGolgI6g6G1NvMgGMifZWYSM3oQFdQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAq'
-    'QT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a'
-    '8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAq'
-    'QT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkQIAqQT0DV27a8QdkjPpJ1mfe2oaR'
-    'lfptplK4+d1N0eBPHOpEasRqzvlAAWoz8bTQyGz0JnblzG/NnwgaiWAjqDkbQwQIoRKhOC25'
-    'aTx12rfmTxzgs4g604L/FWP2GJy6E+V8a/4ALSNbgHC5iKD+5IhJ+8Pt26Ilnr4kf3oBPkdQ'
-    'YXJQAc0YfrqGEjvybsGcb80foH1AgOYKMdtTTpwo51vzB5gFIECzhJOi8ULDh99/ZM635g8w'
-    'F0CAAABQAwRofvDLjWHjlCo6WvMHmBEgQPPG4GwvcnrxAYv7AzQOCBAAAGpYrACdOnacbevg'
-    'ofGjHXn6MI82fqiRsBcmReoFe5ABq57W/GkEhjB0oPK5NT90DEoK0IWz5378+FMyJ+e5PWWE'
-    'V557njqPdIMGoY+7ePYc27fvn7/y2jYFhv795r3z4inUTu9GRvv89W0ejY5nFF2gPogwRCdD'
-    'GDqgl9tnXu69EI4k/1yJmvvn85s33wjZ9d2fuM/VWzf99siJA3rGRyAHXvzwA3pJ/37y9Ve/'
-    'PnpE7XRAb7362WXnFGqhdno3NCCNxmfRaDy+P4ix0LyV+lmJS5c+MnbmpTNFzB6zNX/GkKG+'
-    'MT3oX6Yf2dtffvHzvXvUSAeTkj+XqImWqw+5KC9ANAvdk9+8mgCxxPhSQvFgSeo8cSRjhw1j'
-    '/HOdl90ew0bGdbBBgJo1kpgQN+itqQVoIqIW0JgoygsQf3NS/dDMkjbxNYG7GaniUqXbmzU2'
-    'M5WmtrL7+0ank0U8pNP9DtRie5sSEggQBCiRXY4RyQ35bT6PJ/9ERB2oK8koL0Cb/ZrCTJYt'
-    'QLzeoankawIHIxIDCgALhN/fsRTJ91dh8fVX6FP8MqqarU2Acv0J2QA+Z1lixcHEZjKTMeGJ'
-    'hCPJPx1Rc/UhF5MIkFME2QLkXyXsAsSvQp3+kTBzARwvdP2oxNdfvvkLzMSAlUqk1hK+NX+0'
-    'BCiFfiFCMp/HkH8AURMtVx9yMclt+IePf7v2/a2jhw879yC3Dh6ixp07u3YjvaRG8R4B96eh'
-    '7JFv3Nk9PXR7n06/e/++fXeAjqmF2lNOp6/zpz8+T/1/+b/7wxwA1gNir3kWRHwchBqJ3pHT'
-    'B5N/TkTNVayIWNoSbhdBpl28StiNzkWA36JBTF1KxpXq4EuQvQrLWn9xPUwWL5dC81bqSl68'
-    '6BhfbrTmTyMVELcY8Ft8P4Q5bCBWQFnkH0DURiqgqQRoYxWBZQXI3qKzLVFN7FVY+vqLg9ol'
-    '1LSheYMALVuAmH7inovNcN7HoW70konX5QhQiPwDiLp8ATJbaCMFKH1d3T159y1kZmmdfv+L'
-    'HUvxJDRvEwnQyJx3hlqGPyoCFKGfobEoUl1UgHI3ldKJmv6lJsWEArTZX+/YdWPn7aLZZ/kj'
-    '+P0jxhWNOPt2o3lcqEtbf2UFNTRvBXOpVM4XzPbW/FERoBD9jJSImtKFN6GzyJ9L1ETL1Ydc'
-    'TCtAm70qwz7R2Zx3bkv5ayI/qHRu6OaiWf3a9Sc/SWEHkj+UHetdf+UGNTRvEKDFC5BZ/oRq'
-    'fL8CMk9Ojyf/FOoT4XMpTC5AXGh01ua0/bxDtycEZtI5QvyXE7xKord42cxLOT6OXBbM+Hb/'
-    'zqt0zJiDAxCKdKh/2XTycz4r7f1zl+dPfQGy6cocNgw0F0XmPJOT+xg+jyR/LlEXKEA0g6Hl'
-    'j9NOcsDh8VdAvGnNf9hij2AaUybU9OeHvvwyh11N2agzz4w5FiqdQvNWPKMG5/x02d6aP/UF'
-    'yLCLiGoY69DMkJ/bbR6OIX8uURcoQLBIwKZIKjHnI2kvdl62PyoCtCTL1YdcZD+ImPjDGutE'
-    '/ck5+cJJv/HZEydESzx9Sf70AnyOoMLkLPYHydaDwUk7Uba35g/QMoYIEC4aIhSnhVI3K3tz'
-    '+8/dnzjAZxF1pmVgBcS/fFjWlfmikdngNI5kcm+HZfsTQSMRbARVZ2PqTSaAMdHeKmzkJjSg'
-    'CwhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn'
-    '4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6A'
-    'DAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn4MpNO/6ADAhQJahn'
-    '4MpNO/6ADAhQJahn4MpNO/6AjFE/yfrMW9swslK/zVQKN7+7KRr8iUOdSI1YzTkfKEBtJp4W'
-    'GpmN3sSunPmt+RNBIxFsBDVnY4gAIVQiFKclN42nTvvW/IkDfBZRZ1rwv2LMHoNTd6Kcb80f'
-    'oGVkCxAuFxHUnxwxaX+4fVu0xNOX5E8vwOcIKkwOKqAZw0/XUGJH3i2Y8635A7QPCNBcIWZ7'
-    'yokT5Xxr/gCzAARolnBSNF5o+PD7j8z51vwB5gIIEAAAaoAAzQ9+uTFsnFJFR2v+ADMCBGje'
-    'GJztRU4vPmBxf4DGAQECAEANixWgU8eOs20dPDR+tCNPHy442hjYC5Mi9YI9yIBVT2v+NAJD'
-    'GDpQ+Vx1oiaipABdOHvux48/JXO+PLenjPDKc89T55Fu0CD0cRfPnmP79v3zV17bpsDQv9+8'
-    'd148hdrp3chon7++bUbbPvPySA+BBYMIQ3QyhKEDekmc6VWEkeSfK1Fz/3x+8+YbIbu++xP3'
-    'uXrrpt8eOXFAz/gI5MCLH35AL+nfT77+6tdHj6idDuitVz+77JxCLdRO74YGpNH4LBqNxw91'
-    'JgvNW6mflbh06SNjZ146U8TsMVvzZwwZ6hvTg/5l+pG9/eUXP9+7R410MCn5c4maaLn6kIvy'
-    'AkSz0D2Z59UEiCXGn3SKB0tS54kjGTtsGOOf64eE/BwZ18EGAWrWSGJC3KC3phagiYhaRGUi'
-    'KC9AnOek+qGZJW3iawJ3M1LFpUq3N2tsZmZNbWX3941OJ4t4SKf7HajF9jYlJBAgCFAiuxwj'
-    'khvy23weT/6JiDpQV5JRXoA2+zWFmSxbgHi9Q1PJ1wQORiQGFAAWCL+/Yyx88Rn3V2Hx9Vfo'
-    'O2bxoKytTYBy/QnZAD5nWQr9mD9kTGYyJjzRaST5pyNqrj7kYhIBcoogW4D8q4RdgPhVqNM/'
-    'EmYugOOFrr8Ki6+/jFEg6UO5wop/RGjeSiVSawnfmj9aApRCvxAhmc9jyD+AqImWqw+5mOQ2'
-    '/MPHv137/tbRw4ede5BbBw9R486dXbuRXlKjeI+A+9NQ9sg37uyePnZ8sGN3798/ZZ1Ox9RC'
-    '7Umn//Z7t6N1b6wCMwWx1zwLIt4Xp0aid+T0weSfE1FzFSsilraE20WQaRevEnajcxHgt2gQ'
-    'U5eyuotuJF6C7FVY7vrLnOLvZPdeMUpdyYsXHePLjdb8aaQC4hYDfovvhzCHDcQKKIv8A4ja'
-    'SAU0lQBtrJ2gsgJkb9H5M96rJvYqLHH9Ff+aEKDW/FERoEjC2wznfRzqRi+ZeF2OAIXIP4Co'
-    'iZarD7mYUIDMFtpIAUpfynZP3n0LmVla597/SolraN4mEqCROe8MtQx/VAQoQj9DY1GkuqgA'
-    'jdnHWbsAbfbXO3bd2Hm7aPZZ/gh+/4hxRSPGzG40jwt1g57Uit9tDc1bwVwqlfMFs701f1QE'
-    'KEQ/IyWipnThTegs8ucSNdFy9SEX0wrQZq/KsE907tA7t6X8NZEfVDo3tLLlmovMvvvIT1LY'
-    'geQPZcd611/OwxfMIcUnodtM+Nb8UREgpl8XrvH9Csg8OT2e/LlETbRcfcjF5ALEhYZpN0Fi'
-    'Uej2hMBMOkeI/3KCxZve4mUzL+X4OHJZMOPb/TsvEmbMxAAkfno1AfJzPivt/XOX5099AbLp'
-    'yhw2nDEXReY804n7GEaNJH8uURcoQDSDoeWP005ywOHxFZo3rfkPW+wRTGPKqtj054e+/DKH'
-    'XU15TIvOdUYbFrDiGTU456fL9tb8qS9Ahl1EVMNYh2aG/Nxu83AM+XOJmmi5+pCLkgIEiwRs'
-    'iqQScz6S9mLnZfujIkBLslx9yEX2g4iJP6yxTtSfnJMvnPQbnz1xQrTE05fkTy/A5wgqTM5i'
-    'f5BsPRictBNle2v+AC1jiADhoiFCcVoodbOyN7f/3P2JA3wWUWdaBlZA/MuHZV2ZLxqZDU7j'
-    'SCb3dli2PxE0EsFGUHU2pt5kAhgT7a3CRm5CA7qAAFWCegau3LTjD8iAAFWCegau3LTjD8iA'
-    'AFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau'
-    '3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iA'
-    'AFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8iAAFWCegau3LTjD8gY9ZOsz7y1'
-    'DSMr9dtMpXDzu5uiwZ841InUiNWc84EC1GbiaaGR2ehN7MqZ35o/ETQSwUZQczaGCBBCJUJx'
-    'WnLTeOq0b82fOMBnEXWmBf8rxuwxOHUnyvnW/AFaRrYA4XIRQf3JEZP2h9u3RUs8fUn+9AJ8'
-    'jqDC5KACmjH8dA0lduTdgjnfmj9A+4AAzRVitqecOFHOt+YPMAtAgGYJJ0XjhYYPv//InG/N'
-    'H2AugAABAKAGCND84Jcbw8YpVXS05g8wI0CA5o3B2V7k9OIDFvcHaBwQIAAA1LBYATp17Djb'
-    '1sFD2r6UhL0wKVIv2IMMWPW05k8jOPL0YaYfHWj70jRKCtCFs+d+/PhTMifnuT1lhFeee546'
-    'j3SDBqGPu3j2HNu375+/8to28YD+/ea98+Ip1E7v9o5M34t6Jn4XYJ0g+hFJPn99m+lHB/Ry'
-    '+8zLvRfCIuRnzImouX8+v3nzjZBd3/2J+1y9ddNvj5w4oGd8BHLgxQ8/oJf07ydff/Xro0fU'
-    'Tgf01qufXXZOoRZqp3fjI9NQNE7vJITmrdTPSly69JGxMy+dKWL2mK35M4YM9Y3pR/8y/cje'
-    '/vKLn+/do0Y6mJr8WURNtFx9yEV5AaLk757M82oCxBLjSwmFhCWp88SRjB02jAkZ0YiFbIyH'
-    '4w0C1KyRxHR76iO+VU2AyhK1iMpEUF6AOM9pFkIzS9rE1wTuZqSKS5VuL4Rs3E4DmtrK7u8b'
-    'nU7WGxv/LNvb0FejbsaT8XEdbBCgZk1kl2NEckN+m8/jyT8RUQfqSjLKC9Bmv6Ywk2XPBa93'
-    'aCr5msDBiMSA60mxv2MsfOL1xw6/c3rK+ssEdVPuMjXY1iZAuf6EbACfsyyFfswfMiYzGROe'
-    'SDiS/NMRNVcfcjGJADlFkD0X/lXCLkD8WXP6R8LMBXC80PVXYb3rL2fY3riG5q1UIrWW8K35'
-    'oyVAKfQLEZL5PIb8A4iaaLn6kItJbsM/fPzbte9vHT182LkHuXXwEDXu3Nm1G+klNYr3CLg/'
-    'DWWPfOPO7uljxwc7dvf+/VPW6XRMLdQu9qd3L549987f/ur4DAC9IPaaZ0HEx0GokegdOT2d'
-    '/DMmaq5iRcTSFl27CDLt4lXCbnRkm9+iQUxdykWm6EbiJchehfWuv/jj/E/ne2pZV4xSV/Li'
-    'Rcf4cqM1fxqpgLjFgN/i+yHmLhVDrICyyD+AqI1UQFMJ0MbaCSorQPYWnW3pd9O7/VVY7/qL'
-    'RnM+FwLUvj8qAsT08++xOgznfRzqRi+ZeF2OAIXIP4Coyxcgs4U2UoDS19Xdk3ffQmaW1in3'
-    'v+LfMT1gEwnQyJx3hlqGPyoCFKGfobEoUl1UgHI3ldKJmv6lJsWEArTZX+/YdWPn7aLZZ/kj'
-    '+P0jxhWNGDO70Twu1CVUTLlxDc1bwVwqlfMFs701f1QEKEQ/IyWipnThTegs8ucSNdFy9SEX'
-    '0wrQZq/KsE907tA7t6X8NZEfVDpXLHQ3+zUXmX2rkp+JsAPJH8qO9T5/mBvX0LxBgBYvQOYR'
-    '5FCN71dA5snp8eTPJWqi5epDLiYXIC40TLsJEotCtycEZtI5QrydxqskeouXzbyU4+PIZcGM'
-    'b/fvvErHjJkbj0YEyM/5rLT3z12eP/UFyKar2RI2L/miyPxhcprnlZnP48m/dgGiGQwtf5x2'
-    's2fmr4B405rMVno63TSmrIpNf37oyy9z2NXe50rTv2NvwIpn1OCcny7bW/OnvgAZkhBRDWMd'
-    'mhnyc7vNwyLkTyRqouXqQy5KChAsErApkkrM+Ujai52X7Y+KAC3JcvUhF9kPIs7jb/yVUH9y'
-    'Tr5w0m989sQJ0RJPX5I/vQCfI6gwOYv9QbL1YHDSTpTtrfkDtIwhAoSLhgjFaaHUzcre3P5z'
-    '9ycO8FlEnWkZWAHxLx+WdWW+aGQ2OI0jmdzbYdn+RNBIBBtB1dmYepMJYEy0twobuQkN6AIC'
-    'VAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy'
-    '044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMC'
-    'VAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy044/IAMCVAnqGbhy'
-    '044/IAMCVAnqGbhy044/IOP/AabVSnwHoJ6CAAAAAElFTkSuQmCC')
-
-layout_4P = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcVfwwEbwAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAiX0lEQVR4nO1dv68eRZa1Rpvb'
-    '0SPEmtheO3kERmIxdsbKkDKBZf4A4AkSQALMBjbeWbDJ1zCMZAeTgAYy2zwTYGnZgGdMbq80'
-    'AXZi+y/ovbw7r1SvfnVVdXXd6q5zdGX1V11Vfb+6556uqu73+cAAAAAghAPSDgAA0C8gQAAA'
-    'iAECBACAGCBAAACIAQIEAIAYIEDAPvxy//67X32pTNqdf6Ipr27s/Lz59lvKZJ1ZOvoSIOKx'
-    'Th2byvpZw6jytdvbAk7XRZvZ1ZRXTTmzdPzhQE94769/yW576+7Olb9/8+//cf7hkyflPAKA'
-    'viGtgPVAUxh7UmPUCcyAlL388UcC3tdCm7f3prz67fFj8keZrDNLRy8CZDA4RoBe//wyM+yz'
-    'b742Gq6Ydk2lukKbXgHT0YUA0S1Ll5VIAdLPGgmgTl27va12RiN3iMgZpWg0maJj6ty5w+rb'
-    'efWVc8/GRI8uQSU+xdSdIaNjQ23DF+Wvz1886ep2b1SiQsPSr9e3BcioTx+dX5B80yPOA06u'
-    'JjljdD66I84V6Fq9bSBmoAsBUlTgVM8QIN+pcG82nBMxw3yVU8tHp3tTnKEcVqPKPSdd3RZ0'
-    'u4muQUZ9e07KLumX0D0s23lgOkbVdL0bDQGwfgFS5ObwCwpQOCXmFiBOrVLOGLf31KvHaJ+e'
-    '9jH1U7+d0qDUzgMCFL4oBMjGygVIcUXtHOcJEM2f9VNqOp0kQMatVXXiW/VkCBDdfqlblbe0'
-    'FtBTQt8+n+iMPVBJVzd6U9ttxvRBpb19dbqoUdn37aic11DkmB4vVT+1c9/4G0On1nr0L/MH'
-    'AmRjzQKk3wZVVsQLUGATOrK3QOcxd9TUcid8lSc6owtNxtUDX8G5SWcvALncWLs5v52++aLv'
-    'Bm7uTYJSO/c5b88KdbAMjY5Yb1izACkq64GPFyCf5dHIeAcyZk8hT4CY6PY9XK9c0JmMq4d7'
-    'MyabGV4Fvt2wX+BYeYuMv3FR36Y4YGC1AqSzRH9mYSwKjAcZo+qjTxay/TFSrqAAOXdz4/M5'
-    '76KpV89wIMmrsKv2HajI+ONFgTx0IUCjplr5KvDj2ym3tQoCZOc/3e2NmUhxZzKunuEABGit'
-    'gAB5BajsluHcAmTsbvi2b4s7k3H1DAcWJ0AxG2TAsGIBMt4Wy1iCxQhQ/IuIzu1PRiTR1fxr'
-    'eopOd8b4djOtIn2b0KP9+L6d81Qp5/VCJxmwMWRjtQLkQ/Z7QBm9GTC0j+nIQhlDdH4qR8w2'
-    'XjZxVlZ3YOee7nRnjK+WevX4Z21J9VW5vvSjY1Vu+MN+lhIg45VrXW74DQA8hrcBAdqHWQXI'
-    '+YqtbT5/wvWNSQ1P7uxHUdnOJC3BRq9ua2veqze+cuOZlNOf7HWir9wYBPt7QYBsQID2YVYB'
-    'GjxvyjpnNAynTPjqOx9CBTpPciZjEzq+N6fpM4jpe0mG6cEquH6MvyjAgADtw9wCZP+tEP8x'
-    'aiC3jZd3+d1IX31DBcKd287QCqXgY/jA1Y1yQ2eN9Uvg6mGv9L8p1Ts3NmiKv4flvG3Yf2EL'
-    'DB0KUAugxLih/ZTMaG4b9ZM6L16/SG/2V1Y/sjPHTu2Nvd/uqbkNrIYCuhMABEgeHb5C0uFX'
-    'BpyAAMmjw2zs8CsDTkCA5NFhNnb4lQEnIEDy6DAbO/zKgBMQIAAAxAABAgBADBCgSvjpf/8H'
-    'JmjS8QfcgABVgngGdm7S8QfcgABVgngGdm7S8QfcgABVgngGdm7S8QfcgABVgngGdm7S8Qfc'
-    'gABVgngGdm7S8QfcgABVgngGdm7S8QfcgABVgngGdm7S8QfcgABVgngGdm7S8QfcgABVgngG'
-    'dm7S8QfcgABVgngGdm7S8Qfc+MMBYEV4+PDh5ctX3nv3fbKbN29RCf1LhUYdPhXu5/q169wP'
-    'dXjvl3vqFLXVm/NH25yn9P7Zw5i2yn/2nI1dCvgJLAPSCtgLKtzkL1y8QAF97U+v0cHW1ltH'
-    'jh45tQe9ml1i97OxsUHN6YCMKlO3dECnvv3u70wbOtB7I2zsQr8iVdN90C9K7unl4bZ0zIVX'
-    'r/43f6RT1IPTz7/97W+YAS0IEKBKmFt9WBooLQ0pYVXSC5Wa+Iyy2uiHOqfkZ+FgsTAqOHUt'
-    'cCFWjci2dGn6yA7op5x+3rlzBwK0IECAKmFuAaJUNITGmcy2HsX3w8JBMywyOsgWINbKpLb6'
-    'Rz4O+wkBWgqwB7QS3Lv3K69BbFD5rb39FzrwVRvt5+HDh7/e+/XoLujA2Fpy4vr1f27QkF2/'
-    'dj3SBwO8K3T06JFIP4ElQVoBe8HcM6DAzo4+6zkwtv7S++E9FwYd65OOA9ZyzzmL4Q0pNrWG'
-    'MtZfvrZqD4iWWqqt+go+P7EEWxYwA1o/Tp/+faagHjDxxwAePvrn1GbjmY1Tp0+R3bp16+Gj'
-    'Rzdv3SJR4H5+P7g18ijtwO/TlqN0Obaj/3r0wN40atQHbkuXvnfv3qm9tjF+/uMf/xjtGWgH'
-    '/yLtAFAGlH7vv/c+pfczzzzjOLu3Chtdtuj9MKjw/fcOPH36lISDdEet5ngV5rxcAPHrLxav'
-    '3au/r45H/QSWBcyAVgLKT1qqXLn8uSrhd4L4mGcHhFNjUw/Vj7HFQzMR+veLL65e/OQCGR0c'
-    '2FWTVD9vRvhg+ENrPdIa4x0fn5/AwiC9BuwFc+8B/bT7dIlmKPxCzZHdLVt9m4bDHd/Pgd3p'
-    'knpJ549//KP9PpH+LCy8j8Own38F2hrP6cmHP//Xf+rvATn9xB7QsgABqoQKAqR2ZHnT1y7X'
-    't3JjZIj74XcO1YFRIdC/2n5Wxu8fOn222+qX42v9+c//aW9pG376TDr+gBsQoEqoJkAtm/38'
-    'q5pJxx9wAwJUCeLJ34JJqQ8EqFlAgCpBPPk7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4'
-    'A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpB'
-    'PAM7N+n4A25M+mPU597ZgpFN+mO8GbD9/bbT4E8Y4kRqxGqOeaYAtZl4UmhkNEYTu3Lmt+ZP'
-    'AI1EsBHUHI0cAUKonBAcltQ0njvtW/MnDPDZiTrDgt8DWjyyU3emnG/NH6BlJAsQbhcB1B8c'
-    'Z9L+eOeO0yKbr8mfUYDPAVQYHMyAFgw7XX2JHThbMOdb8wdoHxCgpcKZ7TENZ8r51vwBFgEI'
-    '0CJhpGh4omHDrj8x51vzB1gKIEAAAIgBArQ82NONvH5KTTpa8wdYECBAy0Z2thdpXrzD4v4A'
-    'jQMCBACAGFYrQKeOHWfbOHhI2peS0BcmReYLeicZq57W/GkER549zPSjA2lfmkZJAbpw9txP'
-    'n14hM3Key2N6eO2FF6nyRDeoE7rcxbPn2L778PzVN7aIB/Tvtx+cdzahcjob0+1E34DVg3hC'
-    'dPrizS2mHx3Qx60zr47eCIuQ/8DiiJr65/Obb7/lsxs7P3Oda7e37fJAw4ya4R7IgZc//og+'
-    '0r+fffP1b48fUzkd0KnXP79sNKESKqezgW6pDnUS45tv3Er9rMSlS58oO/PKmSKm99maP1PI'
-    'UN+YfvQv04/s3a++/OX+fSqkg7nJn0TUSEvVh1SUFyBK/mF/nlcTIJYYW0qIDSxJgyWOZOyw'
-    'Ykw4BqXimm0QoGaNJGbYVR/nqQoCNAdRMzQlCeUFiPOcVN83sqRNfE/gakqqeKoy7IaQjcup'
-    'QzW30uvbRs3JAh5Sc7sCleje+tjDPpeKa7ZBgJo1J7sMI5Ir8ut8nk7+mYiapSoJKC9Am3tz'
-    'CjVYugDxeofGSB+sQAwoACwQdn3DWPic9x89/EbzmPWX/S0ErTcBSvXHZxl8TrIY+jGLyJjM'
-    'ZEx4IuFE8s9H1FR9SMUsAmRMgvQRse8S+gTEHjujfiDMPAEOT3TtVdjo+is1rr5xK5VIrSV8'
-    'a/5ICVAM/XyEZD5PIX8GUSMtVR9SMctj+EdPn1z/4fbRw4eNZ5AbBw9R4a27O3ohfaRC5zMC'
-    'rk9d6T3fvLtz+tjxbMfuPXhwSmtOx1RC5XkdAoAPxF71LojzdRAqJHoHmpclf6NIVaxI6dUn'
-    'QarceZfQCw3x5lPUiZqXkvk2+SNvQfoqLH79FX9j8Y1bqTt58UnH9OlGa/40MgPiEgU+xc9D'
-    'mMMKzhlQEvmXOwOaS4A2tZ2gsgKkb9HpFqkm+iosfv0FAVqQPyICxPSzn7EaDOd9HKpGH5l4'
-    'Q4oA+cifQdRIS9WHVMwoQGoLbaIAxa+rh/1P33ymltajz78y4uobt5kEaGLOG12twx8RAQrQ'
-    'T9HYKVJDUIBSN5XiiRr/pWbFjAK0ubfe0eeNg7WLpreye7DrB4xnNM6Y6YXqdaEhev0VH1ff'
-    'uBXMpVI5XzDbW/NHRIB89FNS4tSUwb8JnUT+VKJGWqo+pGJeAdrcnWXoDY0n9MZjKXtNZAeV'
-    '2jonupt7cy4y/VElv0mhB5Ivyo5Frr/i4+obNwjQ6gWI6Tf45/j2DEi9OT2d/KlEjbRUfUjF'
-    '7ALEEw1VroLEojDsCoEadI4Q/+UEr5LoFC+beSnHx4Hbgupfrz9YMx3VZ14MAhNj37iVTSc7'
-    '55PS3m67Pn/qC5BOV+awYqC6KTLnmZxcR/F5OvmTiLpCAaIR9C1/jHKSAw6PvQLiTWsyXemp'
-    'uSqMGVNVn1/6sqc57OroO126/7pF/t2GjuIZlZ3z82V7a/7UFyDFLiKqYqxBM0V+Ltd5OJH8'
-    'SUSNtFR9SEVJAYIFAjZHUjlzPpD2zsrr9kdEgNZkqfqQiuQXEZf0l/7VUX9wTr500i58/sQJ'
-    'p0U2X5M/owCfA6gwOKv9QbJ+kJ20M2V7a/4ALSNHgHDTcEJwWCh1k7I3tf7S/QkDfHaizrBk'
-    'zoD4lw/LurJcNDIanMaBTB6tsG5/Amgkgo2g6mjMvckEMGbaW4VN3IQGZAEBqgTxDOzcpOMP'
-    'uAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTx'
-    'DOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMP'
-    'uAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTxDOzcpOMPuAEBqgTx'
-    'DOzcpOMPuDHpJ1mfe2cLRlbqt5lKYfv7bafBnzDEidSI1RzzTAFqM/Gk0MhojCZ25cxvzZ8A'
-    'GolgI6g5GjkChFA5ITgsqWk8d9q35k8Y4LMTdYYF/yvG4pGdujPlfGv+AC0jWYBwuwig/uA4'
-    'k/bHO3ecFtl8Tf6MAnwOoMLgYAa0YNjp6kvswNmCOd+aP0D7gAAtFc5sj2k4U8635g+wCECA'
-    'FgkjRcMTDRt2/Yk535o/wFIAAQIAQAwQoOXBnm7k9VNq0tGaP8CCAAFaNrKzvUjz4h0W9wdo'
-    'HBAgAADEsFoBOnXsONvGwUPTezvy7GHubXpXE6EvTIrMF/ROMlY9rfnTCBRh6EDkujUvOgUl'
-    'BejC2XM/fXqFzMh5Lo/p4bUXXqTKE92gTuhyF8+eY/vuw/NX39iiwNC/335w3tmEyulsoLcv'
-    '3tzi3uh4QdEF6oMIQ3RShKED+rh15tXRG+FE8i+VqKl/Pr/59ls+u7HzM9e5dnvbLg80zKgZ'
-    '7oEcePnjj+gj/fvZN1//9vgxldMBnXr988tGEyqhcjrr65B641bUG/dvd6LMN26lflbi0qVP'
-    'lJ155UwR0/tszZ8pZKhvTA/6l+lH9u5XX/5y/z4V0sGs5E8laqSl6kMqygsQjcKw/5tXEyCW'
-    'GFtKKB4sSYMljmTssGKM3db4OOwybGJcsw0C1KyRxPi4QafmFqCZiFpAY4IoL0D8zUn1fSNL'
-    '2sT3BK6mpIqnKsPuqLGpoVRzK72+bdScLOAhNbcrUInubUxIIEAQoEh2GUYkV+TX+Tyd/DMR'
-    'NVNXolFegDb35hRqsHQB4vUODSXfEzgYgRhQAFgg7PqGxUi+vQoLr798V7GnUdWsNwFK9cdn'
-    'GXxOssgZBxObyUzGhCcSTiT/fERN1YdUzCJAxiRIFyD7LqFPQOxZqFE/EGaeAIcnunZUwusv'
-    '2+wFZmTASiVSawnfmj9SAhRDPx8hmc9TyJ9B1EhL1YdUzPIY/tHTJ9d/uH308GHjGeTGwUNU'
-    'eOvujl5IH6nQ+YyA61NXes837+6czt3ep+b3HjzQnw7QMZVQeUxz+jp/+rcXqf6v//cgzwGg'
-    'HxB71bsgztdBqJDoHWieTf4lETVVsQJiqUu4PglS5c67hF5o3AT4FHWi5qVkPFPNvgXpq7Ck'
-    '9RfPh8nC0yXfuJW6kxefdEyfbrTmTyMzIC5R4FP8PIQ5rOCcASWRP4OojcyA5hKgTW0SWFaA'
-    '9C063SLVRF+Fxa+/OKhDxJzWN24QoHULENPPueeiM5z3cagafWTiDSkC5CN/BlHXL0BqC22i'
-    'AMWvq4f9T998ppbW8c+/2LEYT3zjNpMATcx5o6t1+CMiQAH6KRo7RWoIClDqplI8UeO/1KyY'
-    'UYA299Y7+rxxsHbR9FZ2D3b9gPGMxjn6eqF6XWiIW38lBdU3bgVzqVTOF8z21vwRESAf/ZSU'
-    'ODVl8G9CJ5E/laiRlqoPqZhXgDZ3Zxl6Q2Nz3ngsZa+J7KBSW9/DRbX61eef/CaFHki+KDs2'
-    'uv5KDapv3CBAqxcgtfzxzfHtGZB6c3o6+edQnwCfS2F2AeKJxqBtTuvvOwy7QqAGnSPEfznB'
-    'qyQ6xctmXsrxceC2oPrX6w/WTEf1mR0AX6R99cumk53zSWlvt12fP/UFSKcrc1gxUN0UmfNM'
-    'Tq6j+DyR/KlEXaEA0Qj6lj9GOckBh8deAfGmNf9hi96DKowZUFWfX/qypznsasxGnXpnzDDf'
-    '1Mk3bsUzKjvn58v21vypL0CKXURUxViDZor8XK7zcAr5U4m6QgGCBQI2R1I5cz6Q9s7K6/ZH'
-    'RIDWZKn6kIrkFxEjf1ijT9QfnJMvnbQLnz9xwmmRzdfkzyjA5wAqDM5qf5CsH2Qn7UzZ3po/'
-    'QMvIESDcNJwQHBZK3aTsTa2/dH/CAJ+dqDMsmTMg/uXDsq4sF42MBqdxIJNHK6zbnwAaiWAj'
-    'qDoac28yAYyZ9lZhEzehAVlAgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25A'
-    'gCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7'
-    'N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25A'
-    'gCpBPAM7N+n4A25AgCpBPAM7N+n4A25AgCpBPAM7N+n4A25M+knW597ZgpGV+m2mUtj+fttp'
-    '8CcMcSI1YjXHPFOA2kw8KTQyGqOJXTnzW/MngEYi2AhqjkaOACFUTggOS2oaz532rfkTBvjs'
-    'RJ1hwf+KsXhkp+5MOd+aP0DLSBYg3C4CqD84zqT98c4dp0U2X5M/owCfA6gwOJgBLRh2uvoS'
-    'O3C2YM635g/QPiBAS4Uz22MazpTzrfkDLAIQoEXCSNHwRMOGXX9izrfmD7AUQIAAABADBGh5'
-    'sKcbef2UmnS05g+wIECAlo3sbC/SvHiHxf0BGgcECAAAMaxWgE4dO862cfDQ9N6OPHu4YG9T'
-    'oC9MiswX9E4yVj2t+dMIFGHoQOS64kSNREkBunD23E+fXiEzvjyXx/Tw2gsvUuWJblAndLmL'
-    'Z8+xfffh+atvbFFg6N9vPzjvbELldDbQ2xdvbqnets68OtFDYMUgwhCdFGHogD4SZ0YVYSL5'
-    'l0rU1D+f33z7LZ/d2PmZ61y7vW2XBxpm1Az3QA68/PFH9JH+/eybr397/JjK6YBOvf75ZaMJ'
-    'lVA5nfV1SL1xK+qN+/dVJvONW6mflbh06RNlZ145U8T0PlvzZwoZ6hvTg/5l+pG9+9WXv9y/'
-    'T4V0MCv5U4kaaan6kIryAkSjMOzP82oCxBJjDzrFgyVpsMSRjB1WjLHb2iEhPyfGNdsgQM0a'
-    'SYyPG3RqbgGaiahFVCaA8gLEeU6q7xtZ0ia+J3A1JVU8VRl2R41NjayaW+n1baPmZAEPqbld'
-    'gUp0b2NCAgGCAEWyyzAiuSK/zufp5J+JqJm6Eo3yArS5N6dQg6ULEK93aCj5nsDBCMSAAsAC'
-    'Ydc3jIUvPOL2Kiy8/vJ9xyQelLXeBCjVH59l8DnJYujH/CFjMpMx4YlOE8k/H1FT9SEVswiQ'
-    'MQnSBci+S+gTEHsWatQPhJknwOGJrr0KC6+/lFEg6aI8wwpfwjdupRKptYRvzR8pAYqhn4+Q'
-    'zOcp5M8gaqSl6kMqZnkM/+jpk+s/3D56+LDxDHLj4CEqvHV3Ry+kj1TofEbA9akrveebd3dO'
-    'Hzue7di9Bw9Oac3pmEqoPKr5k9+rHa37YBVYKIi96l0Q53NxKiR6B5pnk39JRE1VrIBY6hKu'
-    'T4JUufMuoRcaNwE+RZ2oeSmru9ONyFuQvgpLXX+pJvZO9ugdo9SdvPikY/p0ozV/GpkBcYkC'
-    'n+LnIcxhBecMKIn8GURtZAY0lwBtajtBZQVI36KzR3xUTfRVWOT6K/w1IUCt+SMiQIGE1xnO'
-    '+zhUjT4y8YYUAfKRP4OokZaqD6mYUYDUFtpEAYpfyg77n775TC2tU59/xcTVN24zCdDEnDe6'
-    'Woc/IgIUoJ+isVOkhqAATdnH6V2ANvfWO/q8cbB20fRWdg92/YDxjMYZM71QvS40ZL2pFX7a'
-    '6hu3grlUKucLZntr/ogIkI9+SkqcmjL4N6GTyJ9K1EhL1YdUzCtAm7uzDL2h8YTeeCxlr4ns'
-    'oFJb38qW51xk+tNHfpNCDyRflB0bXX8ZL18whwTfhG4z4VvzR0SAmH6Df45vz4DUm9PTyZ9K'
-    '1EhL1YdUzC5APNFQ5SpILArDrhCoQecI8V9OsHjTKV4281KOjwO3BdW/Xn+wIqH6jAxA5NWr'
-    'CZCd80lpb7ddnz/1BUinK3NYcUbdFJnzTCeuoxg1kfypRF2hANEI+pY/RjnJAYfHVmjetOY/'
-    'bNF7UIUxq2JVn1/6sqc57GrMa1rU1ugtL2DFMyo75+fL9tb8qS9Ail1EVMVYg2aK/Fyu83AK'
-    '+VOJGmmp+pCKkgIECwRsjqRy5nwg7Z2V1+2PiACtyVL1IRXJLyJG/rBGn6g/OCdfOmkXPn/i'
-    'hNMim6/Jn1GAzwFUGJzV/iBZP8hO2pmyvTV/gJaRI0C4aTghOCyUuknZm1p/6f6EAT47UWdY'
-    'MmdA/MuHZV1ZLhoZDU7jQCaPVli3PwE0EsFGUHU05t5kAhgz7a3CJm5CA7KAAFWCeAZ2btLx'
-    'B9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWC'
-    'eAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLx'
-    'B9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWC'
-    'eAZ2btLxB9yY9JOsz72zBSMr9dtMpbD9/bbT4E8Y4kRqxGqOeaYAtZl4UmhkNEYTu3Lmt+ZP'
-    'AI1EsBHUHI0cAUKonBAcltQ0njvtW/MnDPDZiTrDgv8VY/HITt2Zcr41f4CWkSxAuF0EUH9w'
-    'nEn74507TotsviZ/RgE+B1BhcDADWjDsdPUlduBswZxvzR+gfUCAlgpntsc0nCnnW/MHWAQg'
-    'QIuEkaLhiYYNu/7EnG/NH2ApgAABACAGCNDyYE838vopNelozR9gQYAALRvZ2V6kefEOi/sD'
-    'NA4IEAAAYlitAJ06dpxt4+AhaV9KQl+YFJkv6J1krHpa86cRHHn2MNOPDqR9aRolBejC2XM/'
-    'fXqFzMh5Lo/p4bUXXqTKE92gTuhyF8+eY/vuw/NX39giHtC/335w3tmEyunsaM/0vahm5HcB'
-    '+gTRj0jyxZtbTD86oI9bZ14dvREWIT9jSURN/fP5zbff8tmNnZ+5zrXb23Z5oGFGzXAP5MDL'
-    'H39EH+nfz775+rfHj6mcDujU659fNppQCZXT2XDP1BX1MzoIvnEr9bMSly59ouzMK2eKmN5n'
-    'a/5MIUN9Y/rRv0w/sne/+vKX+/epkA7mJn8SUSMtVR9SUV6AKPmH/XleTYBYYmwpoZCwJA2W'
-    'OJKxw4oxPiMasZBN8XC6QYCaNZKYYVd9nKeqCVBZohZRmQDKCxDnOY2Cb2RJm/iewNWUVPFU'
-    'ZdgNIRuXU4dqbqXXt42ak43Gxm6le+v7alRNeTI9rtkGAWrWnOwyjEiuyK/zeTr5ZyJqpq5E'
-    'o7wAbe7NKdRg6WPB6x0aSr4ncDACMeD5pLO+YSx8zvuPHn6jecz6SwV1s9xtKtt6E6BUf3yW'
-    'wecki6Ef84eMyUzGhCcSTiT/fERN1YdUzCJAxiRIHwv7LqFPQOxRM+oHwswT4PBE116Fja6/'
-    'jG5H4+obt1KJ1FrCt+aPlADF0M9HSObzFPJnEDXSUvUhFbM8hn/09Mn1H24fPXzYeAa5cfAQ'
-    'Fd66u6MX0kcqdD4j4PrUld7zzbs7p48dz3bs3oMHp7TmdEwlVO6sT2cvnj333l//YvgMAKMg'
-    '9qp3QZyvg1Ah0TvQPJ78CyZqqmIFxFIXXX0SpMqddwm90JBtPkWdqHkpTzKdbkTegvRV2Oj6'
-    'iy9nX52fqSXdMUrdyYtPOqZPN1rzp5EZEJco8Cl+HqKeUjGcM6Ak8mcQtZEZ0FwCtKntBJUV'
-    'IH2LTrf4p+nD3ipsdP1FvRnXhQC174+IADH97GesBsN5H4eq0Ucm3pAiQD7yZxB1/QKkttAm'
-    'ClD8unrY//TNZ2ppHfP8K/wd4wM2kwBNzHmjq3X4IyJAAfopGjtFaggKUOqmUjxR47/UrJhR'
-    'gDb31jv6vHGwdtH0VnYPdv2A8YzGGTO9UL0uNETMmFLj6hu3grlUKucLZntr/ogIkI9+Skqc'
-    'mjL4N6GTyJ9K1EhL1YdUzCtAm7uzDL2h8YTeeCxlr4nsoFJb50R3c2/ORaY/quR3IvRA8kXZ'
-    'sdH3D1Pj6hs3CNDqBUi9guyb49szIPXm9HTypxI10lL1IRWzCxBPNFS5ChKLwrArBGrQOUK8'
-    'ncarJDrFy2ZeyvFx4Lag+tfrD9ZMR/WZGo9GBMjO+aS0t9uuz5/6AqTTVW0Jq498U2T+MDnV'
-    '+8rM5+nk712AaAR9yx+jXO2Z2Ssg3rQm05WemqvCmFWxqs8vfdnTHHZ19L3S+O84GrDiGZWd'
-    '8/Nle2v+1BcgRRIiqmKsQTNFfi7XeViE/JFEjbRUfUhFSQGCBQI2R1I5cz6Q9s7K6/ZHRIDW'
-    'ZKn6kIrkFxGX8Tf+Qqg/OCdfOmkXPn/ihNMim6/Jn1GAzwFUGJzV/iBZP8hO2pmyvTV/gJaR'
-    'I0C4aTghOCyUuknZm1p/6f6EAT47UWdYMmdA/MuHZV1ZLhoZDU7jQCaPVli3PwE0EsFGUHU0'
-    '5t5kAhgz7a3CJm5CA7KAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWC'
-    'eAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLx'
-    'B9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWC'
-    'eAZ2btLxB9yAAFWCeAZ2btLxB9yAAFWCeAZ2btLxB9z4fw96JPjlg+etAAAAAElFTkSuQmCC')
-
-layout_4P_chain = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcO9WnNgwAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAjsklEQVR4nO1dz68XRbYnL28P'
-    'q+tSMmt4sLkuMHHEy84E3ToLgn+AeqMbNFFxAzLzFN0/dJwEFrPRjO4ALy4keb6FF3EPk8xC'
-    '2AB/Qb/jPXMrRdWp6vp9qrvOJyekv/Wtqj59fnz6VHXfLwcmgUAgYMIBbgUEAsG4EAISCARs'
-    'EAISCARsEAISCARsEAISCARsEAKqiF/u3Tv31ZdKuNX5N7rS6vruz5tvv6WEV5kQNLNe1RP1'
-    'Y/Y4AgKj6Hqzh2/n6MfNOrrSqitlQtBM4aon6sfs/3EgBu/+7a9R/QUCgcCHcK6CekdnTbIC'
-    'ghIJyLUkQy4Z/dxndHSl1W+PHoE+SniVCcE6KqB+zB5KQIY5XASE3V7+6MOrt3bgIgsruzR0'
-    'leoKfWq1FKyDgPpBEAEBlShDvP755VkC0jtATRSoCnCW2nKD40DFPv3mazwXsB4cgwLk1p1r'
-    'S8/VjjMbRR+cAlpcdwxdGRA41j/qMUSeFC8fLzzq7PZs0KLcBAfGEDuyjf4ul4FuuvfR4MZt'
-    'ZlYZY/LZrVbsAOfSg8ofHrEGibpAkhfQWWToGsros/kvLdZNmTETaLrwdA5EEAEpG2F6hxOQ'
-    'skIIofhntkGeyxBX59j2wNIvTRkIHWVhnDnq7Dbp20P0EDT6GyypVNJPoWtYdnLPfR666XQw'
-    '64Jkg+RcIDa67jTT01ENpwi/tExLRsVMTmxkYp6AlAXxGmZpAkmUtAJcj4dBowjIHzGzlo1t'
-    'J6+llDLGPTD27CHcp8dNSP/Yq1MpGju5h4D8Jw0noFmD5FwgNhpPh3XCIi885NIyLZlm9tiT'
-    '5mOGgJRCirwDaQKcClUPaWhXDRxFQAY3qwrLdS9KICDQU9/JgiDTL0cZJF8ZMvjCz27MhubF'
-    'Gci4sc8OJzU6u64O2vEWAoqR9/bYyV32N0ynlkIYV/4IiTVIzgWqk5JbEwYx4cyBl5ZgyeSY'
-    '8USm/6T58BGQfmdQV5WwUCKrTVxg6z2jZiYjacqudGavheycqUzghn3CJZBZYS8Asd2oW8mr'
-    '05fS+s7g5v5tP3Zyl/J2VagDczXWUC6D5Fyg6ozcYbTrXAOnjrq0WEtGmSKwPe2kUfARkPKW'
-    '7pVYAkIYG7SZV2LcWEL2FNIICKPBvgnonQsqk3B2/2xkVkRp5bm66el8RuYtYn+ycAhHlEFK'
-    'XSDJVjrXYBKFX1q9iE2YvN4jOScB6afUN8aNoi7wPfGyBOQxR0HLunayAvM57aSxZ09QIEor'
-    'v6r23aiI/TPDPcogpS7Q7kxSW/il1YvYhMmZCWhWPCcIX4KFowEB2b6EqzAupLgyCWdPUEAI'
-    'SP+qIAHZK2tjbNSl1YvYhMmXR0AJm9DhqE1ARjnt2r4trkzC2RMUWBwBxT735SKgyf1467rj'
-    'IZrn0upFbMH2fDgJyHglKXwJlvwYPvxFRHK9jQi0oFIjP0XzlTGurtIqcvYm7Gp3XR35VSnl'
-    '9UYyGBJ2T1wGKXKBCHKfwegWeGlF7hMLJiAXOnkR0eBB9JnNfS7FsAqzazSys7pNkXu6+cr4'
-    'bTh79sCg8bxi62/Xy3j1KMfWx7/HkXNSZVIEPiAPfww/a5AiF4gw9n1QjK2GwEsrUjNmxsxs'
-    'ez7qEtC5mD/FyHkPyCX6kPD+RlGDhZ69k5WsTNQSbPbsNremvXrjajeSitSneM1vGMG+rqj3'
-    'gPwGKXKBCran7L+ZCLm0nDI8NmaS2/NRhYDS/hg19gE/ud4mKxoESROu/uQq0jN5lDIJm9Dh'
-    's5Gi50D+XpIhurMKRnb4SQ3EGqTIBSoYRQf52l7I6fI3oRMicPEElPNzHLEEZP9BDf4xqsdS'
-    'xrut1/dekHX1Nzzqn9xWBgIxx53hZzfaDZ41inzP2WcXF/Yd1V5cl41s19sb/ucYsQYpcoGu'
-    'Dq7Nh9lLy9zyi4qZ5PZ8LP4nWZHyXE8ZZvtHTV68f5HZ7EtWv/ZS/G+X8XT1JndBmSLEtpkG'
-    'ybxAg1Zm1wFRlzaLshHYAIsnIAP1qLpbDHjJfvAaxChnGp99cYj7SVaBQODBjTu7+sdTx45z'
-    'abIUCAEJBMVw7Ydb+sc//fFFHj2WAyEggaAMHjx+/Os/76uPW1L+hIB7DSgQCMaFEJBAIGCD'
-    'EFAj/PR//yvCKNz+F9AQAmoE9gwcXLj9L6AhBNQI7Bk4uHD7X0BDCKgR2DNwcOH2v4CGEFAj'
-    'sGfg4MLtfwENIaBGYM/AwYXb/wIaQkCNwJ6Bgwu3/wU0hIAagT0DBxdu/wtoCAE1AnsGDi7c'
-    '/hfQEAJqBPYMHFy4/S+gIQTUCOwZOLhw+19AQ/4aflV48ODB5cufvXvuPZAbN25CC/wLjUYf'
-    '/Mo/z7Wr13AemPDuL3fVVzBWH44fbSG/0udHDUPGKv1RcxRUyaOnYBngZsBR0OAmf+HiBXDo'
-    'a396DQ62t986cvTI1j70bnaLPc/GxgYMhwMQ6AzTwgF89e13/8CwgQN9NsDGHvQzQjddB/2k'
-    'oJ7e7h8Lx9h45cr/4Ef4CmYg9fz73/8uFdCCIATUCLXZB6kB0tKgEmQlvVGxiUsgq415YHJI'
-    'fiQOJAujA8lrnhMhawSOhVPDR1RA/4rU8/bt20JAC4IQUCPUJiBIRYNoyGS2+Sh8HiQOqLBA'
-    '4CCZgJAro8bqH/HYr6cQ0FIge0Arwd27v+IaxAa039zff4EDV7fZeR48ePDr3V+P7gEOjK0l'
-    'Eteu/XuDBuTa1WuBOhjAXaGjR48E6ilYErgZcBTUroA8Ozt61XNgbv2lz4N7Lgg41ouOA9Zy'
-    'j6xicEMKRa2hjPWXa6zaA4KllhqrLsGlpyzBlgWpgNaPU6d+rxTUAyb86MGDh/8ubTae2dg6'
-    'tQVy8+bNBw8f3rh5E0gB5/n94ObMo7QDv5ctR+F0KEf/6+iB/TJqVgccC6e+e/fu1v7YED3/'
-    '9a9/zc4s6Af/ya2AoAwg/d579z1I72eeeYb4dn8VNrts0edBQON77x548uQJEAfwjlrN4SqM'
-    'PJ0H4esvJK+9s7+njmf1FCwLUgGtBJCfsFT57PLnqgXfCcJjrA4AW3Olh5rH2OKBSgT+/eKL'
-    'Kxc/vgACBwf22CRWzxsBOhj6wFoPuMZ4x8elp2Bh4F4DjoLae0A/7T1dggoFX6g5srdlq2/T'
-    'oLvD5zmwVy6pl3T+8Ic/2O8T6c/C/Ps4CPv5l2es8ZwedPjLf/9Zfw+I1FP2gJYFIaBGaEBA'
-    'akcWN33tdn0rN4SGcB5851AdGB0886vtZyX4/iGpsz1WPx2e6y9/+bO9pW3o6RJu/wtoCAE1'
-    'QjMC6lns51/NhNv/AhpCQI3Anvw9CBf7CAF1CyGgRmBP/sGF2/8CGkJAjcCegYMLt/8FNISA'
-    'GoE9AwcXbv8LaAgBNQJ7Bg4u3P4X0BACagT2DBxcuP0voCEE1AjsGTi4cPtfQEMIqBHYM3Bw'
-    '4fa/gIYQUCOwZ+Dgwu1/AY2sP0Z97p1tEZCsP8argJ3vd0gRffxgD6ROpKXNEwmoz8TjQifW'
-    'mE3sxpnfmz4edOLBTtDSGikEJK4iwWiW2DSunfa96eOHxDOJNmaR3wNaPJJTt1LO96aPoGdE'
-    'E5DcLjxobxwyaX+8fZuUwOFr0mcWEs8eNDCOVEALhp2ursT2fFsw53vTR9A/hICWCjLbQwZW'
-    'yvne9BEsAkJAi4SRov5Cw4bdPzPne9NHsBQIAQkEAjYIAS0PdrmRNk+poqM3fQQLghDQspGc'
-    '7UWGF5+wuD6CziEEJBAI2LBaAto6dhxl4+Ahbl1KQl+YFKkX9EkSVj296dMJjjx7GMMPDrh1'
-    '6RolCejCmbM/ffIZiJHz2B4yw2svvAidM9WASeB0F8+cRfnug/NX3tiGOIB/v33/PDkE2uHb'
-    'kGkzdROsHhAnEE5fvLmN4QcH8HH79KuzN8IiwX9gcYEa++fzm2+/5ZLruz9jn6u3dux2z8CE'
-    'nv4ZQIGXP/oQPsK/n37z9W+PHkE7HMBXr39+2RgCLdAO33qmhT4wSYhuLruV+lmJS5c+VnL6'
-    'ldNFRJ+zN31ygqG9YPjBvxh+IOe++vKXe/egEQ5qB39UoAZKLD/EojwBQfJPT+d5MwJCirGp'
-    'BKIBKWmyyBEEFVYR4/dBKb8mixBQtwIUM+2xD/lVAwKqEagJnBKF8gSEeQ6s77IscBPeE7Cb'
-    'oiosVaY9F6JgO0yoaiu9vy0wHMSjIQy3O0CLrq0relDnUn5NFiGgboWMLkMgyFXw6/GcH/yV'
-    'AjWJVSJQnoA292sKZSydgHC9AzbSjeXxATgACcLubwgSH3n/0d1vDA9Zf9lXwSijEVCsPi5J'
-    'iOcoCQk/jCIQDGYQDHgIwszgrxeosfwQiyoEZBRBukXsu4RegNi2M/p73IwFsL/QtVdhs+uv'
-    'WL+67FYqkXpL+N704SKgkPBzBSTGc07wJwRqoMTyQyyqPIZ/+OTxtR9uHT182HgGuXHwEDTe'
-    'vLOrN8JHaCSfEWB/mEqf+cad3VPHjicrdvf+/S1tOBxDC7SnTSgQuADRq94FIV8HgUYIb8/w'
-    'ssHfKWIZK5B69SJItZN3Cb3RIG/8CiZRdSmIa5M/8Bakr8LC11/hNxaX3UrdyYsXHfnlRm/6'
-    'dFIBYYsCfoXPQzCGFcgKKCr4l1sB1SKgTW0nqCwB6Vt0ugSyib4KC19/CQEtSB8WAsLws5+x'
-    'GhGO+zjQDT5i4E0xBOQK/oRADZRYfohFRQJSW2iZBBS+rp6efvrmErW0nn3+leBXl90qEVBm'
-    'zhtTrUMfFgLyhJ8KY5KkJi8BxW4qhQdq+EVVRUUC2txf7+h142Ttoumj7Bns/h7Biob0md6o'
-    'Xheagtdf4X512a1gLpXK+YLZ3ps+LATkCj9FJSSnTO5N6Kjgjw3UQInlh1jUJaDNvSpDH2g8'
-    'oTceS9lrItupMJYsdDf3ay4Q/VElvkmhOxJPiooFrr/C/eqymxDQ6gkIw29y1/h2BaTenM4P'
-    '/thADZRYfohFdQLCQkO1KychKUx7RKCMjh7Cv5zAVRJ8hctmXMrhsee2oObX+09WpaPmTPOB'
-    'pzB22a1sOtk5H5X29tj16dOegPRwxRhWEahuihjzGJzYR8VzfvBHBeoKCQgs6Fr+GO1AB+ge'
-    'ewWEm9YgOtPDcNUYYlPVH1/6ssscVHX2nS5df10C/25DR/GMSs75etnemz7tCUhFFwSqilgj'
-    'zFTwY7seh5nBHxWogRLLD7EoSUAiHofVSCoy5z1pT3Zetz4sBLQmieWHWES/iLikv/RvjvbG'
-    'OfnSSbvx+RMnSAkcviZ9ZiHx7EED46z2B8nGQXLSVsr23vQR9IwUApKbBglGs0DqRmVvbP+l'
-    '6+OHxDOJNmZJrIDwlw/LqrJcdGINTGNPJs92WLc+HnTiwU7Q1Bq1N5kEiEp7qyKZm9ACXggB'
-    'NQJ7Bg4u3P4X0BACagT2DBxcuP0voCEE1AjsGTi4cPtfQEMIqBHYM3Bw4fa/gIYQUCOwZ+Dg'
-    'wu1/AQ0hoEZgz8DBhdv/AhpCQI3AnoGDC7f/BTSEgBqBPQMHF27/C2gIATUCewYOLtz+F9AQ'
-    'AmoE9gwcXLj9L6AhBNQI7Bk4uHD7X0BDCKgR2DNwcOH2v4CGEFAjsGfg4MLtfwENIaBGYM/A'
-    'wYXb/wIaQkCNwJ6Bgwu3/wU0sn6S9bl3tkVASv02UynsfL9DiujjB3sgdSItbZ5IQH0mHhc6'
-    'scZsYjfO/N708aATD3aCltZIISBxFQlGs8Smce20700fPySeSbQxi/yvGItHcupWyvne9BH0'
-    'jGgCktuFB+2NQybtj7dvkxI4fE36zELi2YMGxpEKaMGw09WV2J5vC+Z8b/oI+ocQ0FJBZnvI'
-    'wEo535s+gkVACGiRMFLUX2jYsPtn5nxv+giWAiEggUDABiGg5cEuN9LmKVV09KaPYEEQAlo2'
-    'krO9yPDiExbXR9A5hIAEAgEbVktAW8eOo2wcPJQ/25FnD+Ns+VNlQl+YFKkX9EkSVj296dMJ'
-    'VMDAAct5W540ByUJ6MKZsz998hmIkfPYHjLDay+8CJ0z1YBJ4HQXz5xF+e6D81fe2AbHwL/f'
-    'vn+eHALt8K1nti/e3MbZ4HhB3hW0BwQMhJMKGDiAj9unX529EWYG/1IDNfbP5zfffssl13d/'
-    'xj5Xb+3Y7Z6BCT39M4ACL3/0IXyEfz/95uvfHj2CdjiAr17//LIxBFqgHb51TQiz4SiYDee3'
-    'J1Hislupn5W4dOljJadfOV1E9Dl70ycnGNoLhgf8i+EHcu6rL3+5dw8a4aBq8McGaqDE8kMs'
-    'yhMQWGF6+sqbERBSjE0l4A+kpMkiRxBUWEWMPdb4OO1FWKZfk0UIqFsBinHFBnxVm4AqBWoB'
-    'jvGiPAHhlQPruywL3IT3BOymqApLlWnPaijKlKq20vvbAsNBPBrCcLsDtOjahrhECEgIKDC6'
-    'DIEgV8Gvx3N+8FcK1EReCUZ5AtrcrymUsXQCwvUOmBLvCegMjw/AAUgQdn9DQijfXoX511+u'
-    's9hlVDMZjYBi9XFJQjxHSWDFgYGNwQyCAQ9BmBn89QI1lh9iUYWAjCJIJyD7LqEXIHYVavT3'
-    'uBkLYH+ha3vFv/6yxV5gBjqsVCL1lvC96cNFQCHh5wpIjOec4E8I1ECJ5YdYVHkM//DJ42s/'
-    '3Dp6+LDxDHLj4CFovHlnV2+Ej9BIPiPA/jCVPvONO7unUrf3Yfjd+/f1pwNwDC3QHjIcLudP'
-    'f3wR+v/6z/tpCgjGAUSveheEfB0EGiG8PcOTg39JgRrLWB6y1ClcL4JUO3mX0BuNmwB+BZOo'
-    'uhQEK9XkW5C+Cotaf2E9DOIvl1x2K3UnL1505JcbvenTSQWELQr4FT4PwRhWICugqOBPCNRO'
-    'KqBaBLSpFYFlCUjfotMlkE30VVj4+gudOgXUtC67CQGtm4Aw/Mg9Fz3CcR8HusFHDLwphoBc'
-    'wZ8QqOsnILWFlklA4evq6emnby5RS+vw51+oWIgmLrtVIqDMnDemWoc+LATkCT8VxiRJTV4C'
-    'it1UCg/U8IuqiooEtLm/3tHrxsnaRdNH2TPY/T2CFQ1pfb1RvS40ha2/opzqslvBXCqV8wWz'
-    'vTd9WAjIFX6KSkhOmdyb0FHBHxuogRLLD7GoS0Cbe1WGPtDYnDceS9lrItupMNb1cFGtfvX6'
-    'E9+k0B2JJ0XFZtdfsU512U0IaPUEpJY/rhrfroDUm9P5wV+DfTzxXArVCQgLjUnbnNbfd5j2'
-    'iEAZHT2EfzmBqyT4CpfNuJTDY89tQc2v95+sSkfNmewAl6dd/cumk53zUWlvj12fPu0JSA9X'
-    'jGEVgeqmiDGPwYl9VDxnBn9soK6QgMCCruWP0Q50gO6xV0C4aY1/2KLPoBpDDKr640tfdpmD'
-    'qoZs1Kl3xgxxlU4uuxXPqOScr5ftvenTnoBUdEGgqog1wkwFP7brcZgT/LGBukICEvE4rEZS'
-    'kTnvSXuy87r1YSGgNUksP8Qi+kXEwB/WGBPtjXPypZN24/MnTpASOHxN+sxC4tmDBsZZ7Q+S'
-    'jYPkpK2U7b3pI+gZKQQkNw0SjGaB1I3K3tj+S9fHD4lnEm3MklgB4S8fllVluejEGpjGnkye'
-    '7bBufTzoxIOdoKk1am8yCRCV9lZFMjehBbwQAmoE9gwcXLj9L6AhBNQI7Bk4uHD7X0BDCKgR'
-    '2DNwcOH2v4CGEFAjsGfg4MLtfwENIaBGYM/AwYXb/wIaQkCNwJ6Bgwu3/wU0hIAagT0DBxdu'
-    '/wtoCAE1AnsGDi7c/hfQEAJqBPYMHFy4/S+gIQTUCOwZOLhw+19AQwioEdgzcHDh9r+AhhBQ'
-    'I7Bn4ODC7X8BDSGgRmDPwMGF2/8CGkJAjcCegYMLt/8FNISAGoE9AwcXbv8LaGT9JOtz72yL'
-    'gJT6baZS2Pl+hxTRxw/2QOpEWto8kYD6TDwudGKN2cRunPm96eNBJx7sBC2tkUJA4ioSjGaJ'
-    'TePaad+bPn5IPJNoYxb5XzEWj+TUrZTzvekj6BnRBCS3Cw/aG4dM2h9v3yYlcPia9JmFxLMH'
-    'DYwjFdCCYaerK7E93xbM+d70EfQPIaClgsz2kIGVcr43fQSLgBDQImGkqL/QsGH3z8z53vQR'
-    'LAVCQAKBgA1CQMuDXW6kzVOq6OhNH8GCIAS0bCRne5HhxScsro+gcwgBCQQCNqyWgLaOHUfZ'
-    'OHgof7Yjzx4uOFsO9IVJkXpBnyRh1dObPp1ABQwcsJyXPVADUZKALpw5+9Mnn4EYF4/tITO8'
-    '9sKL0DlTDZgETnfxzFmU7z44f+WNbXAM/Pvt++fJIdAO33pm++LNbTXb9ulXMzUUrBgQMBBO'
-    'KmDgAD5CzMwyQmbwLzVQY/98fvPtt1xyffdn7HP11o7d7hmY0NM/Ayjw8kcfwkf499Nvvv7t'
-    '0SNohwP46vXPLxtDoAXa4VvXhDAbjoLZcH5XZxCX3Ur9rMSlSx8rOf3K6SKiz9mbPjnB0F4w'
-    'POBfDD+Qc199+cu9e9AIB1WDPzZQAyWWH2JRnoDACtPTed6MgJBibKODP5CSJoscQVBhFTH2'
-    'WNsloGemX5NFCKhbAYpxxQZ8VZuAKgVqEZbxoDwBYZ4D67ssC9yE9wTspqgKS5Vpz2ooyrKq'
-    'ttL72wLDQTwawnC7A7To2oa4RAhICCgwugyBIFfBr8dzfvBXCtREXglGeQLa3K8plLF0AsL1'
-    'DpgS7wnoDI8PwAFIEHZ/Q5D4/Ba3V2H+9ZfrGqPioKyMRkCx+rgkIZ6jJCT8MH5AMJhBMOAh'
-    'nDKDv16gxvJDLKoQkFEE6QRk3yX0AsSuQo3+HjdjAewvdO1VmH/9pQQcCSfFCst/CpfdSiVS'
-    'bwnfmz5cBBQSfq6AxHjOCf6EQA2UWH6IRZXH8A+fPL72w62jhw8bzyA3Dh6Cxpt3dvVG+AiN'
-    '5DMC7A9T6TPfuLN76tjxZMXu3r+/pQ2HY2iB9qDhj3/vdrTtg1XBQgHRq94FIZ+LQyOEt2d4'
-    'cvAvKVBjGctDljqF60WQaifvEnqjcRPAr2ASVZciu5NqBN6C9FVY7PpLDbF3smfvGKXu5MWL'
-    'jvxyozd9OqmAsEUBv8LnIRjDCmQFFBX8CYHaSQVUi4A2tZ2gsgSkb9HZFp9lE30VFrj+8l+m'
-    'EFBv+rAQkCfh9QjHfRzoBh8x8KYYAnIFf0KgBkosP8SiIgGpLbRMAgpfyk5PP31ziVpaxz7/'
-    'CvGry26VCCgz542p1qEPCwF5wk+FMUlSk5eAcvZxRiegzf31jl43TtYumj7KnsHu7xGsaEif'
-    '6Y3qdaEp6U0t/9NWl90K5lKpnC+Y7b3pw0JArvBTVEJyyuTehI4K/thADZRYfohFXQLa3Ksy'
-    '9IHGE3rjsZS9JrKdCmNdK1usuUD0p4/4JoXuSDwpKja7/jJevsAYYnwTus+E700fFgLC8Jvc'
-    'Nb5dAak3p/ODPzZQAyWWH2JRnYCw0FDtyklICtMeESijo4fwLyeQvOErXDbjUg6PPbcFNb/e'
-    'f7I8oeYMdEDg2ZsRkJ3zUWlvj12fPu0JSA9XjGEVM+qmiDGP4YR9VERlBn9soK6QgMCCruWP'
-    '0Q50gO6xGRo3rfEPW/QZVGPIqlj1x5e+7DIHVQ15TQvGGrOlOax4RiXnfL1s702f9gSkogsC'
-    'VUWsEWYq+LFdj8Oc4I8N1ECJ5YdYlCQgEY/DaiQVmfOetCc7r1sfFgJak8TyQyyiX0QM/GGN'
-    'MdHeOCdfOmk3Pn/iBCmBw9ekzywknj1oYJzV/iDZOEhO2krZ3ps+gp6RQkBy0yDBaBZI3ajs'
-    'je2/dH38kHgm0cYsiRUQ/vJhWVWWi06sgWnsyeTZDuvWx4NOPNgJmlqj9iaTAFFpb1UkcxNa'
-    'wAshoEZgz8DBhdv/AhpCQI3AnoGDC7f/BTSEgBqBPQMHF27/C2gIATUCewYOLtz+F9AQAmoE'
-    '9gwcXLj9L6AhBNQI7Bk4uHD7X0BDCKgR2DNwcOH2v4CGEFAjsGfg4MLtfwENIaBGYM/AwYXb'
-    '/wIaQkCNwJ6Bgwu3/wU0hIAagT0DBxdu/wtoCAE1AnsGDi7c/hfQEAJqBPYMHFy4/S+gIQTU'
-    'COwZOLhw+19AQwioEdgzcHDh9r+ARtZPsj73zrYISKnfZiqFne93SBF9/GAPpE6kpc0TCajP'
-    'xONCJ9aYTezGmd+bPh504sFO0NIaKQQkriLBaJbYNK6d9r3p44fEM4k2ZpH/FWPxSE7dSjnf'
-    'mz6CnhFNQHK78KC9ccik/fH2bVICh69Jn1lIPHvQwDhSAS0Ydrq6EtvzbcGc700fQf8QAloq'
-    'yGwPGVgp53vTR7AICAEtEkaK+gsNG3b/zJzvTR/BUiAEJBAI2CAEtDzY5UbaPKWKjt70ESwI'
-    'QkDLRnK2FxlefMLi+gg6hxCQQCBgw2oJaOvYcZSNg4e4dSkJfWFSpF7QJ0lY9fSmTyc48uxh'
-    'DD844Nala5QkoAtnzv70yWcgRs5je8gMr73wInTOVAMmgdNdPHMW5bsPzl95YxviAP799v3z'
-    '5BBoh29nZ4brgp6B1yIYExB+ECRfvLmN4QcH8HH79KuzN8IiwY9YUqDG/vn85ttvueT67s/Y'
-    '5+qtHbvdMzChp38GUODljz6Ej/Dvp998/dujR9AOB/DV659fNoZAC7TDt/6ZYSqYZ9YILruV'
-    '+lmJS5c+VnL6ldNFRJ+zN31ygqG9YPjBvxh+IOe++vKXe/egEQ5qB39UoAZKLD/EojwBQfJP'
-    'T+d5MwJCirGpBFyClDRZ5AiCCquIcQmEERJZjob5IgTUrQDFTHvsQ37VjIDKBmoRlvGgPAFh'
-    'noMVXJYFbsJ7AnZTVIWlyrTnQhRshwlVbaX3twWGg8z6xh6la+u6NOimNMn3a7IIAXUrZHQZ'
-    'AkGugl+P5/zgrxSoibwSjPIEtLlfUyhj6bbA9Q6YEu8J6AyPD7CeJPsbgsRH3n909xvDQ9Zf'
-    'yqmb5W5TyTIaAcXq45KEeI6SkPDD+AHBYAbBgIcgzAz+eoEayw+xqEJARhGk28K+S+gFiG01'
-    'o7/HzVgA+wtdexU2u/4ypp31q8tupRKpt4TvTR8uAgoJP1dAYjznBH9CoAZKLD/Eospj+IdP'
-    'Hl/74dbRw4eNZ5AbBw9B4807u3ojfIRG8hkB9oep9Jlv3Nk9dex4smJ379/f0obDMbRAO9kf'
-    'vr145uy7f/urobNAMAuIXvUuCPk6CDRCeHuGhwf/ggM1lrE8ZKmTrl4EqXbyLqE3GrSNX8Ek'
-    'qi7FIpNUI/AWpK/CZtdfeDr77PhMLeqOUepOXrzoyC83etOnkwoIWxTwK3weop5SIcgKKCr4'
-    'EwK1kwqoFgFtajtBZQlI36LTJfxp+rS/Cptdf8FsxnmFgPrXh4WAMPzsZ6xGhOM+DnSDjxh4'
-    'UwwBuYI/IVDXT0BqCy2TgMLX1dPTT99copbWIc+//NcY7rBKBJSZ88ZU69CHhYA84afCmCSp'
-    'yUtAsZtK4YEaflFVUZGANvfXO3rdOFm7aPooewa7v0ewoiF9pjeq14WmgIop1q8uuxXMpVI5'
-    'XzDbe9OHhYBc4aeohOSUyb0JHRX8sYEaKLH8EIu6BLS5V2XoA40n9MZjKXtNZDsVxpKF7uZ+'
-    'zQWiP6rEdyJ0R+JJUbHZ9w9j/eqymxDQ6glIvYLsqvHtCki9OZ0f/LGBGiix/BCL6gSEhYZq'
-    'V05CUpj2iEAZHT2E22m4SoKvcNmMSzk89twW1Px6/8mqdNScsf7ohIDsnI9Ke3vs+vRpT0B6'
-    'uKotYfURb4oYPxic6n1ljOf84B+dgMCCruWP0a72zOwVEG5ag+hMD8NVY8iqWPXHl77sMgdV'
-    'nX2vNPwaZx1WPKOSc75etvemT3sCUkECgaoi1ggzFfzYrsdhkeAPDNRAieWHWJQkIBGPw2ok'
-    'FZnznrQnO69bHxYCWpPE8kMsol9EXMbf+DOhvXFOvnTSbnz+xAlSAoevSZ9ZSDx70MA4q/1B'
-    'snGQnLSVsr03fQQ9I4WA5KZBgtEskLpR2Rvbf+n6+CHxTKKNWRIrIPzlw7KqLBedWAPT2JPJ'
-    'sx3WrY8HnXiwEzS1Ru1NJgGi0t6qSOYmtIAXQkCNwJ6Bgwu3/wU0hIAagT0DBxdu/wtoCAE1'
-    'AnsGDi7c/hfQEAJqBPYMHFy4/S+gIQTUCOwZOLhw+19AQwioEdgzcHDh9r+AhhBQI7Bn4ODC'
-    '7X8BDSGgRmDPwMGF2/8CGkJAjcCegYMLt/8FNISAGoE9AwcXbv8LaAgBNQJ7Bg4u3P4X0BAC'
-    'agT2DBxcuP0voCEE1AjsGTi4cPtfQEMIqBHYM3Bw4fa/gIYQUCOwZ+Dgwu1/AY3/B+p1kMdj'
-    'w0ysAAAAAElFTkSuQmCC')
-
-layout_4T = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhcG+7JFsQAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAg8klEQVR4nO2dv68dRZbHrdXk'
-    'dvQIbU1sr508glmJsTEZqwepCSxbGy88QWKQZoANbDyzYFubLr9GsleaBDSQPczzjISlZQOM'
-    'TbKRGYkAkxj+gt7DPXZtUX2quqpudZ3qW9+Pjqx7u7uqz61zzrer+9Z9PjAAAIASB7QdAAD0'
-    'CwQIAKAGBAgAoAYECACgBgQIAKAGBAhMc/f+/Qsfvm9s1nPt3flq++WXjM16LqAOBOhnqMDs'
-    'pLdrzN4+aVQ8eh9iRlJFwVYrGttZzwUWzT8cAAcOvPqnD7Rd2Chufn3H2IOfftR2BzSMtgLq'
-    'Q1dpZyKDGZBD6qxknTH5/uFDamIs12WwDHoXIKe0xgJkFwPZ+WtXnOqyjYpH76PMSE0BAl3R'
-    'tQCRXpg6sZUl8JzVmS6Jx1y/tW+egNDrSE/e+fgj7vPZN1+n11S34nNf3/Ng33bu2XGbTkFb'
-    'fNJgO0NGr+23YQHiz24fTANrPw8S/eRWPFbhB968146Ub6Dyjh9/BA6Hc2mZ/BQgkq4FiHLL'
-    'XKWdNPU1iRGgyK4M4izMMd/BqdsDc70MZybHZ3yL6vRPhW2iwM4EZlupvqUeT844M1zHeV/P'
-    '408BIulXgEypcMZoCZCdu/UFaHs1wcl2ZnJ8JgXIPl1YgJxvKid9Sz1+sC5I248nbs5omHnQ'
-    '5KcAkXQqQCaBKHV4i5YAOXc3ZgLvu+vJECCqJerWFA9Vpl0wZgQynBlDnTue8O2keUYWEMSw'
-    'ADlzE+MbvShyvP0Z7ajZ/RixnvwUIJIeBci+zpuy1BIgp1bN9jVnOuGT+g5OdSbmQzlPmpyu'
-    'bGWM981+zlLqeFuUbZfs40mMIj8FiKRHATLXNDsvCwpQPM5tgi/v1xcg6pkfkYrPOLKd8REv'
-    'QOO24gHjZy5ljx+vRDXmjFjegAAf3QmQnTp2njl3Jb6vSMoKUPwD1+ztY599ApThjI+5BWju'
-    '49cZK5BE1yuh7QW7P1gLduk1b1T0rRSv/ukD54McPXyETMkdAH6JtgLWJv5aJ17ZljUDshc6'
-    'bfufoWY742PuGVDxW7DUD4gZUCm6EyBnCdkct2DxCxEdgQisNPFtNz/1TKqrGLWKccZHcQFy'
-    '+rRD4/tWa53jfVELjzbIoDsB8qH1LZgjfJzizvrdgHacv3aFtlDBOCtWxIPNRMBXhKnO+LAP'
-    'tr9NG7s0bhv5NTyv0xk/Uy9yvPnsBnrLPUR+ChAJBOgRjawD8pndJP54Z1LDM7tAEWY4IyIW'
-    'P519vBBx3FZrIeL4ePMjkvEqZwhQKSBAj1D8KYa4+Fic0TCiTPiOF78CC3Se6oyIM8Myto4A'
-    'jXeZEZ71eKftpJMgCQjQIxQFaPwTJF49HDiR82vJcGE7Poc7HztDapJRb6JKrilAg7WgiZ+v'
-    'jZdWr3+8bxp4wfrjahCgUkCAWoF/xGAe2U6muHN8UufFj/exN//fKrHl1axUXv94MwJkqX/U'
-    'EcTzK+1lAOARx44cOTbb8bN2HuCZ4ydKdPOIJ1/ZPfPUSeqT3KO3D350l2s5p0s93qbUCIAw'
-    'ECCwJP7rb7fIxF1bBw+98NuTax4PKtP1SmiwMZCavPvi7nzHg5mAAIHFQPdTp4+fIO2wN9KW'
-    '3Z3nP/39G08cOrTm8UAB7YdQAIB+gQABANSAAFXiy//5b5iiaccfyECAKqFegZ2bdvyBDASo'
-    'EuoV2Llpxx/IQIAqoV6BnZt2/IEMBKgS6hXYuWnHH8hAgCqhXoGdm3b8gQwEqBLqFdi5accf'
-    'yECAKqFegZ2bdvyBDASoEuoV2Llpxx/IQIAqoV6BnZt2/IEMBKgS6hXYuWnHH8jg1/AbxYMH'
-    'D65cufrqhdfIPvvsJm2hf2mjcwzvCvdz4/oN7oc6vHf3ntlFbe3m/HZs4i67f/Ywpq3xnz1n'
-    'Y5cCfoJloK2AvVDhIn/x0kUK6JkXztCL3d2Xjh47evox9mHjLeN+tra2qDm9IKODqVt6Qbs+'
-    '+fQvnDb0wu6N2Fphn5EOs32wT0ru2dvDbek1b3z33f/kt7SLehD9/POf/4wZ0IKAAFVibvVh'
-    'aaCydKSEVcneaNTEZ1TVTj/UORU/CweLhXOAqGuBE7FqRLalU9NbdsDeJfp5+/ZtCNCCgABV'
-    'Ym4BolJ0hEYs5rEexffDwkEzLDJ6kS1ArJVJbe23/DrsJwRoKeAZ0IZw7943fA8yhrbffPz8'
-    'hV74Dpvs58GDB9/c++bYCnrhPFoSuXHj0QMashvXb0T64MBPhY4dOxrpJ1gS2grYC3PPgAJP'
-    'duxZz4Gp+y+7H37mwtBre9JxYHS7J85i+IEUm7mHcu6/fG3NMyC61TJtzUfw+YlbsGWBGdDm'
-    '88wzP88UzBdM/DbAgx8eTW22ntg6/cxpsps3bz744YfPbt4kUeB+fn5xc+KrtAM/T1uO0enY'
-    'jv3jz//PDU+jJn3gtnTqe/funX7cNsbP7777brJn0A74b3k2BCq/1159jcr7iSeeEPY+vgub'
-    'vG2x+2Fo42uvHvjpp59IOEh3zN0c34WJpwsQf//F4rU6+2vm9aSfYFlgBrQhUH3SrcrVK9fM'
-    'Fl4TxK95dkCcnpp6mH6cRzw0E6F/33vv3UtvXSSjFwdWapLq52cRPjj+0L0eaY2zxsfnJ1gY'
-    '2veAvTD3M6AvV98u0QyFF9QcXT2ytR/TcLjj+zmwmi6ZRTq//vWvx+uJ7O/Cws9xmPH3X4G2'
-    'zvf05MMf//0P9jog0U88A1oWEKBKVBAg80SWH/qOt9uPcmNkiPvhNYfmhXNAoH/z+NkYrz8U'
-    'fR63tU/H5/rjH/8wfqTt+Okz7fgDGQhQJaoJUMs2/v6rmmnHH8hAgCqhXvwtmJb6QICaBQJU'
-    'CfXi79y04w9kIECVUK/Azk07/kAGAlQJ9Qrs3LTjD2QgQJVQr8DOTTv+QAYCVAn1CuzctOMP'
-    'ZCBAlVCvwM5NO/5ABgJUCfUK7Ny04w9kIECVUK/Azk07/kBmrR+jPvnKLoxsrR/jzcD+5/ui'
-    'wZ8w6onUiNUc80wBarPwtGhkNCYLu3Llt+ZPgEYi2Ag1RyNHgBAqEcVhSS3jucu+NX/CIJ9F'
-    '6gwL/h7Q4sku3ZlqvjV/QMskCxAuFwHqD45YtF/cvi1aZPNN8mcS5HOACoODGdCCGZerr7AD'
-    'ewvWfGv+gPaBAC0VsdpjGs5U8635AxYBBGiROCUanmiMGR+/Zs235g9YChAgAIAaEKDlMZ5u'
-    '5PVTatLRmj9gQUCAlk12tRdpXrzD4v6AxoEAAQDUgAAtDPvGpMh8we4k466nNX8a4ejhI6eP'
-    'nyCjF9q+NM0sAvTl21cDdvHsObEVbae9c/iTx5mnTjblD1gElDaf/O6N917cvXT2HBm9oLe7'
-    'O89vHTw02dBXGqkOLClvU38+v/3yS5N24cP3jd29f59a2VvOX7sitnrn44/27nwV038FIye/'
-    'f/gw8vPa5hu3Un9W4vLlt4ztPLdTxOw+W/NHPROSjBKYYk3/Pvvm66YWTAnEtNXK29R8LsUs'
-    'AlR8WCvbOp93boMANWskMcNKfcRdFQRojrxdR1xiUBMgM98hzaYX9NaZAdE1hC8dwyqo12/t'
-    'J+3l8xJ0mJlzjU/qyyRz4Sqbo+sbBKhZo4Sh2Uf4GEo5k7d2ctJ2nrlQWrKFM7la3uaISgpq'
-    'AmQmq9wtD7o5ksadXlNIeEzNYZF7aReFwY4HR2580gzPda03AUr1x2el8tlnnJOTzxA4z83j'
-    'CBYdSk5RgAKZXC1vU/UhFWUBskXdPpIvJuZGOmOvmBnjkxYPpG/cShVSawXfmj9aAsT3X5P3'
-    'WY6Nk9PeG8jk4nmbms+lUP4a/l/+4+o3f//W2bh18NCxI0dufn3nh59+HDeJ2Xvjr7fMFjrs'
-    's6/vPHP8RPikAJSFUpG/iWcbfwtGGylXA80nM3kTSFWsVAUNz4DELeLFJGkvXTrMVJbMfC+Q'
-    'dHFocwZUfNKx/nSjNX8amQHxFgPvolnM9Vv7nJAGcQYUzuTieZuaz6XoYiHivb9/S5cObS/A'
-    'JvPgx5/n48esZYc0Sec/rvzqnz4wGy+dPffCb0/SLtr4z//2Rupf/Nq8TP6VtgOzcONvt25u'
-    'Vpx8/NNvfrPO+mNqXtCZA+35Uw2+qT8WXPd89PARvqu6+pePI7vd/ExOnTKlTuEybsF44uc8'
-    'bFtnb97stNlbMOeuJ/vGx+lkk/ypfwtGRvdWg/Qc2tydiU8PBv9D6EAmF8/b1HwuRaO3YPyw'
-    '7fTqedvWwUO7O8/bz97Ce+kKY/YydOWhYyq6D3qEEo9uxOgm67TnOfH4Ns3+7cUPq732s+ou'
-    'MjlVsUrpcXgGZK8zHFaP4uzlVZF7+QEev/ZdZCJVP/7rVd+4lb2ejycdSfOOcdvN86f+DMjO'
-    've8fPuTHxuatvRKNM5OPMclJB5iG/O17IJOL563WDGh2AaJhFUdhvN23xY5c/F5eoMiLpE23'
-    'Pmccs3+5xmavOWpEgLJrfr5qb82f+gJk0oyX5nP6OYvOeDk+GW+3fx3JC/S5VTiTi+dtaj6X'
-    'YnYByrPxwPGVIWavrvnGbY6iEms+UPbiwZvtj4oAbZKl6kMqyQI0VIkZr1JnyTeL0O1fGAf2'
-    'thmtmerKV/OR1oM/YQGqk88LtQxxSKVRAeK5qDmjma/G7G0zYPOVVnbN9+MPBKh4PpciR4AG'
-    'xCw9WrNWV2rZV3CmNX+Qz2XzuRSZX8Pz3zYs+33ccmlkNE49fYot+4DN9idAIxFshKqjUUfn'
-    'QJ1JByxvBgS0gABVQr0COzft+AMZCFAl1Cuwc9OOP5CBAFVCvQI7N+34AxkIUCXUK7Bz044/'
-    'kIEAVUK9Ajs37fgDGQhQJdQrsHPTjj+QgQBVQr0COzft+AMZCFAl1Cuwc9OOP5CBAFVCvQI7'
-    'N+34AxkIUCXUK7Bz044/kIEAVUK9Ajs37fgDGQhQJdQrsHPTjj+QgQBVQr0COzft+AMZCFAl'
-    '1Cuwc9OOP5CBAFVCvQI7N+34A5m1/l8w/p9nYaX+NlMp9j/fFw3+hFFPpEas5phnClCbhadF'
-    'I6MxWdiVK781fwI0EsFGqDkaOQKEUIkoDktqGc9d9q35Ewb5LFJnWBr9r5lBPNmlO1PNt+YP'
-    'aJlkAcLlIkD9wRGL9ovbt0WLbL5J/kyCfA5QYXAwA1ow43L1FXZgb8Gab80f0D4QoKUiVntM'
-    'w5lqvjV/wCKAAC0Sp0TDE40x4+PXrPnW/AFLAQIEAFADArQ8xtONvH5KTTpa8wcsCAjQssmu'
-    '9iLNi3dY3B/QOBAgAIAaECCZo4ePnD5+gkzbERf7xqTIfMHuJOOupzV/GsHkD71QOW/Nk67D'
-    'LAL05dtXA3bx7DmxFW2nvXP4k8SZp06SG++9uHvp7LlLK5cWFE6gDuXPJ797w+QPvaC3uzvP'
-    'bx08NNnQVxqR511k3qb+fH775Zcm7cKH7xu7e/8+tbK3nL92RWz1zscf7d35Kqb/WY18uH5r'
-    'n5189s3X6S357/N5bL5xK/VnJS5ffsvYznM7RczuszV/1PMhNXko1vQvZY6pBVMCMW218jY1'
-    'n0sxiwAVHNb6ZlLHvB1WKaXuGBsEqFkjifGlCl96w83XrJSZ8rak2EioCZCZ75BI0wt668yA'
-    'aAT50jGsxpHUPWkvn5egw8x1YHzSyBhAgCBAk0aZ9v3Dh+FjKOVM3trJSdupLWca23Ywk2Os'
-    'SN7myUo8agJkJqvcLQ+6OZL1m0LClw5zWORe2kXRsu8BOXLjk076z+cigdNKa8d6E6BUf3xW'
-    'Kp/DeTKZUZzn5nEEiw4lpyhAgUyulrep+pCKsgDZom4fyRcTe1aZulfMjPFJJ41COOAZ0HL8'
-    '0RIgvv+avM8SZcJOTntvIJOL521qPpdCWYDELaJ4J+117q3M3tTbbIrfsBKs9QMGAepNgCgV'
-    '7e9enGc0248fDA0eAQpncvG8Tc3nUrQoQOLFJGkvDb2ZypLx5DY+fiYDqKEz1coOWKlCKl7z'
-    '61d7a/40IkC8xcC7KJfo2skJaRAFKJzJxfM2NZ9L0YUAmZvqeAHiKA7pk1jfuEGANluAeNIh'
-    'PnOxM5af49BhZk40pAiQ/Xy6bN6m5nMpNlOAfLfi8QLER6be0gcCNpMArVnzTleb4Y+KAHHo'
-    'xbsek5OiSA1BAUrNwOy8Tc3nUrQoQNvSN4jr7J10pmAUfeNWsJZK1XzBam/NHxUB4ue+47Qx'
-    'UiJqyuB/CB3I5OJ5m5rPpWhUgOyh5Ntm++zhveM8oCsPX3ZiBGjNKPrGDQK08QJkbn+c5AnM'
-    'gMy6EJO39oObQCYXz9vUfC5FowJkrzMcVjNbfpu0l++f+XX8MyDfB48Mra952XIa13xS2Y/b'
-    'bp4/9QXIzj1SIn5eY97aK9E4M/kYk5wsT7yRv30PZHLxvN1YAaJhFYdgvN23xY5c/F5eoLi3'
-    'WiRtuvU54zQULfI7Bd+4Fa+o7Jqfr9pb86e+AJk046X5e9bvs4zxcnwy3m7/OpIX6HOrcCYX'
-    'z9vUfC7F7AKUZ+NR4ytDzF5d843bHEUl1nyg7MWDN9sfFQHaJEvVh1SSBWioEjNepc6Sbxah'
-    '278wDuxtM1oz1ZWv5iOtB3/CAlQnnxdqGeKQSqMCxHNRc0YzX43Z22bA5iut7Jrvxx8IUPF8'
-    'LkWOAA2IWXq0Zq2u1LKv4Exr/iCfy+ZzKTL/IiL/bcOyfxptuTQyGqeePsWWfcBm+xOgkQg2'
-    'QtXRqKNzoM6kA5Y3AwJaQIAqoV6BnZt2/IEMBKgS6hXYuWnHH8hAgCqhXoGdm3b8gQwEqBLq'
-    'Fdi5accfyECAKqFegZ2bdvyBDASoEuoV2Llpxx/IQIAqoV6BnZt2/IEMBKgS6hXYuWnHH8hA'
-    'gCqhXoGdm3b8gQwEqBLqFdi5accfyECAKqFegZ2bdvyBDASoEuoV2Llpxx/IQIAqoV6BnZt2'
-    '/IEMBKgS6hXYuWnHH8hAgCqhXoGdm3b8gUzmHyRjnnxlF0ZW6m8zlWL/833R4E8Y9URqxGqO'
-    'eaYAtVl4WjQyGpOFXbnyW/MnQCMRbISao5EjQAiViOKwpJbx3GXfmj9hkM8idYZlrVsw0ALZ'
-    'pTtTzbfmD2iZZAHC5SJA/cERi/aL27dFi2y+Sf5MgnwOUGFwMANaMONy9RV2YG/Bmm/NH9A+'
-    'EKClIlZ7TMOZar41f8AigAAtEqdEwxONMePj16z51vwBSwECBABQAwK0PMbTjbx+Sk06WvMH'
-    'LAgI0LLJrvYizYt3WNwf0DgQIACAGhAgmaOHj5w+foJs6+AhbV9+gX1jUmS+YHeScdfTmj8b'
-    'Caeik41nnjp58ey5dbpdv4cCpP56dfvllyYt3MPena/EVrQ9sv9Z7Z2PP3Icvn5rP76571OX'
-    '+lX35ctvGdt5bqeI2X0u3Z/UX8OLSSjm4fcPH9rZK/ZjmjPUhLacv3YlkCGp2Xj3/n3ucP16'
-    'ienBN26lmEWALnz4vjEaL2plb3HiYY+1T5tqGvlAisNOPvvm6xwk8i2yuW/cIEB5/tSPPsfL'
-    'iTjlLW83KUpbKE+G1fWJXtvNTarTLke2fA0DztBhlIecjeQVi9o2BKjgh2zKONhODFpQRjYI'
-    '0KzG6UpXTapzeztt4UupIyXDSm6c5mKftqKNG46N5z7jKx/lJ0/JIUBrfUgz36G5Br2gt84M'
-    'iAaaQz6sok6DnrTXXMrMlFU8acxHGCBAnQkQpcdgCQS/5X8zBGh7pV+03VzbYgSIFNARQdFV'
-    '85bcMxVh5/y2VBGc+U4PXESOV6n6kIqaAPF2Myj0wj6SxmtY3ULzVNa5M5/cS7tolO17QPu2'
-    '2T5pfEZWrgSf9SZAqf74LDKfTRLylMdUJr8ecgXIOXJSgDjDw/lpn4vFUcx5s5eKgnTH7HV6'
-    'MKXhnCVVH1JRFiBbqu0jeQ5s3w2l7hVjOT6pz3iKxFeh8JUqMmClCqm1gm/Nn1ICxHdAlAac'
-    'PzxlGHIFyGk7KUAxU6RAzm+vJlBGQMf1wj2bHvh0ot6l6kMqygIkbuGQO989Je117q3M3vjb'
-    'ZhYgjhy+BVuQP6UEiGuY7+5NbQ9NCpBYEfycm3aJe+0eAurTqQCJo5+0l4SD7+nY+JuIJAGy'
-    'lWhI+SbeN26lCql4za9f7a35U0qAuIb5zqVlARIPNhsDXdmLBlLzuRRdLES89/dvP/v6Tl7b'
-    'b1ZtX/jtyaIegQVw46+36N8nDh26mZs8hqOHj9C/9779NvL4Bz/+SP/WWQTLXqmtSExVrEXM'
-    'gHyXjrxvLpNa+cZtphnQmpMOp6vN8KfUDGh79STIvp0fcmdA5oYofoIzrCbyMWm55gxo27oX'
-    'i8/nUrQoQONIr7k3T0qMjZ/whfNGpGAtlar5gtXemj+lBGgc3AwBGj9kiREg1izxGOcRcnZF'
-    'OA+8BksiJ/O5FI0KkC3JvPLKPnt47zhy569diV+75XxHxrnSzkroNgu+NX8aESBOvGH1IMn5'
-    'EmqYEiBeTUJmZyMv59kbrYTms5gjnQfP44oY92CWtjgalCgPyTQqQPY6w2E1FzWLF+L38qNo'
-    'ewFrjACZPp22TQnQuOaTyn7cdvP8mVuAxH7sx7oG5xuM+IJiDXKycXh8OXTqxfzmg7fbUuL0'
-    'Y87rfFjx6zDfuJVidgEiVRaVfrzdt8X307vwXl6gyF+j2ktaJxf1ULRM273RwtB2BCi75uer'
-    '9tb8yRCgcIbYv2S0f97oJFj4Z49iw4A52WhkZewqL/Tf8yzxt/dyJ+Me2CV7EpSqD6nMLkB5'
-    'Nr4XNb/Bm9yra75xm6OoxJoPlL148Gb7kypAsMh8LkWyAA1VYkYyzCsA7aXl9pcIgb1tRmum'
-    'uvLVfKT14E9YgOrk80ItQxxSaVSAeCGyOePeL/+oSnhvmwGbr7Sya74ffyBAxfO5FDkCNCBm'
-    '6dGatbpSy76CM635g3wum8+lyFwJ/eXbV8nKLolcLo2MxqmnT7FlH7DZ/gRoJIKNUHU06ugc'
-    'qDPpgOXNgIAWEKBKqFdg56YdfyADAaqEegV2btrxBzIQoEqoV2Dnph1/IAMBqoR6BXZu2vEH'
-    'MhCgSqhXYOemHX8gAwGqhHoFdm7a8QcyEKBKqFdg56YdfyADAaqEegV2btrxBzIQoEqoV2Dn'
-    'ph1/IAMBqoR6BXZu2vEHMhCgSqhXYOemHX8gAwGqhHoFdm7a8QcyEKBKqFdg56YdfyADAaqE'
-    'egV2btrxBzIQoEqoV2Dnph1/ILPWf8385Cu7MLJSf5upFPuf74sGf8KoJ1IjVnPMMwWozcLT'
-    'opHRmCzsypXfmj8BGolgI9QcjRwBQqhEFIcltYznLvvW/AmDfBapMyxr3YKBFsgu3ZlqvjV/'
-    'QMskCxAuFwHqD45YtF/cvi1aZPNN8mcS5HOACoODGdCCGZerr7ADewvWfGv+gPaBAC0Vsdpj'
-    'Gs5U8635AxYBBGiROCUanmiMGR+/Zs235g9YChAgAIAaEKDlMZ5u5PVTatLRmj9gQUCAlk12'
-    'tRdpXrzD4v6AxoEAAQDUgAAtDPvGpMh8we4k466nNX82jK2Dh04fP8Gm7csszCJAX759NWAX'
-    'z54TW9F22juHP9lQ+D/53RuteQXmg5NQjDhngsleJ6ud5mzUhLYcPXzE7kdsKLK78/ynv3/j'
-    '0tlzbHTwu/+6y72deeqkr45iWLN5SVJ/Pr/98kuTduHD943dvX+fWtlbzl+7IrZ65+OP9u58'
-    'FdN/HXv2zde/f/gw/lOz+cat1J+VuHz5LWM7z+0UMbvP1vypHHTKQI4XZaOT0rzdpChtuX5r'
-    'n7bQv/Tabm5SnXZxCtmJLTb0eWLcoGzkVtyE9675MdfJ51LMIkB5H7U1I+mk7GnNfwjQrMbh'
-    '5tA7ycCXUkdKhseKYDcX+7QVbdzQMbpIDyMR3F7JEF+/IUDrflQz36EBpRf01pkB0VhzyIdV'
-    '1En+k/aaSxkdZuZc45MG3KYUNP2sn9mlDAI0q3G4uf6NQPBb/jdDgLZX+kXbKZ18DR0LH0B5'
-    'ayZWbLzRVEQ47W/duztu7rNUfUhFTYB4u5EJHghzJIWKXtMw8VTWHBa5l3ZRAOx7QPu6YZ/U'
-    '5zOrT8B/LetNgFL98VlkPptw85SHN9LljV8PuQLkHBk5AzIOOCYKEL8wd398gJj2//vddxCg'
-    '/5/rGp22j+Q5sLliZOw1u1itTJCck07mSqoA+catVCG1VvCt+VNKgKjIh1UBc/7wZHnIFSCn'
-    '7aQAbT+eNFEmi4+KJtMynPa4BRO2my08djTu2Xudeyuzd3Lck1IKAtSgP6UEiIyfAPKD5LGI'
-    'pGbLkChA5qmzIV5BeBI0/FKAYqoSAjT4wpO0l0Jlppd8PzXECRAfPG4bfmBUU4CK1/z61d6a'
-    'P6UEiOufEsCEfqgoQPZZ+B6QHfZ9C8aCZb63ZSBATQiQfZ8c/gj8uA4CtGh/SgkQz6YH6+Hx'
-    'kCtAzrdaSQLknI6nY+MTsULx/Ro7PECAtATIF9qMJ8qt3YI5Bb9mzTtdbYY/pQRoe3VBsi88'
-    'Q64A8WQq/luwyWx0TsQC5zyXGCBAgY8aHpRh9BXVOnuz1SSjiW/cCtZSqZovWO2t+VNKgMbB'
-    'zRAg+3GMr6Fj/PBbzEZxBiR2OECAAh81PCh7j1eUbv/yaVzMXnvBqAknXxwgQBCgcD6XFSBO'
-    'vGF132QLSsw6IPvZk92KNzpTqvEMaO/xV+/ih3KaQ4DcLfY6w2H1TIffJu3lJ0H2AtaNEaBx'
-    'zSeV/bjt5vkztwCJ/ew9XmtjM74zmiwoEhTzOJmfRTrrsFlx+AsTe07EOW9W8PvSftx8YwWI'
-    'Pqqo9OPtvi2+tefhvbxAkb9GtZe0pt54pzbxjVvxisqu+fmqvTV/MgQoHG77l4z2zxudBAv/'
-    '7FFs6DsdL/HnNHZ642XNvIu3mK9Q+EjjgPihxs03U4DybDw5ZLWO2atrvnGbo6jEmg+UvXjw'
-    'ZvuTKkCwyHwuRbIADVVixvfAPHkxP6ewv0QI7G0zWjPVla/mI60Hf8ICVCefF2oZ4pBKowLE'
-    '80NzRjOrjNnbZsDmK63smu/HHwhQ8XwuRY4ADYhZerRmra7Usq/gTGv+IJ/L5nMpMv8i4uQf'
-    'c+uKRkbj1NOn2LIP2Gx/AjQSwUaoOhp1dA7UmXTA8mZAQAsIUCXUK7Bz044/kIEAVUK9Ajs3'
-    '7fgDGQhQJdQrsHPTjj+QgQBVQr0COzft+AMZCFAl1Cuwc9OOP5CBAFVCvQI7N+34AxkIUCXU'
-    'K7Bz044/kIEAVUK9Ajs37fgDGQhQJdQrsHPTjj+QgQBVQr0COzft+AMZCFAl1Cuwc9OOP5CB'
-    'AFVCvQI7N+34AxkIUCXUK7Bz044/kIEAVUK9Ajs37fgDGQhQJdQrsHPTjj+Q+T8EuZ+u/Qkb'
-    'YgAAAABJRU5ErkJggg==')
-
-layout_8P_chain = PyEmbeddedImage(
-    'iVBORw0KGgoAAAANSUhEUgAAAYAAAAEACAIAAAA1FTYwAAAAB3RJTUUH3wURFhYu1xzcCgAA'
-    'ABd0RVh0U29mdHdhcmUAR0xEUE5HIHZlciAzLjRxhaThAAAACHRwTkdHTEQzAAAAAEqAKR8A'
-    'AAAEZ0FNQQAAsY8L/GEFAAAABmJLR0QA/wD/AP+gvaeTAAAjkklEQVR4nO1dz68WRZcmk9nD'
-    '6rqUuOYObF4XmPiBl50JutUFwT9AudENmqi4AfkcBfYDfk4CCzea0Z3gxYUkwyy8cN3Dl7gQ'
-    'NsBf0HO857uVoupUdVV1VZ3qrvPkhLxvdVX16fPj6VPVfV/2DQKBQMCEfdwKCASCfiEEJBAI'
-    '2CAEJBAI2CAEJBAI2CAEJBAI2FCJgH7a/k1JnTP2g/sPHpz95mslvMqAf1fvn1HCq0wIqlmv'
-    '6IlmZ3aFsgQEdnnnyiXdNCjQCP4oeur60MOr5tU1FXxNKROCagoXPdHszK5QkIAgD23q0YX9'
-    'dp0X+qXVLPSaCr6mlAmBEBAvShHQ9dtbukVe/+xTLA0MDtIrBfg86wWaEBDgzydP5rXcXgYB'
-    'zc7sCqUICBiHrHTAUq4iCD0EA4G8oFshxcpBCGiOWAYBzRelCMiTjXodZBOQfih8JwU4S+2/'
-    'wOfwUfoWFXDfV99/5+I+3EQ0iBXPhWc3NrnI/aCQM9q7ldCiRsEHw552ZBv9XWbMoowx+ehW'
-    'q8eMLsQaJOoCSV6Abq5wMpTRZ/NfWqybYGZUw15J2NfrMnus++qjdgUE0GNC967hIWXxEEJx'
-    'kZoL4F1dQ0MMB0Nncitdnc6/24WzhZ/RJuKo/hC1dn8j65KVGZ3cc58fNaPLWbEGmXKB2Ghc'
-    'pj6zfnY4RfilTbSk31wusyfERmWUIiDjUtXCChjX9p8CEjZpcZjQw9ZRBOSPTjtG/Z1DCCjq'
-    'jP7Is+MmpD9YL+3yYyf3ENCoGV3+ijXIlAvERj1KjWAgLzzk0iZaMs3ssSetj4JPwUa94qJe'
-    'aAe2Ioe76u0oAtLJEc6CvAYnJW9uBpOqGh6VXO0tFe1bjdoRxFo6/IzGVHjJ9gsNKm7sIINp'
-    'jc46109RZnRyVyaEmNHlr1iDTLlAdVJ9cqWbQUw4c+ClJVgSjur7oXA6PSlCzB570voo+x4Q'
-    'WfLpYeGH6zUiXMzrPaMISJ9KX98ZG+TIdJ615LAXZPa0BktGndFTRJBZYfRX8WrUZVmUGZ3c'
-    'pXy4GW3EGiSLtY3HuNioxzOcOurSYi0ZZYrA9rSTFkVBAoKL9xdBgbWfUUFMtJpxEzOqMD2g'
-    'cdGnd/aTph3cCWccvPlGZkVUUOZSZspJYzc+owyS6wJH70ZIK+GXFmtJpQY+4iDvxMmTt/NI'
-    'rhQB6VeI9wqynAl5XJ2XgPymNyqpKD+5rivqjP7+5KGoIMulTMaTjiLKIBmtbXQmqS380hK4'
-    'YPRV3uTJl09A+uUZbxvqtxFVx5IIX4KFQwgoizI9EJBxSK+2XOvfhKtwtdvsA7lgpEPy5Asn'
-    'IP/lkesIHQmb0Ll08xOQ/4Gl3lMIyHPS2Oe+XAQ0uB+kuB6ieS4tymLGAtD1wCFt8tGrroka'
-    'BBTy6hci+TF81IuILqYgD+kt5MxKq6hpPYfCFwXYGBtkWZSZclK/GW3EGiSXtQf3UxTXnJ5L'
-    'y3KfEAIKgv33Fvo7GnoZqS/BDKOglHgR0aWAUZqhzsartHqe4JNdMu6NFWLUGQODxvOKrb+9'
-    'hDJRJ/Wb0UasQbJcIMLY9xl1rufSstSMrtWDEJAJe++GfGFP95ZhlLMxf4oRRUBGVOHr7a6X'
-    'SgwyXe39mYXqr05nzIDdYHK4rqgzGnYwTqdmcNlttH2KMsknDTejjViDZLlABTuS7b+ZCLm0'
-    'KUsw8hKmuGP5BBT7tvGwZ5S0P0aN/VMMstpyzRDY2bg7GZcZfkZ/TzsHEoIsWZk6J41ylm2Q'
-    'LBeoYP+uQ6yGabtp5F6EkVMl3FQZZV9EdO0lk9XNlJ/jiCWg4fm/ytMdTK74XK8CGJviZB/V'
-    'IfCMRnDYf9TiT7bR9inKTDxpoBkNxBokywW6Org2BEYvLcFiBgfh6/VCQNFo/MdKlGIhKz5k'
-    'Sf+F6BdLlnL+M9rBoQxY4m+Xoy4/F0LMqDDRIBMv0KCV0do86tJGoWabPlWbkB+lbw7t3J0a'
-    'Aa9BjHKm8tkXj3/bJxAIHLh5b1v/euLwES5NlgohIIHAiRu/3Na/vv23Yzx6LBdCQAIBjUdP'
-    'n/7+z4fq64aUPyXAvQYUCAT9QghIIBCwQQioEu7+3/+KMAq3/wU0hIAqgT0DOxdu/wtoCAFV'
-    'AnsGdi7c/hfQEAKqBPYM7Fy4/S+gIQRUCewZ2Llw+19AQwioEtgzsHPh9r+AhhBQJbBnYOfC'
-    '7X8BDSGgSmDPwM6F2/8CGkJAlcCegZ0Lt/8FNISAKoE9AzsXbv8LaAgBVQJ7BnYu3P4X0JC/'
-    'hl8UHj16dOnS5Q/PfgRy8+YtaIF/odHog4f889y4fgPngQl37u+oQzBWH45fbSEP6fOjhiFj'
-    'lf6oOQqq5NFTMA9wM2AvqHCTP3/hPDj0rbffgg+bm2cOrR/a2IPezW6x51lbW4Ph8AEEOsO0'
-    '8AEO/fDj/2DYwAd9NsDaLvQzQjddB/2koJ7e7h8Ln7Hx6tX/wq9wCGYg9fz222+lApoRhIAq'
-    'oTT7IDVAWhpUgqykNyo2cQlktTEPTA7Jj8SBZGF0IHnNcyJkjcCxcGr4igroh0g979y5IwQ0'
-    'IwgBVUJpAoJUNIiGTGabj8LnQeKACgsEPiQTEHJl1Fj9K3726ykENBfIHtBCsLPzO65BbED7'
-    'rb39F/jg6jY6z6NHj37f+X19F/DB2FoicePGvzZoQG5cvxGogwHcFVpfPxSop2BO4GbAXlC6'
-    'AvLs7OhVz76x9Zc+D+65IOCzXnTss5Z7ZBWDG1Ioag1lrL9cY9UeECy11Fh1CS49ZQk2L0gF'
-    'tHycOPFXpaAeMOFXDx49/ldps/bC2saJDZBbt249evz45q1bQAo4z18fbo08Stv3V9myDqdD'
-    'Wf+P9X17ZdSoDjgWTr2zs7OxNzZEzz/++GN0ZkE7+HduBQR5AOn30YcfQXq/8MILxNG9Vdjo'
-    'skWfBwGNH32479mzZ0AcwDtqNYerMPJ0HoSvv5C8ds/+kfo8qqdgXpAKaCGA/ISlyuVLV1QL'
-    'vhOEn7E6AGyMlR5qHmOLByoR+PfatasXPj8PAh/27bJJrJ43A3Qw9IG1HnCN8Y6PS0/BzMC9'
-    'BuwFpfeA7u4+XYIKBV+oObS7Zatv06C7w+fZt1suqZd0XnrpJft9Iv1ZmH8fB2E///KMNZ7T'
-    'gw5f/Off9feASD1lD2heEAKqhAoEpHZkcdPXbte3ckNoCOfBdw7VB6ODZ361/awE3z8kdbbH'
-    '6qfDc33xxd/tLW1DT5dw+19AQwioEqoRUMtiP/+qJtz+F9AQAqoE9uRvQbjYRwioWQgBVQJ7'
-    '8ncu3P4X0BACqgT2DOxcuP0voCEEVAnsGdi5cPtfQEMIqBLYM7Bz4fa/gIYQUCWwZ2Dnwu1/'
-    'AQ0hoEpgz8DOhdv/AhpCQJXAnoGdC7f/BTSEgCqBPQM7F27/C2hM+mPUlz/YFAGZ9Md4BbD1'
-    '8xYpoo8f7IHUiNS0eSIBtZl4XGjEGqOJXTnzW9PHg0Y82AhqWiOFgMRVJBjNEpvGpdO+NX38'
-    'kHgmUccs8ntAs0dy6hbK+db0EbSMaAKS24UH9Y1DJu2vd+6QEjh8SfqMQuLZgwrGkQpoxrDT'
-    '1ZXYnqMZc741fQTtQwhoriCzPWRgoZxvTR/BLCAENEsYKeovNGzY/SfmfGv6COYCISCBQMAG'
-    'IaD5wS430ubJVXS0po9gRhACmjeSsz3L8OwTZtdH0DiEgAQCARsWS0Abh4+grO0/wK1LTugL'
-    'kyz1gj5JwqqnNX0awaEXD2L4wQduXZpGTgI6f+r03S8vgxg5j+0hM7z16jHoPFENmAROd+HU'
-    'aZQfPzl39d1NiAP494ePz5FDoB2Ohkw7UTfB4gFxAuF07b1NDD/4AF83T745eiPMEvz7Zheo'
-    'sX8+v3r/jEt+2v4N+1y/vWW3ewYm9PTPAAq8/tmn8BX+/er77/588gTa4QMceufKJWMItEA7'
-    'HPVMC31gkhDdXHbL9bMSFy9+ruTkGyeziD5na/pMCYb6guEH/2L4gZz95uv7Dx5AI3woHfxR'
-    'gRoosfwQi/wEBMk/PJ/n1QgIKcamEogGpKTBIkcQVFhFjN8HufyaLEJAzQpQzLDLPuShCgRU'
-    'IlATOCUK+QkI8xxY32VZ4Ca8J2A3RVVYqgy7LkTBdphQ1VZ6f1tgOIhHQxhud4AWXVtX9KDO'
-    'ufyaLEJAzQoZXYZAkKvg1+N5evAXCtQkVolAfgJa7dUUylg6AeF6B2ykG8vjA3AAEoTd3xAk'
-    'PvL+o7vfGB6y/rKvglF6I6BYfVySEM9REhJ+GEUgGMwgGPAQhBODv1ygxvJDLIoQkFEE6Rax'
-    '7xJ6AWLbzujvcTMWwP5C116Fja6/Yv3qsluuRGot4VvTh4uAQsLPFZAYz1OCPyFQAyWWH2JR'
-    '5DH842dPb/xye/3gQeMZ5Nr+A9B469623ghfoZF8RoD9YSp95pv3tk8cPpKs2M7DhxvacPgM'
-    'LdCeNqFA4AJEr3oXhHwdBBohvD3D8wZ/o4hlrEDq1Ysg1U7eJfRGg7zxEEyi6lIQ1yZ/4C1I'
-    'X4WFr7/Cbywuu+W6k2cvOqaXG63p00gFhC0KeAifh2AMK5AVUFTwz7cCKkVAK20nKC8B6Vt0'
-    'ugSyib4KC19/CQHNSB8WAsLws5+xGhGO+zjQDb5i4A0xBOQK/oRADZRYfohFQQJSW2gTCSh8'
-    'XT08//TNJWppPfr8K8GvLrsVIqCJOW9MtQx9WAjIE34qjEmSGrwEFLupFB6o4RdVFAUJaLW3'
-    '3tHrxsHaRdNH2TPY/T2CFQ3pM71RvS40BK+/wv3qslvGXMqV8xmzvTV9WAjIFX6KSkhOGdyb'
-    '0FHBHxuogRLLD7EoS0Cr3SpDH2g8oTceS9lrItupMJYsdFd7NReI/qgS36TQHYknRcUC11/h'
-    'fnXZTQho8QSE4Te4a3y7AlJvTk8P/thADZRYfohFcQLCQkO1KychKQy7RKCMjh7Cv5zAVRIc'
-    'wmUzLuXws+e2oObX+w9WpaPmTPOBpzB22S1vOtk5H5X29tjl6VOfgPRwxRhWEahuihjzGJzY'
-    'R8Xz9OCPCtQFEhBY0LX8MdqBDtA99goIN61BdKaH4aoxxKaqP770ZZc5qOroO126/roE/t2G'
-    'juwZlZzz5bK9NX3qE5CKLghUFbFGmKngx3Y9DicGf1SgBkosP8QiJwGJeBxWIqnInPekPdl5'
-    '2fqwENCSJJYfYhH9IuKc/tK/Ouob5/hrx+3GV44eJSVw+JL0GYXEswcVjLPYHyTrB8lJWyjb'
-    'W9NH0DJSCEhuGiQYzQKpG5W9sf3nro8fEs8k6pglsQLCXz7Mq8p80Yg1MI09mTzaYdn6eNCI'
-    'BxtBVWuU3mQSIArtrYpM3IQW8EIIqBLYM7Bz4fa/gIYQUCWwZ2Dnwu1/AQ0hoEpgz8DOhdv/'
-    'AhpCQJXAnoGdC7f/BTSEgCqBPQM7F27/C2gIAVUCewZ2Ltz+F9AQAqoE9gzsXLj9L6AhBFQJ'
-    '7BnYuXD7X0BDCKgS2DOwc+H2v4CGEFAlsGdg58LtfwENIaBKYM/AzoXb/wIaQkCVwJ6BnQu3'
-    '/wU0hIAqgT0DOxdu/wtoCAFVAnsGdi7c/hfQEAKqBPYM7Fy4/S+gMeknWV/+YFMEJNdvM+XC'
-    '1s9bpIg+frAHUiNS0+aJBNRm4nGhEWuMJnblzG9NHw8a8WAjqGmNFAISV5FgNEtsGpdO+9b0'
-    '8UPimUQds8j/ijF7JKduoZxvTR9By4gmILldeFDfOGTS/nrnDimBw5ekzygknj2oYBypgGYM'
-    'O11die05mjHnW9NH0D6EgOYKMttDBhbK+db0EcwCQkCzhJGi/kLDht1/Ys63po9gLhACEggE'
-    'bBACmh/sciNtnlxFR2v6CGYEIaB5IznbswzPPmF2fQSNQwhIIBCwYbEEtHH4CMra/gPTZzv0'
-    '4kGcbfpUE6EvTLLUC/okCaue1vRpBCpg4APLeWuedApyEtD5U6fvfnkZxMh5bA+Z4a1Xj0Hn'
-    'iWrAJHC6C6dOo/z4ybmr726CY+DfHz4+Rw6Bdjjqme3ae5s4G3yekXcF9QEBA+GkAgY+wNfN'
-    'k2+O3ggnBv9cAzX2z+dX759xyU/bv2Gf67e37HbPwISe/hlAgdc/+xS+wr9fff/dn0+eQDt8'
-    'gEPvXLlkDIEWaIejrglhNhwFs+H89iRKXHbL9bMSFy9+ruTkGyeziD5na/pMCYb6guEB/2L4'
-    'gZz95uv7Dx5AI3woGvyxgRoosfwQi/wEBFYYnr/yagSEFGNTCfgDKWmwyBEEFVYRY481vg67'
-    'ETbRr8kiBNSsAMW4YgMOlSagQoGagWO8yE9AeOXA+i7LAjfhPQG7KarCUmXYtRqKMqWqrfT+'
-    'tsBwEI+GMNzuAC26tiEuEQISAgqMLkMgyFXw6/E8PfgLBWoirwQjPwGt9moKZSydgHC9A6bE'
-    'ewI6w+MDcAAShN3fkBDKt1dh/vWX6yx2GVVNeiOgWH1ckhDPURJYcWBgYzCDYMBDEE4M/nKB'
-    'GssPsShCQEYRpBOQfZfQCxC7CjX6e9yMBbC/0LW94l9/2WIvMAMdliuRWkv41vThIqCQ8HMF'
-    'JMbzlOBPCNRAieWHWBR5DP/42dMbv9xeP3jQeAa5tv8ANN66t603wldoJJ8RYH+YSp/55r3t'
-    'E6nb+zB85+FD/ekAfIYWaA8ZDpfz9t+OQf/f//kwTQFBP4DoVe+CkK+DQCOEt2d4cvDPKVBj'
-    'GctDljqF60WQaifvEnqjcRPAQzCJqktBsFJNvgXpq7Co9RfWwyD+csllt1x38uxFx/RyozV9'
-    'GqmAsEUBD+HzEIxhBbICigr+hEBtpAIqRUArrQjMS0D6Fp0ugWyir8LC11/o1CGgpnXZTQho'
-    '2QSE4UfuuegRjvs40A2+YuANMQTkCv6EQF0+AakttIkEFL6uHp5/+uYStbQOf/6FioVo4rJb'
-    'IQKamPPGVMvQh4WAPOGnwpgkqcFLQLGbSuGBGn5RRVGQgFZ76x29bhysXTR9lD2D3d8jWNGQ'
-    '1tcb1etCQ9j6K8qpLrtlzKVcOZ8x21vTh4WAXOGnqITklMG9CR0V/LGBGiix/BCLsgS02q0y'
-    '9IHG5rzxWMpeE9lOhbGuh4tq9avXn/gmhe5IPCkqNrr+inWqy25CQIsnILX8cdX4dgWk3pye'
-    'Hvwl2McTz7lQnICw0Bi0zWn9fYdhlwiU0dFD+JcTuEqCQ7hsxqUcfvbcFtT8ev/BqnTUnMkO'
-    'cHna1T9vOtk5H5X29tjl6VOfgPRwxRhWEahuihjzGJzYR8XzxOCPDdQFEhBY0LX8MdqBDtA9'
-    '9goIN63xD1v0GVRjiEFVf3zpyy5zUNWQjTr1zpghrtLJZbfsGZWc8+WyvTV96hOQii4IVBWx'
-    'Rpip4Md2PQ6nBH9soC6QgEQ8DiuRVGTOe9Ke7LxsfVgIaEkSyw+xiH4RMfCHNfpEfeMcf+24'
-    '3fjK0aOkBA5fkj6jkHj2oIJxFvuDZP0gOWkLZXtr+ghaRgoByU2DBKNZIHWjsje2/9z18UPi'
-    'mUQdsyRWQPjLh3lVmS8asQamsSeTRzssWx8PGvFgI6hqjdKbTAJEob1VkYmb0AJeCAFVAnsG'
-    'di7c/hfQEAKqBPYM7Fy4/S+gIQRUCewZ2Llw+19AQwioEtgzsHPh9r+AhhBQJbBnYOfC7X8B'
-    'DSGgSmDPwM6F2/8CGkJAlcCegZ0Lt/8FNISAKoE9AzsXbv8LaAgBVQJ7BnYu3P4X0BACqgT2'
-    'DOxcuP0voCEEVAnsGdi5cPtfQEMIqBLYM7Bz4fa/gIYQUCWwZ2Dnwu1/AQ0hoEpgz8DOhdv/'
-    'AhpCQJXAnoGdC7f/BTQm/STryx9sioDk+m2mXNj6eYsU0ccP9kBqRGraPJGA2kw8LjRijdHE'
-    'rpz5renjQSMebAQ1rZFCQOIqEoxmiU3j0mnfmj5+SDyTqGMW+V8xZo/k1C2U863pI2gZ0QQk'
-    'twsP6huHTNpf79whJXD4kvQZhcSzBxWMIxXQjGGnqyuxPUcz5nxr+gjahxDQXEFme8jAQjnf'
-    'mj6CWUAIaJYwUtRfaNiw+0/M+db0EcwFQkACgYANQkDzg11upM2Tq+hoTR/BjCAENG8kZ3uW'
-    '4dknzK6PoHEIAQkEAjYsloA2Dh9BWdt/YPpsh148mHG2KdAXJlnqBX2ShFVPa/o0AhUw8IHl'
-    'vOyBGoicBHT+1Om7X14GMS4e20NmeOvVY9B5ohowCZzuwqnTKD9+cu7qu5vgGPj3h4/PkUOg'
-    'HY56Zrv23qaabfPkmxM1FCwYEDAQTipg4AN8hZgZZYSJwT/XQI398/nV+2dc8tP2b9jn+u0t'
-    'u90zMKGnfwZQ4PXPPoWv8O9X33/355Mn0A4f4NA7Vy4ZQ6AF2uGoa0KYDUfBbDi/qzOIy265'
-    'flbi4sXPlZx842QW0edsTZ8pwVBfMDzgXww/kLPffH3/wQNohA9Fgz82UAMllh9ikZ+AwArD'
-    '83lejYCQYmyjgz+QkgaLHEFQYRUx9ljbJaDnRL8mixBQswIU44oNOFSagAoFahaW8SA/AWGe'
-    'A+u7LAvchPcE7KaoCkuVYddqKMqyqrbS+9sCw0E8GsJwuwO06NqGuEQISAgoMLoMgSBXwa/H'
-    '8/TgLxSoibwSjPwEtNqrKZSxdALC9Q6YEu8J6AyPD8ABSBB2f0OQ+PwWt1dh/vWX6xqj4iCv'
-    '9EZAsfq4JCGeoyQk/DB+QDCYQTDgIZwmBn+5QI3lh1gUISCjCNIJyL5L6AWIXYUa/T1uxgLY'
-    'X+jaqzD/+ksJOBJOihWW/xQuu+VKpNYSvjV9uAgoJPxcAYnxPCX4EwI1UGL5IRZFHsM/fvb0'
-    'xi+31w8eNJ5Bru0/AI237m3rjfAVGslnBNgfptJnvnlv+8ThI8mK7Tx8uKENh8/QAu1Bw5/+'
-    '1W297oNVwUwB0aveBSGfi0MjhLdneHLwzylQYxnLQ5Y6hetFkGon7xJ6o3ETwEMwiapLkd1J'
-    'NQJvQfoqLHb9pYbYO9mjd4xcd/LsRcf0cqM1fRqpgLBFAQ/h8xCMYQWyAooK/oRAbaQCKkVA'
-    'K20nKC8B6Vt0tsVH2URfhQWuv/yXKQTUmj4sBORJeD3CcR8HusFXDLwhhoBcwZ8QqIESyw+x'
-    'KEhAagttIgGFL2WH55++uUQtrWOff4X41WW3QgQ0MeeNqZahDwsBecJPhTFJUoOXgKbs4/RO'
-    'QKu99Y5eNw7WLpo+yp7B7u8RrGhIn+mN6nWhIelNLf/TVpfdMuZSrpzPmO2t6cNCQK7wU1RC'
-    'csrg3oSOCv7YQA2UWH6IRVkCWu1WGfpA4wm98VjKXhPZToWxrpUt1lwg+tNHfJNCdySeFBUb'
-    'XX8ZL19gDDG+Cd1mwremDwsBYfgN7hrfroDUm9PTgz82UAMllh9iUZyAsNBQ7cpJSArDLhEo'
-    'o6OH8C8nkLzhEC6bcSmHnz23BTW/3n+wPKHmDHRA4NmrEZCd81Fpb49dnj71CUgPV4xhFTPq'
-    'pogxj+GEfVRETQz+2EBdIAGBBV3LH6Md6ADdYzM0blrjH7boM6jGkFWx6o8vfdllDqoa8poW'
-    'jDVmS3NY9oxKzvly2d6aPvUJSEUXBKqKWCPMVPBjux6HU4I/NlADJZYfYpGTgEQ8DiuRVGTO'
-    'e9Ke7LxsfVgIaEkSyw+xiH4RMfCHNfpEfeMcf+243fjK0aOkBA5fkj6jkHj2oIJxFvuDZP0g'
-    'OWkLZXtr+ghaRgoByU2DBKNZIHWjsje2/9z18UPimUQdsyRWQPjLh3lVmS8asQamsSeTRzss'
-    'Wx8PGvFgI6hqjdKbTAJEob1VkYmb0AJeCAFVAnsGdi7c/hfQEAKqBPYM7Fy4/S+gIQRUCewZ'
-    '2Llw+19AQwioEtgzsHPh9r+AhhBQJbBnYOfC7X8BDSGgSmDPwM6F2/8CGkJAlcCegZ0Lt/8F'
-    'NISAKoE9AzsXbv8LaAgBVQJ7BnYu3P4X0BACqgT2DOxcuP0voCEEVAnsGdi5cPtfQEMIqBLY'
-    'M7Bz4fa/gIYQUCWwZ2Dnwu1/AQ0hoEpgz8DOhdv/AhpCQJXAnoGdC7f/BTQm/STryx9sioDk'
-    '+m2mXNj6eYsU0ccP9kBqRGraPJGA2kw8LjRijdHErpz5renjQSMebAQ1rZFCQOIqEoxmiU3j'
-    '0mnfmj5+SDyTqGMW+V8xZo/k1C2U863pI2gZ0QQktwsP6huHTNpf79whJXD4kvQZhcSzBxWM'
-    'IxXQjGGnqyuxPUcz5nxr+gjahxDQXEFme8jAQjnfmj6CWUAIaJYwUtRfaNiw+0/M+db0EcwF'
-    'QkACgYANQkDzg11upM2Tq+hoTR/BjCAENG8kZ3uW4dknzK6PoHEIAQkEAjYsloA2Dh9BWdt/'
-    'gFuXnNAXJlnqBX2ShFVPa/o0gkMvHsTwgw/cujSNnAR0/tTpu19eBjFyHttDZnjr1WPQeaIa'
-    'MAmc7sKp0yg/fnLu6rubEAfw7w8fnyOHQDscHZ0Zrgt6Bl6LoE9A+EGQXHtvE8MPPsDXzZNv'
-    'jt4IswQ/Yk6BGvvn86v3z7jkp+3fsM/121t2u2dgQk//DKDA6599Cl/h36++/+7PJ0+gHT7A'
-    'oXeuXDKGQAu0w1H/zDAVzDNqBJfdcv2sxMWLnys5+cbJLKLP2Zo+U4KhvmD4wb8YfiBnv/n6'
-    '/oMH0AgfSgd/VKAGSiw/xCI/AUHyD8/neTUCQoqxqQRcgpQ0WOQIggqriHEJhBES2RQNp4sQ'
-    'ULMCFDPssg95qBoB5Q3ULCzjQX4CwjwHK7gsC9yE9wTspqgKS5Vh14Uo2A4TqtpK728LDAcZ'
-    '9Y09StfWdWnQTWky3a/JIgTUrJDRZQgEuQp+PZ6nB3+hQE3klWDkJ6DVXk2hjKXbAtc7YEq8'
-    'J6AzPD7AepLsbwgSH3n/0d1vDA9ZfymnrvLdppKlNwKK1cclCfEcJSHhh/EDgsEMggEPQTgx'
-    '+MsFaiw/xKIIARlFkG4L+y6hFyC21Yz+HjdjAewvdO1V2Oj6y5h21K8uu+VKpNYSvjV9uAgo'
-    'JPxcAYnxPCX4EwI1UGL5IRZFHsM/fvb0xi+31w8eNJ5Bru0/AI237m3rjfAVGslnBNgfptJn'
-    'vnlv+8ThI8mK7Tx8uKENh8/QAu1kfzh64dTpD//7H4bOAsEoIHrVuyDk6yDQCOHtGR4e/DMO'
-    '1FjG8pClTrp6EaTaybuE3mjQNh6CSVRdikUmqUbgLUhfhY2uv/B09tnxmVrUHSPXnTx70TG9'
-    '3GhNn0YqIGxRwEP4PEQ9pUKQFVBU8CcEaiMVUCkCWmk7QXkJSN+i0yX8afqwtwobXX/BbMZ5'
-    'hYDa14eFgDD87GesRoTjPg50g68YeEMMAbmCPyFQl09AagttIgGFr6uH55++uUQtrUOef/mv'
-    'MdxhhQhoYs4bUy1DHxYC8oSfCmOSpAYvAcVuKoUHavhFFUVBAlrtrXf0unGwdtH0UfYMdn+P'
-    'YEVD+kxvVK8LDQEVU6xfXXbLmEu5cj5jtremDwsBucJPUQnJKYN7Ezoq+GMDNVBi+SEWZQlo'
-    'tVtl6AONJ/TGYyl7TWQ7FcaShe5qr+YC0R9V4jsRuiPxpKjY6PuHsX512U0IaPEEpF5BdtX4'
-    'dgWk3pyeHvyxgRoosfwQi+IEhIWGaldOQlIYdolAGR09hNtpuEqCQ7hsxqUcfvbcFtT8ev/B'
-    'qnTUnLH+aISA7JyPSnt77PL0qU9AeriqLWH1FW+KGD8YnOp9ZYzn6cHfOwGBBV3LH6Nd7ZnZ'
-    'KyDctAbRmR6Gq8aQVbHqjy992WUOqjr6Xmn4NY46LHtGJed8uWxvTZ/6BKSCBAJVRawRZir4'
-    'sV2PwyzBHxiogRLLD7HISUAiHoeVSCoy5z1pT3Zetj4sBLQkieWHWES/iDiPv/FnQn3jHH/t'
-    'uN34ytGjpAQOX5I+o5B49qCCcRb7g2T9IDlpC2V7a/oIWkYKAclNgwSjWSB1o7I3tv/c9fFD'
-    '4plEHbMkVkD4y4d5VZkvGrEGprEnk0c7LFsfDxrxYCOoao3Sm0wCRKG9VZGJm9ACXggBVQJ7'
-    'BnYu3P4X0BACqgT2DOxcuP0voCEEVAnsGdi5cPtfQEMIqBLYM7Bz4fa/gIYQUCWwZ2Dnwu1/'
-    'AQ0hoEpgz8DOhdv/AhpCQJXAnoGdC7f/BTSEgCqBPQM7F27/C2gIAVUCewZ2Ltz+F9AQAqoE'
-    '9gzsXLj9L6AhBFQJ7BnYuXD7X0BDCKgS2DOwc+H2v4CGEFAlsGdg58LtfwENIaBKYM/AzoXb'
-    '/wIaQkCVwJ6BnQu3/wU0/h+0W9BQPsR3sgAAAABJRU5ErkJggg==')
-
+# the layout diagrams live in assets/layouts.bin (built by bundle.py), mapped on first use
+layouts = None
+
+def GetLayoutData(name):
+    ''' returns the PNG bytes for a layout, e.g. '2P_chain' '''
+    global layouts
+    if (layouts == None):
+        # the first layout is only drawn once the settings are confirmed, so this waits until then
+        import bundle
+        layouts = bundle.AssetBundle(bundle.layouts_path)
+    return layouts.GetData('layout_' + name)
+
+
+class BitmapCache():
+    ''' decoded layout bitmaps by name, evicting the least recently used past a byte limit '''
+    def __init__(self, limit=4 * 1024 * 1024):
+        # the most memory the cached bitmaps may take up, in bytes
+        self.limit = limit
+        self.bitmaps = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def Get(self, name):
+        ''' returns the wx.Bitmap for a layout, decoding it only if it isn't cached '''
+        bitmap = self.bitmaps.pop(name, None)
+        if (bitmap != None):
+            self.hits += 1
+        else:
+            self.misses += 1
+            # straight from the mapped PNG bytes, no base64 step. io is only needed from here on
+            import io
+            image = wx.ImageFromStream(io.BytesIO(GetLayoutData(name)), wx.BITMAP_TYPE_PNG)
+            bitmap = wx.BitmapFromImage(image)
+            self.sizes[name] = bitmap.GetWidth() * bitmap.GetHeight() * bitmap.GetDepth() // 8
+            self.bytes += self.sizes[name]
+        # most recently used goes last
+        self.bitmaps[name] = bitmap
+        while (self.bytes > self.limit and len(self.bitmaps) > 1):
+            oldest, evicted = self.bitmaps.popitem(last=False)
+            self.bytes -= self.sizes.pop(oldest)
+            self.evictions += 1
+        return bitmap
+
+    def Clear(self):
+        ''' drops every cached bitmap '''
+        self.bitmaps.clear()
+        self.sizes.clear()
+        self.bytes = 0
+
+    def GetStats(self):
+        ''' returns the cache counters '''
+        return {
+            'cached':    len(self.bitmaps),
+            'bytes':     self.bytes,
+            'limit':     self.limit,
+            'hits':      self.hits,
+            'misses':    self.misses,
+            'evictions': self.evictions}
+
+# all ten layouts decode to a bit under 3 MB at 24 bits per pixel, so by default they all fit
+layout_bitmaps = BitmapCache()
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import os
+import sys
+import time
+import sqlite3
+import patch
+
+# where the editor keeps its library unless told otherwise
+default_path = os.path.join(os.path.expanduser('~'), 'yarns_library.db')
+
+# patches per page when browsing
+page_size = 50
+
+# bits per search mask column. sqlite integers are signed 64 bit
+mask_bits = 63
+
+
+class Library():
+    ''' a sqlite file of patch records, searchable by name prefix, parameter value and tag.
+
+        the records live in the patches table, and are never scanned. the globals table
+        holds the global parameters of each patch as indexed table indexes. each part
+        parameter gets a narrow table of bit masks of the labels any part uses, so a
+        search by value scans only the masks it asks about '''
+    def __init__(self, state, path=default_path):
+        self.state = state
+        self.path = path
+        # parameter name -> (is it global, its cc_values table)
+        self.parameters = {}
+        for offset, (part, name) in enumerate(state.keys):
+            self.parameters.setdefault(name, (part == 0, state.tables[offset]))
+        self.globals = [name for part, name in state.keys if (part == 0)]
+        # part parameter name -> number of mask columns its labels need
+        self.masks = {}
+        for name, (is_global, table) in self.parameters.items():
+            if (not is_global): self.masks[name] = (len(table) + mask_bits - 1) // mask_bits
+        schema = [
+            'create table if not exists patches (',
+            '    id integer primary key, name text not null, record blob not null, created real);',
+            'create index if not exists patches_name on patches (name);',
+            'create table if not exists tags (patch integer not null, tag text not null);',
+            'create unique index if not exists tags_tag on tags (tag, patch);',
+            'create index if not exists tags_patch on tags (patch);',
+            'create table if not exists globals (id integer primary key, %s);' % (
+                ', '.join('%s integer' % (name) for name in self.globals))]
+        for name in self.globals:
+            schema.append('create index if not exists globals_%s on globals (%s);' % (name, name))
+        for name, count in sorted(self.masks.items()):
+            schema.append('create table if not exists masks_%s (id integer primary key, %s);' % (
+                name, ', '.join('mask%d integer' % (number) for number in range(count))))
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript('\n'.join(schema))
+
+    def _SearchRows(self, snapshot):
+        ''' returns the globals row and {name: mask row} of a Snapshot() '''
+        globals_row = []
+        masks = dict((name, [0] * count) for name, count in self.masks.items())
+        for (part, name), index in zip(self.state.keys, snapshot):
+            if (part == 0): globals_row.append(index)
+            else: masks[name][index // mask_bits] |= 1 << (index % mask_bits)
+        return globals_row, masks
+
+    def Add(self, name, snapshot, tags=(), commit=True):
+        ''' stores a PatchState Snapshot() under a name, returns its id '''
+        cursor = self.connection.execute(
+            'insert into patches (name, record, created) values (?, ?, ?)',
+            (name, sqlite3.Binary(patch.Pack(self.state, snapshot)), time.time()))
+        patch_id = cursor.lastrowid
+        globals_row, masks = self._SearchRows(snapshot)
+        self.connection.execute(
+            'insert into globals values (?, %s)' % (', '.join('?' * len(globals_row))), [patch_id] + globals_row)
+        for name, row in masks.items():
+            self.connection.execute(
+                'insert into masks_%s values (?, %s)' % (name, ', '.join('?' * len(row))), [patch_id] + row)
+        self.connection.executemany(
+            'insert or ignore into tags values (?, ?)', [(patch_id, tag) for tag in tags])
+        if (commit): self.connection.commit()
+        return patch_id
+
+    def AddMany(self, patches):
+        ''' stores a list of (name, snapshot, tags) in one transaction, returns their ids '''
+        ids = [self.Add(name, snapshot, tags, commit=False) for name, snapshot, tags in patches]
+        self.connection.commit()
+        return ids
+
+    def Get(self, patch_id):
+        ''' returns (name, snapshot, tags) of a patch '''
+        row = self.connection.execute('select name, record from patches where id = ?', (patch_id,)).fetchone()
+        if (row == None):
+            raise ValueError('Incorrect patch id passed to Library.Get(): %s' % (patch_id))
+        return (row[0], patch.Unpack(self.state, bytes(row[1])), self.GetTags(patch_id))
+
+    def GetTags(self, patch_id):
+        ''' returns the tags of a patch '''
+        return [row[0] for row in self.connection.execute(
+            'select tag from tags where patch = ? order by tag', (patch_id,))]
+
+    def Tag(self, patch_id, tags):
+        ''' adds tags to a patch '''
+        self.connection.executemany(
+            'insert or ignore into tags values (?, ?)', [(patch_id, tag) for tag in tags])
+        self.connection.commit()
+
+    def Untag(self, patch_id, tags):
+        ''' removes tags from a patch '''
+        self.connection.executemany(
+            'delete from tags where patch = ? and tag = ?', [(patch_id, tag) for tag in tags])
+        self.connection.commit()
+
+    def Delete(self, patch_id):
+        ''' removes a patch '''
+        for table in ['patches', 'globals'] + ['masks_' + name for name in self.masks]:
+            self.connection.execute('delete from %s where id = ?' % (table), (patch_id,))
+        self.connection.execute('delete from tags where patch = ?', (patch_id,))
+        self.connection.commit()
+
+    def FindLabel(self, name, text):
+        ''' returns the label of parameter name that text is, or uniquely starts with, e.g. '4T' '''
+        if (name not in self.parameters):
+            raise ValueError('Incorrect parameter passed to Library.FindLabel(): %s' % (name))
+        label = self.parameters[name][1].Find(text)
+        if (label == None):
+            raise ValueError('Incorrect value passed to Library.FindLabel(): %s=%s' % (name, text))
+        return label
+
+    def _Filters(self, where, tags):
+        ''' returns a search's {parameter: label} and tags as (table, id column, condition, arguments) '''
+        filters = []
+        for name, text in sorted(where.items()):
+            # FindLabel() rejects unknown names before the table lookup
+            label = self.FindLabel(name, text)
+            index = self.parameters[name][1].Index(label)
+            if (self.parameters[name][0]):
+                filters.append(('globals', 'id', '%s = ?' % (name), [index]))
+            else:
+                filters.append(('masks_' + name, 'id', 'mask%d & ? != 0' % (index // mask_bits),
+                                [1 << (index % mask_bits)]))
+        for tag in tags:
+            filters.append(('tags', 'patch', 'tag = ?', [tag]))
+        return filters
+
+    def _Join(self, prefix, where, tags, select):
+        ''' returns (sql, arguments) selecting from the narrow tables of a search joined on id '''
+        sources = [('patches', 'id', 'name >= ? and name < ?', [prefix, prefix + u'\uffff'])] if (prefix) else []
+        sources += self._Filters(where, tags)
+        joins = []
+        conditions = []
+        arguments = []
+        for number, (table, column, condition, values) in enumerate(sources):
+            alias = 't%d' % (number)
+            if (number == 0): joins.append('%s %s' % (table, alias))
+            else: joins.append('join %s %s on %s.%s = t0.%s' % (table, alias, alias, column, sources[0][1]))
+            if (table == 'patches'): conditions.append(condition.replace('name', alias + '.name'))
+            else: conditions.append('%s.%s' % (alias, condition))
+            arguments += values
+        select = select % {'id': 't0.' + sources[0][1]}
+        return 'select %s from %s where %s' % (select, ' '.join(joins), ' and '.join(conditions)), arguments
+
+    def Search(self, prefix='', where={}, tags=(), page=0, limit=page_size, count=None):
+        ''' returns a page of (id, name) matching a name prefix, {parameter: label} and tags, by name.
+            count is the Count() of the search, if the caller already has it '''
+        # a range on the name index rather than like, which sqlite can't always index
+        conditions = ['name >= ? and name < ?'] if (prefix) else []
+        arguments = [prefix, prefix + u'\uffff'] if (prefix) else []
+        filters = self._Filters(where, tags)
+        if (filters):
+            if (count == None): count = self.Count(prefix, where, tags)
+            total = self.connection.execute('select count(*) from patches').fetchone()[0]
+            if ((page + 1) * limit * total < count * count):
+                # common matches: walk the name index, checking each patch, until the page is full
+                for table, column, condition, values in filters:
+                    conditions.append('exists (select 1 from %s where %s = patches.id and %s)' % (table, column, condition))
+                    arguments += values
+            else:
+                # rare matches: find them all with one join, then sort what was found
+                join, arguments = self._Join(prefix, where, tags, '%(id)s')
+                conditions = ['id in (%s)' % (join)]
+        where_sql = ('where ' + ' and '.join(conditions)) if (conditions) else ''
+        return self.connection.execute(
+            'select id, name from patches %s order by name, id limit ? offset ?' % (where_sql),
+            arguments + [limit, page * limit]).fetchall()
+
+    def Count(self, prefix='', where={}, tags=()):
+        ''' returns the number of patches a Search() pages through '''
+        if (not (prefix or where or tags)):
+            return self.connection.execute('select count(*) from patches').fetchone()[0]
+        # join the narrow tables on id, never visiting the records
+        join, arguments = self._Join(prefix, where, tags, 'count(*)')
+        return self.connection.execute(join, arguments).fetchone()[0]
+
+    def Close(self):
+        ''' closes the file '''
+        self.connection.close()
+
+
+def ParseQuery(text):
+    ''' splits a search box query into (prefix, {parameter: value}, tags).
+        'bass layout=4T #live' is a name prefix, a parameter value and a tag '''
+    prefix = []
+    where = {}
+    tags = []
+    for word in text.split():
+        if (word.startswith('#')): tags.append(word[1:])
+        elif ('=' in word):
+            name, value = word.split('=', 1)
+            where[name] = value
+        else: prefix.append(word)
+    return ' '.join(prefix), where, tags
+
+
+def Main(argv):
+    ''' the command line: add, search, export, tag and delete patches '''
+    # only the command line parses arguments, the editor imports this module too
+    import argparse
+    parser = argparse.ArgumentParser(description='Manages a Yarns Editor patch library.')
+    parser.add_argument('--db', default=default_path, help='library file (default: %(default)s)')
+    commands = parser.add_subparsers(dest='command')
+    add = commands.add_parser('add', help='add a patch file')
+    add.add_argument('name')
+    add.add_argument('file', help='a .yarns patch or .json export')
+    add.add_argument('--tag', action='append', default=[], help='tag the patch, can be repeated')
+    search = commands.add_parser('search', help="list patches, e.g. search bass layout=4T arpDirection=Random '#live'")
+    search.add_argument('query', nargs='*')
+    search.add_argument('--page', type=int, default=0)
+    export = commands.add_parser('export', help='write a patch out as a .yarns or .json file')
+    export.add_argument('id', type=int)
+    export.add_argument('file')
+    tag = commands.add_parser('tag', help='tag a patch')
+    tag.add_argument('id', type=int)
+    tag.add_argument('tags', nargs='+')
+    delete = commands.add_parser('delete', help='remove a patch')
+    delete.add_argument('id', type=int)
+    args = parser.parse_args(argv)
+
+    # the parameter layout comes from core, which doesn't need wx
+    import core
+    library = Library(core.PatchState(), args.db)
+    try:
+        if (args.command == 'add'):
+            snapshot = patch.Load(args.file, library.state)
+            sys.stdout.write('%d\n' % (library.Add(args.name, snapshot, args.tag)))
+        elif (args.command == 'search'):
+            prefix, where, tags = ParseQuery(' '.join(args.query))
+            count = library.Count(prefix, where, tags)
+            for patch_id, name in library.Search(prefix, where, tags, args.page):
+                sys.stdout.write('%6d  %s\n' % (patch_id, name))
+            pages = max(1, (count + page_size - 1) // page_size)
+            sys.stdout.write('page %d of %d, %d patches\n' % (args.page + 1, pages, count))
+        elif (args.command == 'export'):
+            name, snapshot, tags = library.Get(args.id)
+            if (args.file.lower().endswith('.json')): patch.SaveJSON(args.file, library.state, snapshot)
+            else: patch.Save(args.file, library.state, snapshot)
+        elif (args.command == 'tag'):
+            library.Tag(args.id, args.tags)
+        elif (args.command == 'delete'):
+            library.Delete(args.id)
+    except ValueError as error:
+        sys.stderr.write('%s\n' % (error))
+        return 1
+    finally:
+        library.Close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(Main(sys.argv[1:]))
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+
+# imports
+import threading
+import time
+from timeit import default_timer as clock
+
+
+class RtMidiBackend():
+    ''' real midi ports, through rtmidi-python '''
+    name = 'rtmidi'
+
+    def CreateInput(self):
+        ''' returns a midi input with ports, open_port(), close_port() and callback '''
+        import rtmidi_python
+        return rtmidi_python.MidiIn()
+
+    def CreateOutput(self):
+        ''' returns a midi output with ports, open_port(), close_port() and send_message() '''
+        import rtmidi_python
+        return rtmidi_python.MidiOut()
+
+
+class LoopbackBackend():
+    ''' an in-process midi "cable": whatever goes out comes back in, no hardware needed '''
+    name = 'loopback'
+
+    def __init__(self, baud=31250, buffer_size=64, overflow='drop', realtime=False, running_status=True,
+                 port='Loopback'):
+        if (overflow not in ('block', 'drop')):
+            raise ValueError('Incorrect value passed to LoopbackBackend()')
+        # the name its one input and one output port go by
+        self.port = port
+        # wire speed in baud (10 bits per byte), or None for an infinitely fast wire
+        self.baud = baud
+        # how many bytes the receiving end can hold before it starts losing them
+        self.buffer_size = buffer_size
+        # what happens when the receiver is full: the sender waits, or the message is lost
+        self.overflow = overflow
+        # when False nothing sleeps, the wire timing is only worked out on paper
+        self.realtime = realtime
+        # whether outputs accept raw byte streams that omit repeated status bytes
+        self.running_status = running_status
+        self.inputs = []
+        self.outputs = []
+
+    def CreateInput(self):
+        ''' returns an input that receives everything sent to any output '''
+        port = LoopbackInput(self)
+        self.inputs.append(port)
+        return port
+
+    def CreateOutput(self):
+        ''' returns an output that records and times everything sent to it '''
+        port = LoopbackOutput(self)
+        self.outputs.append(port)
+        return port
+
+
+class LoopbackInput():
+    ''' the receiving end of a LoopbackBackend '''
+    def __init__(self, backend):
+        self.backend = backend
+        self.ports = [backend.port]
+        self.is_open = False
+        self.callback = None
+        self.received = 0
+        self.last = None
+
+    def open_port(self, index):
+        ''' opens the (only) port '''
+        self.ports[index]
+        self.is_open = True
+
+    def close_port(self):
+        ''' closes the port '''
+        self.is_open = False
+
+    def Deliver(self, message, timestamp):
+        ''' hands one complete message to the callback, the way rtmidi does '''
+        if (not self.is_open): return
+        delta = (timestamp - self.last) if (self.last != None) else 0.0
+        self.last = timestamp
+        self.received += 1
+        if (self.callback): self.callback(message, delta)
+
+
+class LoopbackOutput():
+    ''' the sending end of a LoopbackBackend '''
+    def __init__(self, backend):
+        self.backend = backend
+        self.ports = [backend.port]
+        self.running_status = backend.running_status
+        self.is_open = False
+        self.lock = threading.Lock()
+        self.Reset()
+
+    def open_port(self, index):
+        ''' opens the (only) port '''
+        self.ports[index]
+        self.is_open = True
+
+    def close_port(self):
+        ''' closes the port '''
+        self.is_open = False
+
+    def Reset(self):
+        ''' forgets everything that was sent '''
+        with self.lock:
+            # (time the message started on the wire, message bytes), times relative to the first one
+            self.sent = []
+            self.started = None
+            self.busy_until = 0.0
+            self.bytes = 0
+            self.dropped = 0
+            self.dropped_bytes = 0
+            self.blocked = 0.0
+
+    def send_message(self, message):
+        ''' puts a message (or a running status stream) on the simulated wire '''
+        message = list(message)
+        size = len(message)
+        backend = self.backend
+        with self.lock:
+            now = clock()
+            if (self.started == None): self.started = now
+            now -= self.started
+            if (backend.baud):
+                bytes_per_second = backend.baud / 10.0
+                # bytes still in flight or waiting in the receiver
+                backlog = max(0.0, self.busy_until - now) * bytes_per_second
+                if (backlog + size > backend.buffer_size):
+                    if (backend.overflow == 'drop'):
+                        self.dropped += 1
+                        self.dropped_bytes += size
+                        return
+                    # a blocking driver: the sender waits until there's room
+                    wait = (backlog + size - backend.buffer_size) / bytes_per_second
+                    self.blocked += wait
+                    if (backend.realtime): time.sleep(wait)
+                    now += wait
+                start = max(now, self.busy_until)
+                self.busy_until = start + size / bytes_per_second
+            else:
+                start = now
+                self.busy_until = now
+            self.sent.append((start, message))
+            self.bytes += size
+        # loop it back around, one complete message at a time
+        for data in SplitMessages(message):
+            for port in backend.inputs:
+                port.Deliver(data, start)
+
+    def GetStats(self):
+        ''' returns what made it onto the simulated wire '''
+        with self.lock:
+            wire_time = self.busy_until - self.sent[0][0] if (self.sent) else 0.0
+            return {
+                'messages':         len(self.sent),
+                'bytes':            self.bytes,
+                'dropped':          self.dropped,
+                'dropped_bytes':    self.dropped_bytes,
+                'blocked':          self.blocked,
+                'wire_time':        wire_time,
+                'bytes_per_second': (self.bytes / wire_time) if (wire_time > 0) else 0.0}
+
+
+def SplitMessages(data):
+    ''' expands a running status stream of 3-byte channel messages into whole messages '''
+    if (len(data) <= 3): return [data]
+    status = data[0]
+    return [[status, data[index], data[index + 1]] for index in range(1, len(data) - 1, 2)]
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import math
+import time
+import threading
+from timeit import default_timer as clock
+import cc_values
+
+# tables whose neighbouring labels aren't neighbouring settings. these jump at the midpoint
+discrete_tables = [
+    'layout', 'channel', 'midi_output', 'voicing', 'note_priority', 'boolean', 'tuning_root',
+    'tuning_system', 'trigger_shape', 'aux_cv', 'oscillator', 'arp_direction', 'arp_pattern']
+
+# fastest tick rate, in Hz
+max_rate = 1000
+
+# sleep until this long before a tick is due, then spin. os sleeps are too coarse for 1 ms ticks
+spin_time = 0.002
+
+
+def TempoToBPM(tempo):
+    ''' returns the beats per minute of a tempo label, e.g. '120'. external clock counts as 120 '''
+    try: return float(tempo)
+    except ValueError: return 120.0
+
+
+def BeatsToSeconds(beats, tempo):
+    ''' returns how long beats last at a tempo label '''
+    return beats * 60.0 / TempoToBPM(tempo)
+
+
+def WaitUntil(deadline):
+    ''' sleeps, then spins, until clock() reaches deadline. returns how late it woke, in seconds '''
+    remaining = deadline - clock()
+    if (remaining > spin_time): time.sleep(remaining - spin_time)
+    # yield while spinning, so the midi writer thread still gets the interpreter
+    while (clock() < deadline): time.sleep(0)
+    return clock() - deadline
+
+
+class Morph():
+    ''' glides yarns from one PatchState Snapshot() to another, on its own timer thread.
+        every parameter moves through the indexes of its cc_values table, so it passes through
+        the labels between the two ends. discrete tables switch halfway. each tick sends the
+        CCs that changed since the last one, as one SendMany() '''
+    def __init__(self, state, manager, source, target, duration, rate=250, done=None):
+        if (rate <= 0 or rate > max_rate or duration < 0):
+            raise ValueError('Incorrect value passed to Morph()')
+        self.state = state
+        self.manager = manager
+        self.duration = duration
+        self.period = 1.0 / rate
+        # called from the timer thread with the (part, name, label) edits of where the morph stopped
+        self.done = done
+        # only the parameters that differ move, layout first
+        discrete = set(id(cc_values.tables[name]) for name in discrete_tables)
+        self.offsets = state.Order([offset for offset in range(len(source)) if (source[offset] != target[offset])])
+        self.start_index = [source[offset] for offset in self.offsets]
+        self.end_index = [target[offset] for offset in self.offsets]
+        self.discrete = [id(state.tables[offset]) in discrete for offset in self.offsets]
+        # the indexes yarns has been sent
+        self.current = list(self.start_index)
+        self.thread = None
+        self.running = False
+        # tick stats: lateness against each tick's deadline, in seconds
+        self.ticks = 0
+        self.overruns = 0
+        self.sent = 0
+        self.late_sum = 0.0
+        self.late_squares = 0.0
+        self.late_max = 0.0
+
+    def Start(self):
+        ''' starts gliding '''
+        if (self.running): return
+        self.running = True
+        self.thread = threading.Thread(target=self._Run, name='Morph')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def Stop(self, timeout=None):
+        ''' stops where it is. done() still gets called '''
+        self.running = False
+        if (self.thread and self.thread is not threading.current_thread()): self.thread.join(timeout)
+
+    def IsRunning(self):
+        ''' returns True until the morph reaches the target or is stopped '''
+        return self.running
+
+    def Tick(self, position):
+        ''' sends the CCs for a position between 0 (source) and 1 (target), returns how many '''
+        pairs = []
+        state = self.state
+        for number, offset in enumerate(self.offsets):
+            start = self.start_index[number]
+            if (self.discrete[number]): index = start if (position < 0.5) else self.end_index[number]
+            else: index = int(start + (self.end_index[number] - start) * position + 0.5)
+            if (index != self.current[number]):
+                self.current[number] = index
+                pairs.append((state.controllers[offset], state.tables[offset].values[index]))
+        if (pairs): self.manager.SendMany(pairs)
+        self.sent += len(pairs)
+        return len(pairs)
+
+    def GetEdits(self):
+        ''' returns the (part, name, label) edits for where the morph is now '''
+        return [self.state.Edit(offset, self.current[number]) for number, offset in enumerate(self.offsets)]
+
+    def GetStats(self):
+        ''' returns the tick count, CCs sent, and tick lateness (jitter) in seconds '''
+        ticks = max(self.ticks, 1)
+        mean = self.late_sum / ticks
+        return {
+            'ticks':     self.ticks,
+            'overruns':  self.overruns,
+            'sent':      self.sent,
+            'period':    self.period,
+            'late_mean': mean,
+            'late_max':  self.late_max,
+            'jitter':    math.sqrt(max(self.late_squares / ticks - mean * mean, 0.0))}
+
+    def _Run(self):
+        ''' the timer thread: ticks on a fixed grid of deadlines from the start '''
+        period = self.period
+        start = clock()
+        tick = 0
+        try:
+            while (self.running):
+                deadline = start + tick * period
+                late = WaitUntil(deadline)
+                now = deadline + late
+                self.ticks += 1
+                self.late_sum += late
+                self.late_squares += late * late
+                if (late > self.late_max): self.late_max = late
+                position = min((now - start) / self.duration, 1.0) if (self.duration) else 1.0
+                self.Tick(position)
+                if (position >= 1.0): break
+                # a tick that ran into the next one's slot skips ahead, rather than bunching up
+                tick += 1
+                behind = int((clock() - start) / period) - tick
+                if (behind > 0):
+                    self.overruns += behind
+                    tick += behind
+        finally:
+            self.running = False
+            if (self.done): self.done(self.GetEdits())
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import struct
+
+# patch record, all little endian:
+#   header: magic, format version, number of parameters
+#   then one cc value per parameter, in PatchState order: the globals, then each part's
+#   part_parameters. cc values rather than table indexes, so the menus can change freely
+magic = b'YEAP'
+version = 1
+header_format = '<4sHH'
+header_size = struct.calcsize(header_format)
+
+
+def Pack(state, snapshot=None):
+    ''' returns a PatchState Snapshot() (or the current state) as a patch record '''
+    if (snapshot == None): snapshot = state.data
+    values = bytearray(len(snapshot))
+    for offset, index in enumerate(snapshot):
+        values[offset] = state.tables[offset].values[index]
+    return struct.pack(header_format, magic, version, len(values)) + bytes(values)
+
+
+def Unpack(state, record):
+    ''' returns a patch record as a Snapshot() of state '''
+    if (len(record) < header_size):
+        raise ValueError('Incorrect patch passed to Unpack()')
+    record_magic, record_version, count = struct.unpack_from(header_format, record, 0)
+    if (record_magic != magic or record_version != version or count != len(state.data)
+        or len(record) != header_size + count):
+        raise ValueError('Incorrect patch passed to Unpack()')
+    tables = state.tables
+    return bytearray([tables[offset].reverse[value & 0x7F]
+                      for offset, value in enumerate(bytearray(record[header_size:]))])
+
+
+def Save(path, state, snapshot=None):
+    ''' writes a patch record to a file '''
+    with open(path, 'wb') as patch_file:
+        patch_file.write(Pack(state, snapshot))
+
+
+def Load(path, state):
+    ''' reads a patch record (or JSON export, by its .json extension) from a file as a Snapshot() '''
+    if (path.lower().endswith('.json')):
+        # json is only loaded for json files, so the command line starts faster
+        import json
+        with open(path, 'r') as patch_file:
+            return FromJSON(state, json.load(patch_file))
+    with open(path, 'rb') as patch_file:
+        return Unpack(state, patch_file.read())
+
+
+def ToJSON(state, snapshot=None):
+    ''' returns a Snapshot() (or the current state) as a dict of labels, for json '''
+    if (snapshot == None): snapshot = state.data
+    patch = {'version': version, 'parts': {}}
+    for offset, index in enumerate(snapshot):
+        part, name, label = state.Edit(offset, index)
+        if (part == 0): patch[name] = label
+        else: patch['parts'].setdefault(str(part), {})[name] = label
+    return patch
+
+
+def FromJSON(state, patch):
+    ''' returns a dict from ToJSON() as a Snapshot() of state. missing parameters keep their defaults '''
+    if (not isinstance(patch, dict) or patch.get('version') != version):
+        raise ValueError('Incorrect patch passed to FromJSON()')
+    snapshot = bytearray(state.defaults)
+    try:
+        for offset, (part, name) in enumerate(state.keys):
+            if (part == 0): label = patch.get(name)
+            else: label = patch['parts'].get(str(part), {}).get(name)
+            if (label != None): snapshot[offset] = state.tables[offset].Index(label)
+    except (KeyError, AttributeError, TypeError):
+        # a missing table entry, or parts and labels that aren't the dicts and strings they should be
+        raise ValueError('Incorrect patch passed to FromJSON()')
+    return snapshot
+
+
+def SaveJSON(path, state, snapshot=None):
+    ''' writes a Snapshot() (or the current state) out as readable json '''
+    import json
+    with open(path, 'w') as patch_file:
+        json.dump(ToJSON(state, snapshot), patch_file, indent=2, sort_keys=True)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+'''
+The MIT License (MIT)
+
+Copyright (c) 2015 Panagiotis Peppas
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Notice:
+Portions of this software may include text and/or graphics from Mutable Instruments, 
+provided under the cc-by-sa 3.0 license. The author of this software is not 
+endorsed by Mutable Instruments. Their company website, and the license, can be 
+found at the following address: http://mutable-instruments.net/
+'''
+
+# imports
+import os
+from timeit import default_timer as clock
+import patch
+
+# recalls kept for the latency stats
+history_size = 64
+
+
+class SetlistEntry():
+    ''' a patch in a setlist, with its streams built ahead of time '''
+    def __init__(self, name, snapshot):
+        self.name = name
+        self.snapshot = snapshot
+        # [status, controller, value, ...] for the whole patch, and for the change from the previous entry
+        self.full = None
+        self.delta = None
+        # the (part, name, label) edits that show the patch in the editor
+        self.edits = None
+
+
+class Setlist():
+    ''' patches to step through on stage. every entry is encoded into the exact bytes that recall it
+        when the setlist is loaded, so a recall only hands a prebuilt stream to the midi manager '''
+    def __init__(self, state, manager):
+        self.state = state
+        self.manager = manager
+        self.entries = []
+        # the entry recalled last, -1 before the first recall
+        self.position = -1
+        # the status byte the streams were built for
+        self.status = None
+        # (entry number, delta or not, clock() at the recall, MidiStream) of recent recalls, newest last
+        self.history = []
+
+    def Add(self, name, snapshot):
+        ''' appends a patch. the streams are built by Prepare() '''
+        self.entries.append(SetlistEntry(name, snapshot))
+        self.status = None
+
+    def Load(self, path):
+        ''' reads a setlist file: one .yarns or .json patch per line, relative to the file. # starts a comment '''
+        folder = os.path.dirname(os.path.abspath(path))
+        with open(path, 'r') as setlist_file:
+            for line in setlist_file:
+                line = line.split('#', 1)[0].strip()
+                if (not line): continue
+                patch_path = os.path.join(folder, line)
+                self.Add(os.path.splitext(os.path.basename(line))[0], patch.Load(patch_path, self.state))
+        self.Prepare()
+
+    def Prepare(self):
+        ''' encodes every entry for the midi manager's current channel '''
+        state = self.state
+        status = self.manager.status_byte
+        previous = None
+        for entry in self.entries:
+            everything = state.Order(range(len(entry.snapshot)))
+            pairs, entry.edits = state.Delta(entry.snapshot, everything)
+            entry.full = self._Stream(status, pairs)
+            if (previous == None): entry.delta = None
+            else:
+                changed = [offset for offset in everything if (previous[offset] != entry.snapshot[offset])]
+                pairs, edits = state.Delta(entry.snapshot, changed)
+                entry.delta = self._Stream(status, pairs)
+            previous = entry.snapshot
+        self.status = status
+
+    def _Stream(self, status, pairs):
+        ''' returns (controller, value) pairs as a [status, controller, value, ...] stream '''
+        stream = [status]
+        for controller, value in pairs:
+            stream.append(controller)
+            stream.append(value)
+        return stream
+
+    def Recall(self, number):
+        ''' sends an entry, then puts it in the patch state. steps from the previous entry send only
+            what changed, as long as yarns still has the previous entry '''
+        pressed = clock()
+        if (number < 0 or number >= len(self.entries)):
+            raise ValueError('Incorrect value passed to Setlist.Recall()')
+        if (self.status != self.manager.status_byte): self.Prepare()
+        entry = self.entries[number]
+        delta = (number > 0 and self.entries[number - 1].snapshot == self.state.data)
+        stream = entry.delta if (delta) else entry.full
+        if (len(stream) > 1): stream = self.manager.SendStream(stream)
+        else: stream = None
+        self.position = number
+        self.history.append((number, delta, pressed, stream))
+        del self.history[:-history_size]
+        # the widgets catch up once the bytes are on their way
+        self.state.Update(entry.edits)
+
+    def Next(self):
+        ''' recalls the entry after the current one. returns False at the end '''
+        if (self.position + 1 >= len(self.entries)): return False
+        self.Recall(self.position + 1)
+        return True
+
+    def Previous(self):
+        ''' recalls the entry before the current one. returns False at the start '''
+        if (self.position <= 0): return False
+        self.Recall(self.position - 1)
+        return True
+
+    def GetLatency(self):
+        ''' returns the seconds from the last Recall() to its first byte reaching the device,
+            or None if it sent nothing or hasn't been written yet '''
+        if (not self.history): return None
+        number, delta, pressed, stream = self.history[-1]
+        if (stream == None or stream.written == None): return None
+        return stream.written - pressed
+
+    def GetStats(self):
+        ''' returns latency stats (seconds) over the recent recalls that have been written '''
+        latencies = sorted(stream.written - pressed for number, delta, pressed, stream in self.history
+                           if (stream != None and stream.written != None))
+        stats = {
+            'recalls': len(self.history),
+            'deltas':  len([delta for number, delta, pressed, stream in self.history if (delta)]),
+            'written': len(latencies)}
+        if (latencies):
+            stats['min'] = latencies[0]
+            stats['median'] = latencies[len(latencies) // 2]
+            stats['max'] = latencies[-1]
+        return stats